@@ -19,7 +19,8 @@ from kerykeion import (
     KerykeionChartSVG, 
     Report,
     SynastryAspects,
-    CompositeSubjectFactory
+    CompositeSubjectFactory,
+    TimezoneResolver
 )
 
 # Configuration Flask pour Vercel
@@ -33,6 +34,11 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max
 # Cache pour optimiser les performances
 cache = {}
 
+# Résolution du fuseau horaire à partir des coordonnées, sans appel réseau.
+# Chemin d'un fichier GeoJSON des frontières des fuseaux (ex. timezone-boundary-builder)
+TIMEZONE_BOUNDARIES_PATH = os.environ.get('KERYKEION_TIMEZONE_BOUNDARIES')
+timezone_resolver = TimezoneResolver.from_geojson(TIMEZONE_BOUNDARIES_PATH) if TIMEZONE_BOUNDARIES_PATH else None
+
 def get_cache_key(data: Dict[str, Any]) -> str:
     """Génère une clé de cache basée sur les données"""
     return f"{data.get('name', '')}_{data.get('year', '')}_{data.get('month', '')}_{data.get('day', '')}_{data.get('hour', '')}_{data.get('minute', '')}_{data.get('city', '')}_{data.get('nation', '')}"
@@ -56,7 +62,8 @@ def create_astrological_subject(data: Dict[str, Any]) -> AstrologicalSubject:
         houses_system_identifier=data.get('houses_system', 'P'),
         perspective_type=data.get('perspective_type', 'Apparent Geocentric'),
         online=data.get('online', True),
-        geonames_username=data.get('geonames_username')
+        geonames_username=data.get('geonames_username'),
+        timezone_resolver=timezone_resolver
     )
 
 def get_planet_interpretation(planet_data: Dict[str, Any], planet_name: str) -> Dict[str, Any]:
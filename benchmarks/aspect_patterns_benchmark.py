@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: aspect patterns of many natal charts with find_aspect_patterns against the triple and
+quadruple loops over the points of NatalAspects.relevant_aspects. The charts and their aspects are
+calculated before the timings; the loops run on the first charts only and are extrapolated.
+
+Usage:
+    python -m benchmarks.aspect_patterns_benchmark [charts]
+"""
+
+import sys
+from collections import Counter
+from itertools import combinations
+from time import perf_counter
+
+from benchmarks.subject_batch_benchmark import get_records
+from kerykeion import AspectPatternsFactory, SubjectBatchFactory
+from kerykeion.aspects import find_aspect_patterns
+
+BRUTE_FORCE_CHARTS = 200
+
+
+def find_patterns_with_loops(aspects) -> Counter:
+    """
+    Counts the patterns of a list of aspects checking every triple and quadruple of points.
+    """
+    pairs = {}
+    points = []
+    for aspect in aspects:
+        first, second = (aspect.p1_owner, aspect.p1_name), (aspect.p2_owner, aspect.p2_name)
+        pairs[frozenset((first, second))] = aspect.aspect
+        points.extend(point for point in (first, second) if point not in points)
+
+    def get_aspect(first, second):
+        return pairs.get(frozenset((first, second)))
+
+    counter = Counter()
+    for triple in combinations(points, 3):
+        names = [get_aspect(first, second) for first, second in combinations(triple, 2)]
+        if names.count("trine") == 3:
+            counter["Grand Trine"] += 1
+        if names.count("conjunction") == 3:
+            counter["Stellium"] += 1
+        if names.count("opposition") == 1 and names.count("square") == 2:
+            counter["T-Square"] += 1
+        if names.count("sextile") == 1 and names.count("quincunx") == 2:
+            counter["Yod"] += 1
+
+    for quadruple in combinations(points, 4):
+        names = [get_aspect(first, second) for first, second in combinations(quadruple, 2)]
+        if names.count("opposition") == 2 and names.count("square") == 4:
+            counter["Grand Cross"] += 1
+        if names.count("trine") == 3 and names.count("opposition") == 1 and names.count("sextile") == 2:
+            counter["Kite"] += 1
+
+    return counter
+
+
+def main(charts: int = 10000) -> None:
+    factory = AspectPatternsFactory()
+
+    start = perf_counter()
+    subjects = SubjectBatchFactory().get_astrological_subjects(get_records(charts))
+    aspects = [factory.get_aspects(subject) for subject in subjects]
+    print(f"{charts} charts and their aspects: {perf_counter() - start:.1f}s (not included in the timings)")
+
+    start = perf_counter()
+    patterns = [find_aspect_patterns(chart_aspects) for chart_aspects in aspects]
+    graph_elapsed = perf_counter() - start
+
+    brute_force_charts = min(charts, BRUTE_FORCE_CHARTS)
+    start = perf_counter()
+    for chart_aspects in aspects[:brute_force_charts]:
+        find_patterns_with_loops(chart_aspects)
+    loops_elapsed = (perf_counter() - start) / brute_force_charts * charts
+
+    start = perf_counter()
+    factory.get_patterns_batch(subjects)
+    batch_elapsed = perf_counter() - start
+
+    print(f"Patterns found: {dict(Counter(pattern.name for chart_patterns in patterns for pattern in chart_patterns))}")
+    print(
+        f"find_aspect_patterns {graph_elapsed:.2f}s ({graph_elapsed / charts * 1e6:.0f}us/chart), "
+        f"loops {loops_elapsed:.2f}s (extrapolated from {brute_force_charts} charts), x{loops_elapsed / graph_elapsed:.1f}"
+    )
+    print(f"get_patterns_batch, aspects included: {batch_elapsed:.2f}s ({batch_elapsed / charts * 1000:.2f}ms/chart)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: aspects between two lists of points with the vectorized iter_aspects_matrix against
+the double loop on get_aspect_from_two_points, for growing lists of points (random positions).
+
+Usage:
+    python -m benchmarks.aspects_matrix_benchmark [repetitions]
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from kerykeion.aspects.aspects_utils import get_aspect_from_two_points, iter_aspects_matrix
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_ASPECTS
+from kerykeion.settings.kerykeion_settings import get_settings
+
+
+def main(repetitions: int = 200) -> None:
+    orbs = {aspect["name"]: aspect["orb"] for aspect in DEFAULT_ACTIVE_ASPECTS}
+    aspects_settings = [
+        {"name": aspect["name"], "degree": aspect["degree"], "orb": orbs[aspect["name"]]} for aspect in get_settings().aspects if aspect["name"] in orbs
+    ]
+    random_generator = random.Random(42)
+
+    # Warm up NumPy
+    list(iter_aspects_matrix(aspects_settings, [0.0], [0.0]))
+
+    for points_count in (13, 20, 50, 100):
+        first_positions = [random_generator.uniform(0, 360) for _ in range(points_count)]
+        second_positions = [random_generator.uniform(0, 360) for _ in range(points_count)]
+
+        start = perf_counter()
+        for _ in range(repetitions):
+            for first_position in first_positions:
+                for second_position in second_positions:
+                    get_aspect_from_two_points(aspects_settings, first_position, second_position)
+        loop_elapsed = (perf_counter() - start) / repetitions
+
+        start = perf_counter()
+        for _ in range(repetitions):
+            for _ in iter_aspects_matrix(aspects_settings, first_positions, second_positions):
+                pass
+        matrix_elapsed = (perf_counter() - start) / repetitions
+
+        print(
+            f"{points_count}x{points_count} points: double loop {loop_elapsed * 1000:.3f}ms, "
+            f"matrix {matrix_elapsed * 1000:.3f}ms, x{loop_elapsed / matrix_elapsed:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: samples/sec of the columnar ephemeris against EphemerisDataFactory.get_ephemeris_data,
+at 1-minute steps. The rates are measured on a short range and extrapolated to a year.
+
+Usage:
+    python -m benchmarks.columnar_ephemeris_benchmark [minutes]
+"""
+
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from kerykeion import EphemerisDataFactory
+
+MINUTES_PER_YEAR = 525600
+
+
+def main(minutes: int = 1440) -> None:
+    start_datetime = datetime(2025, 1, 1)
+    factory = EphemerisDataFactory(
+        start_datetime=start_datetime,
+        end_datetime=start_datetime + timedelta(minutes=minutes - 1),
+        step_type="minutes",
+        max_minutes=None,
+    )
+
+    cases = (
+        ("get_ephemeris_data", lambda: factory.get_ephemeris_data()),
+        ("columnar, all the planets", lambda: factory.get_columnar_ephemeris_data()),
+        ("columnar, all + houses", lambda: factory.get_columnar_ephemeris_data(include_houses=True)),
+        ("columnar, Sun and Moon", lambda: factory.get_columnar_ephemeris_data(bodies=["Sun", "Moon"])),
+    )
+
+    reference_rate = None
+    for label, function in cases:
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+
+        rate = minutes / elapsed
+        reference_rate = reference_rate or rate
+        print(
+            f"{label:<28} {minutes} samples in {elapsed:.2f}s -> {rate:,.0f} samples/sec, "
+            f"one year ~{MINUTES_PER_YEAR / rate / 60:.1f} min, x{rate / reference_rate:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1440)
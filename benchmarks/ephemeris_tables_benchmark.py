@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: body states/sec read from the Chebyshev ephemeris tables against swe.calc_ut,
+and the columnar ephemeris with and without the tables, at 1-minute steps.
+The tables of the benchmark cover one month and are built in a temporary directory.
+
+Usage:
+    python -m benchmarks.ephemeris_tables_benchmark [minutes]
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import swisseph as swe
+
+from kerykeion import ChebyshevEphemeris, ColumnarEphemerisFactory
+from kerykeion.ephemeris_tables import DEFAULT_TABLES_BODIES
+from kerykeion.utilities import get_number_from_name
+
+START_JULIAN_DAY = 2460676.5
+
+
+def main(minutes: int = 1440) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        start = perf_counter()
+        tables_path = ChebyshevEphemeris.build(Path(directory) / "benchmark.krcheb", START_JULIAN_DAY, START_JULIAN_DAY + 31)
+        print(f"Tables of 31 days built in {perf_counter() - start:.2f}s, {tables_path.stat().st_size / 1024:.0f} KB")
+
+        tables = ChebyshevEphemeris(tables_path)
+        planet_numbers = [get_number_from_name(body) for body in DEFAULT_TABLES_BODIES]
+        julian_days = [START_JULIAN_DAY + minute / 1440 for minute in range(minutes)]
+        states_count = minutes * len(planet_numbers)
+
+        start = perf_counter()
+        for julian_day in julian_days:
+            for planet_number in planet_numbers:
+                swe.calc_ut(julian_day, planet_number, tables.iflag)
+        calc_ut_rate = states_count / (perf_counter() - start)
+
+        start = perf_counter()
+        for julian_day in julian_days:
+            for planet_number in planet_numbers:
+                tables.get_body_state(julian_day, planet_number)
+        tables_rate = states_count / (perf_counter() - start)
+
+        print(f"{'swe.calc_ut':<28} {calc_ut_rate:,.0f} states/sec")
+        print(f"{'tables, get_body_state':<28} {tables_rate:,.0f} states/sec, x{tables_rate / calc_ut_rate:.1f}")
+
+        end_julian_day = julian_days[-1]
+        cases = (
+            ("columnar, swe.calc_ut", lambda: ColumnarEphemerisFactory(START_JULIAN_DAY, end_julian_day, step=1 / 1440).get_ephemeris_arrays()),
+            ("columnar, tables", lambda: ColumnarEphemerisFactory(START_JULIAN_DAY, end_julian_day, step=1 / 1440, ephemeris_tables=tables).get_ephemeris_arrays()),
+        )
+
+        reference_rate = None
+        for label, function in cases:
+            start = perf_counter()
+            function()
+            rate = minutes / (perf_counter() - start)
+            reference_rate = reference_rate or rate
+            print(f"{label:<28} {rate:,.0f} samples/sec, x{rate / reference_rate:.1f}")
+
+        tables.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1440)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: scaling of EphemerisDataFactory.get_ephemeris_data with 1, 2, 4 and 8 worker processes,
+on an hourly range for a fixed location. The speedup is bounded by the CPU cores of the machine.
+
+Usage:
+    python -m benchmarks.parallel_ephemeris_benchmark [hours]
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from kerykeion import EphemerisDataFactory
+
+HOURS_IN_TWO_YEARS = 17520
+
+
+def main(hours: int = 2000) -> None:
+    start_datetime = datetime(2025, 1, 1)
+    print(f"{hours} hourly dates, {os.cpu_count()} CPU cores")
+
+    reference_rate = None
+    for workers in (1, 2, 4, 8):
+        factory = EphemerisDataFactory(
+            start_datetime=start_datetime,
+            end_datetime=start_datetime + timedelta(hours=hours - 1),
+            step_type="hours",
+            lat=41.9027,
+            lng=12.4963,
+            tz_str="Europe/Rome",
+            max_hours=None,
+            workers=workers,
+        )
+
+        start = perf_counter()
+        factory.get_ephemeris_data()
+        elapsed = perf_counter() - start
+
+        rate = hours / elapsed
+        reference_rate = reference_rate or rate
+        print(
+            f"{workers} workers: {elapsed:.2f}s -> {rate:,.0f} dates/sec, "
+            f"two years ~{HOURS_IN_TWO_YEARS / rate:.0f}s, x{rate / reference_rate:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: memory and creation time of KerykeionPoint against KerykeionPointModel.
+
+Usage:
+    python -m benchmarks.point_memory_benchmark [points]
+"""
+
+import gc
+import sys
+import tracemalloc
+from time import perf_counter
+
+from kerykeion.kr_types import KerykeionPoint
+from kerykeion.utilities import get_kerykeion_point_from_degree
+
+
+def build_compact_points(count: int) -> list:
+    return [
+        KerykeionPoint("Sun", (i * 0.37) % 360, "Planet", house="First_House", retrograde=False, speed=0.98)
+        for i in range(count)
+    ]
+
+
+def build_pydantic_points(count: int) -> list:
+    points = []
+    for i in range(count):
+        point = get_kerykeion_point_from_degree((i * 0.37) % 360, "Sun", "Planet")
+        point.house = "First_House"
+        point.retrograde = False
+        point.speed = 0.98
+        points.append(point)
+
+    return points
+
+
+def main(count: int = 1_000_000) -> None:
+    for label, function in (("KerykeionPoint", build_compact_points), ("KerykeionPointModel", build_pydantic_points)):
+        gc.collect()
+        tracemalloc.start()
+
+        start = perf_counter()
+        points = function(count)
+        elapsed = perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+
+        tracemalloc.stop()
+        del points
+
+        print(f"{label:<20} {count:,} points in {elapsed:.2f}s, held {current / 2**20:,.0f} MiB (peak {peak / 2**20:,.0f} MiB), {current / count:,.0f} bytes/point")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: rows/sec of SubjectBatchFactory against the AstrologicalSubject loop.
+The subjects of the batch are the same of the loop, get_positions skips the subjects
+and their models and returns only the positions, as NumPy columns.
+
+Usage:
+    python -m benchmarks.subject_batch_benchmark [rows]
+"""
+
+import sys
+import random
+from time import perf_counter
+
+from kerykeion import AstrologicalSubject, SubjectBatchFactory
+
+
+def get_records(rows: int) -> list[dict]:
+    randomizer = random.Random(42)
+    timezones = [("Europe/London", -0.13, 51.51), ("Europe/Rome", 12.5, 41.9), ("America/New_York", -74.0, 40.71), ("Asia/Tokyo", 139.69, 35.69)]
+
+    records = []
+    for i in range(rows):
+        tz_str, lng, lat = randomizer.choice(timezones)
+        records.append({
+            "name": f"Subject {i}",
+            "year": randomizer.randint(1930, 2020),
+            "month": randomizer.randint(1, 12),
+            "day": randomizer.randint(1, 28),
+            "hour": randomizer.randint(0, 23),
+            "minute": randomizer.randint(0, 59),
+            "lng": lng,
+            "lat": lat,
+            "tz_str": tz_str,
+            "is_dst": False,
+        })
+
+    return records
+
+
+def run_loop(records: list[dict]) -> list:
+    return [
+        AstrologicalSubject(
+            r["name"], r["year"], r["month"], r["day"], r["hour"], r["minute"],
+            lng=r["lng"], lat=r["lat"], tz_str=r["tz_str"], is_dst=r["is_dst"], online=False
+        ).model()
+        for r in records
+    ]
+
+
+def run_batch(records: list[dict]) -> list:
+    return SubjectBatchFactory().get_astrological_subjects(records, as_model=True)
+
+
+def run_batch_positions(records: list[dict]) -> dict:
+    return SubjectBatchFactory().get_positions(records)
+
+
+def main(rows: int = 2000) -> None:
+    records = get_records(rows)
+
+    for label, function in (
+        ("AstrologicalSubject loop", run_loop),
+        ("SubjectBatchFactory", run_batch),
+        ("SubjectBatchFactory positions", run_batch_positions),
+    ):
+        start = perf_counter()
+        function(records)
+        elapsed = perf_counter() - start
+        print(f"{label:<30} {rows} rows in {elapsed:.2f}s -> {rows / elapsed:,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
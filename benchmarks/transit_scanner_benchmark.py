@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: exact transits of a month for N natal charts, with one TransitScannerFactory pass
+against one ExactTransitsFactory per chart (measured on the first 20 charts and extrapolated).
+
+Usage:
+    python -m benchmarks.transit_scanner_benchmark [charts]
+"""
+
+import random
+import sys
+from datetime import datetime
+from time import perf_counter
+
+from kerykeion import AstrologicalSubject, ExactTransitsFactory, TransitScannerFactory
+
+START_DATETIME = datetime(2025, 1, 1)
+END_DATETIME = datetime(2025, 2, 1)
+PER_CHART_SAMPLE = 20
+
+
+def get_natal_charts(count: int) -> list[AstrologicalSubject]:
+    random_generator = random.Random(42)
+    return [
+        AstrologicalSubject(
+            f"Subject {index}",
+            random_generator.randint(1940, 2005),
+            random_generator.randint(1, 12),
+            random_generator.randint(1, 28),
+            random_generator.randint(0, 23),
+            random_generator.randint(0, 59),
+            lng=12.4963,
+            lat=41.9027,
+            tz_str="Europe/Rome",
+            online=False,
+        )
+        for index in range(count)
+    ]
+
+
+def main(charts_count: int = 1000) -> None:
+    natal_charts = get_natal_charts(charts_count)
+
+    start = perf_counter()
+    for natal_chart in natal_charts[:PER_CHART_SAMPLE]:
+        ExactTransitsFactory(natal_chart, START_DATETIME, END_DATETIME).get_exact_transits()
+    per_chart_elapsed = (perf_counter() - start) / min(PER_CHART_SAMPLE, charts_count) * charts_count
+
+    for count in sorted({max(charts_count // 10, 1), charts_count}):
+        start = perf_counter()
+        transits_count = sum(1 for _ in TransitScannerFactory(natal_charts[:count], START_DATETIME, END_DATETIME).iter_exact_transits())
+        elapsed = perf_counter() - start
+        print(f"scanner, {count} charts: {elapsed:.2f}s, {transits_count:,} transits, {transits_count / elapsed:,.0f} transits/sec")
+
+    print(f"ExactTransitsFactory per chart, {charts_count} charts: ~{per_chart_elapsed:.2f}s, x{per_chart_elapsed / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
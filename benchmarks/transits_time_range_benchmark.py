@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+
+Benchmark: TransitsTimeRangeFactory.get_transit_moments over a daily range, with the compiled
+SynastryAspectsContext against a SynastryAspects per ephemeris data point (the previous implementation).
+The ephemeris data points are calculated before the measures.
+
+Usage:
+    python -m benchmarks.transits_time_range_benchmark [days]
+"""
+
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from kerykeion import AstrologicalSubject, EphemerisDataFactory, SynastryAspects, TransitsTimeRangeFactory
+
+
+def main(days: int = 365) -> None:
+    natal_chart = AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False)
+    ephemeris_data_points = EphemerisDataFactory(
+        start_datetime=datetime(2025, 1, 1),
+        end_datetime=datetime(2025, 1, 1) + timedelta(days=days - 1),
+        step_type="days",
+        lat=natal_chart.lat,
+        lng=natal_chart.lng,
+        tz_str=natal_chart.tz_str,
+        max_days=None,
+    ).get_ephemeris_data_as_astrological_subjects()
+
+    start = perf_counter()
+    previous_aspects = [SynastryAspects(ephemeris_point, natal_chart).relevant_aspects for ephemeris_point in ephemeris_data_points]
+    previous_elapsed = perf_counter() - start
+
+    start = perf_counter()
+    transits = TransitsTimeRangeFactory(natal_chart, ephemeris_data_points).get_transit_moments()
+    elapsed = perf_counter() - start
+
+    assert [moment.aspects for moment in transits.transits] == previous_aspects
+
+    print(f"{'SynastryAspects per point':<28} {previous_elapsed:.2f}s, {days / previous_elapsed:,.0f} points/sec")
+    print(f"{'compiled aspects context':<28} {elapsed:.2f}s, {days / elapsed:,.0f} points/sec, x{previous_elapsed / elapsed:.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 365)
@@ -11,10 +11,21 @@ from .charts.kerykeion_chart_svg import KerykeionChartSVG
 from .kr_types import *
 from .relationship_score.relationship_score import RelationshipScore
 from .relationship_score.relationship_score_factory import RelationshipScoreFactory
-from .aspects import SynastryAspects, NatalAspects
+from .aspects import SynastryAspects, NatalAspects, SynastryAspectsContext, AspectPatternsFactory
 from .report import Report
 from .settings import KerykeionSettingsModel, get_settings
 from .enums import Planets, Aspects, Signs
 from .ephemeris_data import EphemerisDataFactory
 from .composite_subject_factory import CompositeSubjectFactory
 from .transits_time_range import TransitsTimeRangeFactory
+from .subject_batch_factory import SubjectBatchFactory
+from .swiss_ephemeris_context import SwissEphemerisContext
+from .subject_cache import SubjectCache, InMemorySubjectCacheBackend, SQLiteSubjectCacheBackend
+from .offline_gazetteer import OfflineGazetteer
+from .timezone_resolver import TimezoneResolver
+from .columnar_ephemeris import ColumnarEphemerisFactory
+from .ephemeris_tables import ChebyshevEphemeris
+from .adaptive_ephemeris import AdaptiveEphemerisFactory
+from .exact_transits import ExactTransitsFactory
+from .transit_scanner import TransitScannerFactory
+from .transit_tracker import TransitTracker
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import heapq
+from datetime import datetime, timezone
+from typing import Iterator, Mapping, Union, get_args, TYPE_CHECKING
+
+from kerykeion.astrological_subject import DEFAULT_PERSPECTIVE_TYPE, DEFAULT_ZODIAC_TYPE
+from kerykeion.columnar_ephemeris import DEFAULT_COLUMNAR_BODIES, UNIX_EPOCH_JULIAN_DAY, get_body_state, get_swisseph_flags
+from kerykeion.kr_types import EphemerisSampleModel, KerykeionException, KerykeionPoint, Planet, PerspectiveType, SiderealMode, ZodiacType
+from kerykeion.utilities import get_number_from_name
+
+if TYPE_CHECKING:
+    from kerykeion.ephemeris_tables import ChebyshevEphemeris
+
+
+DEFAULT_MIN_STEP = 1 / 1440
+"""The shortest step between two samples of a body, in days (one minute)."""
+
+DEFAULT_MAX_STEP = 30.0
+"""The longest step between two samples of a body, in days."""
+
+_BodyState = tuple[float, float, float, float]
+
+
+class AdaptiveEphemerisFactory:
+    """
+    Ephemeris sampled with a different time step for every body, from a target angular resolution.
+
+    The step of every body follows its speed: the next sample is taken when the body is expected
+    to have moved by the resolution, and the step is shortened when it moved more than that,
+    so two consecutive samples of a body are never more than the resolution apart in longitude
+    (unless the step reaches min_step). A slow planet needs a few samples per year, the Moon
+    hundreds, instead of the same fixed step for all of them.
+
+    The samples of all the bodies are merged in a single stream ordered by time.
+
+    Args:
+    - start_julian_day (float): The first julian day (UT) of the range, every body is sampled at it.
+    - end_julian_day (float): The last julian day (UT) of the range, every body is sampled at it.
+    - resolution (Union[float, Mapping[Planet, float]], optional): The angular resolution in degrees,
+        for all the bodies or for each body. Defaults to 1.
+    - bodies (list[Planet], optional): The bodies to sample. Defaults to the bodies of the resolution mapping,
+        or to DEFAULT_COLUMNAR_BODIES.
+    - zodiac_type (ZodiacType, optional): The zodiac type. Defaults to DEFAULT_ZODIAC_TYPE.
+    - sidereal_mode (SiderealMode, optional): The sidereal mode, for the Sidereal zodiac. Defaults to None (FAGAN_BRADLEY).
+    - perspective_type (PerspectiveType, optional): The perspective. Defaults to DEFAULT_PERSPECTIVE_TYPE.
+    - lat (float, optional): The latitude, for the Topocentric perspective. Defaults to 51.4769 (Greenwich).
+    - lng (float, optional): The longitude, for the Topocentric perspective. Defaults to 0.0005 (Greenwich).
+    - min_step (float, optional): The shortest step, in days. Defaults to DEFAULT_MIN_STEP.
+    - max_step (float, optional): The longest step, in days. Defaults to DEFAULT_MAX_STEP.
+    - ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables used instead of the Swiss Ephemeris
+        for the bodies and dates they cover. Defaults to None.
+
+    Example:
+        factory = AdaptiveEphemerisFactory(2460676.5, 2461041.5, resolution={"Moon": 0.5, "Pluto": 0.5})
+        for sample in factory.iter_samples():
+            print(sample["date"], sample["point"].name, sample["point"].abs_pos)
+    """
+
+    def __init__(
+        self,
+        start_julian_day: float,
+        end_julian_day: float,
+        resolution: Union[float, Mapping[Planet, float]] = 1.0,
+        bodies: Union[list[Planet], tuple[Planet, ...], None] = None,
+        zodiac_type: ZodiacType = DEFAULT_ZODIAC_TYPE,
+        sidereal_mode: Union[SiderealMode, None] = None,
+        perspective_type: PerspectiveType = DEFAULT_PERSPECTIVE_TYPE,
+        lat: float = 51.4769,
+        lng: float = 0.0005,
+        min_step: float = DEFAULT_MIN_STEP,
+        max_step: float = DEFAULT_MAX_STEP,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+    ):
+        if end_julian_day < start_julian_day:
+            raise ValueError("No dates found. The end of the range is before the start.")
+
+        if not 0 < min_step <= max_step:
+            raise ValueError(f"Invalid steps: {min_step}, {max_step}. The steps must be positive and min_step <= max_step.")
+
+        if bodies is None:
+            bodies = list(resolution) if isinstance(resolution, Mapping) else DEFAULT_COLUMNAR_BODIES
+
+        self.start_julian_day = float(start_julian_day)
+        self.end_julian_day = float(end_julian_day)
+        self.bodies: list[Planet] = list(bodies)
+        self.zodiac_type = zodiac_type
+        self.sidereal_mode = sidereal_mode
+        self.perspective_type = perspective_type
+        self.lat = lat
+        self.lng = lng
+        self.min_step = min_step
+        self.max_step = max_step
+        self.ephemeris_tables = ephemeris_tables
+
+        self.resolutions: dict[Planet, float] = {}
+        for body in self.bodies:
+            if body not in get_args(Planet):
+                raise KerykeionException(f"'{body}' is not a valid body! Available bodies are: {get_args(Planet)}")
+
+            if isinstance(resolution, Mapping) and body not in resolution:
+                raise KerykeionException(f"No resolution given for {body}!")
+
+            self.resolutions[body] = resolution[body] if isinstance(resolution, Mapping) else resolution
+            if self.resolutions[body] <= 0:
+                raise ValueError(f"Invalid resolution for {body}: {self.resolutions[body]}. The resolution must be a positive number of degrees.")
+
+        if self.zodiac_type not in get_args(ZodiacType):
+            raise KerykeionException(f"'{self.zodiac_type}' is NOT a valid zodiac type! Available types are: {get_args(ZodiacType)}")
+
+        if self.sidereal_mode and self.zodiac_type == "Tropic":
+            raise KerykeionException("You can't set a sidereal mode with a Tropic zodiac type!")
+
+        if self.zodiac_type == "Sidereal" and not self.sidereal_mode:
+            self.sidereal_mode = "FAGAN_BRADLEY"
+
+        self._iflag = get_swisseph_flags(self.zodiac_type, self.perspective_type)
+        self._topo = (self.lng, self.lat, 0) if self.perspective_type == "Topocentric" else None
+
+    def _get_body_state(self, julian_day: float, planet_number: int) -> _BodyState:
+        """
+        Returns longitude, latitude, distance and speed of a body.
+        """
+        longitude, latitude, distance, speed, _, _ = get_body_state(
+            julian_day, planet_number, self._iflag, self.sidereal_mode, self._topo, self.ephemeris_tables
+        )
+        return longitude, latitude, distance, speed
+
+    def _iter_body_samples(self, body: Planet) -> Iterator[tuple[float, Planet, _BodyState]]:
+        """
+        Yields the samples of a body as (julian day, body, state), stepping by its speed.
+        """
+        planet_number = get_number_from_name(body)
+        resolution = self.resolutions[body]
+
+        julian_day = self.start_julian_day
+        state = self._get_body_state(julian_day, planet_number)
+        yield julian_day, body, state
+
+        while julian_day < self.end_julian_day:
+            step = min(max(resolution / max(abs(state[3]), 1e-9), self.min_step), self.max_step)
+
+            while True:
+                next_julian_day = min(julian_day + step, self.end_julian_day)
+                next_state = self._get_body_state(next_julian_day, planet_number)
+                moved = abs((next_state[0] - state[0] + 180) % 360 - 180)
+
+                if moved <= resolution or next_julian_day - julian_day <= self.min_step:
+                    break
+
+                # Faster than expected (the body is accelerating), a shorter step with a small margin
+                step = max((next_julian_day - julian_day) * resolution / moved * 0.9, self.min_step)
+
+            julian_day, state = next_julian_day, next_state
+            yield julian_day, body, state
+
+    def iter_samples(self, as_model: bool = False) -> Iterator[Union[dict, EphemerisSampleModel]]:
+        """
+        Yields the samples of all the bodies, ordered by time (and by the order of the bodies at the same time).
+
+        Args:
+        - as_model (bool, optional): If True, EphemerisSampleModel instances are yielded. Defaults to False.
+
+        Returns:
+        - Iterator[Union[dict, EphemerisSampleModel]]: The samples, with "date" (UTC ISO 8601), "julian_day"
+            and "point" (a KerykeionPoint without the house).
+        """
+        streams = [self._iter_body_samples(body) for body in self.bodies]
+
+        for julian_day, body, (longitude, latitude, distance, speed) in heapq.merge(*streams, key=lambda sample: sample[0]):
+            date = datetime.fromtimestamp(round((julian_day - UNIX_EPOCH_JULIAN_DAY) * 86400, 3), tz=timezone.utc)
+            point = KerykeionPoint(body, longitude, "Planet", retrograde=speed < 0, speed=speed, latitude=latitude, distance=distance)
+            if as_model:
+                yield EphemerisSampleModel(date=date.isoformat(), julian_day=julian_day, point=point.model())
+            else:
+                yield {"date": date.isoformat(), "julian_day": julian_day, "point": point}
+
+
+if __name__ == "__main__":
+    from collections import Counter
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    factory = AdaptiveEphemerisFactory(2460676.5, 2461041.5, resolution=1.0)
+    samples_count = Counter(sample["point"].name for sample in factory.iter_samples())
+
+    # One hourly sample per body for a year would be 8761
+    print(samples_count)
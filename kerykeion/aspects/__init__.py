@@ -9,3 +9,6 @@ The aspects module contains the classes and functions for calculating
 
 from .synastry_aspects import SynastryAspects
 from .natal_aspects import NatalAspects
+from .aspects_context import SynastryAspectsContext
+from .compiled_aspect_config import CompiledAspectConfig, get_compiled_aspect_config
+from .aspect_patterns import AspectPatternsFactory, find_aspect_patterns
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+from collections import defaultdict
+from itertools import combinations
+from pathlib import Path
+from typing import Iterable, Iterator, Union, List, Mapping, Optional
+
+from kerykeion import AstrologicalSubject
+from kerykeion.aspects.natal_aspects import NatalAspects
+from kerykeion.aspects.synastry_aspects import SynastryAspects
+from kerykeion.kr_types import CompositeSubjectModel, KerykeionException
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel, AspectModel, AspectPatternModel, ActiveAspect
+from kerykeion.kr_types.kr_literals import AspectPatternName, AxialCusps, Planet
+from kerykeion.kr_types.settings_models import KerykeionSettingsModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+
+
+DEFAULT_PATTERNS_ACTIVE_ASPECTS: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS + [{"name": "quincunx", "orb": 2}]
+"""
+Default list of active aspects of the aspect patterns: the default active aspects and the quincunx, for the Yod.
+"""
+
+DEFAULT_STELLIUM_MIN_SIZE = 3
+"""The minimum number of conjunct points of a Stellium."""
+
+# (owner, point name)
+_PatternNode = tuple[str, str]
+
+
+class _AspectGraph:
+    """
+    The points of a list of aspects and their adjacency sets, one for each aspect name.
+    The points are numbered in the order of their first aspect.
+    """
+
+    def __init__(self, aspects: Iterable[AspectModel]):
+        self.nodes: list[_PatternNode] = []
+        self.edges: dict[tuple[int, int], AspectModel] = {}
+        self.adjacency: defaultdict[str, defaultdict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+
+        indexes: dict[_PatternNode, int] = {}
+        for aspect in aspects:
+            first = indexes.setdefault((aspect.p1_owner, aspect.p1_name), len(indexes))
+            second = indexes.setdefault((aspect.p2_owner, aspect.p2_name), len(indexes))
+            if first == second:
+                continue
+
+            self.edges[(min(first, second), max(first, second))] = aspect
+            self.adjacency[aspect.aspect][first].add(second)
+            self.adjacency[aspect.aspect][second].add(first)
+
+        self.nodes = list(indexes)
+
+    def neighbours(self, aspect_name: str, node: int) -> set[int]:
+        """
+        Returns the points in the aspect with a point, empty if there are none.
+        """
+        aspect_adjacency = self.adjacency.get(aspect_name)
+        if aspect_adjacency is None:
+            return set()
+
+        return aspect_adjacency.get(node, set())
+
+    def iter_edges(self, aspect_name: str) -> Iterator[tuple[int, int]]:
+        """
+        Yields the pairs of points in an aspect, once each, as (lower, higher) index.
+        """
+        for node, neighbours in sorted(self.adjacency.get(aspect_name, {}).items()):
+            for neighbour in sorted(neighbours):
+                if node < neighbour:
+                    yield node, neighbour
+
+    def iter_triangles(self, aspect_name: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yields the triangles of an aspect (e.g. the trines of a Grand Trine), once each, ordered by index.
+        """
+        for first, second in self.iter_edges(aspect_name):
+            for third in sorted(self.neighbours(aspect_name, first) & self.neighbours(aspect_name, second)):
+                if third > second:
+                    yield first, second, third
+
+    def iter_maximal_cliques(self, aspect_name: str) -> Iterator[list[int]]:
+        """
+        Yields the maximal cliques of an aspect (Bron–Kerbosch with pivoting), ordered by index.
+        """
+        adjacency = self.adjacency.get(aspect_name)
+        if not adjacency:
+            return
+
+        def expand(clique: list[int], candidates: set[int], excluded: set[int]) -> Iterator[list[int]]:
+            if not candidates and not excluded:
+                yield sorted(clique)
+                return
+
+            # The pivot with the most candidates among its neighbours leaves the fewest branches
+            pivot = max(candidates | excluded, key=lambda node: len(adjacency[node] & candidates))
+            for node in sorted(candidates - adjacency[pivot]):
+                yield from expand(clique + [node], candidates & adjacency[node], excluded & adjacency[node])
+                candidates = candidates - {node}
+                excluded = excluded | {node}
+
+        yield from expand([], set(adjacency), set())
+
+
+def _get_pattern(
+    graph: _AspectGraph, name: AspectPatternName, points: Iterable[int], apex: Optional[int] = None
+) -> AspectPatternModel:
+    """
+    Returns the model of a pattern, with the aspects between its points.
+    """
+    points = list(points)
+    aspects = []
+    for first, second in combinations(points, 2):
+        aspect = graph.edges.get((min(first, second), max(first, second)))
+        if aspect is not None:
+            aspects.append(aspect)
+
+    return AspectPatternModel(
+        name=name,
+        points=[graph.nodes[point][1] for point in points],
+        owners=[graph.nodes[point][0] for point in points],
+        apex=None if apex is None else graph.nodes[apex][1],
+        apex_owner=None if apex is None else graph.nodes[apex][0],
+        aspects=aspects,
+    )
+
+
+def find_aspect_patterns(
+    aspects: Iterable[AspectModel],
+    stellium_min_size: int = DEFAULT_STELLIUM_MIN_SIZE,
+) -> list[AspectPatternModel]:
+    """
+    Finds the aspect patterns in a list of aspects.
+
+    The aspects are turned into a graph of the points, with an adjacency set for each aspect,
+    and the patterns are the triangles, the squares and the cliques of the graph:
+
+    - Grand Trine: three points in trine to each other.
+    - T-Square: two points in opposition, both in square to the apex.
+    - Grand Cross: two oppositions, each point in square to the points of the other opposition.
+    - Yod: two points in sextile, both in quincunx to the apex.
+    - Kite: a Grand Trine and a point, the apex, in opposition to one of its points and in sextile to the others.
+    - Stellium: stellium_min_size or more points, all in conjunction to each other (a maximal clique).
+
+    Every pattern is reported, also when it is part of a larger one (e.g. the T-Squares of a Grand Cross).
+    The points are identified by owner and name, so the aspects can be of a natal chart, of a composite chart
+    or of two charts (e.g. the natal aspects of both subjects and their synastry aspects).
+
+    Args:
+    - aspects (Iterable[AspectModel]): The aspects, e.g. NatalAspects.relevant_aspects.
+    - stellium_min_size (int, optional): The minimum number of points of a Stellium. Defaults to DEFAULT_STELLIUM_MIN_SIZE.
+
+    Returns:
+    - list[AspectPatternModel]: The patterns, in the order of AspectPatternName and then of the points.
+    """
+    if stellium_min_size < 2:
+        raise KerykeionException(f"Invalid stellium_min_size: {stellium_min_size}. A Stellium has at least 2 points.")
+
+    graph = _AspectGraph(aspects)
+    patterns = []
+
+    grand_trines = list(graph.iter_triangles("trine"))
+    for grand_trine in grand_trines:
+        patterns.append(_get_pattern(graph, "Grand Trine", grand_trine))
+
+    for first, second in graph.iter_edges("opposition"):
+        for apex in sorted(graph.neighbours("square", first) & graph.neighbours("square", second)):
+            patterns.append(_get_pattern(graph, "T-Square", (first, second, apex), apex))
+
+    for first, second in graph.iter_edges("opposition"):
+        squares = graph.neighbours("square", first) & graph.neighbours("square", second)
+        for third in sorted(squares):
+            for fourth in sorted(graph.neighbours("opposition", third) & squares):
+                # Each cross has two oppositions, it's reported from the one with the lowest point
+                if third < fourth and first < third:
+                    patterns.append(_get_pattern(graph, "Grand Cross", (first, third, second, fourth)))
+
+    for first, second in graph.iter_edges("sextile"):
+        for apex in sorted(graph.neighbours("quincunx", first) & graph.neighbours("quincunx", second)):
+            patterns.append(_get_pattern(graph, "Yod", (first, second, apex), apex))
+
+    for grand_trine in grand_trines:
+        for opposed in grand_trine:
+            first, second = [point for point in grand_trine if point != opposed]
+            apexes = graph.neighbours("opposition", opposed) & graph.neighbours("sextile", first) & graph.neighbours("sextile", second)
+            for apex in sorted(apexes):
+                patterns.append(_get_pattern(graph, "Kite", grand_trine + (apex,), apex))
+
+    for clique in graph.iter_maximal_cliques("conjunction"):
+        if len(clique) >= stellium_min_size:
+            patterns.append(_get_pattern(graph, "Stellium", clique))
+
+    return patterns
+
+
+class AspectPatternsFactory:
+    """
+    Finds the aspect patterns (Grand Trine, T-Square, Grand Cross, Yod, Kite, Stellium) of charts.
+
+    The patterns of a subject (natal or composite chart) are found in its relevant natal aspects,
+    the patterns of two subjects in the relevant natal aspects of both and in their relevant synastry aspects.
+    The settings are compiled once for all the charts (see get_compiled_aspect_config).
+
+    Args:
+    - new_settings_file (Union[Path, KerykeionSettingsModel, dict], optional): Custom settings. Defaults to None.
+    - active_points (list[Union[AxialCusps, Planet]], optional): The points to consider. Defaults to DEFAULT_ACTIVE_POINTS.
+    - active_aspects (list[ActiveAspect], optional): The aspects and their orbs. Defaults to DEFAULT_PATTERNS_ACTIVE_ASPECTS.
+    - points_orbs (Mapping[str, float], optional): The maximum orbit of the relevant aspects of the points, by name.
+        Defaults to None (only the axes orbit of the settings).
+    - stellium_min_size (int, optional): The minimum number of points of a Stellium. Defaults to DEFAULT_STELLIUM_MIN_SIZE.
+
+    Example:
+        factory = AspectPatternsFactory()
+        natal_patterns = factory.get_patterns(john)
+        synastry_patterns = factory.get_patterns(john, yoko)
+        for patterns in factory.iter_patterns(subjects):
+            ...
+    """
+
+    def __init__(
+        self,
+        new_settings_file: Union[Path, KerykeionSettingsModel, dict, None] = None,
+        active_points: List[Union[AxialCusps, Planet]] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_PATTERNS_ACTIVE_ASPECTS,
+        points_orbs: Optional[Mapping[str, float]] = None,
+        stellium_min_size: int = DEFAULT_STELLIUM_MIN_SIZE,
+    ):
+        if stellium_min_size < 2:
+            raise KerykeionException(f"Invalid stellium_min_size: {stellium_min_size}. A Stellium has at least 2 points.")
+
+        self.new_settings_file = new_settings_file
+        self.active_points = active_points
+        self.active_aspects = active_aspects
+        self.points_orbs = points_orbs
+        self.stellium_min_size = stellium_min_size
+
+    def get_aspects(
+        self,
+        first_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        second_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel, None] = None,
+    ) -> list[AspectModel]:
+        """
+        Returns the relevant aspects the patterns are found in: the natal aspects of the first subject,
+        and with a second subject its natal aspects and the synastry aspects of the two subjects.
+        """
+        aspects = list(self._get_natal_aspects(first_subject))
+        if second_subject is None:
+            return aspects
+
+        if first_subject.name == second_subject.name:
+            raise KerykeionException("The two subjects of the aspect patterns must have different names!")
+
+        aspects.extend(self._get_natal_aspects(second_subject))
+        aspects.extend(
+            SynastryAspects(
+                first_subject, second_subject, self.new_settings_file, self.active_points, self.active_aspects, self.points_orbs
+            ).relevant_aspects
+        )
+        return aspects
+
+    def _get_natal_aspects(self, subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel]) -> list[AspectModel]:
+        return NatalAspects(subject, self.new_settings_file, self.active_points, self.active_aspects, self.points_orbs).relevant_aspects
+
+    def get_patterns(
+        self,
+        first_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        second_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel, None] = None,
+    ) -> list[AspectPatternModel]:
+        """
+        Returns the aspect patterns of a subject, or of two subjects (their points by owner).
+
+        Args:
+        - first_subject: The subject, or the first subject of a synastry.
+        - second_subject (optional): The second subject of a synastry. Defaults to None.
+
+        Returns:
+        - list[AspectPatternModel]: The patterns, like find_aspect_patterns.
+        """
+        return find_aspect_patterns(self.get_aspects(first_subject, second_subject), self.stellium_min_size)
+
+    def iter_patterns(
+        self, subjects: Iterable[Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel]]
+    ) -> Iterator[list[AspectPatternModel]]:
+        """
+        Yields the aspect patterns of many subjects, one list for each subject, in the same order.
+
+        Args:
+        - subjects (Iterable): A list or an iterator of subjects, e.g. SubjectBatchFactory.iter_astrological_subjects.
+        """
+        for subject in subjects:
+            yield self.get_patterns(subject)
+
+    def get_patterns_batch(
+        self, subjects: Iterable[Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel]]
+    ) -> list[list[AspectPatternModel]]:
+        """
+        Returns the aspect patterns of many subjects, one list for each subject, in the same order.
+        """
+        return list(self.iter_patterns(subjects))
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+
+    setup_logging(level="debug")
+
+    john = AstrologicalSubject("John", 1940, 10, 9, 10, 30, "Liverpool", "GB")
+    yoko = AstrologicalSubject("Yoko", 1933, 2, 18, 10, 30, "Tokyo", "JP")
+
+    factory = AspectPatternsFactory()
+    for pattern in factory.get_patterns(john):
+        print(pattern.name, pattern.points, pattern.apex)
+
+    for pattern in factory.get_patterns(john, yoko):
+        print(pattern.name, list(zip(pattern.owners, pattern.points)), pattern.apex)
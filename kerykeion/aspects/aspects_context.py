@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+from pathlib import Path
+from typing import Union, List, Mapping, Optional
+
+from kerykeion import AstrologicalSubject
+from kerykeion.aspects.aspects_utils import iter_aspects_matrix
+from kerykeion.aspects.compiled_aspect_config import get_compiled_aspect_config
+from kerykeion.kr_types import CompositeSubjectModel
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel, AspectModel, ActiveAspect
+from kerykeion.kr_types.kr_literals import AxialCusps, Planet
+from kerykeion.kr_types.settings_models import KerykeionSettingsModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+
+
+# (name, absolute position, id in the settings, daily speed)
+AspectPoint = tuple[str, float, int, Optional[float]]
+
+
+class SynastryAspectsContext:
+    """
+    The settings of SynastryAspects compiled once, to calculate the aspects between many pairs of subjects.
+
+    The context takes the shared CompiledAspectConfig of its arguments once, and the points of a subject
+    compared many times (e.g. the natal chart of the transits) can be prepared once with get_points.
+    The aspects are the same of SynastryAspects.all_aspects and SynastryAspects.relevant_aspects: applying
+    and days to exact come from the speeds of both subjects, unless the points of one are fixed (see get_points).
+
+    Args:
+    - new_settings_file (Union[Path, KerykeionSettingsModel, dict], optional): Custom settings. Defaults to None.
+    - active_points (list[Union[AxialCusps, Planet]], optional): The points to consider. Defaults to DEFAULT_ACTIVE_POINTS.
+    - active_aspects (list[ActiveAspect], optional): The aspects and their orbs. Defaults to DEFAULT_ACTIVE_ASPECTS.
+    - points_orbs (Mapping[str, float], optional): The maximum orbit of the relevant aspects of the points, by name.
+        Defaults to None (only the axes orbit of the settings).
+
+    Example:
+        context = SynastryAspectsContext()
+        natal_points = context.get_points(natal_chart, fixed=True)
+        for transit_subject in transit_subjects:
+            aspects = context.get_relevant_aspects(transit_subject, natal_chart, second_points=natal_points)
+    """
+
+    def __init__(
+        self,
+        new_settings_file: Union[Path, KerykeionSettingsModel, dict, None] = None,
+        active_points: List[Union[AxialCusps, Planet]] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        points_orbs: Optional[Mapping[str, float]] = None,
+    ):
+        self.active_points = active_points
+        self.active_aspects = active_aspects
+        self.points_orbs = points_orbs
+        self.aspect_config = get_compiled_aspect_config(new_settings_file, active_points, active_aspects, points_orbs)
+
+        self.aspects_settings = self.aspect_config.aspects
+        self.axes_orbit = self.aspect_config.axes_orbit
+
+        # Active points with their ids, in the order of the settings
+        self.points: list[tuple[str, int]] = [(name, self.aspect_config.get_point_id(name)) for name in self.aspect_config.active_points]
+
+    def get_points(
+        self, subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel], fixed: bool = False
+    ) -> list[AspectPoint]:
+        """
+        Returns the active points of a subject as (name, absolute position, id, daily speed).
+
+        Args:
+        - subject: The subject.
+        - fixed (bool, optional): If True, the points don't move (speed 0), like the natal chart
+            of the transits. Defaults to False (the speeds of the subject).
+        """
+        if fixed:
+            return [(name, subject[name.lower()]["abs_pos"], point_id, 0.0) for name, point_id in self.points]
+
+        return [(name, subject[name.lower()]["abs_pos"], point_id, subject[name.lower()]["speed"]) for name, point_id in self.points]
+
+    def get_aspects(
+        self,
+        first_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        second_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        first_points: Optional[list[AspectPoint]] = None,
+        second_points: Optional[list[AspectPoint]] = None,
+    ) -> list[AspectModel]:
+        """
+        Returns all the aspects between the points of two subjects, like SynastryAspects.all_aspects.
+
+        Args:
+        - first_subject: The first subject.
+        - second_subject: The second subject.
+        - first_points (list[AspectPoint], optional): The points of the first subject, from get_points. Defaults to None (calculated).
+        - second_points (list[AspectPoint], optional): The points of the second subject, from get_points. Defaults to None (calculated).
+        """
+        if first_points is None:
+            first_points = self.get_points(first_subject)
+        if second_points is None:
+            second_points = self.get_points(second_subject)
+
+        aspects = []
+        for first, second, aspect in iter_aspects_matrix(
+            self.aspects_settings,
+            [position for _, position, _, _ in first_points],
+            [position for _, position, _, _ in second_points],
+            first_speeds=[speed for _, _, _, speed in first_points],
+            second_speeds=[speed for _, _, _, speed in second_points],
+        ):
+            first_name, first_position, first_id, first_speed = first_points[first]
+            second_name, second_position, second_id, second_speed = second_points[second]
+
+            aspects.append(
+                AspectModel(
+                    p1_name=first_name,
+                    p1_owner=first_subject.name,
+                    p1_abs_pos=first_position,
+                    p2_name=second_name,
+                    p2_owner=second_subject.name,
+                    p2_abs_pos=second_position,
+                    aspect=aspect["name"],
+                    orbit=aspect["orbit"],
+                    aspect_degrees=aspect["aspect_degrees"],
+                    diff=aspect["diff"],
+                    p1=first_id,
+                    p2=second_id,
+                    p1_speed=first_speed,
+                    p2_speed=second_speed,
+                    applying=aspect["applying"],
+                    days_to_exact=aspect["days_to_exact"],
+                )
+            )
+
+        return aspects
+
+    def get_relevant_aspects(
+        self,
+        first_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        second_subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        first_points: Optional[list[AspectPoint]] = None,
+        second_points: Optional[list[AspectPoint]] = None,
+    ) -> list[AspectModel]:
+        """
+        Returns the aspects between the points of two subjects without the aspects beyond the maximum orbit
+        of their points (the axes orbit of the settings and points_orbs), like SynastryAspects.relevant_aspects.
+        The arguments are the ones of get_aspects.
+        """
+        return [
+            aspect for aspect in self.get_aspects(first_subject, second_subject, first_points, second_points) if self.aspect_config.is_relevant(aspect)
+        ]
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+
+    setup_logging(level="debug")
+
+    john = AstrologicalSubject("John", 1940, 10, 9, 10, 30, "Liverpool", "GB")
+    yoko = AstrologicalSubject("Yoko", 1933, 2, 18, 10, 30, "Tokyo", "JP")
+
+    context = SynastryAspectsContext()
+    print([aspect.model_dump() for aspect in context.get_relevant_aspects(john, yoko)])
@@ -4,13 +4,25 @@
 """
 # TODO: Better documentation and unit tests
 
+import math
+
 from kerykeion import AstrologicalSubject
 from kerykeion.settings import KerykeionSettingsModel
 from swisseph import difdeg2n
-from typing import Union
+from typing import Iterator, Optional, Sequence, Union
 from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
 from kerykeion.kr_types.kr_literals import Planet, AxialCusps
+from kerykeion.kr_types import KerykeionException
 from kerykeion.kr_types.settings_models import KerykeionSettingsCelestialPointModel, KerykeionSettingsAspectModel
+from kerykeion.utilities import import_numpy
+
+
+AXES_LIST = [
+    "Ascendant",
+    "Medium_Coeli",
+    "Descendant",
+    "Imum_Coeli",
+]
 
 
 def get_aspect_from_two_points(
@@ -57,6 +69,156 @@ def get_aspect_from_two_points(
     }
 
 
+def get_aspect_motion(
+    first_position: float,
+    second_position: float,
+    first_speed: Optional[float],
+    second_speed: Optional[float],
+    orbit: float,
+) -> tuple[Optional[bool], Optional[float]]:
+    """
+    Utility function to calculate if an aspect is applying and when it is exact, from the daily speeds of the points.
+
+    The speeds are taken as constant, so the time is a linear estimate: good for the days around
+    the exact aspect, less accurate far from it and near a station.
+
+    Args:
+        first_position (float): Absolute position of the first point.
+        second_position (float): Absolute position of the second point.
+        first_speed (Optional[float]): Daily speed of the first point, None if unknown (e.g. the axes).
+        second_speed (Optional[float]): Daily speed of the second point, None if unknown.
+        orbit (float): The orbit of the aspect, distance minus aspect degrees.
+
+    Returns:
+        tuple: (applying, days to exact). The days are negative for a separating aspect (the days since
+            the exact aspect). (None, None) when a speed is unknown or the points move together.
+    """
+    if first_speed is None or second_speed is None:
+        return None, None
+
+    if orbit == 0:
+        return False, 0.0
+
+    # Daily change of the distance: the relative speed, with the sign of the shortest arc from the second point
+    rate = math.copysign(1.0, difdeg2n(first_position, second_position)) * (first_speed - second_speed)
+    if rate == 0:
+        return None, None
+
+    days_to_exact = -orbit / rate
+    return days_to_exact > 0, days_to_exact
+
+
+def iter_aspects_matrix(
+    aspects_settings: Union[list[KerykeionSettingsAspectModel], list[dict]],
+    first_positions: Sequence[float],
+    second_positions: Sequence[float],
+    upper_triangle: bool = False,
+    first_speeds: Optional[Sequence[Optional[float]]] = None,
+    second_speeds: Optional[Sequence[Optional[float]]] = None,
+) -> Iterator[tuple[int, int, dict]]:
+    """
+    Yields the aspects between every point of a list and every point of another list,
+    as (first index, second index, aspect), in the order of a double loop on the two lists.
+    The aspects are the ones of get_aspect_from_two_points with a True verdict, with "applying" and
+    "days_to_exact" of get_aspect_motion when the speeds of the points are given (None otherwise).
+
+    With NumPy the distances of all the pairs are calculated at once and matched with the bands of all
+    the aspects, and the dictionaries are created only for the pairs in aspect. The distances are
+    calculated with the same operations of swe.difdeg2n, so the results are the same of the double loop
+    used without NumPy.
+
+    Args:
+        aspects_settings: The aspects, with degree and orb.
+        first_positions (Sequence[float]): The absolute positions of the first points.
+        second_positions (Sequence[float]): The absolute positions of the second points.
+        upper_triangle (bool, optional): Only the pairs with second index > first index,
+            for the aspects of a list with itself. Defaults to False.
+        first_speeds (Sequence[Optional[float]], optional): The daily speeds of the first points. Defaults to None.
+        second_speeds (Sequence[Optional[float]], optional): The daily speeds of the second points. Defaults to None.
+    """
+    try:
+        np = import_numpy()
+    except KerykeionException:
+        np = None
+
+    if np is None or not aspects_settings or not len(first_positions) or not len(second_positions):
+        for first in range(len(first_positions)):
+            for second in range(first + 1 if upper_triangle else 0, len(second_positions)):
+                aspect = get_aspect_from_two_points(aspects_settings, first_positions[first], second_positions[second])
+                if aspect["verdict"]:
+                    aspect["applying"], aspect["days_to_exact"] = get_aspect_motion(
+                        first_positions[first],
+                        second_positions[second],
+                        None if first_speeds is None else first_speeds[first],
+                        None if second_speeds is None else second_speeds[second],
+                        aspect["orbit"],
+                    )
+                    yield first, second, aspect
+        return
+
+    differences = np.asarray(first_positions, dtype=float)[:, None] - np.asarray(second_positions, dtype=float)[None, :]
+
+    # swe.difdeg2n: swe.degnorm of the difference, in [-180, 180)
+    normalized = np.fmod(differences, 360.0)
+    normalized[np.abs(normalized) < 1e-13] = 0.0
+    normalized[normalized < 0.0] += 360.0
+    signed_distances = np.where(normalized >= 180.0, normalized - 360.0, normalized)
+    distances = np.abs(signed_distances)
+
+    degrees = np.array([aspect["degree"] for aspect in aspects_settings], dtype=float)  # type: ignore
+    orbs = np.array([aspect["orb"] for aspect in aspects_settings], dtype=float)  # type: ignore
+    truncated = np.floor(distances)[:, :, None]
+    in_bands = (degrees - orbs <= truncated) & (truncated <= degrees + orbs)
+
+    in_aspect = in_bands.any(axis=2)
+    if upper_triangle:
+        in_aspect &= np.triu(np.ones(in_aspect.shape, dtype=bool), k=1)
+
+    # The first aspect of the settings in band, like the loop of get_aspect_from_two_points
+    firsts, seconds = np.nonzero(in_aspect)
+    aspect_indexes = in_bands[firsts, seconds].argmax(axis=1).tolist()
+    pair_distances = distances[firsts, seconds].tolist()
+    pair_diffs = np.abs(differences[firsts, seconds]).tolist()
+
+    # Daily change of the distances, like get_aspect_motion: NaN when a speed is unknown
+    if first_speeds is None or second_speeds is None:
+        pair_rates = [math.nan] * len(pair_distances)
+    else:
+        speeds_differences = (
+            np.array([math.nan if speed is None else speed for speed in first_speeds], dtype=float)[firsts]
+            - np.array([math.nan if speed is None else speed for speed in second_speeds], dtype=float)[seconds]
+        )
+        pair_rates = (np.where(signed_distances[firsts, seconds] < 0.0, -1.0, 1.0) * speeds_differences).tolist()
+
+    for first, second, aspect_index, distance, diff, rate in zip(
+        firsts.tolist(), seconds.tolist(), aspect_indexes, pair_distances, pair_diffs, pair_rates
+    ):
+        aspect_settings = aspects_settings[aspect_index]
+        aspect_degrees = aspect_settings["degree"]  # type: ignore
+        orbit = distance - aspect_degrees
+
+        if math.isnan(rate):
+            applying, days_to_exact = None, None
+        elif orbit == 0:
+            applying, days_to_exact = False, 0.0
+        elif rate == 0:
+            applying, days_to_exact = None, None
+        else:
+            days_to_exact = -orbit / rate
+            applying = days_to_exact > 0
+
+        yield first, second, {
+            "verdict": True,
+            "name": aspect_settings["name"],  # type: ignore
+            "orbit": orbit,
+            "distance": orbit,
+            "aspect_degrees": aspect_degrees,
+            "diff": diff,
+            "applying": applying,
+            "days_to_exact": days_to_exact,
+        }
+
+
 def planet_id_decoder(planets_settings: list[KerykeionSettingsCelestialPointModel], name: str) -> int:
     """
     Check if the name of the planet is the same in the settings and return
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Union, List, Mapping, Optional
+
+from kerykeion import AstrologicalSubject
+from kerykeion.aspects.aspects_utils import AXES_LIST
+from kerykeion.kr_types import CompositeSubjectModel
+from kerykeion.kr_types.kr_models import AstrologicalSubjectModel, ActiveAspect
+from kerykeion.kr_types.kr_literals import AxialCusps, Planet
+from kerykeion.kr_types.settings_models import KerykeionSettingsModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+from kerykeion.settings.kerykeion_settings import get_settings, get_settings_file_path
+
+
+COMPILED_ASPECT_CONFIGS_MAX_SIZE = 256
+"""Maximum number of compiled aspect configurations kept by get_compiled_aspect_config."""
+
+# The sections of the settings the configuration is compiled from
+_SETTINGS_SECTIONS = ("general_settings", "aspects", "celestial_points")
+
+
+@dataclass(frozen=True)
+class CompiledAspect:
+    """
+    An active aspect, with the degrees and the color of the settings and the orb of the active aspects.
+    Subscriptable like the aspects of the settings.
+    """
+
+    name: str
+    degree: int
+    orb: float
+    color: str
+
+    def __getitem__(self, item: str) -> Any:
+        return getattr(self, item)
+
+
+@dataclass(frozen=True)
+class CompiledAspectConfig:
+    """
+    The settings of the aspect calculations for a set of active points and active aspects, read-only.
+
+    The aspects are the active aspects in the order of the settings, with their orbs, and the points
+    are the active points in the order of the settings: the configuration is built once, without
+    changing the settings, and shared by all the aspects calculations with the same arguments
+    (see get_compiled_aspect_config).
+    """
+
+    aspects: tuple[CompiledAspect, ...]
+    """The active aspects, in the order of the settings."""
+
+    active_points: tuple[str, ...]
+    """The active points, in the order of the settings."""
+
+    celestial_points_ids: tuple[tuple[str, int], ...]
+    """Name and id of all the celestial points of the settings."""
+
+    axes_orbit: float
+    """The maximum orbit of the aspects of the axes, for the relevant aspects."""
+
+    points_max_orbits: tuple[tuple[str, float], ...] = ()
+    """The maximum orbit of the relevant aspects of the points, by name: the axes orbit and the overrides."""
+
+    _points_ids: dict[str, int] = field(init=False, repr=False, compare=False, hash=False)
+    _points_max_orbits: dict[str, float] = field(init=False, repr=False, compare=False, hash=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_points_ids", dict(self.celestial_points_ids))
+        object.__setattr__(self, "_points_max_orbits", dict(self.points_max_orbits))
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: KerykeionSettingsModel,
+        active_points: List[Union[AxialCusps, Planet]] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        points_orbs: Optional[Mapping[str, float]] = None,
+    ) -> "CompiledAspectConfig":
+        """
+        Compiles the configuration from the settings, the settings are not changed.
+        points_orbs overrides the maximum orbit of the relevant aspects of the points (the axes orbit for the axes).
+        """
+        axes_orbit = settings.general_settings.axes_orbit
+        points_max_orbits: dict[str, float] = {axis: axes_orbit for axis in AXES_LIST}
+        points_max_orbits.update(points_orbs or {})
+
+        orbs: dict[str, float] = {}
+        for aspect in active_aspects:
+            orbs.setdefault(aspect["name"], aspect["orb"])
+
+        return cls(
+            aspects=tuple(
+                CompiledAspect(aspect["name"], aspect["degree"], orbs[aspect["name"]], aspect["color"])
+                for aspect in settings.aspects if aspect["name"] in orbs
+            ),
+            active_points=tuple(point["name"] for point in settings.celestial_points if point["name"] in active_points),
+            celestial_points_ids=tuple((point["name"], point["id"]) for point in settings.celestial_points),
+            axes_orbit=axes_orbit,
+            points_max_orbits=tuple(sorted(points_max_orbits.items())),
+        )
+
+    def get_point_id(self, name: str) -> int:
+        """
+        Returns the id of a celestial point, like planet_id_decoder.
+        """
+        point_id = self._points_ids.get(str(name))
+        if point_id is None:
+            raise ValueError(f"Planet {name} not found in the settings")
+
+        return point_id
+
+    def is_relevant(self, aspect) -> bool:
+        """
+        Returns False when the orbit of an aspect reaches the maximum orbit of one of its points.
+        """
+        max_orbits = self._points_max_orbits
+        first_max_orbit = max_orbits.get(aspect["p1_name"])
+        second_max_orbit = max_orbits.get(aspect["p2_name"])
+
+        if first_max_orbit is None and second_max_orbit is None:
+            return True
+
+        max_orbit = min(orbit for orbit in (first_max_orbit, second_max_orbit) if orbit is not None)
+        return abs(aspect["orbit"]) < max_orbit
+
+    def get_active_points(self, subject: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel]) -> list:
+        """
+        Returns the active points of a subject, like get_active_points_list.
+        """
+        return [subject[name.lower()] for name in self.active_points]
+
+
+_compiled_aspect_configs: OrderedDict[tuple, CompiledAspectConfig] = OrderedDict()
+_compiled_aspect_configs_lock = threading.Lock()
+
+
+def _get_settings_key(settings: Union[Path, KerykeionSettingsModel, dict, None]) -> tuple:
+    """
+    Returns the memo key of the settings, which changes when the settings used by the configuration change:
+    - a settings file by path, modification time and size;
+    - a settings model by the fields of the configuration (axes orbit, aspects and celestial points);
+    - a settings dictionary by the JSON of the sections of the configuration, validated again when they change.
+    """
+    if isinstance(settings, KerykeionSettingsModel):
+        return (
+            "model",
+            settings.general_settings.axes_orbit,
+            tuple((aspect.name, aspect.degree, aspect.color) for aspect in settings.aspects),
+            tuple((point.name, point.id) for point in settings.celestial_points),
+        )
+
+    if isinstance(settings, dict):
+        return ("dict", json.dumps([settings.get(section) for section in _SETTINGS_SECTIONS], default=str))
+
+    settings_file = get_settings_file_path(settings)
+    settings_file_stat = settings_file.stat()
+    return ("file", str(settings_file), settings_file_stat.st_mtime_ns, settings_file_stat.st_size)
+
+
+def get_compiled_aspect_config(
+    new_settings_file: Union[Path, KerykeionSettingsModel, dict, None] = None,
+    active_points: List[Union[AxialCusps, Planet]] = DEFAULT_ACTIVE_POINTS,
+    active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+    points_orbs: Optional[Mapping[str, float]] = None,
+) -> CompiledAspectConfig:
+    """
+    Returns the compiled aspect configuration of the settings, active points and active aspects.
+
+    The configurations are memoized in the process: the settings are loaded and validated only the first time,
+    and the same configuration is shared by all the callers with the same arguments (the last
+    COMPILED_ASPECT_CONFIGS_MAX_SIZE used). The settings are memoized by content, so a changed settings file,
+    model or dictionary gets a new configuration: the files by modification time, the models and the dictionaries
+    by the sections the configuration is compiled from (see _get_settings_key).
+
+    Args:
+    - new_settings_file (Union[Path, KerykeionSettingsModel, dict], optional): Custom settings. Defaults to None.
+    - active_points (list[Union[AxialCusps, Planet]], optional): The points to consider. Defaults to DEFAULT_ACTIVE_POINTS.
+    - active_aspects (list[ActiveAspect], optional): The aspects and their orbs. Defaults to DEFAULT_ACTIVE_ASPECTS.
+    - points_orbs (Mapping[str, float], optional): The maximum orbit of the relevant aspects of the points, by name.
+        Defaults to None (only the axes orbit of the settings).
+
+    Returns:
+    - CompiledAspectConfig: The read-only configuration.
+    """
+    key = (
+        _get_settings_key(new_settings_file),
+        tuple(active_points),
+        tuple((aspect["name"], aspect["orb"]) for aspect in active_aspects),
+        tuple(sorted((points_orbs or {}).items())),
+    )
+
+    with _compiled_aspect_configs_lock:
+        config = _compiled_aspect_configs.get(key)
+        if config is not None:
+            _compiled_aspect_configs.move_to_end(key)
+            return config
+
+    config = CompiledAspectConfig.from_settings(get_settings(new_settings_file), active_points, active_aspects, points_orbs)
+
+    with _compiled_aspect_configs_lock:
+        _compiled_aspect_configs[key] = config
+        while len(_compiled_aspect_configs) > COMPILED_ASPECT_CONFIGS_MAX_SIZE:
+            _compiled_aspect_configs.popitem(last=False)
+
+    return config
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    config = get_compiled_aspect_config()
+    print(config.aspects)
+    print(config.active_points)
+    print(config is get_compiled_aspect_config(), hash(config))
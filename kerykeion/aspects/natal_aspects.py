@@ -7,11 +7,12 @@ from pathlib import Path
 from kerykeion import AstrologicalSubject
 from kerykeion.kr_types import CompositeSubjectModel
 import logging
-from typing import Union, List
+from typing import Union, List, Mapping, Optional
 from kerykeion.settings.kerykeion_settings import get_settings
 from dataclasses import dataclass, field
 from functools import cached_property
-from kerykeion.aspects.aspects_utils import planet_id_decoder, get_aspect_from_two_points, get_active_points_list
+from kerykeion.aspects.aspects_utils import AXES_LIST, iter_aspects_matrix
+from kerykeion.aspects.compiled_aspect_config import get_compiled_aspect_config
 from kerykeion.kr_types.kr_models import AstrologicalSubjectModel, AspectModel, ActiveAspect
 from kerykeion.kr_types.kr_literals import AxialCusps, Planet
 from kerykeion.kr_types.settings_models import KerykeionSettingsModel
@@ -19,32 +20,36 @@ from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_A
 
 
 
-AXES_LIST = [
-    "Ascendant",
-    "Medium_Coeli",
-    "Descendant",
-    "Imum_Coeli",
-]
-
-
 @dataclass
 class NatalAspects:
     """
     Generates an object with all the aspects of a birthcart.
+
+    The relevant aspects don't include the aspects of the axes with an orbit beyond the axes orbit of
+    the settings. points_orbs sets the maximum orbit of the relevant aspects of any point, by name
+    (e.g. {"Mean_Lilith": 2}), the axes included: it can only narrow the orbs of the active aspects.
     """
 
     user: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel]
     new_settings_file: Union[Path, KerykeionSettingsModel, dict, None] = None
     active_points: List[Union[AxialCusps, Planet]] = field(default_factory=lambda: DEFAULT_ACTIVE_POINTS)
     active_aspects: List[ActiveAspect] = field(default_factory=lambda: DEFAULT_ACTIVE_ASPECTS)
+    points_orbs: Optional[Mapping[str, float]] = None
 
     def __post_init__(self):
-        self.settings = get_settings(self.new_settings_file)
+        # Shared, read-only configuration: the settings are validated once per process
+        self.aspect_config = get_compiled_aspect_config(self.new_settings_file, self.active_points, self.active_aspects, self.points_orbs)
+
+        self.aspects_settings = list(self.aspect_config.aspects)
+        self.axes_orbit_settings = self.aspect_config.axes_orbit
+
+    @cached_property
+    def settings(self) -> KerykeionSettingsModel:
+        return get_settings(self.new_settings_file)
 
-        self.celestial_points = self.settings.celestial_points
-        self.aspects_settings = self.settings.aspects
-        self.axes_orbit_settings = self.settings.general_settings.axes_orbit
-        self.active_points = self.active_points
+    @cached_property
+    def celestial_points(self):
+        return self.settings.celestial_points
 
     @cached_property
     def all_aspects(self):
@@ -54,65 +59,50 @@ class NatalAspects:
         without repetitions.
         """
 
-        active_points_list = get_active_points_list(self.user, self.settings, self.active_points)
+        active_points_list = self.aspect_config.get_active_points(self.user)
+
+        # AC/DC, MC/IC and North/South nodes are always in opposition
+        opposite_pairs = {
+            ("Ascendant", "Descendant"),
+            ("Descendant", "Ascendant"),
+            ("Medium_Coeli", "Imum_Coeli"),
+            ("Imum_Coeli", "Medium_Coeli"),
+            ("True_Node", "True_South_Node"),
+            ("Mean_Node", "Mean_South_Node"),
+            ("True_South_Node", "True_Node"),
+            ("Mean_South_Node", "Mean_Node"),
+        }
 
-        # ---> TODO: Clean this up
-        filtered_settings = []
-        for a in self.aspects_settings:
-            for aspect in self.active_aspects:
-                if a["name"] == aspect["name"]:
-                    a["orb"] = aspect["orb"]  # Assign the aspect's orb
-                    filtered_settings.append(a)
-                    break  # Exit the inner loop once a match is found
-        self.aspects_settings = filtered_settings
-        # <--- TODO: Clean this up
+        positions = [point["abs_pos"] for point in active_points_list]
+        speeds = [point["speed"] for point in active_points_list]
 
         self.all_aspects_list = []
-        for first in range(len(active_points_list)):
-            # Generates the aspects list without repetitions
-            for second in range(first + 1, len(active_points_list)):
-                # AC/DC, MC/IC and North/South nodes are always in opposition
-                opposite_pairs = {
-                    ("Ascendant", "Descendant"),
-                    ("Descendant", "Ascendant"),
-                    ("Medium_Coeli", "Imum_Coeli"),
-                    ("Imum_Coeli", "Medium_Coeli"),
-                    ("True_Node", "True_South_Node"),
-                    ("Mean_Node", "Mean_South_Node"),
-                    ("True_South_Node", "True_Node"),
-                    ("Mean_South_Node", "Mean_Node"),
-                }
-                if (active_points_list[first]["name"], active_points_list[second]["name"]) in opposite_pairs:
-                    continue
-
-                aspect = get_aspect_from_two_points(
-                    self.aspects_settings,
-                    active_points_list[first]["abs_pos"],
-                    active_points_list[second]["abs_pos"]
-                )
-
-                verdict = aspect["verdict"]
-                name = aspect["name"]
-                orbit = aspect["orbit"]
-                aspect_degrees = aspect["aspect_degrees"]
-                diff = aspect["diff"]
-
-                if verdict == True:
-                    aspect_model = AspectModel(
-                        p1_name=active_points_list[first]["name"],
-                        p1_owner=self.user.name,
-                        p1_abs_pos=active_points_list[first]["abs_pos"],
-                        p2_name=active_points_list[second]["name"],
-                        p2_owner=self.user.name,
-                        p2_abs_pos=active_points_list[second]["abs_pos"],
-                        aspect=name,
-                        orbit=orbit,
-                        aspect_degrees=aspect_degrees,
-                        diff=diff,
-                        p1=planet_id_decoder(self.celestial_points, active_points_list[first]["name"]),
-                        p2=planet_id_decoder(self.celestial_points, active_points_list[second]["name"]),
-                    )
-                    self.all_aspects_list.append(aspect_model)
+        # Generates the aspects list without repetitions
+        for first, second, aspect in iter_aspects_matrix(
+            self.aspects_settings, positions, positions, upper_triangle=True, first_speeds=speeds, second_speeds=speeds
+        ):
+            if (active_points_list[first]["name"], active_points_list[second]["name"]) in opposite_pairs:
+                continue
+
+            aspect_model = AspectModel(
+                p1_name=active_points_list[first]["name"],
+                p1_owner=self.user.name,
+                p1_abs_pos=active_points_list[first]["abs_pos"],
+                p2_name=active_points_list[second]["name"],
+                p2_owner=self.user.name,
+                p2_abs_pos=active_points_list[second]["abs_pos"],
+                aspect=aspect["name"],
+                orbit=aspect["orbit"],
+                aspect_degrees=aspect["aspect_degrees"],
+                diff=aspect["diff"],
+                p1=self.aspect_config.get_point_id(active_points_list[first]["name"]),
+                p2=self.aspect_config.get_point_id(active_points_list[second]["name"]),
+                p1_speed=speeds[first],
+                p2_speed=speeds[second],
+                applying=aspect["applying"],
+                days_to_exact=aspect["days_to_exact"],
+            )
+            self.all_aspects_list.append(aspect_model)
 
         return self.all_aspects_list
 
@@ -127,29 +117,10 @@ class NatalAspects:
         """
 
         logging.debug("Relevant aspects not already calculated, calculating now...")
-        self.all_aspects
-
-        axes_list = AXES_LIST
-        counter = 0
-
-        # Remove aspects where the orbits exceed the maximum orb thresholds specified in the settings
-        # (specified usually in kr.config.json file)
-        aspects_filtered = self.all_aspects
-        aspects_list_subtract = []
-        for a in aspects_filtered:
-            counter += 1
-            name_p1 = str(a["p1_name"])
-            name_p2 = str(a["p2_name"])
-
-            if name_p1 in axes_list:
-                if abs(a["orbit"]) >= self.axes_orbit_settings:
-                    aspects_list_subtract.append(a)
-
-            elif name_p2 in axes_list:
-                if abs(a["orbit"]) >= self.axes_orbit_settings:
-                    aspects_list_subtract.append(a)
 
-        self.aspects = [item for item in aspects_filtered if item not in aspects_list_subtract]
+        # Remove aspects where the orbits exceed the maximum orb thresholds of their points: the axes orbit
+        # specified in the settings (usually in kr.config.json file) and the points_orbs, in a single pass
+        self.aspects = [aspect for aspect in self.all_aspects if self.aspect_config.is_relevant(aspect)]
 
         return self.aspects
 
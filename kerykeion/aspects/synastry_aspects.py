@@ -9,13 +9,14 @@ from typing import Union
 from functools import cached_property
 
 from kerykeion.aspects.natal_aspects import NatalAspects
-from kerykeion.settings.kerykeion_settings import get_settings
-from kerykeion.aspects.aspects_utils import planet_id_decoder, get_aspect_from_two_points, get_active_points_list
+from kerykeion.aspects.aspects_utils import iter_aspects_matrix
+from kerykeion.aspects.compiled_aspect_config import get_compiled_aspect_config
+from kerykeion.kr_types import CompositeSubjectModel
 from kerykeion.kr_types.kr_models import AstrologicalSubjectModel, AspectModel, ActiveAspect
 from kerykeion.kr_types.settings_models import KerykeionSettingsModel
 from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
 from kerykeion.kr_types.kr_literals import AxialCusps, Planet
-from typing import Union, List
+from typing import Union, List, Mapping, Optional
 
 
 class SynastryAspects(NatalAspects):
@@ -25,11 +26,12 @@ class SynastryAspects(NatalAspects):
 
     def __init__(
         self,
-        kr_object_one: Union[AstrologicalSubject, AstrologicalSubjectModel],
-        kr_object_two: Union[AstrologicalSubject, AstrologicalSubjectModel],
+        kr_object_one: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
+        kr_object_two: Union[AstrologicalSubject, AstrologicalSubjectModel, CompositeSubjectModel],
         new_settings_file: Union[Path, KerykeionSettingsModel, dict, None] = None,
         active_points: list[Union[AxialCusps, Planet]] = DEFAULT_ACTIVE_POINTS,
         active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        points_orbs: Optional[Mapping[str, float]] = None,
     ):
         # Subjects
         self.first_user = kr_object_one
@@ -37,17 +39,15 @@ class SynastryAspects(NatalAspects):
 
         # Settings
         self.new_settings_file = new_settings_file
-        self.settings = get_settings(self.new_settings_file)
-
-        self.celestial_points = self.settings.celestial_points
-        self.aspects_settings = self.settings.aspects
-        self.axes_orbit_settings = self.settings.general_settings.axes_orbit
         self.active_points = active_points
         self.active_aspects = active_aspects
+        self.points_orbs = points_orbs
+
+        # Shared, read-only configuration: the settings are validated once per process
+        self.aspect_config = get_compiled_aspect_config(self.new_settings_file, self.active_points, self.active_aspects, self.points_orbs)
 
-        # Private variables of the aspects
-        self._all_aspects: Union[list, None] = None
-        self._relevant_aspects: Union[list, None] = None
+        self.aspects_settings = list(self.aspect_config.aspects)
+        self.axes_orbit_settings = self.aspect_config.axes_orbit
 
     @cached_property
     def all_aspects(self):
@@ -57,55 +57,37 @@ class SynastryAspects(NatalAspects):
         whiteout repetitions.
         """
 
-        if self._all_aspects is not None:
-            return self._all_aspects
-
         # Celestial Points Lists
-        first_active_points_list = get_active_points_list(self.first_user, self.settings, self.active_points)
-        second_active_points_list = get_active_points_list(self.second_user, self.settings, self.active_points)
-
-        # ---> TODO: Clean this up
-        filtered_settings = []
-        for a in self.aspects_settings:
-            for aspect in self.active_aspects:
-                if a["name"] == aspect["name"]:
-                    a["orb"] = aspect["orb"]  # Assign the aspect's orb
-                    filtered_settings.append(a)
-        self.aspects_settings = filtered_settings
-        # <--- TODO: Clean this up
+        first_active_points_list = self.aspect_config.get_active_points(self.first_user)
+        second_active_points_list = self.aspect_config.get_active_points(self.second_user)
 
         self.all_aspects_list = []
-        for first in range(len(first_active_points_list)):
-            # Generates the aspects list whitout repetitions
-            for second in range(len(second_active_points_list)):
-                aspect = get_aspect_from_two_points(
-                    self.aspects_settings,
-                    first_active_points_list[first]["abs_pos"],
-                    second_active_points_list[second]["abs_pos"],
-                )
-
-                verdict = aspect["verdict"]
-                name = aspect["name"]
-                orbit = aspect["orbit"]
-                aspect_degrees = aspect["aspect_degrees"]
-                diff = aspect["diff"]
-
-                if verdict == True:
-                    aspect_model = AspectModel(
-                        p1_name=first_active_points_list[first]["name"],
-                        p1_owner=self.first_user.name,
-                        p1_abs_pos=first_active_points_list[first]["abs_pos"],
-                        p2_name=second_active_points_list[second]["name"],
-                        p2_owner=self.second_user.name,
-                        p2_abs_pos=second_active_points_list[second]["abs_pos"],
-                        aspect=name,
-                        orbit=orbit,
-                        aspect_degrees=aspect_degrees,
-                        diff=diff,
-                        p1=planet_id_decoder(self.celestial_points, first_active_points_list[first]["name"]),
-                        p2=planet_id_decoder(self.celestial_points, second_active_points_list[second]["name"]),
-                    )
-                    self.all_aspects_list.append(aspect_model)
+        for first, second, aspect in iter_aspects_matrix(
+            self.aspects_settings,
+            [point["abs_pos"] for point in first_active_points_list],
+            [point["abs_pos"] for point in second_active_points_list],
+            first_speeds=[point["speed"] for point in first_active_points_list],
+            second_speeds=[point["speed"] for point in second_active_points_list],
+        ):
+            aspect_model = AspectModel(
+                p1_name=first_active_points_list[first]["name"],
+                p1_owner=self.first_user.name,
+                p1_abs_pos=first_active_points_list[first]["abs_pos"],
+                p2_name=second_active_points_list[second]["name"],
+                p2_owner=self.second_user.name,
+                p2_abs_pos=second_active_points_list[second]["abs_pos"],
+                aspect=aspect["name"],
+                orbit=aspect["orbit"],
+                aspect_degrees=aspect["aspect_degrees"],
+                diff=aspect["diff"],
+                p1=self.aspect_config.get_point_id(first_active_points_list[first]["name"]),
+                p2=self.aspect_config.get_point_id(second_active_points_list[second]["name"]),
+                p1_speed=first_active_points_list[first]["speed"],
+                p2_speed=second_active_points_list[second]["speed"],
+                applying=aspect["applying"],
+                days_to_exact=aspect["days_to_exact"],
+            )
+            self.all_aspects_list.append(aspect_model)
 
         return self.all_aspects_list
 
@@ -3,6 +3,8 @@
     This is part of Kerykeion (C) 2025 Giacomo Battaglia
 """
 
+import asyncio
+import inspect
 import pytz
 import swisseph as swe
 import logging
@@ -13,12 +15,16 @@ from datetime import datetime
 
 from functools import cached_property
 from kerykeion.fetch_geonames import FetchGeonames
+from kerykeion.async_fetch_geonames import AsyncFetchGeonames, get_async_geonames_client
+from kerykeion.offline_gazetteer import OfflineGazetteer
+from kerykeion.timezone_resolver import TimezoneResolver
+from kerykeion.swiss_ephemeris_context import SwissEphemerisContext
 from kerykeion.kr_types import (
     KerykeionException,
     ZodiacType,
     AstrologicalSubjectModel,
     LunarPhaseModel,
-    KerykeionPointModel,
+    KerykeionPoint,
     PointType,
     SiderealMode,
     HousesSystemIdentifier,
@@ -29,13 +35,15 @@ from kerykeion.kr_types import (
 )
 from kerykeion.utilities import (
     get_number_from_name,
-    get_kerykeion_point_from_degree,
     get_planet_house,
     check_and_adjust_polar_latitude,
     calculate_moon_phase
 )
 from pathlib import Path
-from typing import Union, get_args
+from typing import List, Union, get_args, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kerykeion.ephemeris_tables import ChebyshevEphemeris
 
 DEFAULT_GEONAMES_USERNAME = "century.boy"
 DEFAULT_SIDEREAL_MODE: SiderealMode = "FAGAN_BRADLEY"
@@ -55,6 +63,11 @@ GEONAMES_DEFAULT_USERNAME_WARNING = (
 
 NOW = datetime.now()
 
+PLANETS_ATTRIBUTES: dict[str, Planet] = {planet.lower(): planet for planet in get_args(Planet)}
+"""
+The AstrologicalSubject attributes of the planets, with the name of the planet they store.
+"""
+
 
 class AstrologicalSubject:
     """
@@ -98,6 +111,17 @@ class AstrologicalSubject:
         if it can't guess. If you know the time is in DST, set this to True, if you know it's not, set it to False.
     - disable_chiron_and_lilith (bool, optional): boolean representing if Chiron and Lilith should be disabled. Default is False.
         Chiron calculation can create some issues with the Swiss Ephemeris when the date is too far in the past.
+    - active_points (list[Planet | AxialCusps], optional): The points to calculate when the subject is created.
+        Defaults to None, which calculates all the points. When set, the other planets and the lunar phase
+        are calculated the first time they are accessed, the houses and the axial cusps are always calculated.
+        The json() and model() methods calculate all the points.
+    - offline_gazetteer (OfflineGazetteer, optional): Local index used to find the coordinates and the timezone
+        of the city before calling geonames. With the offline mode, the city is looked up only in the gazetteer.
+        Defaults to None.
+    - timezone_resolver (TimezoneResolver, optional): Offline resolver used to find the timezone
+        when the coordinates are given without tz_str. Defaults to None.
+    - ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables used instead of the Swiss Ephemeris
+        for the bodies, dates and settings they cover. Defaults to None.
     """
 
     # Defined by the user
@@ -129,45 +153,45 @@ class AstrologicalSubject:
     iso_formatted_utc_datetime: str
 
     # Planets
-    sun: KerykeionPointModel
-    moon: KerykeionPointModel
-    mercury: KerykeionPointModel
-    venus: KerykeionPointModel
-    mars: KerykeionPointModel
-    jupiter: KerykeionPointModel
-    saturn: KerykeionPointModel
-    uranus: KerykeionPointModel
-    neptune: KerykeionPointModel
-    pluto: KerykeionPointModel
-    true_node: KerykeionPointModel
-    mean_node: KerykeionPointModel
-    chiron: Union[KerykeionPointModel, None]
-    mean_lilith: Union[KerykeionPointModel, None]
-    true_south_node: KerykeionPointModel
-    mean_south_node: KerykeionPointModel
+    sun: KerykeionPoint
+    moon: KerykeionPoint
+    mercury: KerykeionPoint
+    venus: KerykeionPoint
+    mars: KerykeionPoint
+    jupiter: KerykeionPoint
+    saturn: KerykeionPoint
+    uranus: KerykeionPoint
+    neptune: KerykeionPoint
+    pluto: KerykeionPoint
+    true_node: KerykeionPoint
+    mean_node: KerykeionPoint
+    chiron: Union[KerykeionPoint, None]
+    mean_lilith: Union[KerykeionPoint, None]
+    true_south_node: KerykeionPoint
+    mean_south_node: KerykeionPoint
 
     # Axes
-    asc: KerykeionPointModel
-    dsc: KerykeionPointModel
-    mc: KerykeionPointModel
-    ic: KerykeionPointModel
+    asc: KerykeionPoint
+    dsc: KerykeionPoint
+    mc: KerykeionPoint
+    ic: KerykeionPoint
 
     # Houses
-    first_house: KerykeionPointModel
-    second_house: KerykeionPointModel
-    third_house: KerykeionPointModel
-    fourth_house: KerykeionPointModel
-    fifth_house: KerykeionPointModel
-    sixth_house: KerykeionPointModel
-    seventh_house: KerykeionPointModel
-    eighth_house: KerykeionPointModel
-    ninth_house: KerykeionPointModel
-    tenth_house: KerykeionPointModel
-    eleventh_house: KerykeionPointModel
-    twelfth_house: KerykeionPointModel
+    first_house: KerykeionPoint
+    second_house: KerykeionPoint
+    third_house: KerykeionPoint
+    fourth_house: KerykeionPoint
+    fifth_house: KerykeionPoint
+    sixth_house: KerykeionPoint
+    seventh_house: KerykeionPoint
+    eighth_house: KerykeionPoint
+    ninth_house: KerykeionPoint
+    tenth_house: KerykeionPoint
+    eleventh_house: KerykeionPoint
+    twelfth_house: KerykeionPoint
 
     # Lists
-    _houses_list: list[KerykeionPointModel]
+    _houses_list: list[KerykeionPoint]
     _houses_degree_ut: list[float]
     planets_names_list: list[Planet]
     houses_names_list: list[Houses]
@@ -176,6 +200,10 @@ class AstrologicalSubject:
     # Enable or disable features
     disable_chiron: Union[None, bool]
     disable_chiron_and_lilith: bool
+    active_points: Union[List[Union[Planet, AxialCusps]], None]
+    offline_gazetteer: Union[OfflineGazetteer, None]
+    timezone_resolver: Union[TimezoneResolver, None]
+    ephemeris_tables: Union["ChebyshevEphemeris", None]
 
     lunar_phase: LunarPhaseModel
 
@@ -201,7 +229,11 @@ class AstrologicalSubject:
         perspective_type: Union[PerspectiveType, None] = DEFAULT_PERSPECTIVE_TYPE,
         cache_expire_after_days: Union[int, None] = DEFAULT_GEONAMES_CACHE_EXPIRE_AFTER_DAYS,
         is_dst: Union[None, bool] = None,
-        disable_chiron_and_lilith: bool = False
+        disable_chiron_and_lilith: bool = False,
+        active_points: Union[List[Union[Planet, AxialCusps]], None] = None,
+        offline_gazetteer: Union[OfflineGazetteer, None] = None,
+        timezone_resolver: Union[TimezoneResolver, None] = None,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None
     ) -> None:
         logging.debug("Starting Kerykeion")
 
@@ -219,64 +251,81 @@ class AstrologicalSubject:
             self.disable_chiron_and_lilith = disable_chiron
         # <--- Deprecation warnings
 
-        self.name = name
-        self.year = year
-        self.month = month
-        self.day = day
-        self.hour = hour
-        self.minute = minute
-        self.online = online
-        self.json_dir = Path.home()
-        self.disable_chiron = disable_chiron
-        self.sidereal_mode = sidereal_mode
-        self.cache_expire_after_days = cache_expire_after_days
-        self.is_dst = is_dst
-        self.disable_chiron_and_lilith = disable_chiron_and_lilith
+        self._setup_chart_settings(
+            online=online,
+            zodiac_type=zodiac_type,
+            sidereal_mode=sidereal_mode,
+            houses_system_identifier=houses_system_identifier,
+            perspective_type=perspective_type,
+            cache_expire_after_days=cache_expire_after_days,
+            disable_chiron=disable_chiron,
+            disable_chiron_and_lilith=disable_chiron_and_lilith,
+            active_points=active_points,
+            offline_gazetteer=offline_gazetteer,
+            timezone_resolver=timezone_resolver,
+            ephemeris_tables=ephemeris_tables,
+        )
+        self._setup_birth_data(
+            name=name,
+            year=year,
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            city=city,
+            nation=nation,
+            lng=lng,
+            lat=lat,
+            tz_str=tz_str,
+            is_dst=is_dst,
+            geonames_username=geonames_username,
+        )
 
-        #---------------#
-        # General setup #
-        #---------------#
+        # With a gazetteer the location can be found offline too
+        can_find_location = self.online or self.offline_gazetteer is not None
 
-        # Geonames username
-        if geonames_username is None and online and (not lat or not lng or not tz_str):
-            logging.warning(GEONAMES_DEFAULT_USERNAME_WARNING)
-            self.geonames_username = DEFAULT_GEONAMES_USERNAME
-        else:
-            self.geonames_username = geonames_username # type: ignore
-
-        # City
-        if not city:
-            self.city = "London"
-            logging.info("No city specified, using London as default")
-        else:
-            self.city = city
+        # geopos_is_set, for topocentric
+        if self.perspective_type == "Topocentric":
+            if (can_find_location) and (not self.tz_str) and (not self.lat) and (not self.lng):
+                self._fetch_and_set_tz_and_coordinates_from_geonames()
 
-        # Nation
-        if not nation:
-            self.nation = "GB"
-            logging.info("No nation specified, using GB as default")
-        else:
-            self.nation = nation
+        #------------------------#
+        # Start the calculations #
+        #------------------------#
 
-        # Latitude
-        if not lat and not self.online:
-            self.lat = 51.5074
-            logging.info("No latitude specified, using London as default")
-        else:
-            self.lat = lat # type: ignore
+        if (can_find_location) and (not self.tz_str) and (not self.lat) and (not self.lng):
+            self._fetch_and_set_tz_and_coordinates_from_geonames()
 
-        # Longitude
-        if not lng and not self.online:
-            self.lng = 0
-            logging.info("No longitude specified, using London as default")
-        else:
-            self.lng = lng # type: ignore
+        self._calculate_chart()
 
-        # Timezone
-        if (not self.online) and (not tz_str):
-            raise KerykeionException("You need to set the coordinates and timezone if you want to use the offline mode!")
-        else:
-            self.tz_str = tz_str # type: ignore
+    def _setup_chart_settings(
+        self,
+        online: bool = True,
+        zodiac_type: Union[ZodiacType, None] = DEFAULT_ZODIAC_TYPE,
+        sidereal_mode: Union[SiderealMode, None] = None,
+        houses_system_identifier: Union[HousesSystemIdentifier, None] = DEFAULT_HOUSES_SYSTEM_IDENTIFIER,
+        perspective_type: Union[PerspectiveType, None] = DEFAULT_PERSPECTIVE_TYPE,
+        cache_expire_after_days: Union[int, None] = DEFAULT_GEONAMES_CACHE_EXPIRE_AFTER_DAYS,
+        disable_chiron: Union[None, bool] = None,
+        disable_chiron_and_lilith: bool = False,
+        active_points: Union[List[Union[Planet, AxialCusps]], None] = None,
+        offline_gazetteer: Union[OfflineGazetteer, None] = None,
+        timezone_resolver: Union[TimezoneResolver, None] = None,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+    ) -> None:
+        """
+        Sets and validates the chart settings, the same for many birth data (see SubjectBatchFactory):
+        zodiac type, sidereal mode, house system, perspective and the Swiss Ephemeris flags.
+        """
+        self.online = online
+        self.json_dir = Path.home()
+        self.disable_chiron = disable_chiron
+        self.sidereal_mode = sidereal_mode
+        self.disable_chiron_and_lilith = disable_chiron_and_lilith
+        self.active_points = active_points
+        self.offline_gazetteer = offline_gazetteer
+        self.timezone_resolver = timezone_resolver
+        self.ephemeris_tables = ephemeris_tables
 
         # Zodiac type
         if not zodiac_type:
@@ -306,8 +355,8 @@ class AstrologicalSubject:
         # Swiss Ephemeris setup #
         #-----------------------#
 
-        # We set the swisseph path to the current directory
-        swe.set_ephe_path(str(Path(__file__).parent.absolute() / "sweph"))
+        # The ephemeris path is set only once per process by the shared context
+        SwissEphemerisContext.get_instance()
 
         # Flags for the Swiss Ephemeris
         self._iflag = swe.FLG_SWIEPH + swe.FLG_SPEED
@@ -322,10 +371,6 @@ class AstrologicalSubject:
             self._iflag += swe.FLG_HELCTR
         elif self.perspective_type == "Topocentric":
             self._iflag += swe.FLG_TOPOCTR
-            # geopos_is_set, for topocentric
-            if (self.online) and (not self.tz_str) and (not self.lat) and (not self.lng):
-                self._fetch_and_set_tz_and_coordinates_from_geonames()
-            swe.set_topo(self.lng, self.lat, 0)
         # <--- Chart Perspective check and setup
 
         # House System check and setup --->
@@ -353,55 +398,155 @@ class AstrologicalSubject:
                 raise KerykeionException(f"\n* ERROR: '{self.sidereal_mode}' is NOT a valid sidereal mode! Available modes are: *" + "\n" + str(get_args(SiderealMode)))
 
             self._iflag += swe.FLG_SIDEREAL
-            mode = "SIDM_" + self.sidereal_mode
-            swe.set_sid_mode(getattr(swe, mode))
-            logging.debug(f"Using sidereal mode: {mode}")
         # <--- Zodiac Type and Sidereal mode checks and setup
 
-        #------------------------#
-        # Start the calculations #
-        #------------------------#
+    def _setup_birth_data(
+        self,
+        name="Now",
+        year: int = NOW.year,
+        month: int = NOW.month,
+        day: int = NOW.day,
+        hour: int = NOW.hour,
+        minute: int = NOW.minute,
+        city: Union[str, None] = None,
+        nation: Union[str, None] = None,
+        lng: Union[int, float, None] = None,
+        lat: Union[int, float, None] = None,
+        tz_str: Union[str, None] = None,
+        is_dst: Union[None, bool] = None,
+        geonames_username: Union[str, None] = None,
+    ) -> None:
+        """
+        Sets the birth data: name, date, location and timezone, with their defaults.
+        Expects the chart settings to be already set (see _setup_chart_settings).
+        """
+        self.name = name
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour = hour
+        self.minute = minute
+        self.is_dst = is_dst
 
-        # UTC, julian day and local time setup --->
-        if (self.online) and (not self.tz_str) and (not self.lat) and (not self.lng):
-            self._fetch_and_set_tz_and_coordinates_from_geonames()
+        # Geonames username
+        if geonames_username is None and self.online and (not lat or not lng or not tz_str):
+            logging.warning(GEONAMES_DEFAULT_USERNAME_WARNING)
+            self.geonames_username = DEFAULT_GEONAMES_USERNAME
+        else:
+            self.geonames_username = geonames_username # type: ignore
 
-        self.lat = check_and_adjust_polar_latitude(self.lat)
+        # City
+        if not city:
+            self.city = "London"
+            logging.info("No city specified, using London as default")
+        else:
+            self.city = city
 
-        # Local time to UTC
-        local_time = pytz.timezone(self.tz_str)
-        naive_datetime = datetime(self.year, self.month, self.day, self.hour, self.minute, 0)
+        # Nation
+        if not nation:
+            self.nation = "GB"
+            logging.info("No nation specified, using GB as default")
+        else:
+            self.nation = nation
 
-        try:
-            local_datetime = local_time.localize(naive_datetime, is_dst=self.is_dst)
-        except pytz.exceptions.AmbiguousTimeError:
-            raise KerykeionException("Ambiguous time! Please specify if the time is in DST or not with the is_dst argument.")
+        # With a gazetteer the location can be found offline too
+        can_find_location = self.online or self.offline_gazetteer is not None
 
-        utc_object = local_datetime.astimezone(pytz.utc)
+        # Latitude
+        if not lat and not can_find_location:
+            self.lat = 51.5074
+            logging.info("No latitude specified, using London as default")
+        else:
+            self.lat = lat # type: ignore
+
+        # Longitude
+        if not lng and not can_find_location:
+            self.lng = 0
+            logging.info("No longitude specified, using London as default")
+        else:
+            self.lng = lng # type: ignore
+
+        # Timezone, resolved offline from the coordinates when possible
+        if (not tz_str) and (lat is not None) and (lng is not None) and (self.timezone_resolver is not None):
+            tz_str = self.timezone_resolver.get_timezone(lat, lng)
+            logging.info(f"Timezone {tz_str} resolved from the coordinates")
+
+        if (not can_find_location) and (not tz_str):
+            raise KerykeionException("You need to set the coordinates and timezone if you want to use the offline mode!")
+        else:
+            self.tz_str = tz_str # type: ignore
+
+    def _calculate_chart(self) -> None:
+        """
+        Runs the chart calculations (UTC and julian day, houses, planets and lunar phase).
+        Expects the location, the timezone and the Swiss Ephemeris flags to be already set.
+
+        The calculations run inside the shared Swiss Ephemeris context, which sets
+        the sidereal mode and the topocentric position needed by this subject.
+        """
+
+        # The topocentric position uses the coordinates before the polar circle override
+        self._topo = (self.lng, self.lat, 0) if self.perspective_type == "Topocentric" else None
+
+        with SwissEphemerisContext.get_instance().configure(sidereal_mode=self.sidereal_mode, topo=self._topo):
+            self._calculate_chart_positions()
+
+    def _calculate_chart_positions(self) -> None:
+        """
+        Calculates UTC and julian day, houses, planets and lunar phase.
+        """
+
+        # UTC, julian day and local time setup --->
+        self.lat = check_and_adjust_polar_latitude(self.lat)
+
+        local_datetime, utc_object, self.julian_day = self._get_birth_datetimes(
+            self.year, self.month, self.day, self.hour, self.minute, self.tz_str, self.is_dst
+        )
         self.iso_formatted_utc_datetime = utc_object.isoformat()
 
         # ISO formatted local datetime
         self.iso_formatted_local_datetime = local_datetime.isoformat()
-
-        # Julian day calculation
-        utc_float_hour_with_minutes = utc_object.hour + (utc_object.minute / 60)
-        self.julian_day = float(swe.julday(utc_object.year, utc_object.month, utc_object.day, utc_float_hour_with_minutes))
         # <--- UTC, julian day and local time setup
 
         # Planets and Houses setup
         self._initialize_houses()
         self._initialize_planets()
 
-        # Lunar Phase
-        self.lunar_phase = calculate_moon_phase(
-            self.moon.abs_pos,
-            self.sun.abs_pos
-        )
+        # Lunar Phase, calculated on first access when only some points are active
+        if self.active_points is None:
+            self.lunar_phase = calculate_moon_phase(
+                self.moon.abs_pos,
+                self.sun.abs_pos
+            )
 
         # Deprecated properties
         self.utc_time
         self.local_time
 
+    @staticmethod
+    def _get_birth_datetimes(
+        year: int, month: int, day: int, hour: int, minute: int, tz_str: str, is_dst: Union[None, bool]
+    ) -> tuple[datetime, datetime, float]:
+        """
+        Returns the local datetime, the UTC datetime and the julian day (UT) of a local birth time.
+        """
+        # Local time to UTC
+        local_time = pytz.timezone(tz_str)
+        naive_datetime = datetime(year, month, day, hour, minute, 0)
+
+        try:
+            local_datetime = local_time.localize(naive_datetime, is_dst=is_dst)
+        except pytz.exceptions.AmbiguousTimeError:
+            raise KerykeionException("Ambiguous time! Please specify if the time is in DST or not with the is_dst argument.")
+
+        utc_object = local_datetime.astimezone(pytz.utc)
+
+        # Julian day calculation
+        utc_float_hour_with_minutes = utc_object.hour + (utc_object.minute / 60)
+        julian_day = float(swe.julday(utc_object.year, utc_object.month, utc_object.day, utc_float_hour_with_minutes))
+
+        return local_datetime, utc_object, julian_day
+
     def __str__(self) -> str:
         return f"Astrological data for: {self.name}, {self.iso_formatted_utc_datetime} UTC\nBirth location: {self.city}, Lat {self.lat}, Lon {self.lng}"
 
@@ -414,17 +559,57 @@ class AstrologicalSubject:
     def get(self, item, default=None):
         return getattr(self, item, default)
 
+    def __getattr__(self, item):
+        """
+        Calculates the planets left out by active_points, and the lunar phase,
+        the first time they are accessed.
+        """
+        # Only called for missing attributes, vars() avoids recursion before the chart is calculated
+        attributes = vars(self)
+
+        if "_bodies_state" in attributes:
+            if item in PLANETS_ATTRIBUTES and PLANETS_ATTRIBUTES[item] in self.planets_names_list:
+                with SwissEphemerisContext.get_instance().configure(sidereal_mode=self.sidereal_mode, topo=self._topo):
+                    point = self._get_planet_point(PLANETS_ATTRIBUTES[item])
+
+                setattr(self, item, point)
+                return point
+
+            if item == "lunar_phase":
+                self.lunar_phase = calculate_moon_phase(self.moon.abs_pos, self.sun.abs_pos)
+                return self.lunar_phase
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
+
+    def _calculate_all_points(self) -> None:
+        """
+        Calculates the points not calculated yet, if the subject was created with active_points.
+        """
+        for planet in self.planets_names_list:
+            getattr(self, planet.lower())
+
+        self.lunar_phase
+
     def _fetch_and_set_tz_and_coordinates_from_geonames(self) -> None:
-        """Gets the nearest time zone for the calculation"""
-        logging.info("Fetching timezone/coordinates from geonames")
-
-        geonames = FetchGeonames(
-            self.city,
-            self.nation,
-            username=self.geonames_username,
-            cache_expire_after_days=self.cache_expire_after_days
-        )
-        self.city_data: dict[str, str] = geonames.get_serialized_data()
+        """Gets the nearest time zone for the calculation, from the offline gazetteer when possible"""
+        self.city_data: dict[str, str] = {}
+
+        if self.offline_gazetteer is not None:
+            self.city_data = self.offline_gazetteer.get_serialized_data(self.city, self.nation)
+
+            if not self.city_data and not self.online:
+                raise KerykeionException(f"City {self.city}, {self.nation} not found in the offline gazetteer!")
+
+        if not self.city_data:
+            logging.info("Fetching timezone/coordinates from geonames")
+
+            geonames = FetchGeonames(
+                self.city,
+                self.nation,
+                username=self.geonames_username,
+                cache_expire_after_days=self.cache_expire_after_days
+            )
+            self.city_data = geonames.get_serialized_data()
 
         if (
             not "countryCode" in self.city_data
@@ -500,18 +685,18 @@ class AstrologicalSubject:
         point_type: PointType = "House"
 
         # stores the house in singular dictionaries.
-        self.first_house = get_kerykeion_point_from_degree(self._houses_degree_ut[0], "First_House", point_type=point_type)
-        self.second_house = get_kerykeion_point_from_degree(self._houses_degree_ut[1], "Second_House", point_type=point_type)
-        self.third_house = get_kerykeion_point_from_degree(self._houses_degree_ut[2], "Third_House", point_type=point_type)
-        self.fourth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[3], "Fourth_House", point_type=point_type)
-        self.fifth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[4], "Fifth_House", point_type=point_type)
-        self.sixth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[5], "Sixth_House", point_type=point_type)
-        self.seventh_house = get_kerykeion_point_from_degree(self._houses_degree_ut[6], "Seventh_House", point_type=point_type)
-        self.eighth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[7], "Eighth_House", point_type=point_type)
-        self.ninth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[8], "Ninth_House", point_type=point_type)
-        self.tenth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[9], "Tenth_House", point_type=point_type)
-        self.eleventh_house = get_kerykeion_point_from_degree(self._houses_degree_ut[10], "Eleventh_House", point_type=point_type)
-        self.twelfth_house = get_kerykeion_point_from_degree(self._houses_degree_ut[11], "Twelfth_House", point_type=point_type)
+        self.first_house = KerykeionPoint("First_House", self._houses_degree_ut[0], point_type)
+        self.second_house = KerykeionPoint("Second_House", self._houses_degree_ut[1], point_type)
+        self.third_house = KerykeionPoint("Third_House", self._houses_degree_ut[2], point_type)
+        self.fourth_house = KerykeionPoint("Fourth_House", self._houses_degree_ut[3], point_type)
+        self.fifth_house = KerykeionPoint("Fifth_House", self._houses_degree_ut[4], point_type)
+        self.sixth_house = KerykeionPoint("Sixth_House", self._houses_degree_ut[5], point_type)
+        self.seventh_house = KerykeionPoint("Seventh_House", self._houses_degree_ut[6], point_type)
+        self.eighth_house = KerykeionPoint("Eighth_House", self._houses_degree_ut[7], point_type)
+        self.ninth_house = KerykeionPoint("Ninth_House", self._houses_degree_ut[8], point_type)
+        self.tenth_house = KerykeionPoint("Tenth_House", self._houses_degree_ut[9], point_type)
+        self.eleventh_house = KerykeionPoint("Eleventh_House", self._houses_degree_ut[10], point_type)
+        self.twelfth_house = KerykeionPoint("Twelfth_House", self._houses_degree_ut[11], point_type)
 
         self.houses_names_list = list(get_args(Houses))
 
@@ -535,55 +720,68 @@ class AstrologicalSubject:
         point_type: PointType = "AxialCusps"
 
         # Calculate ascendant and medium coeli
-        self.ascendant = get_kerykeion_point_from_degree(_ascmc[0], "Ascendant", point_type=point_type)
-        self.medium_coeli = get_kerykeion_point_from_degree(_ascmc[1], "Medium_Coeli", point_type=point_type)
+        self.ascendant = KerykeionPoint("Ascendant", _ascmc[0], point_type)
+        self.medium_coeli = KerykeionPoint("Medium_Coeli", _ascmc[1], point_type)
         # For descendant and imum coeli there exist no Swiss Ephemeris library calculation function,
         # but they are simply opposite the the ascendant and medium coeli
         dsc_deg = math.fmod(_ascmc[0] + 180, 360)
         ic_deg = math.fmod(_ascmc[1] + 180, 360)
-        self.descendant = get_kerykeion_point_from_degree(dsc_deg, "Descendant", point_type=point_type)
-        self.imum_coeli = get_kerykeion_point_from_degree(ic_deg, "Imum_Coeli", point_type=point_type)
+        self.descendant = KerykeionPoint("Descendant", dsc_deg, point_type)
+        self.imum_coeli = KerykeionPoint("Imum_Coeli", ic_deg, point_type)
+
+    def _get_body_state(self, planet_number: int) -> tuple[float, float, float, float, float, float]:
+        """
+        Returns the full Swiss Ephemeris state of a body: longitude, latitude, distance
+        and their daily speeds. Every body is calculated only once for each subject,
+        from the ephemeris tables when they cover it.
+        """
+        if planet_number not in self._bodies_state:
+            if self.ephemeris_tables is not None and self.ephemeris_tables.covers(self.julian_day, planet_number, self._iflag, self.sidereal_mode):
+                self._bodies_state[planet_number] = self.ephemeris_tables.get_body_state(self.julian_day, planet_number)
+            else:
+                self._bodies_state[planet_number] = swe.calc_ut(self.julian_day, planet_number, self._iflag)[0]
+
+        return self._bodies_state[planet_number]
+
+    def _get_planet_point(self, name: Planet) -> KerykeionPoint:
+        """
+        Creates the KerykeionPoint of a planet from its body state,
+        with house, retrograde flag, speed, latitude and distance.
+        """
+        planet_number = get_number_from_name(name)
+
+        # For south nodes there exist no Swiss Ephemeris library calculation function,
+        # but they are simply opposite the north node and have the same direction.
+        if planet_number == 1000:   # Number of Mean South Node
+            longitude, latitude, distance, speed, _, _ = self._get_body_state(10)
+            longitude = math.fmod(longitude + 180, 360)
+            latitude = -latitude
+        elif planet_number == 1100: # Number of True South Node
+            longitude, latitude, distance, speed, _, _ = self._get_body_state(11)
+            longitude = math.fmod(longitude + 180, 360)
+            latitude = -latitude
+        else:
+            longitude, latitude, distance, speed, _, _ = self._get_body_state(planet_number)
+
+        return KerykeionPoint(
+            name,
+            longitude,
+            "Planet",
+            house=get_planet_house(longitude, self._houses_degree_ut),
+            retrograde=speed < 0,
+            speed=speed,
+            latitude=latitude,
+            distance=distance,
+        )
 
     def _initialize_planets(self) -> None:
         """Defines body positon in signs and information and
         stores them in dictionaries"""
 
-        point_type: PointType = "Planet"
-
-        sun_deg = swe.calc_ut(self.julian_day, 0, self._iflag)[0][0]
-        moon_deg = swe.calc_ut(self.julian_day, 1, self._iflag)[0][0]
-        mercury_deg = swe.calc_ut(self.julian_day, 2, self._iflag)[0][0]
-        venus_deg = swe.calc_ut(self.julian_day, 3, self._iflag)[0][0]
-        mars_deg = swe.calc_ut(self.julian_day, 4, self._iflag)[0][0]
-        jupiter_deg = swe.calc_ut(self.julian_day, 5, self._iflag)[0][0]
-        saturn_deg = swe.calc_ut(self.julian_day, 6, self._iflag)[0][0]
-        uranus_deg = swe.calc_ut(self.julian_day, 7, self._iflag)[0][0]
-        neptune_deg = swe.calc_ut(self.julian_day, 8, self._iflag)[0][0]
-        pluto_deg = swe.calc_ut(self.julian_day, 9, self._iflag)[0][0]
-        mean_node_deg = swe.calc_ut(self.julian_day, 10, self._iflag)[0][0]
-        true_node_deg = swe.calc_ut(self.julian_day, 11, self._iflag)[0][0]
-        # For south nodes there exist no Swiss Ephemeris library calculation function,
-        # but they are simply opposite the north node.
-        mean_south_node_deg = math.fmod(mean_node_deg + 180, 360)
-        true_south_node_deg = math.fmod(true_node_deg + 180, 360)
+        self._bodies_state: dict[int, tuple[float, float, float, float, float, float]] = {}
 
         # AC/DC axis and MC/IC axis were already calculated previously...
 
-        self.sun = get_kerykeion_point_from_degree(sun_deg, "Sun", point_type=point_type)
-        self.moon = get_kerykeion_point_from_degree(moon_deg, "Moon", point_type=point_type)
-        self.mercury = get_kerykeion_point_from_degree(mercury_deg, "Mercury", point_type=point_type)
-        self.venus = get_kerykeion_point_from_degree(venus_deg, "Venus", point_type=point_type)
-        self.mars = get_kerykeion_point_from_degree(mars_deg, "Mars", point_type=point_type)
-        self.jupiter = get_kerykeion_point_from_degree(jupiter_deg, "Jupiter", point_type=point_type)
-        self.saturn = get_kerykeion_point_from_degree(saturn_deg, "Saturn", point_type=point_type)
-        self.uranus = get_kerykeion_point_from_degree(uranus_deg, "Uranus", point_type=point_type)
-        self.neptune = get_kerykeion_point_from_degree(neptune_deg, "Neptune", point_type=point_type)
-        self.pluto = get_kerykeion_point_from_degree(pluto_deg, "Pluto", point_type=point_type)
-        self.mean_node = get_kerykeion_point_from_degree(mean_node_deg, "Mean_Node", point_type=point_type)
-        self.true_node = get_kerykeion_point_from_degree(true_node_deg, "True_Node", point_type=point_type)
-        self.mean_south_node = get_kerykeion_point_from_degree(mean_south_node_deg, "Mean_South_Node", point_type=point_type)
-        self.true_south_node = get_kerykeion_point_from_degree(true_south_node_deg, "True_South_Node", point_type=point_type)
-
         # Note that in whole-sign house systems ac/dc or mc/ic axes may not align with house cusps.
         # Therefore, for the axes we need to calculate house positions explicitly too.
         self.ascendant.house = get_planet_house(self.ascendant.abs_pos, self._houses_degree_ut)
@@ -591,80 +789,38 @@ class AstrologicalSubject:
         self.medium_coeli.house = get_planet_house(self.medium_coeli.abs_pos, self._houses_degree_ut)
         self.imum_coeli.house = get_planet_house(self.imum_coeli.abs_pos, self._houses_degree_ut)
 
-        self.sun.house = get_planet_house(sun_deg, self._houses_degree_ut)
-        self.moon.house = get_planet_house(moon_deg, self._houses_degree_ut)
-        self.mercury.house = get_planet_house(mercury_deg, self._houses_degree_ut)
-        self.venus.house = get_planet_house(venus_deg, self._houses_degree_ut)
-        self.mars.house = get_planet_house(mars_deg, self._houses_degree_ut)
-        self.jupiter.house = get_planet_house(jupiter_deg, self._houses_degree_ut)
-        self.saturn.house = get_planet_house(saturn_deg, self._houses_degree_ut)
-        self.uranus.house = get_planet_house(uranus_deg, self._houses_degree_ut)
-        self.neptune.house = get_planet_house(neptune_deg, self._houses_degree_ut)
-        self.pluto.house = get_planet_house(pluto_deg, self._houses_degree_ut)
-        self.mean_node.house = get_planet_house(mean_node_deg, self._houses_degree_ut)
-        self.true_node.house = get_planet_house(true_node_deg, self._houses_degree_ut)
-        self.mean_south_node.house = get_planet_house(mean_south_node_deg, self._houses_degree_ut)
-        self.true_south_node.house = get_planet_house(true_south_node_deg, self._houses_degree_ut)
-
-
-        # Deprecated
-        planets_list = [
-            self.sun,
-            self.moon,
-            self.mercury,
-            self.venus,
-            self.mars,
-            self.jupiter,
-            self.saturn,
-            self.uranus,
-            self.neptune,
-            self.pluto,
-            self.mean_node,
-            self.true_node,
-            self.mean_south_node,
-            self.true_south_node,
+        self.planets_names_list = [
+            "Sun",
+            "Moon",
+            "Mercury",
+            "Venus",
+            "Mars",
+            "Jupiter",
+            "Saturn",
+            "Uranus",
+            "Neptune",
+            "Pluto",
+            "Mean_Node",
+            "True_Node",
+            "Mean_South_Node",
+            "True_South_Node",
         ]
 
         if not self.disable_chiron_and_lilith:
-            chiron_deg = swe.calc_ut(self.julian_day, 15, self._iflag)[0][0]
-            mean_lilith_deg = swe.calc_ut(self.julian_day, 12, self._iflag)[0][0]
-
-            self.chiron = get_kerykeion_point_from_degree(chiron_deg, "Chiron", point_type=point_type)
-            self.mean_lilith = get_kerykeion_point_from_degree(mean_lilith_deg, "Mean_Lilith", point_type=point_type)
-
-            self.chiron.house = get_planet_house(chiron_deg, self._houses_degree_ut)
-            self.mean_lilith.house = get_planet_house(mean_lilith_deg, self._houses_degree_ut)
-
-            # Deprecated
-            planets_list.append(self.chiron)
-            planets_list.append(self.mean_lilith)
+            self.planets_names_list += ["Chiron", "Mean_Lilith"]
 
         else:
             self.chiron = None
             self.mean_lilith = None
 
-        # FIXME: Update after removing planets_list
-        self.planets_names_list = [planet["name"] for planet in planets_list]
         self.axial_cusps_names_list = [
             axis["name"] for axis in [self.ascendant, self.descendant, self.medium_coeli, self.imum_coeli]
         ]
 
-        # Check in retrograde or not:
-        for planet in planets_list:
-            planet_number = get_number_from_name(planet["name"])
-
-            # Swiss ephemeris library does not offer calculation of direction of south nodes.
-            # But south nodes have same direction as north nodes. We can use those to calculate direction.
-            if planet_number == 1000:   # Number of Mean South Node
-                planet_number = 10      # Number of Mean North Node
-            elif planet_number == 1100: # Number of True South Node
-                planet_number = 11      # Number of True North Node
-
-
-            if swe.calc_ut(self.julian_day, planet_number, self._iflag)[0][3] < 0:
-                planet["retrograde"] = True
-            else:
-                planet["retrograde"] = False
+        # With active_points, the other planets are calculated on first access (see __getattr__)
+        for planet in self.planets_names_list:
+            if self.active_points is None or planet in self.active_points:
+                setattr(self, planet.lower(), self._get_planet_point(planet))
 
         # AC/DC and MC/IC axes are never retrograde. For consistency, set them to be not retrograde.
         self.ascendant.retrograde = False
@@ -680,6 +836,7 @@ class AstrologicalSubject:
         or the home folder.
         """
 
+        self._calculate_all_points()
         KrData = AstrologicalSubjectModel(**self.__dict__)
         json_string = KrData.model_dump_json(exclude_none=True, indent=indent)
 
@@ -701,6 +858,7 @@ class AstrologicalSubject:
         """
         Creates a Pydantic model of the Kerykeion object.
         """
+        self._calculate_all_points()
 
         return AstrologicalSubjectModel(**self.__dict__)
 
@@ -741,6 +899,67 @@ class AstrologicalSubject:
         return float_time
 
 
+    @classmethod
+    async def acreate(cls, *args, geonames_client: Union[AsyncFetchGeonames, None] = None, **kwargs) -> "AstrologicalSubject":
+        """
+        Creates an AstrologicalSubject without blocking the running event loop.
+
+        When the location has to be fetched from geonames, the lookup is done by the asyncio client
+        (the concurrent lookups of the same city are coalesced and capped for each username),
+        then the chart is calculated in a worker thread.
+
+        Args:
+        - Same arguments of AstrologicalSubject.
+        - geonames_client (AsyncFetchGeonames, optional): The client used for the lookups,
+            defaults to the one shared by the running event loop.
+
+        Returns:
+        - AstrologicalSubject: The AstrologicalSubject object.
+
+        Example:
+            subject = await AstrologicalSubject.acreate("John", 1940, 10, 9, 18, 30, "Liverpool", "GB", geonames_username="my_username")
+        """
+        bound_arguments = inspect.signature(cls.__init__).bind(None, *args, **kwargs)
+        bound_arguments.apply_defaults()
+
+        arguments = dict(bound_arguments.arguments)
+        del arguments["self"]
+
+        # Same condition of the constructor for the geonames lookup
+        if arguments["online"] and not arguments["tz_str"] and not arguments["lat"] and not arguments["lng"]:
+            city = arguments["city"] or "London"
+            nation = arguments["nation"] or "GB"
+
+            city_data: dict[str, str] = {}
+            if arguments["offline_gazetteer"] is not None:
+                city_data = arguments["offline_gazetteer"].get_serialized_data(city, nation)
+
+            if arguments["geonames_username"] is None:
+                logging.warning(GEONAMES_DEFAULT_USERNAME_WARNING)
+                arguments["geonames_username"] = DEFAULT_GEONAMES_USERNAME
+
+            if not city_data:
+                logging.info("Fetching timezone/coordinates from geonames")
+                city_data = await (geonames_client or get_async_geonames_client()).get_serialized_data(
+                    city,
+                    nation,
+                    username=arguments["geonames_username"],
+                    cache_expire_after_days=arguments["cache_expire_after_days"] or DEFAULT_GEONAMES_CACHE_EXPIRE_AFTER_DAYS,
+                )
+
+            if not all(field in city_data for field in ("countryCode", "timezonestr", "lat", "lng")):
+                raise KerykeionException("No data found for this city, try again! Maybe check your connection?")
+
+            arguments.update(
+                city=city,
+                nation=city_data["countryCode"],
+                lat=float(city_data["lat"]),
+                lng=float(city_data["lng"]),
+                tz_str=city_data["timezonestr"],
+            )
+
+        return await asyncio.to_thread(lambda: cls(**arguments))
+
     @staticmethod
     def get_from_iso_utc_time(
         name: str,
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Union
+
+from kerykeion.fetch_geonames import (
+    FetchGeonames,
+    DEFAULT_GEONAMES_URL,
+    GEONAMES_POOL_MAXSIZE,
+    _add_resolved_city,
+    _get_resolved_city,
+    _get_resolved_city_key,
+    _get_search_params,
+    _parse_search_response,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+
+DEFAULT_MAX_CONCURRENT_REQUESTS_PER_USERNAME = 4
+"""Default maximum number of lookups running at the same time for each geonames username."""
+
+GEONAMES_REQUEST_TIMEOUT_SECONDS = 10
+"""Timeout of every request of the native asyncio lookups."""
+
+_GeonamesLookupKey = tuple[str, str, str, int]
+
+_default_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncFetchGeonames]" = weakref.WeakKeyDictionary()
+
+
+class AsyncFetchGeonames:
+    """
+    Asyncio client of the GeoNames API, for the applications running in an event loop.
+
+    With httpx installed (pip install kerykeion[httpx]) the lookups are native asyncio requests,
+    made by an httpx.AsyncClient that keeps up to GEONAMES_POOL_MAXSIZE connections alive: an in-flight
+    lookup holds no thread. Without httpx, the lookups fall back to the synchronous FetchGeonames run
+    in the default thread pool of the loop (asyncio.to_thread), so every in-flight lookup holds a worker
+    thread and the concurrency is also capped by the size of that pool.
+
+    Both ways share the in-memory cache of the resolved cities of FetchGeonames. The persistent HTTP cache
+    (requests_cache) is used only by the thread fallback. On top of them:
+
+    - the concurrent lookups of the same city and country are coalesced in a single request,
+      all the callers get the same result;
+    - the lookups running at the same time are capped for each username,
+      so that a burst of requests doesn't burn the hourly quota of the account.
+
+    An instance belongs to the event loop where it's first used, get_async_geonames_client
+    returns a shared instance for the running loop. Close the instances you create with aclose,
+    or use them with "async with".
+
+    Args:
+    - max_concurrent_requests_per_username (int, optional): Maximum number of lookups running at the same time
+        for each username. Defaults to DEFAULT_MAX_CONCURRENT_REQUESTS_PER_USERNAME.
+    - geonames_url (str, optional): Base URL of the GeoNames API, defaults to DEFAULT_GEONAMES_URL.
+    - use_threads (bool, optional): If True, the lookups run FetchGeonames in worker threads also when httpx
+        is installed. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests_per_username: int = DEFAULT_MAX_CONCURRENT_REQUESTS_PER_USERNAME,
+        geonames_url: str = DEFAULT_GEONAMES_URL,
+        use_threads: bool = False,
+    ):
+        self.max_concurrent_requests_per_username = max_concurrent_requests_per_username
+        self.geonames_url = geonames_url
+        self.use_threads = use_threads or httpx is None
+
+        self._in_flight: dict[_GeonamesLookupKey, asyncio.Future] = {}
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._http_client: Union["httpx.AsyncClient", None] = None
+
+    async def __aenter__(self) -> "AsyncFetchGeonames":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections of the native lookups.
+        """
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=GEONAMES_REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=GEONAMES_POOL_MAXSIZE, max_keepalive_connections=GEONAMES_POOL_MAXSIZE),
+            )
+
+        return self._http_client
+
+    def _get_semaphore(self, username: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(username)
+        if semaphore is None:
+            semaphore = self._semaphores[username] = asyncio.Semaphore(self.max_concurrent_requests_per_username)
+
+        return semaphore
+
+    async def _fetch(self, city_name: str, country_code: str, username: str, cache_expire_after_days: int) -> dict[str, str]:
+        async with self._get_semaphore(username):
+            if self.use_threads:
+                geonames = FetchGeonames(
+                    city_name,
+                    country_code,
+                    username=username,
+                    cache_expire_after_days=cache_expire_after_days,
+                    geonames_url=self.geonames_url,
+                )
+                return await asyncio.to_thread(geonames.get_serialized_data)
+
+            return await self._fetch_native(city_name, country_code, username)
+
+    async def _get_json(self, endpoint: str, params: dict[str, Any]) -> Any:
+        url = f"{self.geonames_url}/{endpoint}"
+        logging.debug(f"Requesting data from geonames: {url} {params}")
+
+        response = await self._get_http_client().get(url, params=params)
+        return response.json()
+
+    async def _fetch_native(self, city_name: str, country_code: str, username: str) -> dict[str, str]:
+        """
+        Looks up a city with native asyncio requests, like FetchGeonames.get_serialized_data.
+        """
+        resolved_city_key = _get_resolved_city_key(self.geonames_url, city_name, country_code)
+
+        resolved_city = _get_resolved_city(resolved_city_key)
+        if resolved_city is not None:
+            return resolved_city
+
+        try:
+            city_data = _parse_search_response(await self._get_json("searchJSON", _get_search_params(city_name, country_code, username)))
+        except Exception as e:
+            logging.error(f"Error fetching the geonames city of {city_name}, {country_code}: {e}")
+            return {}
+
+        # Like FetchGeonames, a failed timezone lookup returns the city data only
+        serialized_data = dict(city_data)
+        try:
+            timezone_response = await self._get_json("timezoneJSON", {"lat": city_data["lat"], "lng": city_data["lng"], "username": username})
+            serialized_data["timezonestr"] = timezone_response["timezoneId"]
+        except Exception as e:
+            logging.error(f"Error fetching the geonames timezone of {city_name}, {country_code}: {e}")
+
+        _add_resolved_city(resolved_city_key, serialized_data)
+
+        return serialized_data
+
+    async def get_serialized_data(
+        self,
+        city_name: str,
+        country_code: str,
+        username: str = "century.boy",
+        cache_expire_after_days: int = 30,
+    ) -> dict[str, str]:
+        """
+        Returns all the data necessary for the Kerykeion calculation, like FetchGeonames.get_serialized_data.
+
+        Args:
+        - city_name (str): Name of the city
+        - country_code (str): Two letters country code
+        - username (str, optional): GeoNames username, defaults to "century.boy".
+        - cache_expire_after_days (int, optional): Cache expiration time in days, defaults to 30.
+
+        Returns:
+        - dict[str, str]: timezonestr, name, lat, lng and countryCode of the city, empty when the lookup fails.
+        """
+        key = (city_name.strip().casefold(), country_code.strip().upper(), username, cache_expire_after_days)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(city_name, country_code, username, cache_expire_after_days))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            logging.debug(f"Joining the geonames lookup in flight for {city_name}, {country_code}")
+
+        # A cancelled caller must not cancel the lookup shared with the others
+        return dict(await asyncio.shield(future))
+
+
+def get_async_geonames_client() -> AsyncFetchGeonames:
+    """
+    Returns the AsyncFetchGeonames shared by the lookups of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+
+    client = _default_clients.get(loop)
+    if client is None:
+        client = _default_clients[loop] = AsyncFetchGeonames()
+
+    return client
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    async def main() -> None:
+        async with AsyncFetchGeonames() as client:
+            results = await asyncio.gather(*(client.get_serialized_data("Montichiari", "IT") for _ in range(5)))
+            print(results[0])
+
+    asyncio.run(main())
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import math
+import swisseph as swe
+from datetime import datetime, timezone
+from typing import Any, Union, get_args, TYPE_CHECKING
+
+from kerykeion.astrological_subject import DEFAULT_HOUSES_SYSTEM_IDENTIFIER, DEFAULT_PERSPECTIVE_TYPE, DEFAULT_ZODIAC_TYPE
+from kerykeion.kr_types import KerykeionException, Planet, SiderealMode, HousesSystemIdentifier, PerspectiveType, ZodiacType
+from kerykeion.swiss_ephemeris_context import SwissEphemerisContext
+from kerykeion.utilities import get_number_from_name, check_and_adjust_polar_latitude, import_numpy
+
+if TYPE_CHECKING:
+    from kerykeion.ephemeris_tables import ChebyshevEphemeris
+
+
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+"""Julian day of 1970-01-01T00:00:00 UTC."""
+
+DEFAULT_COLUMNAR_BODIES: tuple[Planet, ...] = (
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "Mean_Node",
+    "True_Node",
+    "Mean_South_Node",
+    "True_South_Node",
+    "Chiron",
+    "Mean_Lilith",
+)
+"""The bodies calculated when no list is given, the same planets of AstrologicalSubject."""
+
+# South nodes are the north nodes mirrored, see AstrologicalSubject._get_planet_point
+_SOUTH_NODES = {1000: 10, 1100: 11}
+
+
+def get_swisseph_flags(zodiac_type: ZodiacType, perspective_type: PerspectiveType) -> int:
+    """
+    Returns the Swiss Ephemeris flags of calc_ut for a zodiac type and a perspective, the same used by AstrologicalSubject.
+    """
+    iflag = swe.FLG_SWIEPH + swe.FLG_SPEED
+
+    if perspective_type == "True Geocentric":
+        iflag += swe.FLG_TRUEPOS
+    elif perspective_type == "Heliocentric":
+        iflag += swe.FLG_HELCTR
+    elif perspective_type == "Topocentric":
+        iflag += swe.FLG_TOPOCTR
+    elif perspective_type != "Apparent Geocentric":
+        raise KerykeionException(f"'{perspective_type}' is NOT a valid chart perspective! Available perspectives are: {get_args(PerspectiveType)}")
+
+    if zodiac_type == "Sidereal":
+        iflag += swe.FLG_SIDEREAL
+
+    return iflag
+
+
+def get_body_state(
+    julian_day: float,
+    planet_number: int,
+    iflag: int,
+    sidereal_mode: Union[SiderealMode, None] = None,
+    topo: Union[tuple[float, float, float], None] = None,
+    ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+) -> tuple[float, float, float, float, float, float]:
+    """
+    Returns the state of a body like swe.calc_ut: longitude, latitude, distance and their daily speeds.
+    The state is read from the ephemeris tables when they cover it, the south nodes are the north nodes mirrored.
+    """
+    north_node_number = _SOUTH_NODES.get(planet_number, planet_number)
+
+    if ephemeris_tables is not None and ephemeris_tables.covers(julian_day, north_node_number, iflag, sidereal_mode):
+        state = ephemeris_tables.get_body_state(julian_day, north_node_number)
+    else:
+        with SwissEphemerisContext.get_instance().configure(sidereal_mode=sidereal_mode, topo=topo):
+            state = swe.calc_ut(julian_day, north_node_number, iflag)[0]
+
+    if planet_number in _SOUTH_NODES:
+        longitude, latitude, distance, longitude_speed, latitude_speed, distance_speed = state
+        return math.fmod(longitude + 180, 360), -latitude, distance, longitude_speed, -latitude_speed, distance_speed
+
+    return state
+
+
+def get_julian_day_from_datetime(dt: datetime) -> float:
+    """
+    Converts a datetime to a julian day (UT). Naive datetimes are considered UTC.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+
+    return dt.timestamp() / 86400 + UNIX_EPOCH_JULIAN_DAY
+
+
+class ColumnarEphemerisFactory:
+    """
+    Positions-only ephemeris for a julian day range, returned as columns of NumPy arrays.
+
+    Unlike EphemerisDataFactory no AstrologicalSubject is created: the samples are spaced
+    by a fixed step in Universal Time, the timestamps are derived from the julian days with
+    array arithmetic, and only the requested bodies (and, optionally, the houses) are calculated.
+    NumPy is an optional dependency: pip install kerykeion[numpy].
+
+    Args:
+    - start_julian_day (float): The first julian day (UT) of the range.
+    - end_julian_day (float): The last julian day (UT) of the range, included when it falls on a step.
+    - step (float, optional): The step between two samples, in days. Defaults to 1.
+    - bodies (list[Planet], optional): The bodies to calculate. Defaults to DEFAULT_COLUMNAR_BODIES.
+    - zodiac_type (ZodiacType, optional): The zodiac type. Defaults to DEFAULT_ZODIAC_TYPE.
+    - sidereal_mode (SiderealMode, optional): The sidereal mode, for the Sidereal zodiac. Defaults to None (FAGAN_BRADLEY).
+    - perspective_type (PerspectiveType, optional): The perspective. Defaults to DEFAULT_PERSPECTIVE_TYPE.
+    - houses_system_identifier (HousesSystemIdentifier, optional): The houses system, for include_houses.
+        Defaults to DEFAULT_HOUSES_SYSTEM_IDENTIFIER.
+    - lat (float, optional): The latitude, for the houses and the Topocentric perspective. Defaults to 51.4769 (Greenwich).
+    - lng (float, optional): The longitude, for the houses and the Topocentric perspective. Defaults to 0.0005 (Greenwich).
+    - include_houses (bool, optional): If True, the house cusps, the ascendant and the medium coeli are calculated too.
+        Defaults to False.
+    - ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables, the bodies they cover for the whole range
+        are evaluated from them instead of the Swiss Ephemeris. Defaults to None.
+
+    Example:
+        factory = ColumnarEphemerisFactory(2460676.5, 2461041.5, step=1 / 1440, bodies=["Sun", "Moon"])
+        data = factory.get_ephemeris_arrays()
+        moon_longitudes = data["longitude"][:, data["bodies"].index("Moon")]
+    """
+
+    def __init__(
+        self,
+        start_julian_day: float,
+        end_julian_day: float,
+        step: float = 1.0,
+        bodies: Union[list[Planet], tuple[Planet, ...], None] = None,
+        zodiac_type: ZodiacType = DEFAULT_ZODIAC_TYPE,
+        sidereal_mode: Union[SiderealMode, None] = None,
+        perspective_type: PerspectiveType = DEFAULT_PERSPECTIVE_TYPE,
+        houses_system_identifier: HousesSystemIdentifier = DEFAULT_HOUSES_SYSTEM_IDENTIFIER,
+        lat: float = 51.4769,
+        lng: float = 0.0005,
+        include_houses: bool = False,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+    ):
+        if step <= 0:
+            raise ValueError(f"Invalid step: {step}. The step must be a positive number of days.")
+
+        self.start_julian_day = float(start_julian_day)
+        self.end_julian_day = float(end_julian_day)
+        self.step = float(step)
+        self.bodies: list[Planet] = list(bodies if bodies is not None else DEFAULT_COLUMNAR_BODIES)
+        self.zodiac_type = zodiac_type
+        self.sidereal_mode = sidereal_mode
+        self.perspective_type = perspective_type
+        self.houses_system_identifier = houses_system_identifier
+        self.lat = lat
+        self.lng = lng
+        self.include_houses = include_houses
+        self.ephemeris_tables = ephemeris_tables
+
+        # The small tolerance keeps the end of the range when it falls on a step
+        self.samples_count = int(math.floor((self.end_julian_day - self.start_julian_day) / self.step + 1e-9)) + 1
+        if self.samples_count < 1:
+            raise ValueError("No dates found. Check the julian day range and step values.")
+
+        for body in self.bodies:
+            if body not in get_args(Planet):
+                raise KerykeionException(f"'{body}' is not a valid body! Available bodies are: {get_args(Planet)}")
+
+        if self.zodiac_type not in get_args(ZodiacType):
+            raise KerykeionException(f"'{self.zodiac_type}' is NOT a valid zodiac type! Available types are: {get_args(ZodiacType)}")
+
+        if self.sidereal_mode and self.zodiac_type == "Tropic":
+            raise KerykeionException("You can't set a sidereal mode with a Tropic zodiac type!")
+
+        if self.zodiac_type == "Sidereal" and not self.sidereal_mode:
+            self.sidereal_mode = "FAGAN_BRADLEY"
+
+        self._iflag = get_swisseph_flags(self.zodiac_type, self.perspective_type)
+
+    def get_julian_days(self) -> Any:
+        """
+        Returns the julian days of the samples, as a NumPy array.
+        """
+        np = import_numpy()
+        return self.start_julian_day + self.step * np.arange(self.samples_count, dtype=np.float64)
+
+    def get_ephemeris_arrays(self) -> dict[str, Any]:
+        """
+        Calculates the ephemeris of the range.
+
+        Returns:
+        - dict[str, Any]: The columns of the ephemeris:
+            - julian_day: julian days (UT), shape (samples,);
+            - timestamp: UNIX timestamps in seconds, shape (samples,);
+            - datetime: UTC datetimes as datetime64[ms], shape (samples,);
+            - bodies: the names of the bodies, in the order of the columns of the next arrays;
+            - longitude, latitude, distance, speed: one column per body, shape (samples, bodies),
+              in degrees, AU and degrees per day;
+            - houses, ascendant, medium_coeli: only with include_houses, the twelve cusps
+              with shape (samples, 12) and the axes with shape (samples,).
+        """
+        np = import_numpy()
+
+        julian_days = self.get_julian_days()
+        timestamps = (julian_days - UNIX_EPOCH_JULIAN_DAY) * 86400.0
+
+        data: dict[str, Any] = {
+            "julian_day": julian_days,
+            "timestamp": timestamps,
+            "datetime": np.datetime64(0, "ms") + np.rint(timestamps * 1000).astype("timedelta64[ms]"),
+            "bodies": list(self.bodies),
+        }
+
+        topo = (self.lng, self.lat, 0) if self.perspective_type == "Topocentric" else None
+        julian_days_list = julian_days.tolist()
+        calc_ut = swe.calc_ut
+        iflag = self._iflag
+
+        states = np.empty((self.samples_count, len(self.bodies), 4), dtype=np.float64)
+        calculated_states: dict[int, Any] = {}
+
+        with SwissEphemerisContext.get_instance().configure(sidereal_mode=self.sidereal_mode, topo=topo):
+            for index, body in enumerate(self.bodies):
+                planet_number = get_number_from_name(body)
+                north_node_number = _SOUTH_NODES.get(planet_number, planet_number)
+
+                if north_node_number not in calculated_states and self._tables_cover(north_node_number):
+                    calculated_states[north_node_number] = self.ephemeris_tables.get_body_states(julian_days, north_node_number)[:, :4]  # type: ignore
+                elif north_node_number not in calculated_states:
+                    calculated_states[north_node_number] = np.array(
+                        [calc_ut(julian_day, north_node_number, iflag)[0][:4] for julian_day in julian_days_list],
+                        dtype=np.float64,
+                    ).reshape(self.samples_count, 4)
+
+                states[:, index, :] = calculated_states[north_node_number]
+
+                if planet_number in _SOUTH_NODES:
+                    states[:, index, 0] = np.fmod(states[:, index, 0] + 180.0, 360.0)
+                    states[:, index, 1] = -states[:, index, 1]
+
+            if self.include_houses:
+                houses, ascendants, medium_coelis = self._get_houses(julian_days_list)
+
+                data["houses"] = np.array(houses, dtype=np.float64)
+                data["ascendant"] = np.array(ascendants, dtype=np.float64)
+                data["medium_coeli"] = np.array(medium_coelis, dtype=np.float64)
+
+        data["longitude"] = states[:, :, 0]
+        data["latitude"] = states[:, :, 1]
+        data["distance"] = states[:, :, 2]
+        data["speed"] = states[:, :, 3]
+
+        return data
+
+    def _tables_cover(self, planet_number: int) -> bool:
+        """
+        Checks if the ephemeris tables cover a body for the whole range.
+        """
+        return (
+            self.ephemeris_tables is not None
+            and self.ephemeris_tables.covers(self.start_julian_day, planet_number, self._iflag, self.sidereal_mode)
+            and self.ephemeris_tables.covers(self.start_julian_day + self.step * (self.samples_count - 1), planet_number, self._iflag, self.sidereal_mode)
+        )
+
+    def _get_houses(self, julian_days: list[float]) -> tuple[list, list, list]:
+        """
+        Calculates the house cusps and the axes, like AstrologicalSubject._initialize_houses.
+        """
+        lat = check_and_adjust_polar_latitude(self.lat)
+        hsys = self.houses_system_identifier.encode("ascii")
+
+        houses, ascendants, medium_coelis = [], [], []
+        for julian_day in julian_days:
+            if self.zodiac_type == "Sidereal":
+                cusps, ascmc = swe.houses_ex(tjdut=julian_day, lat=lat, lon=self.lng, hsys=hsys, flags=swe.FLG_SIDEREAL)
+            else:
+                cusps, ascmc = swe.houses(tjdut=julian_day, lat=lat, lon=self.lng, hsys=hsys)
+
+            houses.append(cusps[:12])
+            ascendants.append(ascmc[0])
+            medium_coelis.append(ascmc[1])
+
+        return houses, ascendants, medium_coelis
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    start_julian_day = get_julian_day_from_datetime(datetime(2025, 1, 1))
+
+    start = perf_counter()
+    data = ColumnarEphemerisFactory(start_julian_day, start_julian_day + 30, step=1 / 1440).get_ephemeris_arrays()
+    print(f"{len(data['julian_day'])} samples in {perf_counter() - start:.2f}s")
+    print(data["datetime"][0], dict(zip(data["bodies"], data["longitude"][0])))
@@ -1,17 +1,65 @@
 from kerykeion import AstrologicalSubject
 from kerykeion.utilities import get_houses_list, get_available_astrological_points_list
 from kerykeion.astrological_subject import DEFAULT_HOUSES_SYSTEM_IDENTIFIER, DEFAULT_PERSPECTIVE_TYPE, DEFAULT_ZODIAC_TYPE
-from kerykeion.kr_types import EphemerisDictModel
+from kerykeion.adaptive_ephemeris import AdaptiveEphemerisFactory
+from kerykeion.columnar_ephemeris import ColumnarEphemerisFactory, get_julian_day_from_datetime
+from kerykeion.ephemeris_tables import ChebyshevEphemeris
+from kerykeion.kr_types import EphemerisDictModel, EphemerisSampleModel, AstrologicalSubjectModel, KerykeionPointModel, Planet
 from kerykeion.kr_types import SiderealMode, HousesSystemIdentifier, PerspectiveType, ZodiacType
+from kerykeion.swiss_ephemeris_context import SwissEphemerisContext
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Literal, Union, List
+from typing import Any, Iterator, Literal, Mapping, Union, List
 import logging
+import math
+import pytz
+
+
+# The factory of the worker process, set once by _initialize_worker
+_worker_factory: Union["EphemerisDataFactory", None] = None
+
+
+def _initialize_worker(factory: "EphemerisDataFactory") -> None:
+    """
+    Sets up a worker process of the pool: the Swiss Ephemeris is initialized once
+    and the factory is kept for all the chunks calculated by the worker.
+    """
+    global _worker_factory
+
+    SwissEphemerisContext.get_instance()
+    _worker_factory = factory
+
+
+def _get_chunk(first_index: int, last_index: int, as_model: bool, astrological_subjects: bool) -> list:
+    """
+    Calculates the dates of a chunk of the range in a worker process.
+    """
+    factory = _worker_factory
+    if factory is None:
+        raise RuntimeError("The worker process has not been initialized.")
+
+    if astrological_subjects:
+        return [factory._get_subject_item(factory._get_date(index), as_model) for index in range(first_index, last_index)]
+
+    return [factory._get_ephemeris_item(factory._get_date(index), as_model) for index in range(first_index, last_index)]
 
 
 class EphemerisDataFactory:
     """
     This class is used to generate ephemeris data for a given date range.
 
+    The dates are generated on the fly: iter_ephemeris_data and iter_astrological_subjects yield
+    one date at a time in constant memory, so that long ranges can be written straight to a file or a socket
+    (set the max_days, max_hours and max_minutes checks to None for them).
+    get_ephemeris_data and get_ephemeris_data_as_astrological_subjects return the same data as lists,
+    get_columnar_ephemeris_data returns only the positions, as NumPy arrays, and is much faster.
+    iter_adaptive_ephemeris_data ignores the step and samples every body following its speed.
+
+    With workers greater than 1 the range is split in contiguous chunks of dates, calculated
+    by a pool of processes; the results are merged in the order of the dates, both by the iterators
+    (keeping only a few chunks in memory) and by the list methods.
+
     Parameters:
     - start_datetime: datetime object representing the start date and time.
     - end_datetime: datetime object representing the end date and time.
@@ -32,12 +80,19 @@ class EphemerisDataFactory:
         Set it to None to disable the check. Default is 8760.
     - max_minutes: integer representing the maximum number of minutes.
         Set it to None to disable the check. Default is 525600.
+    - ephemeris_tables: ChebyshevEphemeris precomputed tables, used instead of the Swiss Ephemeris
+        for the bodies and dates they cover. Default is None.
+    - workers: integer representing the number of processes calculating the dates. Default is 1 (no processes).
+    - chunk_size: integer representing the number of dates sent to a process at once.
+        Default is None, which splits the range in about 4 chunks per worker, of at most MAX_CHUNK_SIZE dates.
 
     Raises:
     - ValueError: if the step type is invalid.
     - ValueError: if the number of days, hours, or minutes is greater than the maximum allowed.
     """
 
+    MAX_CHUNK_SIZE = 1000
+
     def __init__(
         self,
         start_datetime: datetime,
@@ -56,6 +111,9 @@ class EphemerisDataFactory:
         max_days: Union[int, None] = 730,
         max_hours: Union[int, None] = 8760,
         max_minutes: Union[int, None] = 525600,
+        ephemeris_tables: Union[ChebyshevEphemeris, None] = None,
+        workers: int = 1,
+        chunk_size: Union[int, None] = None,
     ):
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
@@ -73,33 +131,163 @@ class EphemerisDataFactory:
         self.max_days = max_days
         self.max_hours = max_hours
         self.max_minutes = max_minutes
+        self.ephemeris_tables = ephemeris_tables
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        if self.workers < 1:
+            raise ValueError(f"Invalid workers: {self.workers}. At least one worker is needed.")
+
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError(f"Invalid chunk size: {self.chunk_size}. The chunks must contain at least one date.")
 
-        self.dates_list = []
+        # Only the number of dates is calculated here, the dates are generated by iter_dates
         if self.step_type == "days":
-            self.dates_list = [self.start_datetime + timedelta(days=i * self.step) for i in range((self.end_datetime - self.start_datetime).days // self.step + 1)]
-            if max_days and (len(self.dates_list) > max_days):
-                raise ValueError(f"Too many days: {len(self.dates_list)} > {self.max_days}. To prevent this error, set max_days to a higher value or reduce the date range.")
+            self.step_timedelta = timedelta(days=self.step)
+            self.dates_count = max((self.end_datetime - self.start_datetime).days // self.step + 1, 0)
+            if max_days and (self.dates_count > max_days):
+                raise ValueError(f"Too many days: {self.dates_count} > {self.max_days}. To prevent this error, set max_days to a higher value or reduce the date range.")
 
         elif self.step_type == "hours":
             hours_diff = (self.end_datetime - self.start_datetime).total_seconds() / 3600
-            self.dates_list = [self.start_datetime + timedelta(hours=i * self.step) for i in range(int(hours_diff) // self.step + 1)]
-            if max_hours and (len(self.dates_list) > max_hours):
-                raise ValueError(f"Too many hours: {len(self.dates_list)} > {self.max_hours}. To prevent this error, set max_hours to a higher value or reduce the date range.")
+            self.step_timedelta = timedelta(hours=self.step)
+            self.dates_count = max(int(hours_diff) // self.step + 1, 0)
+            if max_hours and (self.dates_count > max_hours):
+                raise ValueError(f"Too many hours: {self.dates_count} > {self.max_hours}. To prevent this error, set max_hours to a higher value or reduce the date range.")
 
         elif self.step_type == "minutes":
             minutes_diff = (self.end_datetime - self.start_datetime).total_seconds() / 60
-            self.dates_list = [self.start_datetime + timedelta(minutes=i * self.step) for i in range(int(minutes_diff) // self.step + 1)]
-            if max_minutes and (len(self.dates_list) > max_minutes):
-                raise ValueError(f"Too many minutes: {len(self.dates_list)} > {self.max_minutes}. To prevent this error, set max_minutes to a higher value or reduce the date range.")
+            self.step_timedelta = timedelta(minutes=self.step)
+            self.dates_count = max(int(minutes_diff) // self.step + 1, 0)
+            if max_minutes and (self.dates_count > max_minutes):
+                raise ValueError(f"Too many minutes: {self.dates_count} > {self.max_minutes}. To prevent this error, set max_minutes to a higher value or reduce the date range.")
 
         else:
             raise ValueError(f"Invalid step type: {self.step_type}")
 
-        if not self.dates_list:
+        if not self.dates_count:
             raise ValueError("No dates found. Check the date range and step values.")
 
-        if len(self.dates_list) > 1000:
-            logging.warning(f"Large number of dates: {len(self.dates_list)}. The calculation may take a while.")
+        if self.dates_count > 1000:
+            logging.warning(f"Large number of dates: {self.dates_count}. The calculation may take a while.")
+
+    def iter_dates(self) -> Iterator[datetime]:
+        """
+        Yields the dates of the range, one at a time.
+        """
+        for i in range(self.dates_count):
+            yield self._get_date(i)
+
+    def _get_date(self, index: int) -> datetime:
+        return self.start_datetime + self.step_timedelta * index
+
+    @property
+    def dates_list(self) -> List[datetime]:
+        """
+        The dates of the range as a list, prefer iter_dates for long ranges.
+        """
+        return list(self.iter_dates())
+
+    def _get_astrological_subject(self, date: datetime) -> AstrologicalSubject:
+        return AstrologicalSubject(
+            year=date.year,
+            month=date.month,
+            day=date.day,
+            hour=date.hour,
+            minute=date.minute,
+            lng=self.lng,
+            lat=self.lat,
+            tz_str=self.tz_str,
+            city="Placeholder",
+            nation="Placeholder",
+            online=False,
+            disable_chiron_and_lilith=self.disable_chiron_and_lilith,
+            zodiac_type=self.zodiac_type,
+            sidereal_mode=self.sidereal_mode,
+            houses_system_identifier=self.houses_system_identifier,
+            perspective_type=self.perspective_type,
+            is_dst=self.is_dst,
+            ephemeris_tables=self.ephemeris_tables,
+        )
+
+    def _get_ephemeris_item(self, date: datetime, as_model: bool) -> Union[dict, EphemerisDictModel]:
+        subject = self._get_astrological_subject(date)
+
+        # The items hold KerykeionPointModel points, not the compact points of the subject
+        houses_list = [KerykeionPointModel.model_validate(house) for house in get_houses_list(subject)]
+        available_planets = [KerykeionPointModel.model_validate(planet) for planet in get_available_astrological_points_list(subject)]
+
+        data = {"date": date.isoformat(), "planets": available_planets, "houses": houses_list}
+
+        if as_model:
+            return EphemerisDictModel(**data)
+
+        return data
+
+    def _get_subject_item(self, date: datetime, as_model: bool) -> Union[AstrologicalSubject, AstrologicalSubjectModel]:
+        subject = self._get_astrological_subject(date)
+
+        if as_model:
+            return subject.model()
+
+        return subject
+
+    def _iter_chunks_results(self, as_model: bool, astrological_subjects: bool) -> Iterator[Any]:
+        """
+        Calculates the chunks of the range in a process pool and yields their items in the order of the dates.
+        At most two chunks per worker are submitted ahead of the one being yielded.
+        """
+        chunk_size = self.chunk_size or min(max(math.ceil(self.dates_count / (self.workers * 4)), 1), self.MAX_CHUNK_SIZE)
+
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_initialize_worker, initargs=(self,))
+        pending: deque[Future] = deque()
+        try:
+            for first_index in range(0, self.dates_count, chunk_size):
+                last_index = min(first_index + chunk_size, self.dates_count)
+                pending.append(executor.submit(_get_chunk, first_index, last_index, as_model, astrological_subjects))
+
+                if len(pending) > self.workers * 2:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Stops the pool also when the caller doesn't consume the whole iterator
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def iter_ephemeris_data(self, as_model: bool = False) -> Iterator[Union[dict, EphemerisDictModel]]:
+        """
+        Yields the ephemeris data of the date range one date at a time, in constant memory.
+        Every item has the same structure of the items of get_ephemeris_data.
+
+        Args:
+        - as_model (bool): If True, EphemerisDictModel instances are yielded. Default is False.
+
+        Example usage:
+            with open("ephemeris.jsonl", "w") as file:
+                for data in factory.iter_ephemeris_data(as_model=True):
+                    file.write(data.model_dump_json() + "\n")
+        """
+        if self.workers > 1:
+            yield from self._iter_chunks_results(as_model, astrological_subjects=False)
+            return
+
+        for date in self.iter_dates():
+            yield self._get_ephemeris_item(date, as_model)
+
+    def iter_astrological_subjects(self, as_model: bool = False) -> Iterator[Union[AstrologicalSubject, AstrologicalSubjectModel]]:
+        """
+        Yields an AstrologicalSubject for each date of the range, one at a time.
+
+        Args:
+        - as_model (bool): If True, AstrologicalSubjectModel instances are yielded. Default is False.
+        """
+        if self.workers > 1:
+            yield from self._iter_chunks_results(as_model, astrological_subjects=True)
+            return
+
+        for date in self.iter_dates():
+            yield self._get_subject_item(date, as_model)
 
     def get_ephemeris_data(self, as_model: bool = False) -> list:
         """
@@ -121,37 +309,7 @@ class EphemerisDataFactory:
         Returns:
         - list: A list of dictionaries representing the ephemeris data. If as_model is True, a list of EphemerisDictModel instances is returned.
         """
-        ephemeris_data_list = []
-        for date in self.dates_list:
-            subject = AstrologicalSubject(
-                year=date.year,
-                month=date.month,
-                day=date.day,
-                hour=date.hour,
-                minute=date.minute,
-                lng=self.lng,
-                lat=self.lat,
-                tz_str=self.tz_str,
-                city="Placeholder",
-                nation="Placeholder",
-                online=False,
-                disable_chiron_and_lilith=self.disable_chiron_and_lilith,
-                zodiac_type=self.zodiac_type,
-                sidereal_mode=self.sidereal_mode,
-                houses_system_identifier=self.houses_system_identifier,
-                perspective_type=self.perspective_type,
-                is_dst=self.is_dst,
-            )
-
-            houses_list = get_houses_list(subject)
-            available_planets = get_available_astrological_points_list(subject)
-
-            ephemeris_data_list.append({"date": date.isoformat(), "planets": available_planets, "houses": houses_list})
-
-        if as_model:
-            return [EphemerisDictModel(**data) for data in ephemeris_data_list]
-
-        return ephemeris_data_list
+        return list(self.iter_ephemeris_data(as_model=as_model))
 
     def get_ephemeris_data_as_astrological_subjects(self, as_model: bool = False) -> List[AstrologicalSubject]:
         """
@@ -173,35 +331,90 @@ class EphemerisDataFactory:
             all_points = subjects[0].get_all_points()
             chart_drawing = subjects[0].draw_chart()
         """
-        subjects_list = []
-        for date in self.dates_list:
-            subject = AstrologicalSubject(
-                year=date.year,
-                month=date.month,
-                day=date.day,
-                hour=date.hour,
-                minute=date.minute,
-                lng=self.lng,
-                lat=self.lat,
-                tz_str=self.tz_str,
-                city="Placeholder",
-                nation="Placeholder",
-                online=False,
-                disable_chiron_and_lilith=self.disable_chiron_and_lilith,
-                zodiac_type=self.zodiac_type,
-                sidereal_mode=self.sidereal_mode,
-                houses_system_identifier=self.houses_system_identifier,
-                perspective_type=self.perspective_type,
-                is_dst=self.is_dst,
-            )
-
-            if as_model:
-                subjects_list.append(subject.model())
-            else:
-                subjects_list.append(subject)
-
-        return subjects_list
+        return list(self.iter_astrological_subjects(as_model=as_model))
+
+    def get_columnar_ephemeris_data(self, bodies: Union[List[Planet], None] = None, include_houses: bool = False) -> dict[str, Any]:
+        """
+        Positions-only ephemeris of the date range, as columns of NumPy arrays (see ColumnarEphemerisFactory).
+        No AstrologicalSubject is created, NumPy is required (pip install kerykeion[numpy]).
+
+        The samples start at the start datetime, in the timezone of the factory, and are spaced
+        by the step in Universal Time: across a daylight saving change they don't follow the local clock
+        like the other methods.
+
+        Args:
+        - bodies (list[Planet], optional): The bodies to calculate. Defaults to the planets of AstrologicalSubject.
+        - include_houses (bool): If True, the houses, the ascendant and the medium coeli are calculated too. Default is False.
+
+        Returns:
+        - dict[str, Any]: The columns returned by ColumnarEphemerisFactory.get_ephemeris_arrays.
+        """
+        start_julian_day = self._get_julian_day(self.start_datetime)
+        step = self.step_timedelta.total_seconds() / 86400
+
+        columnar_factory = ColumnarEphemerisFactory(
+            start_julian_day,
+            start_julian_day + step * (self.dates_count - 1),
+            step=step,
+            bodies=bodies,
+            zodiac_type=self.zodiac_type,
+            sidereal_mode=self.sidereal_mode,
+            perspective_type=self.perspective_type,
+            houses_system_identifier=self.houses_system_identifier,
+            lat=self.lat,
+            lng=self.lng,
+            include_houses=include_houses,
+            ephemeris_tables=self.ephemeris_tables,
+        )
+
+        return columnar_factory.get_ephemeris_arrays()
+
+
+    def iter_adaptive_ephemeris_data(
+        self,
+        resolution: Union[float, Mapping[Planet, float]] = 1.0,
+        bodies: Union[list[Planet], None] = None,
+        as_model: bool = False,
+    ) -> Iterator[Union[dict, EphemerisSampleModel]]:
+        """
+        Yields the positions of the bodies sampled with a time step adapted to the speed of every body,
+        instead of the step of the factory: two consecutive samples of a body are at most the resolution apart.
+        The samples of all the bodies are ordered by time, see AdaptiveEphemerisFactory.
+
+        Args:
+        - resolution (Union[float, Mapping[Planet, float]]): The angular resolution in degrees, for all the bodies
+            or for each body. Default is 1.
+        - bodies (list[Planet], optional): The bodies to sample. Defaults to the bodies of the resolution mapping,
+            or to the planets of AstrologicalSubject.
+        - as_model (bool): If True, EphemerisSampleModel instances are yielded. Default is False.
+
+        Example usage:
+            for sample in factory.iter_adaptive_ephemeris_data(resolution={"Moon": 0.25, "Saturn": 0.25}):
+                print(sample["date"], sample["point"].name, sample["point"].abs_pos)
+        """
+        adaptive_factory = AdaptiveEphemerisFactory(
+            self._get_julian_day(self.start_datetime),
+            self._get_julian_day(self.end_datetime),
+            resolution=resolution,
+            bodies=bodies,
+            zodiac_type=self.zodiac_type,
+            sidereal_mode=self.sidereal_mode,
+            perspective_type=self.perspective_type,
+            lat=self.lat,
+            lng=self.lng,
+            ephemeris_tables=self.ephemeris_tables,
+        )
+
+        return adaptive_factory.iter_samples(as_model=as_model)
+
+    def _get_julian_day(self, date: datetime) -> float:
+        """
+        Converts a date of the range to a julian day (UT), naive dates are in the timezone of the factory.
+        """
+        if date.tzinfo is None:
+            date = pytz.timezone(self.tz_str).localize(date, is_dst=self.is_dst)
 
+        return get_julian_day_from_datetime(date)
 
 if "__main__" == __name__:
     start_date = datetime.fromisoformat("2020-01-01")
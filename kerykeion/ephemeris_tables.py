@@ -0,0 +1,482 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import json
+import logging
+import math
+import mmap
+import struct
+import sys
+import swisseph as swe
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Iterable, Union
+
+from kerykeion.astrological_subject import DEFAULT_PERSPECTIVE_TYPE, DEFAULT_SIDEREAL_MODE, DEFAULT_ZODIAC_TYPE
+from kerykeion.columnar_ephemeris import get_swisseph_flags
+from kerykeion.kr_types import KerykeionException, Planet, PerspectiveType, SiderealMode, ZodiacType
+from kerykeion.swiss_ephemeris_context import SwissEphemerisContext
+from kerykeion.utilities import get_number_from_name, import_numpy
+
+
+EPHEMERIS_TABLES_MAGIC = b"KRCHEB1\n"
+"""First bytes of the ephemeris tables files, followed by the length of the JSON header."""
+
+DEFAULT_TABLES_BODIES: tuple[Planet, ...] = (
+    "Sun",
+    "Moon",
+    "Mercury",
+    "Venus",
+    "Mars",
+    "Jupiter",
+    "Saturn",
+    "Uranus",
+    "Neptune",
+    "Pluto",
+    "Mean_Node",
+    "True_Node",
+    "Chiron",
+    "Mean_Lilith",
+)
+"""The bodies of the tables when no list is given, the south nodes are calculated from the north nodes."""
+
+DEFAULT_CHEBYSHEV_DEGREE = 13
+"""Degree of the Chebyshev polynomials of every segment."""
+
+SEGMENT_DAYS_CANDIDATES = (64.0, 32.0, 16.0, 8.0, 4.0, 2.0, 1.0, 0.5, 0.25)
+"""The segment lengths tried for every body, from the longest."""
+
+MIN_SEGMENT_DAYS = 1 / 256
+"""The shortest segment, a segment still exceeding the error bounds stops the build."""
+
+_HEADER = struct.Struct("<8sI")
+
+# South nodes are the north nodes mirrored, the subject calculates them from the north nodes
+_SOUTH_NODES = {1000: 10, 1100: 11}
+
+
+def _get_angle_difference_arcsec(first, second):
+    return abs((first - second + 180.0) % 360.0 - 180.0) * 3600.0
+
+
+class ChebyshevEphemeris:
+    """
+    Precomputed ephemeris tables: the positions of every body are stored as Chebyshev polynomials
+    fitted on consecutive segments of time, in a binary file that is memory-mapped when opened.
+
+    The tables are built once from swe.calc_ut with build (NumPy is needed only to build them).
+    Every segment is verified against swe.calc_ut on a dense grid of times: the error of the positions
+    is checked on the validation grid to be within the bound chosen at build time (1 arcsecond by default),
+    and the error of the longitude speeds within the speed bound. Between the times of the grid the error
+    is not measured. The measured errors are kept in the file.
+
+    Reading the tables doesn't call the Swiss Ephemeris: the position and the speed of a body
+    at any time of the range are evaluated from a few coefficients. Since the file is memory-mapped
+    read-only, all the processes opening it share the same pages of the operating system cache.
+
+    The tables can be used by AstrologicalSubject, SubjectBatchFactory, EphemerisDataFactory and
+    ColumnarEphemerisFactory with the ephemeris_tables argument: the bodies, times and settings
+    covered by the tables are read from them, everything else is calculated by the Swiss Ephemeris.
+
+    Example:
+        ChebyshevEphemeris.build("ephemeris_1900_2100.krcheb", 2415020.5, 2488069.5)
+        tables = ChebyshevEphemeris("ephemeris_1900_2100.krcheb")
+        subject = AstrologicalSubject("John", 1940, 10, 9, 18, 30, lng=-2.97, lat=53.41, tz_str="Europe/London", online=False, ephemeris_tables=tables)
+
+    Args:
+    - tables_path (Union[str, Path]): Path of the tables file created by build.
+    """
+
+    def __init__(self, tables_path: Union[str, Path]):
+        self.tables_path = Path(tables_path)
+
+        with open(self.tables_path, "rb") as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_length = _HEADER.unpack_from(self._data, 0)
+        if magic != EPHEMERIS_TABLES_MAGIC:
+            raise KerykeionException(f"{self.tables_path} is not a Kerykeion ephemeris tables file, build it with ChebyshevEphemeris.build")
+
+        self.header: dict[str, Any] = json.loads(self._data[_HEADER.size:_HEADER.size + header_length].decode("utf-8"))
+        if self.header["byteorder"] != sys.byteorder:
+            raise KerykeionException(f"{self.tables_path} was built on a {self.header['byteorder']} endian machine")
+
+        self.start_julian_day: float = self.header["start_julian_day"]
+        self.end_julian_day: float = self.header["end_julian_day"]
+        self.iflag: int = self.header["iflag"]
+        self.sidereal_mode: Union[SiderealMode, None] = self.header["sidereal_mode"]
+
+        self._data_offset = self.header["data_offset"]
+        self._values = memoryview(self._data)[self._data_offset:].cast("d")
+
+        # Planet number -> (coefficients per component, segments count, boundaries offset, coefficients offset)
+        self._bodies: dict[int, tuple[int, int, int, int]] = {
+            int(planet_number): (body["degree"] + 1, body["segments_count"], body["boundaries_offset"], body["offset"])
+            for planet_number, body in self.header["bodies"].items()
+        }
+        self._boundaries = {
+            planet_number: self._values[boundaries_offset:boundaries_offset + segments_count + 1]
+            for planet_number, (_, segments_count, boundaries_offset, _) in self._bodies.items()
+        }
+
+    def __reduce__(self):
+        # The memory map can't be pickled, the copy opens the same file
+        return (self.__class__, (self.tables_path,))
+
+    @property
+    def bodies(self) -> list[str]:
+        """The names of the bodies in the tables."""
+        return [body["name"] for body in self.header["bodies"].values()]
+
+    @property
+    def max_errors(self) -> dict[str, dict[str, float]]:
+        """
+        The maximum errors measured while building the tables, for every body:
+        longitude and latitude in arcseconds, distance in AU, longitude speed in arcseconds per day.
+        """
+        return {body["name"]: body["max_errors"] for body in self.header["bodies"].values()}
+
+    def covers(self, julian_day: float, planet_number: int, iflag: int, sidereal_mode: Union[SiderealMode, None] = None) -> bool:
+        """
+        Checks if the state of a body can be read from the tables: the body must be in the tables,
+        the julian day in the range and the flags (and the sidereal mode) the same of the tables.
+        """
+        return (
+            planet_number in self._bodies
+            and self.start_julian_day <= julian_day <= self.end_julian_day
+            and iflag == self.iflag
+            and (sidereal_mode == self.sidereal_mode or not iflag & swe.FLG_SIDEREAL)
+        )
+
+    def get_body_state(self, julian_day: float, planet_number: int) -> tuple[float, float, float, float, float, float]:
+        """
+        Evaluates the state of a body, with the same values of swe.calc_ut: longitude, latitude, distance
+        and their daily speeds. The julian day must be in the range of the tables.
+
+        Args:
+        - julian_day (float): The julian day (UT).
+        - planet_number (int): The Swiss Ephemeris number of the body.
+
+        Returns:
+        - tuple[float, float, float, float, float, float]: The state of the body.
+        """
+        coefficients_count, segments_count, _, offset = self._bodies[planet_number]
+        boundaries = self._boundaries[planet_number]
+
+        segment_index = min(max(bisect_right(boundaries, julian_day) - 1, 0), segments_count - 1)
+        segment_start = boundaries[segment_index]
+        segment_days = boundaries[segment_index + 1] - segment_start
+        x = 2.0 * (julian_day - segment_start) / segment_days - 1.0
+
+        start = offset + segment_index * 3 * coefficients_count
+        longitude_coefficients = self._values[start:start + coefficients_count].tolist()
+        latitude_coefficients = self._values[start + coefficients_count:start + 2 * coefficients_count].tolist()
+        distance_coefficients = self._values[start + 2 * coefficients_count:start + 3 * coefficients_count].tolist()
+
+        # Chebyshev polynomials T_k(x) and their derivatives k * U_(k-1)(x)
+        t_previous, t_current = 1.0, x
+        u_previous, u_current = 0.0, 1.0
+
+        longitude = longitude_coefficients[0] + longitude_coefficients[1] * x
+        latitude = latitude_coefficients[0] + latitude_coefficients[1] * x
+        distance = distance_coefficients[0] + distance_coefficients[1] * x
+        longitude_speed: float = longitude_coefficients[1]
+        latitude_speed: float = latitude_coefficients[1]
+        distance_speed: float = distance_coefficients[1]
+
+        two_x = 2.0 * x
+        for k in range(2, coefficients_count):
+            t_previous, t_current = t_current, two_x * t_current - t_previous
+            u_previous, u_current = u_current, two_x * u_current - u_previous
+
+            longitude += longitude_coefficients[k] * t_current
+            latitude += latitude_coefficients[k] * t_current
+            distance += distance_coefficients[k] * t_current
+            longitude_speed += k * longitude_coefficients[k] * u_current
+            latitude_speed += k * latitude_coefficients[k] * u_current
+            distance_speed += k * distance_coefficients[k] * u_current
+
+        speed_scale = 2.0 / segment_days
+        return (
+            longitude % 360.0,
+            latitude,
+            distance,
+            longitude_speed * speed_scale,
+            latitude_speed * speed_scale,
+            distance_speed * speed_scale,
+        )
+
+    def get_body_states(self, julian_days: Any, planet_number: int) -> Any:
+        """
+        Vectorized version of get_body_state, needs NumPy.
+
+        Args:
+        - julian_days (array-like): The julian days (UT), all in the range of the tables.
+        - planet_number (int): The Swiss Ephemeris number of the body.
+
+        Returns:
+        - numpy.ndarray: The states of the body, shape (julian days, 6).
+        """
+        np = import_numpy()
+
+        coefficients_count, segments_count, boundaries_offset, offset = self._bodies[planet_number]
+        boundaries = np.frombuffer(self._data, dtype=np.float64, count=segments_count + 1, offset=self._data_offset + boundaries_offset * 8)
+        coefficients = np.frombuffer(
+            self._data, dtype=np.float64, count=segments_count * 3 * coefficients_count, offset=self._data_offset + offset * 8
+        ).reshape(segments_count, 3, coefficients_count)
+
+        julian_days = np.asarray(julian_days, dtype=np.float64)
+        segment_indexes = np.clip(np.searchsorted(boundaries, julian_days, side="right") - 1, 0, segments_count - 1)
+        segment_starts = boundaries[segment_indexes]
+        segments_days = boundaries[segment_indexes + 1] - segment_starts
+        x = 2.0 * (julian_days - segment_starts) / segments_days - 1.0
+
+        segment_coefficients = coefficients[segment_indexes]
+        values = segment_coefficients[:, :, 0] + segment_coefficients[:, :, 1] * x[:, None]
+        speeds = segment_coefficients[:, :, 1].copy()
+
+        t_previous, t_current = np.ones_like(x), x
+        u_previous, u_current = np.zeros_like(x), np.ones_like(x)
+        for k in range(2, coefficients_count):
+            t_previous, t_current = t_current, 2.0 * x * t_current - t_previous
+            u_previous, u_current = u_current, 2.0 * x * u_current - u_previous
+
+            values += segment_coefficients[:, :, k] * t_current[:, None]
+            speeds += k * segment_coefficients[:, :, k] * u_current[:, None]
+
+        states = np.empty((len(julian_days), 6), dtype=np.float64)
+        states[:, :3] = values
+        states[:, 0] %= 360.0
+        states[:, 3:] = speeds * (2.0 / segments_days)[:, None]
+
+        return states
+
+    @staticmethod
+    def _fit_segment(np: Any, planet_number: int, iflag: int, segment_start: float, segment_days: float, degree: int) -> Any:
+        """
+        Fits the longitude, latitude and distance of a segment, interpolating swe.calc_ut on the Chebyshev nodes.
+        """
+        nodes_count = degree + 1
+        k = np.arange(nodes_count)
+        nodes = np.cos(np.pi * (k + 0.5) / nodes_count)
+        julian_days = segment_start + (nodes + 1.0) * segment_days / 2.0
+
+        states = np.array([swe.calc_ut(julian_day, planet_number, iflag)[0][:3] for julian_day in julian_days.tolist()])
+        states[:, 0] = np.rad2deg(np.unwrap(np.deg2rad(states[:, 0])))
+
+        transform = np.cos(np.pi * np.outer(k, k + 0.5) / nodes_count) * 2.0 / nodes_count
+        transform[0] /= 2.0
+
+        return states.T @ transform.T
+
+    @staticmethod
+    def _check_segment(
+        np: Any, coefficients: Any, planet_number: int, iflag: int, segment_start: float, segment_days: float
+    ) -> tuple[float, float, float, float]:
+        """
+        Compares a fitted segment with swe.calc_ut on an evenly spaced grid, twice as dense as the nodes.
+        Returns the maximum errors of longitude, latitude (arcseconds), distance (AU) and longitude speed (arcseconds per day).
+        """
+        checks_count = 2 * coefficients.shape[1] + 1
+        x = np.linspace(-1.0, 1.0, checks_count)
+        julian_days = segment_start + (x + 1.0) * segment_days / 2.0
+
+        expected = np.array([swe.calc_ut(julian_day, planet_number, iflag)[0][:4] for julian_day in julian_days.tolist()])
+
+        chebyshev = np.polynomial.chebyshev
+        values = chebyshev.chebval(x, coefficients.T)
+        longitude_speeds = chebyshev.chebval(x, chebyshev.chebder(coefficients[0])) * 2.0 / segment_days
+
+        return (
+            float(_get_angle_difference_arcsec(values[0], expected[:, 0]).max()),
+            float(np.abs(values[1] - expected[:, 1]).max() * 3600.0),
+            float(np.abs(values[2] - expected[:, 2]).max()),
+            float(np.abs(longitude_speeds - expected[:, 3]).max() * 3600.0),
+        )
+
+    @staticmethod
+    def _fit_interval(
+        np: Any, planet_number: int, iflag: int, interval_start: float, interval_days: float, degree: int, bounds: tuple[float, ...]
+    ) -> list[tuple[float, float, Any, tuple[float, float, float, float]]]:
+        """
+        Fits an interval with a single segment, or splits it in two halves when the segment exceeds the error bounds.
+        Returns the segments as (start, days, coefficients, errors).
+        """
+        coefficients = ChebyshevEphemeris._fit_segment(np, planet_number, iflag, interval_start, interval_days, degree)
+        errors = ChebyshevEphemeris._check_segment(np, coefficients, planet_number, iflag, interval_start, interval_days)
+
+        if all(error <= bound for error, bound in zip(errors, bounds)):
+            return [(interval_start, interval_days, coefficients, errors)]
+
+        if interval_days <= MIN_SEGMENT_DAYS:
+            raise KerykeionException(f"Can't fit the body {planet_number} at {interval_start} within the error bounds, errors: {errors}")
+
+        half_days = interval_days / 2
+        return (
+            ChebyshevEphemeris._fit_interval(np, planet_number, iflag, interval_start, half_days, degree, bounds)
+            + ChebyshevEphemeris._fit_interval(np, planet_number, iflag, interval_start + half_days, half_days, degree, bounds)
+        )
+
+    @staticmethod
+    def build(
+        tables_path: Union[str, Path],
+        start_julian_day: float,
+        end_julian_day: float,
+        bodies: Union[Iterable[Planet], None] = None,
+        zodiac_type: ZodiacType = DEFAULT_ZODIAC_TYPE,
+        sidereal_mode: Union[SiderealMode, None] = None,
+        perspective_type: PerspectiveType = DEFAULT_PERSPECTIVE_TYPE,
+        max_error_arcsec: float = 1.0,
+        max_speed_error_arcsec: float = 3.6,
+        max_distance_error: float = 1e-6,
+        degree: int = DEFAULT_CHEBYSHEV_DEGREE,
+    ) -> Path:
+        """
+        Builds the tables from swe.calc_ut, needs NumPy.
+
+        For every body the longest segment length passing a few probes is chosen, then all
+        the segments are fitted and verified: a segment exceeding an error bound is split
+        in two halves, until every segment meets the bounds.
+
+        Args:
+        - tables_path (Union[str, Path]): The path of the tables file to write.
+        - start_julian_day (float): The first julian day (UT) of the tables.
+        - end_julian_day (float): The last julian day (UT) of the tables.
+        - bodies (Iterable[Planet], optional): The bodies of the tables. Defaults to DEFAULT_TABLES_BODIES.
+        - zodiac_type (ZodiacType, optional): The zodiac type. Defaults to DEFAULT_ZODIAC_TYPE.
+        - sidereal_mode (SiderealMode, optional): The sidereal mode, for the Sidereal zodiac. Defaults to None (FAGAN_BRADLEY).
+        - perspective_type (PerspectiveType, optional): The perspective, Topocentric is not supported. Defaults to DEFAULT_PERSPECTIVE_TYPE.
+        - max_error_arcsec (float, optional): The error bound of longitude and latitude, in arcseconds. Defaults to 1.
+        - max_speed_error_arcsec (float, optional): The error bound of the longitude speed, in arcseconds per day. Defaults to 3.6.
+        - max_distance_error (float, optional): The error bound of the distance, in AU. Defaults to 1e-6.
+        - degree (int, optional): The degree of the polynomials. Defaults to DEFAULT_CHEBYSHEV_DEGREE.
+
+        Returns:
+        - Path: The path of the tables file.
+        """
+        np = import_numpy()
+
+        if end_julian_day <= start_julian_day:
+            raise ValueError("The end of the tables must be after the start.")
+
+        if perspective_type == "Topocentric":
+            raise KerykeionException("The Topocentric positions depend on the location, they can't be stored in the tables!")
+
+        if zodiac_type == "Sidereal" and not sidereal_mode:
+            sidereal_mode = DEFAULT_SIDEREAL_MODE
+        elif zodiac_type != "Sidereal":
+            sidereal_mode = None
+
+        iflag = get_swisseph_flags(zodiac_type, perspective_type)
+        bounds = (max_error_arcsec, max_error_arcsec, max_distance_error, max_speed_error_arcsec)
+        span = end_julian_day - start_julian_day
+
+        planet_numbers: dict[int, str] = {}
+        for body in bodies if bodies is not None else DEFAULT_TABLES_BODIES:
+            planet_number = get_number_from_name(body)
+            if planet_number in _SOUTH_NODES:
+                continue
+
+            planet_numbers[planet_number] = body
+
+        header_bodies: dict[str, dict[str, Any]] = {}
+        bodies_values = []
+        offset = 0
+
+        with SwissEphemerisContext.get_instance().configure(sidereal_mode=sidereal_mode):
+            for planet_number, name in planet_numbers.items():
+                # The longest segment passing with a margin on a few probes spread over the range
+                probes = [start_julian_day + span * fraction for fraction in (0.0, 0.31, 0.67)]
+                candidates = [segment_days for segment_days in SEGMENT_DAYS_CANDIDATES if segment_days <= max(span, SEGMENT_DAYS_CANDIDATES[-1])]
+
+                segment_days = candidates[-1]
+                for candidate in candidates:
+                    probe_errors = [
+                        ChebyshevEphemeris._check_segment(
+                            np, ChebyshevEphemeris._fit_segment(np, planet_number, iflag, probe, candidate, degree), planet_number, iflag, probe, candidate
+                        )
+                        for probe in probes
+                    ]
+                    if all(error <= bound / 4 for errors in probe_errors for error, bound in zip(errors, bounds)):
+                        segment_days = candidate
+                        break
+
+                # Fit and verify all the segments, splitting the ones exceeding the bounds
+                segments = []
+                for segment_index in range(max(int(math.ceil(span / segment_days)), 1)):
+                    segment_start = start_julian_day + segment_index * segment_days
+                    segments += ChebyshevEphemeris._fit_interval(np, planet_number, iflag, segment_start, segment_days, degree, bounds)
+
+                boundaries = np.array([segment[0] for segment in segments] + [segments[-1][0] + segments[-1][1]], dtype=np.float64)
+                coefficients = np.array([segment[2] for segment in segments], dtype=np.float64)
+                max_errors = np.max([segment[3] for segment in segments], axis=0)
+
+                logging.info(f"{name}: {len(segments)} segments, from {segment_days} days, max errors {max_errors.tolist()}")
+
+                header_bodies[str(planet_number)] = {
+                    "name": name,
+                    "degree": degree,
+                    "segments_count": len(segments),
+                    "boundaries_offset": offset,
+                    "offset": offset + boundaries.size,
+                    "max_errors": dict(zip(("longitude", "latitude", "distance", "speed"), max_errors.tolist())),
+                }
+                bodies_values += [boundaries, coefficients]
+                offset += boundaries.size + coefficients.size
+
+        header = {
+            "start_julian_day": float(start_julian_day),
+            "end_julian_day": float(end_julian_day),
+            "iflag": iflag,
+            "zodiac_type": zodiac_type,
+            "sidereal_mode": sidereal_mode,
+            "perspective_type": perspective_type,
+            "byteorder": sys.byteorder,
+            "data_offset": 0,
+            "bodies": header_bodies,
+        }
+
+        # The coefficients start at a multiple of 8 bytes, after the header
+        header_json = json.dumps(header).encode("utf-8")
+        data_offset = int(math.ceil((_HEADER.size + len(header_json) + 32) / 8)) * 8
+        header["data_offset"] = data_offset
+        header_json = json.dumps(header).encode("utf-8").ljust(data_offset - _HEADER.size)
+
+        tables_path = Path(tables_path)
+        tables_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tables_path, "wb") as file:
+            file.write(_HEADER.pack(EPHEMERIS_TABLES_MAGIC, len(header_json)))
+            file.write(header_json)
+            for values in bodies_values:
+                file.write(values.tobytes())
+
+        return tables_path
+
+    def close(self) -> None:
+        """
+        Closes the memory map, the tables can't be read anymore.
+        """
+        for boundaries in self._boundaries.values():
+            boundaries.release()
+
+        self._values.release()
+        self._data.close()
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="info")
+
+    # Usage: python -m kerykeion.ephemeris_tables ephemeris.krcheb [start_year] [end_year]
+    start_year = int(sys.argv[2]) if len(sys.argv) > 2 else 1900
+    end_year = int(sys.argv[3]) if len(sys.argv) > 3 else 2100
+
+    start = perf_counter()
+    tables_path = ChebyshevEphemeris.build(sys.argv[1], swe.julday(start_year, 1, 1, 0), swe.julday(end_year, 12, 31, 24))
+    print(f"Tables built in {perf_counter() - start:.1f}s, {tables_path.stat().st_size / 1024 / 1024:.1f} MB")
+
+    tables = ChebyshevEphemeris(tables_path)
+    print(tables.max_errors)
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Callable, Iterator, List, Optional, Union, get_args, TYPE_CHECKING
+
+from kerykeion.astrological_subject import AstrologicalSubject
+from kerykeion.columnar_ephemeris import UNIX_EPOCH_JULIAN_DAY, get_body_state, get_julian_day_from_datetime, get_swisseph_flags
+from kerykeion.kr_types import KerykeionException, Planet, AxialCusps
+from kerykeion.kr_types.kr_models import ActiveAspect, AstrologicalSubjectModel, ExactTransitModel, TransitIntervalModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+from kerykeion.settings.kerykeion_settings import get_settings
+from kerykeion.utilities import get_number_from_name
+
+if TYPE_CHECKING:
+    from kerykeion.ephemeris_tables import ChebyshevEphemeris
+
+
+DEFAULT_SCAN_STEPS: dict[Planet, float] = {
+    "Sun": 10.0,
+    "Moon": 5.0,
+    "Mercury": 4.0,
+    "Venus": 8.0,
+    "Mars": 8.0,
+    "Jupiter": 8.0,
+    "Saturn": 8.0,
+    "Uranus": 8.0,
+    "Neptune": 8.0,
+    "Pluto": 8.0,
+    "Mean_Node": 8.0,
+    "True_Node": 0.5,
+    "Mean_South_Node": 8.0,
+    "True_South_Node": 0.5,
+    "Chiron": 8.0,
+    "Mean_Lilith": 8.0,
+}
+"""
+Step in days of the scan of every body. Between two steps a body can't move more than 180 degrees,
+and can't station more than once: the stations found in a step are added to the scan.
+"""
+
+DEFAULT_TIME_TOLERANCE = 1 / 86400
+"""The precision of the exact times, in days (one second)."""
+
+# (julian day, longitude, speed)
+_BodySample = tuple[float, float, float]
+
+
+def _get_signed_difference(longitude: float, target: float) -> float:
+    """The difference from target to longitude, in [-180, 180)."""
+    return (longitude - target + 180.0) % 360.0 - 180.0
+
+
+def _find_root(function: Callable[[float], float], a: float, b: float, fa: float, fb: float, tolerance: float) -> float:
+    """
+    Brent's method: finds a root of a continuous function in [a, b], where fa and fb have opposite signs.
+    """
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+
+    c, fc = a, fa
+    d = e = b - a
+
+    while True:
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tolerance_1 = 2.0 * 1e-15 * abs(b) + tolerance / 2
+        middle = (c - b) / 2
+        if abs(middle) <= tolerance_1 or fb == 0:
+            return b
+
+        if abs(e) >= tolerance_1 and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation, or secant when only two points are distinct
+            s = fb / fa
+            if a == c:
+                p = 2.0 * middle * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * middle * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            if 2.0 * p < min(3.0 * middle * q - abs(tolerance_1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = middle
+        else:
+            # Bisection
+            d = e = middle
+
+        a, fa = b, fb
+        b += d if abs(d) > tolerance_1 else math.copysign(tolerance_1, middle)
+        fb = function(b)
+
+
+def get_datetime_from_julian_day(julian_day: float) -> datetime:
+    """
+    Converts a julian day (UT) to a UTC datetime, rounded to the millisecond.
+    """
+    return datetime.fromtimestamp(round((julian_day - UNIX_EPOCH_JULIAN_DAY) * 86400, 3), tz=timezone.utc)
+
+
+class ExactTransitsFactory:
+    """
+    Finds the exact times of the aspects between the transiting bodies and the points of a natal chart.
+
+    Instead of checking the orbs on a grid of AstrologicalSubjects, every transiting body is scanned
+    once over the time window with a coarse step (DEFAULT_SCAN_STEPS), and its stations are located:
+    between two scan points the body moves in a single direction, so every pass over the longitude
+    of an aspect is bracketed by a sign change of the residual (body longitude minus the aspect longitude).
+    Every pass is then refined with Brent's method on swe.calc_ut to the second, usually in 10-20
+    evaluations. A retrograde loop gives all its passes: direct, retrograde and direct again.
+
+    The orb windows are found the same way, as the passes over the longitudes at the edges of the orb:
+    get_transit_intervals returns one interval per window, with the enter time, the exact times and the
+    leave time, instead of the aspects of every sampled moment. The orbs are the ones of the active aspects,
+    measured on the continuous separation (the aspect is within the orb when |separation - degrees| <= orb).
+
+    The transits are calculated with the zodiac type, sidereal mode and perspective of the natal chart.
+
+    Args:
+    - natal_chart (AstrologicalSubject): The natal chart.
+    - start_datetime (datetime): The start of the time window, naive datetimes are UTC.
+    - end_datetime (datetime): The end of the time window, naive datetimes are UTC.
+    - transiting_points (list[Planet], optional): The transiting bodies.
+        Defaults to the planets of DEFAULT_ACTIVE_POINTS.
+    - natal_points (list[Planet | AxialCusps], optional): The points of the natal chart. Defaults to DEFAULT_ACTIVE_POINTS.
+    - active_aspects (list[ActiveAspect], optional): The aspects to find. Defaults to DEFAULT_ACTIVE_ASPECTS.
+    - settings_file (optional): Custom settings, with the degrees of the aspects.
+    - time_tolerance (float, optional): The precision of the times, in days. Defaults to DEFAULT_TIME_TOLERANCE (one second).
+    - ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables used instead of the Swiss Ephemeris
+        for the bodies and dates they cover. Defaults to None.
+
+    Example:
+        factory = ExactTransitsFactory(natal_chart, datetime(2025, 1, 1), datetime(2026, 1, 1), transiting_points=["Saturn"])
+        for transit in factory.iter_exact_transits():
+            print(transit.date, transit.p1_name, transit.aspect, transit.p2_name)
+    """
+
+    def __init__(
+        self,
+        natal_chart: Union[AstrologicalSubject, AstrologicalSubjectModel],
+        start_datetime: datetime,
+        end_datetime: datetime,
+        transiting_points: Optional[List[Planet]] = None,
+        natal_points: List[Union[Planet, AxialCusps]] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        settings_file=None,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+    ):
+        self.natal_chart = natal_chart
+        self.start_julian_day = get_julian_day_from_datetime(start_datetime)
+        self.end_julian_day = get_julian_day_from_datetime(end_datetime)
+        self.transiting_points: List[Planet] = (
+            list(transiting_points) if transiting_points is not None else [point for point in DEFAULT_ACTIVE_POINTS if point in get_args(Planet)]  # type: ignore
+        )
+        self.natal_points = natal_points
+        self.active_aspects = active_aspects
+        self.settings_file = settings_file
+        self.time_tolerance = time_tolerance
+        self.ephemeris_tables = ephemeris_tables
+
+        if self.end_julian_day <= self.start_julian_day:
+            raise ValueError("The end of the time window must be after the start.")
+
+        for point in self.transiting_points:
+            if point not in get_args(Planet):
+                raise KerykeionException(f"'{point}' can't be a transiting point, the transiting points must be planets: {get_args(Planet)}")
+
+        # Degrees of the active aspects, from the settings
+        aspects_degrees = {aspect["name"]: aspect["degree"] for aspect in get_settings(self.settings_file).aspects}
+        self.aspects_degrees: dict[str, float] = {}
+        self.aspects_orbs: dict[str, float] = {}
+        for aspect in self.active_aspects:
+            if aspect["name"] not in aspects_degrees:
+                raise KerykeionException(f"Unknown aspect: {aspect['name']}")
+
+            self.aspects_degrees[aspect["name"]] = aspects_degrees[aspect["name"]]
+            self.aspects_orbs[aspect["name"]] = aspect["orb"]
+
+        self._sidereal_mode = natal_chart.sidereal_mode
+        self._iflag = get_swisseph_flags(natal_chart.zodiac_type, natal_chart.perspective_type)  # type: ignore
+        self._topo = (natal_chart.lng, natal_chart.lat, 0) if natal_chart.perspective_type == "Topocentric" else None
+
+    def _get_body_state(self, julian_day: float, planet_number: int) -> tuple[float, float]:
+        """
+        Returns the longitude and the speed of a body.
+        """
+        longitude, _, _, speed, _, _ = get_body_state(julian_day, planet_number, self._iflag, self._sidereal_mode, self._topo, self.ephemeris_tables)
+        return longitude, speed
+
+    def _get_body_samples(self, planet_number: int, scan_step: float) -> list[_BodySample]:
+        """
+        Scans a body over the time window, adding its stations to the scan:
+        between two consecutive samples the body moves in a single direction.
+        """
+        steps_count = max(int(math.ceil((self.end_julian_day - self.start_julian_day) / scan_step)), 1)
+        step = (self.end_julian_day - self.start_julian_day) / steps_count
+
+        samples: list[_BodySample] = []
+        for index in range(steps_count + 1):
+            julian_day = self.start_julian_day + index * step
+            longitude, speed = self._get_body_state(julian_day, planet_number)
+
+            if samples and samples[-1][2] * speed < 0:
+                previous_julian_day, _, previous_speed = samples[-1]
+                station_julian_day = _find_root(
+                    lambda t: self._get_body_state(t, planet_number)[1], previous_julian_day, julian_day, previous_speed, speed, self.time_tolerance
+                )
+                samples.append((station_julian_day, self._get_body_state(station_julian_day, planet_number)[0], 0.0))
+
+            samples.append((julian_day, longitude, speed))
+
+        return samples
+
+    def _iter_longitude_crossings(self, planet_number: int, samples: list[_BodySample], target: float) -> Iterator[float]:
+        """
+        Yields the julian days when a body passes over a longitude, in chronological order.
+        """
+        def residual(julian_day: float) -> float:
+            return _get_signed_difference(self._get_body_state(julian_day, planet_number)[0], target)
+
+        previous_julian_day, previous_longitude, _ = samples[0]
+        previous_residual = _get_signed_difference(previous_longitude, target)
+        if previous_residual == 0:
+            yield previous_julian_day
+
+        for julian_day, longitude, _ in samples[1:]:
+            current_residual = _get_signed_difference(longitude, target)
+
+            # A jump of the residual is the body crossing the opposite longitude, not the target
+            if previous_residual * current_residual < 0 and abs(current_residual - previous_residual) < 180:
+                yield _find_root(residual, previous_julian_day, julian_day, previous_residual, current_residual, self.time_tolerance)
+            elif current_residual == 0:
+                yield julian_day
+
+            previous_julian_day, previous_residual = julian_day, current_residual
+
+    def _get_natal_positions(self) -> list[tuple[Union[Planet, AxialCusps], float]]:
+        positions = []
+        for point in self.natal_points:
+            natal_point = self.natal_chart.get(point.lower())
+            if natal_point is not None:
+                positions.append((point, natal_point["abs_pos"]))
+
+        return positions
+
+    def _iter_aspect_targets(self) -> Iterator[tuple[Union[Planet, AxialCusps], float, str, float, float]]:
+        """
+        Yields the longitudes where the aspects to the natal points are exact,
+        as (natal point, natal position, aspect name, aspect degrees, longitude).
+        """
+        for natal_point, natal_position in self._get_natal_positions():
+            for aspect_name, aspect_degrees in self.aspects_degrees.items():
+                yield natal_point, natal_position, aspect_name, aspect_degrees, math.fmod(natal_position + aspect_degrees, 360)
+
+                # Conjunction and opposition have a single aspect longitude, the others one on each side
+                if 0 < aspect_degrees < 180:
+                    yield natal_point, natal_position, aspect_name, aspect_degrees, math.fmod(natal_position - aspect_degrees + 360, 360)
+
+    def _iter_orb_intervals(
+        self, planet_number: int, samples: list[_BodySample], target: float, orb: float
+    ) -> Iterator[tuple[Optional[float], list[float], Optional[float]]]:
+        """
+        Yields the intervals when a body is within the orb of a longitude, as (enter, exact passes, leave).
+        The enter is None when the body is within the orb at the start of the window, the leave when it is at the end.
+        """
+        # Every pass over an edge of the orb enters or leaves the window
+        edges_crossings = sorted(
+            list(self._iter_longitude_crossings(planet_number, samples, math.fmod(target - orb + 360, 360)))
+            + list(self._iter_longitude_crossings(planet_number, samples, math.fmod(target + orb, 360)))
+        )
+        exact_julian_days = list(self._iter_longitude_crossings(planet_number, samples, target))
+
+        inside = abs(_get_signed_difference(samples[0][1], target)) < orb
+        enter: Optional[float] = None
+        intervals: list[tuple[Optional[float], Optional[float]]] = []
+
+        for julian_day in edges_crossings:
+            if inside:
+                intervals.append((enter, julian_day))
+            else:
+                enter = julian_day
+            inside = not inside
+
+        if inside:
+            intervals.append((enter, None))
+
+        for enter, leave in intervals:
+            exact = [
+                julian_day for julian_day in exact_julian_days
+                if (enter is None or julian_day >= enter) and (leave is None or julian_day <= leave)
+            ]
+            yield enter, exact, leave
+
+    def iter_exact_transits(self) -> Iterator[ExactTransitModel]:
+        """
+        Yields the exact transits of every transiting body, body by body, in chronological order for each body.
+        """
+        for transiting_point in self.transiting_points:
+            planet_number = get_number_from_name(transiting_point)
+            samples = self._get_body_samples(planet_number, DEFAULT_SCAN_STEPS[transiting_point])
+
+            transits = []
+            for natal_point, natal_position, aspect_name, aspect_degrees, target in self._iter_aspect_targets():
+                for julian_day in self._iter_longitude_crossings(planet_number, samples, target):
+                    longitude, speed = self._get_body_state(julian_day, planet_number)
+                    transits.append(
+                        ExactTransitModel(
+                            date=get_datetime_from_julian_day(julian_day).isoformat(),
+                            julian_day=julian_day,
+                            p1_name=transiting_point,
+                            p1_abs_pos=longitude,
+                            p1_speed=speed,
+                            p2_name=natal_point,
+                            p2_abs_pos=natal_position,
+                            aspect=aspect_name,  # type: ignore
+                            aspect_degrees=aspect_degrees,
+                            retrograde=speed < 0,
+                        )
+                    )
+
+            yield from sorted(transits, key=lambda transit: transit.julian_day)
+
+    def iter_transit_intervals(self) -> Iterator[TransitIntervalModel]:
+        """
+        Yields the orb windows of every transiting body, body by body, ordered by enter time for each body.
+        """
+        for transiting_point in self.transiting_points:
+            planet_number = get_number_from_name(transiting_point)
+            samples = self._get_body_samples(planet_number, DEFAULT_SCAN_STEPS[transiting_point])
+
+            intervals = []
+            for natal_point, natal_position, aspect_name, aspect_degrees, target in self._iter_aspect_targets():
+                orb = self.aspects_orbs[aspect_name]
+
+                for enter, exact, leave in self._iter_orb_intervals(planet_number, samples, target, orb):
+                    intervals.append(
+                        TransitIntervalModel(
+                            p1_name=transiting_point,
+                            p2_name=natal_point,
+                            p2_abs_pos=natal_position,
+                            aspect=aspect_name,  # type: ignore
+                            aspect_degrees=aspect_degrees,
+                            orb=orb,
+                            enter_date=get_datetime_from_julian_day(enter).isoformat() if enter is not None else None,
+                            enter_julian_day=enter,
+                            exact_dates=[get_datetime_from_julian_day(julian_day).isoformat() for julian_day in exact],
+                            exact_julian_days=exact,
+                            leave_date=get_datetime_from_julian_day(leave).isoformat() if leave is not None else None,
+                            leave_julian_day=leave,
+                        )
+                    )
+
+            yield from sorted(intervals, key=lambda interval: interval.enter_julian_day or self.start_julian_day)
+
+    def get_exact_transits(self) -> list[ExactTransitModel]:
+        """
+        Returns the exact transits of all the transiting bodies, in chronological order.
+        """
+        return sorted(self.iter_exact_transits(), key=lambda transit: transit.julian_day)
+
+    def get_transit_intervals(self) -> list[TransitIntervalModel]:
+        """
+        Returns the orb windows of all the transiting bodies, ordered by enter time
+        (the windows already open at the start of the time window first).
+        """
+        return sorted(self.iter_transit_intervals(), key=lambda interval: interval.enter_julian_day or self.start_julian_day)
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="info")
+
+    johnny = AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False)
+    factory = ExactTransitsFactory(johnny, datetime(2025, 1, 1), datetime(2026, 1, 1), transiting_points=["Mercury", "Saturn"])
+
+    for transit in factory.get_exact_transits():
+        print(transit.date, transit.p1_name, "R" if transit.retrograde else " ", transit.aspect, transit.p2_name)
+
+    for interval in factory.get_transit_intervals():
+        print(interval.enter_date, interval.exact_dates, interval.leave_date, interval.p1_name, interval.aspect, interval.p2_name)
@@ -5,21 +5,167 @@
 
 
 import logging
+import os
+import threading
+from collections import OrderedDict
 from datetime import timedelta
+from pathlib import Path
 from requests import Request
+from requests.adapters import HTTPAdapter
 from requests_cache import CachedSession
-from typing import Union
+from typing import Any, Union
+
+
+DEFAULT_GEONAMES_CACHE_DIR = Path(os.environ.get("KERYKEION_CACHE_DIR", Path.home() / ".cache" / "kerykeion")).absolute()
+"""
+Default directory of the geonames HTTP cache, it can be changed with the KERYKEION_CACHE_DIR
+environment variable or with set_geonames_cache_dir.
+"""
+
+DEFAULT_GEONAMES_URL = "http://api.geonames.org"
+"""Base URL of the GeoNames API, a different one can be given to FetchGeonames (for example a local stub server)."""
+
+GEONAMES_POOL_MAXSIZE = 10
+"""Maximum number of keep-alive connections to geonames kept by each shared session."""
+
+RESOLVED_CITIES_CACHE_SIZE = 1024
+"""Maximum number of (city, country) results kept in memory."""
+
+_geonames_cache_dir = DEFAULT_GEONAMES_CACHE_DIR
+_sessions: dict[int, CachedSession] = {}
+_sessions_lock = threading.Lock()
+
+_resolved_cities: OrderedDict[tuple[str, str, str], dict[str, str]] = OrderedDict()
+_resolved_cities_lock = threading.Lock()
+
+
+def set_geonames_cache_dir(cache_dir: Union[str, Path]) -> None:
+    """
+    Sets the directory of the geonames HTTP cache, the shared sessions are created again on the next lookup.
+
+    Args:
+    - cache_dir (Union[str, Path]): The directory, a relative path is resolved against the current directory.
+    """
+    global _geonames_cache_dir
+
+    with _sessions_lock:
+        _geonames_cache_dir = Path(cache_dir).absolute()
+
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_geonames_cache_dir() -> Path:
+    """
+    Returns the absolute directory of the geonames HTTP cache.
+    """
+    return _geonames_cache_dir
+
+
+def get_geonames_session(cache_expire_after_days: int = 30) -> CachedSession:
+    """
+    Returns the cached HTTP session shared by all the lookups with the same cache expiration.
+    The session can be used from more threads and keeps the connections to geonames alive between the lookups.
+
+    Args:
+    - cache_expire_after_days (int, optional): Cache expiration time in days, defaults to 30.
+    """
+    with _sessions_lock:
+        session = _sessions.get(cache_expire_after_days)
+
+        if session is None:
+            _geonames_cache_dir.mkdir(parents=True, exist_ok=True)
+            session = CachedSession(
+                cache_name=str(_geonames_cache_dir / "kerykeion_geonames_cache"),
+                backend="sqlite",
+                expire_after=timedelta(days=cache_expire_after_days),
+            )
+
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=GEONAMES_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            _sessions[cache_expire_after_days] = session
+
+        return session
+
+
+def clear_resolved_cities_cache() -> None:
+    """
+    Removes the (city, country) results kept in memory.
+    """
+    with _resolved_cities_lock:
+        _resolved_cities.clear()
+
+
+def _get_resolved_city_key(geonames_url: str, city_name: str, country_code: str) -> tuple[str, str, str]:
+    return (f"{geonames_url}/searchJSON", city_name.strip().casefold(), country_code.strip().upper())
+
+
+def _get_resolved_city(resolved_city_key: tuple[str, str, str]) -> Union[dict[str, str], None]:
+    """
+    Returns a copy of a resolved city kept in memory, None if it's not there.
+    """
+    with _resolved_cities_lock:
+        resolved_city = _resolved_cities.get(resolved_city_key)
+        if resolved_city is None:
+            return None
+
+        _resolved_cities.move_to_end(resolved_city_key)
+        return dict(resolved_city)
+
+
+def _add_resolved_city(resolved_city_key: tuple[str, str, str], serialized_data: dict[str, str]) -> None:
+    """
+    Keeps a lookup result in memory, only the complete results: the failed lookups are tried again.
+    """
+    if "timezonestr" not in serialized_data:
+        return
+
+    with _resolved_cities_lock:
+        _resolved_cities[resolved_city_key] = dict(serialized_data)
+        while len(_resolved_cities) > RESOLVED_CITIES_CACHE_SIZE:
+            _resolved_cities.popitem(last=False)
+
+
+def _get_search_params(city_name: str, country_code: str, username: str) -> dict[str, Any]:
+    """
+    Returns the query parameters of the geonames search of a city.
+    """
+    return {
+        "q": city_name,
+        "country": country_code,
+        "username": username,
+        "maxRows": 1,
+        "style": "SHORT",
+        "featureClass": ["A", "P"],
+    }
+
+
+def _parse_search_response(response_json: Any) -> dict[str, str]:
+    """
+    Returns name, lat, lng and countryCode of the first city of a geonames search response.
+    Raises an exception when the response has no cities.
+    """
+    city = response_json["geonames"][0]
+
+    return {"name": city["name"], "lat": city["lat"], "lng": city["lng"], "countryCode": city["countryCode"]}
 
 
 class FetchGeonames:
     """
     Class to handle requests to the GeoNames API
 
+    The HTTP session is shared by all the instances (see get_geonames_session) and the resolved
+    cities are kept in memory, so a repeated lookup doesn't touch the network nor the HTTP cache.
+
     Args:
     - city_name (str): Name of the city
     - country_code (str): Two letters country code
     - username (str, optional): GeoNames username, defaults to "century.boy".
     - cache_expire_after_days (int, optional): Cache expiration time in days, defaults to 30.
+    - geonames_url (str, optional): Base URL of the GeoNames API, defaults to DEFAULT_GEONAMES_URL.
     """
 
     def __init__(
@@ -28,18 +174,16 @@ class FetchGeonames:
         country_code: str,
         username: str = "century.boy",
         cache_expire_after_days=30,
+        geonames_url: str = DEFAULT_GEONAMES_URL,
     ):
-        self.session = CachedSession(
-            cache_name="cache/kerykeion_geonames_cache",
-            backend="sqlite",
-            expire_after=timedelta(days=cache_expire_after_days),
-        )
+        self.session = get_geonames_session(cache_expire_after_days)
 
         self.username = username
         self.city_name = city_name
         self.country_code = country_code
-        self.base_url = "http://api.geonames.org/searchJSON"
-        self.timezone_url = "http://api.geonames.org/timezoneJSON"
+        self.geonames_url = geonames_url
+        self.base_url = f"{geonames_url}/searchJSON"
+        self.timezone_url = f"{geonames_url}/timezoneJSON"
 
     def __get_timezone(self, lat: Union[str, float, int], lon: Union[str, float, int]) -> dict[str, str]:
         """
@@ -80,14 +224,7 @@ class FetchGeonames:
         # Dictionary that will be returned:
         city_data_whitout_tz = {}
 
-        params = {
-            "q": city_name,
-            "country": country_code,
-            "username": self.username,
-            "maxRows": 1,
-            "style": "SHORT",
-            "featureClass": ["A", "P"],
-        }
+        params = _get_search_params(city_name, country_code, self.username)
 
         prepared_request = Request("GET", self.base_url, params=params).prepare()
         logging.debug(f"Requesting data from geonames basic: {prepared_request.url}")
@@ -102,10 +239,7 @@ class FetchGeonames:
             return {}
 
         try:
-            city_data_whitout_tz["name"] = response_json["geonames"][0]["name"]
-            city_data_whitout_tz["lat"] = response_json["geonames"][0]["lat"]
-            city_data_whitout_tz["lng"] = response_json["geonames"][0]["lng"]
-            city_data_whitout_tz["countryCode"] = response_json["geonames"][0]["countryCode"]
+            city_data_whitout_tz.update(_parse_search_response(response_json))
 
         except Exception as e:
             logging.error(f"Error serializing data maybe wrong username? Details: {e}")
@@ -123,6 +257,12 @@ class FetchGeonames:
         Returns:
             dict[str, str]: _description_
         """
+        resolved_city_key = _get_resolved_city_key(self.geonames_url, self.city_name, self.country_code)
+
+        resolved_city = _get_resolved_city(resolved_city_key)
+        if resolved_city is not None:
+            return resolved_city
+
         city_data_response = self.__get_contry_data(self.city_name, self.country_code)
         try:
             timezone_response = self.__get_timezone(city_data_response["lat"], city_data_response["lng"])
@@ -131,7 +271,11 @@ class FetchGeonames:
             logging.error(f"Error in fetching timezone: {e}")
             return {}
 
-        return {**timezone_response, **city_data_response}
+        serialized_data = {**timezone_response, **city_data_response}
+
+        _add_resolved_city(resolved_city_key, serialized_data)
+
+        return serialized_data
 
 
 if __name__ == "__main__":
@@ -6,5 +6,6 @@
 from .kerykeion_exception import KerykeionException
 from .kr_literals import *
 from .kr_models import *
+from .kerykeion_point import KerykeionPoint
 from .chart_types import ChartTemplateDictionary
 from .settings_models import KerykeionSettingsModel
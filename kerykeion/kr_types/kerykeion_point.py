@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+from typing import Union
+
+from kerykeion.kr_types.kerykeion_exception import KerykeionException
+from kerykeion.kr_types.kr_literals import Planet, Houses, AxialCusps, PointType, Sign, Quality, Element
+from kerykeion.kr_types.kr_models import KerykeionPointModel
+
+
+ZODIAC_SIGNS_TABLE: tuple[tuple[Sign, Quality, Element, str], ...] = (
+    ("Ari", "Cardinal", "Fire", "♈️"),
+    ("Tau", "Fixed", "Earth", "♉️"),
+    ("Gem", "Mutable", "Air", "♊️"),
+    ("Can", "Cardinal", "Water", "♋️"),
+    ("Leo", "Fixed", "Fire", "♌️"),
+    ("Vir", "Mutable", "Earth", "♍️"),
+    ("Lib", "Cardinal", "Air", "♎️"),
+    ("Sco", "Fixed", "Water", "♏️"),
+    ("Sag", "Mutable", "Fire", "♐️"),
+    ("Cap", "Cardinal", "Earth", "♑️"),
+    ("Aqu", "Fixed", "Air", "♒️"),
+    ("Pis", "Mutable", "Water", "♓️"),
+)
+"""
+Sign, quality, element and emoji of the zodiac signs, indexed by sign number.
+"""
+
+
+class KerykeionPoint:
+    """
+    Compact representation of a point of the chart (planet, house cusp or axial cusp),
+    with the same fields of KerykeionPointModel.
+
+    Only the name, the absolute position and the calculated data are stored, the sign,
+    quality, element and emoji are read from the precomputed zodiac signs table.
+    Like the pydantic models, the fields can be read with the [] operator or the get method.
+
+    The point becomes a KerykeionPointModel only when model() or json() is called,
+    KerykeionPointModel also validates KerykeionPoint instances directly.
+
+    Args:
+    - name (Planet | Houses | AxialCusps): The name of the point.
+    - abs_pos (float): The absolute position in degrees (0-360).
+    - point_type (PointType): The type of the point.
+    - house (Houses, optional): The house of the point.
+    - retrograde (bool, optional): If the point is retrograde.
+    - speed (float, optional): Daily speed in longitude, in degrees.
+    - latitude (float, optional): Ecliptic latitude, in degrees.
+    - distance (float, optional): Distance, in AU.
+    """
+
+    __slots__ = ("name", "abs_pos", "position", "sign_num", "point_type", "house", "retrograde", "speed", "latitude", "distance")
+
+    FIELDS = ("name", "quality", "element", "sign", "sign_num", "position", "abs_pos", "emoji", "point_type", "house", "retrograde", "speed", "latitude", "distance")
+    """The fields of the point, in the same order of KerykeionPointModel."""
+
+    def __init__(
+        self,
+        name: Union[Planet, Houses, AxialCusps],
+        abs_pos: float,
+        point_type: PointType,
+        house: Union[Houses, None] = None,
+        retrograde: Union[bool, None] = None,
+        speed: Union[float, None] = None,
+        latitude: Union[float, None] = None,
+        distance: Union[float, None] = None,
+    ):
+        if abs_pos < 0 or abs_pos >= 360:
+            raise KerykeionException(f"Error in calculating positions! Degrees: {abs_pos}")
+
+        self.name = name
+        self.abs_pos = abs_pos
+        self.position = abs_pos % 30
+        self.sign_num = int(abs_pos // 30)
+        self.point_type = point_type
+        self.house = house
+        self.retrograde = retrograde
+        self.speed = speed
+        self.latitude = latitude
+        self.distance = distance
+
+    @property
+    def sign(self) -> Sign:
+        return ZODIAC_SIGNS_TABLE[self.sign_num][0]
+
+    @property
+    def quality(self) -> Quality:
+        return ZODIAC_SIGNS_TABLE[self.sign_num][1]
+
+    @property
+    def element(self) -> Element:
+        return ZODIAC_SIGNS_TABLE[self.sign_num][2]
+
+    @property
+    def emoji(self) -> str:
+        return ZODIAC_SIGNS_TABLE[self.sign_num][3]
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (KerykeionPoint, KerykeionPointModel)):
+            return all(getattr(self, field) == getattr(other, field) for field in self.FIELDS)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"KerykeionPoint({fields})"
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+    def model(self) -> KerykeionPointModel:
+        """
+        Creates the pydantic model of the point.
+        """
+        return KerykeionPointModel.model_validate(self)
+
+    def json(self, indent: Union[int, None] = None) -> str:
+        """
+        Dumps the point to a json string.
+        """
+        return self.model().model_dump_json(exclude_none=True, indent=indent)
@@ -136,3 +136,6 @@ AspectName = Literal[
     "opposition"
 ]
 """Literal type for all the available aspects names"""
+
+AspectPatternName = Literal["Grand Trine", "T-Square", "Grand Cross", "Yod", "Kite", "Stellium"]
+"""Literal type for the aspect patterns (configurations of three or more points)"""
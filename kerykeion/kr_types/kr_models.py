@@ -6,8 +6,8 @@
 
 from typing import Union, Optional
 from typing_extensions import TypedDict
-from pydantic import BaseModel
-from kerykeion.kr_types.kr_literals import AspectName
+from pydantic import BaseModel, ConfigDict
+from kerykeion.kr_types.kr_literals import AspectName, AspectPatternName
 
 from kerykeion.kr_types import (
     AxialCusps,
@@ -61,6 +61,9 @@ class KerykeionPointModel(SubscriptableBaseModel):
     Kerykeion Point Model
     """
 
+    # Accepts the compact KerykeionPoint instances too
+    model_config = ConfigDict(from_attributes=True)
+
     name: Union[Planet, Houses, AxialCusps]
     quality: Quality
     element: Element
@@ -72,6 +75,12 @@ class KerykeionPointModel(SubscriptableBaseModel):
     point_type: PointType
     house: Optional[Houses] = None
     retrograde: Optional[bool] = None
+    speed: Optional[float] = None
+    """Daily speed in longitude, in degrees. Negative when the point is retrograde."""
+    latitude: Optional[float] = None
+    """Ecliptic latitude, in degrees"""
+    distance: Optional[float] = None
+    """Distance, in AU"""
 
 
 class AstrologicalSubjectModel(SubscriptableBaseModel):
@@ -167,6 +176,21 @@ class EphemerisDictModel(SubscriptableBaseModel):
     houses: list[KerykeionPointModel]
 
 
+class EphemerisSampleModel(SubscriptableBaseModel):
+    """
+    Sample of a single body in the adaptive ephemeris, see AdaptiveEphemerisFactory.
+    """
+
+    date: str
+    """ISO 8601 formatted UTC date and time of the sample."""
+
+    julian_day: float
+    """Julian day (UT) of the sample."""
+
+    point: KerykeionPointModel
+    """Position and speed of the body, without the house."""
+
+
 class AspectModel(SubscriptableBaseModel):
     p1_name: str
     p1_owner: str
@@ -180,6 +204,38 @@ class AspectModel(SubscriptableBaseModel):
     diff: float
     p1: int
     p2: int
+    p1_speed: Optional[float] = None
+    """Daily speed of the first point, in degrees. None when unknown (e.g. the axes)."""
+    p2_speed: Optional[float] = None
+    """Daily speed of the second point, in degrees. None when unknown (e.g. the axes)."""
+    applying: Optional[bool] = None
+    """If the orbit is decreasing, from the speeds of the points. None when a speed is unknown."""
+    days_to_exact: Optional[float] = None
+    """Linear estimate of the days to the exact aspect from the speeds of the points, negative for a separating aspect."""
+
+
+class AspectPatternModel(SubscriptableBaseModel):
+    """
+    An aspect pattern: a configuration of three or more points connected by aspects.
+    """
+
+    name: AspectPatternName
+    """The name of the pattern."""
+
+    points: list[str]
+    """The names of the points of the pattern."""
+
+    owners: list[str]
+    """The names of the subjects of the points, in the order of the points."""
+
+    apex: Optional[str] = None
+    """The focal point of the T-Square, the Yod and the Kite, None for the other patterns."""
+
+    apex_owner: Optional[str] = None
+    """The name of the subject of the apex."""
+
+    aspects: list[AspectModel]
+    """The aspects between the points of the pattern."""
 
 
 class ZodiacSignModel(SubscriptableBaseModel):
@@ -322,3 +378,83 @@ class TransitsTimeRangeModel(SubscriptableBaseModel):
 
     dates: Optional[list[str]]
     """ISO 8601 formatted dates of all transit moments."""
+
+
+class ExactTransitModel(SubscriptableBaseModel):
+    """
+    Model representing the exact time of an aspect between a transiting body and a natal point,
+    see ExactTransitsFactory.
+    """
+
+    date: str
+    """ISO 8601 formatted UTC date and time of the exact aspect."""
+
+    julian_day: float
+    """Julian day (UT) of the exact aspect."""
+
+    p1_name: Planet
+    """The transiting body."""
+
+    p1_abs_pos: float
+    """Absolute position of the transiting body at the exact aspect."""
+
+    p1_speed: float
+    """Daily speed of the transiting body at the exact aspect, in degrees."""
+
+    p2_name: Union[Planet, AxialCusps]
+    """The natal point."""
+
+    p2_abs_pos: float
+    """Absolute position of the natal point."""
+
+    aspect: AspectName
+    """Name of the aspect."""
+
+    aspect_degrees: float
+    """Degrees of the aspect."""
+
+    retrograde: bool
+    """If the transiting body is retrograde at the exact aspect."""
+
+
+class TransitIntervalModel(SubscriptableBaseModel):
+    """
+    Model representing the window of time when a transiting body is within the orb of an aspect to a natal point,
+    see ExactTransitsFactory.get_transit_intervals.
+    """
+
+    p1_name: Planet
+    """The transiting body."""
+
+    p2_name: Union[Planet, AxialCusps]
+    """The natal point."""
+
+    p2_abs_pos: float
+    """Absolute position of the natal point."""
+
+    aspect: AspectName
+    """Name of the aspect."""
+
+    aspect_degrees: float
+    """Degrees of the aspect."""
+
+    orb: float
+    """Orb of the aspect, in degrees."""
+
+    enter_date: Optional[str]
+    """ISO 8601 formatted UTC date and time when the body enters the orb, None if it's within the orb at the start of the time window."""
+
+    enter_julian_day: Optional[float]
+    """Julian day (UT) when the body enters the orb."""
+
+    exact_dates: list[str]
+    """ISO 8601 formatted UTC dates and times of the exact aspects in the window, more than one with retrograde passes."""
+
+    exact_julian_days: list[float]
+    """Julian days (UT) of the exact aspects in the window."""
+
+    leave_date: Optional[str]
+    """ISO 8601 formatted UTC date and time when the body leaves the orb, None if it's within the orb at the end of the time window."""
+
+    leave_julian_day: Optional[float]
+    """Julian day (UT) when the body leaves the orb."""
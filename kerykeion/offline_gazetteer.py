@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import io
+import logging
+import mmap
+import os
+import struct
+import unicodedata
+import zipfile
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterator, Union
+
+from kerykeion.kr_types import KerykeionException
+
+
+GAZETTEER_INDEX_MAGIC = b"KRGAZ01\n"
+"""First bytes of the gazetteer index files, followed by the number of records."""
+
+_HEADER = struct.Struct("<8sI")
+_OFFSET = struct.Struct("<I")
+_FIELD_SEPARATOR = b"\x1f"
+_KEY_SEPARATOR = "\x1e"
+
+
+def normalize_place_name(name: str) -> str:
+    """
+    Normalizes a place name for the gazetteer lookups: unicode NFKC, case folded, without surrounding spaces.
+    """
+    return unicodedata.normalize("NFKC", name).strip().casefold()
+
+
+class _GazetteerKeys:
+    """
+    Read only sequence of the keys of the index, used for the binary search.
+    """
+
+    def __init__(self, gazetteer: "OfflineGazetteer"):
+        self._gazetteer = gazetteer
+
+    def __len__(self) -> int:
+        return self._gazetteer.records_count
+
+    def __getitem__(self, index: int) -> bytes:
+        start = self._gazetteer._get_record_offset(index)
+        return self._gazetteer._data[start:self._gazetteer._data.find(_FIELD_SEPARATOR, start)]
+
+
+class OfflineGazetteer:
+    """
+    Offline city lookup, backed by an index built from a GeoNames dump.
+
+    The index is a sorted, memory-mapped file: only the pages touched by the binary search
+    are read from disk, so opening it is instant and a lookup takes a few microseconds.
+    The records are sorted by country code and normalized name: when more places share the same name,
+    the places with that primary name come before the ones with that alternate name, the most populated first.
+
+    Build the index once from a GeoNames dump (https://download.geonames.org/export/dump/),
+    for example cities500.zip or cities15000.txt:
+
+        OfflineGazetteer.build_index("cities15000.zip", "cities15000.kgaz")
+        gazetteer = OfflineGazetteer("cities15000.kgaz")
+        gazetteer.get_serialized_data("Roma", "IT")
+
+    Args:
+    - index_path (Union[str, Path]): Path of the index file created by build_index.
+    """
+
+    def __init__(self, index_path: Union[str, Path]):
+        self.index_path = Path(index_path)
+
+        not_an_index_error = f"{self.index_path} is not a Kerykeion gazetteer index, build it with OfflineGazetteer.build_index"
+
+        with open(self.index_path, "rb") as file:
+            # Shorter than the header: an empty file could not even be memory mapped
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise KerykeionException(not_an_index_error)
+
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.records_count = _HEADER.unpack_from(self._data, 0)
+        if magic != GAZETTEER_INDEX_MAGIC:
+            raise KerykeionException(not_an_index_error)
+
+        self._data_start = _HEADER.size + _OFFSET.size * self.records_count
+        self._keys = _GazetteerKeys(self)
+
+    def __reduce__(self):
+        # The memory map can't be pickled, the copy opens the same index
+        return (self.__class__, (self.index_path,))
+
+    @staticmethod
+    def _iter_dump_rows(dump_path: Path) -> Iterator[list[str]]:
+        """
+        Yields the rows of a GeoNames dump, plain text or zipped.
+        """
+        if dump_path.suffix == ".zip":
+            with zipfile.ZipFile(dump_path) as archive:
+                dump_name = next(name for name in archive.namelist() if name.endswith(".txt"))
+                with archive.open(dump_name) as binary_file:
+                    for line in io.TextIOWrapper(binary_file, encoding="utf-8"):
+                        yield line.rstrip("\n").split("\t")
+        else:
+            with open(dump_path, encoding="utf-8") as file:
+                for line in file:
+                    yield line.rstrip("\n").split("\t")
+
+    @staticmethod
+    def build_index(dump_path: Union[str, Path], index_path: Union[str, Path]) -> Path:
+        """
+        Builds the gazetteer index from a GeoNames dump.
+
+        Every place is indexed by its name, its ASCII name and its alternate names (e.g. "Roma" and "Naples"),
+        with its coordinates, country code and timezone. Places without a timezone are skipped.
+        A name matches the places with that primary name before the places with that alternate name,
+        then the most populated place first. The alternate names of the dumps make the index a few times larger.
+
+        Args:
+        - dump_path (Union[str, Path]): The GeoNames dump, in the "geoname" table format, plain text or zipped.
+        - index_path (Union[str, Path]): The path of the index file to write.
+
+        Returns:
+        - Path: The path of the index file.
+        """
+        dump_path = Path(dump_path)
+        index_path = Path(index_path)
+
+        entries: list[tuple[bytes, int, int, bytes]] = []
+        for row in OfflineGazetteer._iter_dump_rows(dump_path):
+            if len(row) < 18 or not row[17]:
+                continue
+
+            name, ascii_name, alternate_names = row[1], row[2], row[3]
+            lat, lng, country_code, population, timezone = row[4], row[5], row[8].upper(), row[14], row[17]
+            population_number = int(population) if population.isdigit() else 0
+
+            record = _FIELD_SEPARATOR.join(value.encode("utf-8") for value in (name, lat, lng, country_code, timezone))
+
+            primary_names = {normalize_place_name(name), normalize_place_name(ascii_name)}
+            other_names = {normalize_place_name(alternate_name) for alternate_name in alternate_names.split(",")} - primary_names
+
+            # Rank 0 for the primary names, 1 for the alternate names
+            for rank, indexed_names in enumerate((primary_names, other_names)):
+                for indexed_name in indexed_names:
+                    if indexed_name:
+                        key = f"{country_code}{_KEY_SEPARATOR}{indexed_name}".encode("utf-8")
+                        entries.append((key, rank, -population_number, record))
+
+        entries.sort()
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(index_path, "wb") as file:
+            file.write(_HEADER.pack(GAZETTEER_INDEX_MAGIC, len(entries)))
+
+            offset = 0
+            for key, _, _, record in entries:
+                file.write(_OFFSET.pack(offset))
+                offset += len(key) + len(_FIELD_SEPARATOR) + len(record) + 1
+
+            for key, _, _, record in entries:
+                file.write(key + _FIELD_SEPARATOR + record + b"\n")
+
+        logging.info(f"Gazetteer index with {len(entries)} records written to {index_path}")
+        return index_path
+
+    def _get_record_offset(self, index: int) -> int:
+        return self._data_start + _OFFSET.unpack_from(self._data, _HEADER.size + _OFFSET.size * index)[0]
+
+    def _get_record(self, index: int) -> dict[str, str]:
+        start = self._get_record_offset(index)
+        line = self._data[start:self._data.find(b"\n", start)].decode("utf-8")
+        _, name, lat, lng, country_code, timezone = line.split(_FIELD_SEPARATOR.decode())
+
+        return {
+            "timezonestr": timezone,
+            "name": name,
+            "lat": lat,
+            "lng": lng,
+            "countryCode": country_code,
+        }
+
+    @staticmethod
+    def _get_key(name: str, country_code: str) -> bytes:
+        return f"{country_code.strip().upper()}{_KEY_SEPARATOR}{normalize_place_name(name)}".encode("utf-8")
+
+    def get_serialized_data(self, city_name: str, country_code: str) -> dict[str, str]:
+        """
+        Exact lookup of a place by name and two letters country code, case insensitive.
+        Returns the same data of FetchGeonames.get_serialized_data, or an empty dictionary
+        when the place is not in the gazetteer.
+
+        Args:
+        - city_name (str): The name of the place.
+        - country_code (str): The two letters country code.
+
+        Returns:
+        - dict[str, str]: timezonestr, name, lat, lng and countryCode of the place with that name,
+            see build_index for the order of the places sharing it.
+        """
+        key = self._get_key(city_name, country_code)
+        index = bisect_left(self._keys, key)
+
+        if index < self.records_count and self._keys[index] == key:
+            return self._get_record(index)
+
+        return {}
+
+    def search(self, prefix: str, country_code: str, limit: Union[int, None] = 10) -> list[dict[str, str]]:
+        """
+        Prefix lookup of the places of a country, case insensitive,
+        in alphabetical order (the most populated first for the same name).
+
+        Args:
+        - prefix (str): The beginning of the name of the place.
+        - country_code (str): The two letters country code.
+        - limit (int, optional): The maximum number of results, None for all of them. Defaults to 10.
+
+        Returns:
+        - list[dict[str, str]]: The places found, with the same fields of get_serialized_data.
+        """
+        key_prefix = self._get_key(prefix, country_code)
+        index = bisect_left(self._keys, key_prefix)
+
+        results: list[dict[str, str]] = []
+        seen_records: set[tuple[str, str, str]] = set()
+        while index < self.records_count and (limit is None or len(results) < limit):
+            if not self._keys[index].startswith(key_prefix):
+                break
+
+            # The same place is indexed by name, ASCII name and alternate names
+            record = self._get_record(index)
+            record_id = (record["name"], record["lat"], record["lng"])
+            if record_id not in seen_records:
+                seen_records.add(record_id)
+                results.append(record)
+
+            index += 1
+
+        return results
+
+    def close(self) -> None:
+        self._data.close()
+
+    def __len__(self) -> int:
+        return self.records_count
+
+
+if __name__ == "__main__":
+    import sys
+    from time import perf_counter
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    # Usage: python -m kerykeion.offline_gazetteer cities15000.zip cities15000.kgaz
+    gazetteer = OfflineGazetteer(OfflineGazetteer.build_index(sys.argv[1], sys.argv[2]))
+
+    start = perf_counter()
+    data = gazetteer.get_serialized_data("Roma", "IT")
+    print(data, f"{(perf_counter() - start) * 1_000_000:.1f} µs")
+    print(gazetteer.search("Mont", "IT", limit=5))
@@ -1,12 +1,18 @@
 from kerykeion import AstrologicalSubject
 from simple_ascii_tables import AsciiTable
 from kerykeion.utilities import get_houses_list, get_available_astrological_points_list
-from typing import Union
+from typing import List, Union
 from kerykeion.kr_types.kr_models import AstrologicalSubjectModel
+from kerykeion.kr_types.kr_literals import Planet, AxialCusps
 
 class Report:
     """
     Create a report for a Kerykeion instance.
+
+    Args:
+    - instance (AstrologicalSubject | AstrologicalSubjectModel): The subject of the report.
+    - active_points (list[Planet | AxialCusps], optional): The points listed in the planets table.
+        Defaults to None, which lists all the points of the subject.
     """
 
     report_title: str
@@ -14,8 +20,13 @@ class Report:
     planets_table: str
     houses_table: str
 
-    def __init__(self, instance: Union[AstrologicalSubject, AstrologicalSubjectModel]):
+    def __init__(
+        self,
+        instance: Union[AstrologicalSubject, AstrologicalSubjectModel],
+        active_points: Union[List[Union[Planet, AxialCusps]], None] = None,
+    ):
         self.instance = instance
+        self.active_points = active_points
 
         self.get_report_title()
         self.get_data_table()
@@ -54,7 +65,7 @@ class Report:
                 ("R" if planet.retrograde else "-"),
                 planet.house,
             ]
-            for planet in get_available_astrological_points_list(self.instance)
+            for planet in get_available_astrological_points_list(self.instance, self.active_points)
         ]
 
         self.planets_table = AsciiTable(planets_data).table
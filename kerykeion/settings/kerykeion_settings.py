@@ -6,6 +6,7 @@
 
 from json import load
 import logging
+import os
 from pathlib import Path
 from typing import Dict, Union
 from kerykeion.kr_types import KerykeionSettingsModel
@@ -31,6 +32,28 @@ def get_settings(new_settings_file: Union[Path, None, KerykeionSettingsModel, di
     elif isinstance(new_settings_file, KerykeionSettingsModel):
         return new_settings_file
 
+    settings_file = get_settings_file_path(new_settings_file)
+
+    logging.debug(f"Kerykeion config file path: {settings_file}")
+    settings_dict = load_settings_file(settings_file)
+
+    return KerykeionSettingsModel(**settings_dict)
+
+
+def get_settings_file_path(new_settings_file: Union[Path, None] = None) -> Path:
+    """
+    This function is used to get the path of the settings file used by get_settings.
+    If no settings file is passed as argument, it will fallback to:
+    - The system wide config file, located in ~/.config/kerykeion/kr.config.json
+    - The default config file, located in the package folder
+
+    Args:
+        new_settings_file (Union[Path, None], optional): The path of the settings file. Defaults to None.
+
+    Returns:
+        Path: The path of the settings file
+    """
+
     # Config path we passed as argument
     if new_settings_file is not None:
         settings_file = new_settings_file
@@ -47,10 +70,7 @@ def get_settings(new_settings_file: Union[Path, None, KerykeionSettingsModel, di
     if not settings_file.exists():
         settings_file = Path(__file__).parent / "kr.config.json"
 
-    logging.debug(f"Kerykeion config file path: {settings_file}")
-    settings_dict = load_settings_file(settings_file)
-
-    return KerykeionSettingsModel(**settings_dict)
+    return settings_file
 
 
 def merge_settings(settings: KerykeionSettingsModel, new_settings: Dict) -> KerykeionSettingsModel:
@@ -69,10 +89,10 @@ def merge_settings(settings: KerykeionSettingsModel, new_settings: Dict) -> Kery
     return KerykeionSettingsModel(**new_settings_dict)
 
 
-@functools.lru_cache
-def load_settings_file(settings_file_path: str) -> dict:
+def load_settings_file(settings_file_path: Union[str, Path]) -> dict:
     """
     This function is used to load the settings file from a path.
+    The file is read again when it changes, by modification time and size.
 
     Args:
         settings_file (Path): The path of the settings file
@@ -80,12 +100,18 @@ def load_settings_file(settings_file_path: str) -> dict:
     Returns:
         dict: The settings dict
     """
+    settings_file_stat = os.stat(settings_file_path)
+
+    return _load_settings_file(str(settings_file_path), settings_file_stat.st_mtime_ns, settings_file_stat.st_size)
+
+
+@functools.lru_cache
+def _load_settings_file(settings_file_path: str, modification_time: int, size: int) -> dict:
     with open(settings_file_path, "r", encoding="utf8") as f:
         settings_dict = load(f)
 
     return settings_dict
 
-
 if __name__ == "__main__":
     from kerykeion.utilities import setup_logging
     setup_logging(level="debug")
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import swisseph as swe
+from typing import Any, Iterable, Iterator, List, Mapping, Union
+
+from kerykeion.astrological_subject import (
+    AstrologicalSubject,
+    DEFAULT_HOUSES_SYSTEM_IDENTIFIER,
+    DEFAULT_PERSPECTIVE_TYPE,
+    DEFAULT_ZODIAC_TYPE,
+)
+from kerykeion.columnar_ephemeris import DEFAULT_COLUMNAR_BODIES
+from kerykeion.ephemeris_tables import ChebyshevEphemeris
+from kerykeion.kr_types import (
+    KerykeionException,
+    AstrologicalSubjectModel,
+    ZodiacType,
+    SiderealMode,
+    HousesSystemIdentifier,
+    PerspectiveType,
+    Planet,
+    AxialCusps,
+)
+from kerykeion.swiss_ephemeris_context import SwissEphemerisContext
+from kerykeion.utilities import check_and_adjust_polar_latitude, get_number_from_name, import_numpy
+
+
+# South nodes are the north nodes mirrored, see AstrologicalSubject._get_planet_point
+_SOUTH_NODES = {1000: 10, 1100: 11}
+
+class SubjectBatchFactory:
+    """
+    Factory class to build many AstrologicalSubject instances sharing the same configuration.
+
+    The zodiac type, sidereal mode, house system and perspective are validated and converted
+    to Swiss Ephemeris flags only once, then every birth record is computed with the same
+    chart calculation used by AstrologicalSubject, so the results are identical to the ones
+    obtained creating the subjects one by one. The ephemeris path, the sidereal mode and the
+    topocentric position are handled by the shared SwissEphemerisContext.
+
+    When only the positions are needed, get_positions skips the subjects and their models:
+    the records are calculated together and returned as columns of NumPy arrays.
+
+    The batch works offline only: every record must contain the coordinates and the timezone.
+
+    Args:
+        zodiac_type (ZodiacType, optional): The zodiac type to use. Defaults to "Tropic".
+        sidereal_mode (SiderealMode, optional): The sidereal mode (Ayanamsa), only for the Sidereal zodiac.
+        houses_system_identifier (HousesSystemIdentifier, optional): The house system. Defaults to "P" (Placidus).
+        perspective_type (PerspectiveType, optional): The chart perspective. Defaults to "Apparent Geocentric".
+        disable_chiron_and_lilith (bool, optional): Disable Chiron and Lilith calculation. Defaults to False.
+        active_points (list[Planet | AxialCusps], optional): The points calculated up front for every subject,
+            the others are calculated on first access. Defaults to None (all the points).
+        ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables used instead of the Swiss Ephemeris
+            for the bodies and dates they cover. Defaults to None.
+
+    Records:
+        Each record is a mapping with the same keys of the AstrologicalSubject arguments:
+        "year", "month", "day", "hour", "minute", "lng", "lat" and "tz_str" are required,
+        "name", "city", "nation" and "is_dst" are optional.
+
+    Example:
+        factory = SubjectBatchFactory(zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+        for model in factory.iter_astrological_subjects(records, as_model=True):
+            ...
+
+        positions = factory.get_positions(records)
+        sun_longitudes = positions["longitude"][:, positions["bodies"].index("Sun")]
+    """
+
+    REQUIRED_RECORD_KEYS = ("year", "month", "day", "hour", "minute", "lng", "lat", "tz_str")
+
+    def __init__(
+        self,
+        zodiac_type: ZodiacType = DEFAULT_ZODIAC_TYPE,
+        sidereal_mode: Union[SiderealMode, None] = None,
+        houses_system_identifier: HousesSystemIdentifier = DEFAULT_HOUSES_SYSTEM_IDENTIFIER,
+        perspective_type: PerspectiveType = DEFAULT_PERSPECTIVE_TYPE,
+        disable_chiron_and_lilith: bool = False,
+        active_points: Union[List[Union[Planet, AxialCusps]], None] = None,
+        ephemeris_tables: Union[ChebyshevEphemeris, None] = None,
+    ):
+        # The chart settings are validated once, with the same setup of AstrologicalSubject
+        settings_subject = AstrologicalSubject.__new__(AstrologicalSubject)
+        settings_subject._setup_chart_settings(
+            online=False,
+            zodiac_type=zodiac_type,
+            sidereal_mode=sidereal_mode,
+            houses_system_identifier=houses_system_identifier,
+            perspective_type=perspective_type,
+            disable_chiron_and_lilith=disable_chiron_and_lilith,
+            active_points=active_points,
+            ephemeris_tables=ephemeris_tables,
+        )
+
+        self.zodiac_type = settings_subject.zodiac_type
+        self.sidereal_mode = settings_subject.sidereal_mode
+        self.houses_system_identifier = settings_subject.houses_system_identifier
+        self.houses_system_name = settings_subject.houses_system_name
+        self.perspective_type = settings_subject.perspective_type
+        self.disable_chiron_and_lilith = disable_chiron_and_lilith
+        self.active_points = active_points
+        self.ephemeris_tables = ephemeris_tables
+
+        # Attributes shared by all the subjects of the batch
+        self._shared_attributes = dict(settings_subject.__dict__)
+
+    def _get_birth_data(self, record: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Returns the birth data of a record, as the arguments of AstrologicalSubject._setup_birth_data.
+        """
+        missing_keys = [key for key in self.REQUIRED_RECORD_KEYS if record.get(key) is None]
+        if missing_keys:
+            raise KerykeionException(f"Missing required keys in the batch record: {missing_keys}")
+
+        return {
+            "name": record.get("name", "Now"),
+            "year": record["year"],
+            "month": record["month"],
+            "day": record["day"],
+            "hour": record["hour"],
+            "minute": record["minute"],
+            "city": record.get("city"),
+            "nation": record.get("nation"),
+            "lng": record["lng"],
+            "lat": record["lat"],
+            "tz_str": record["tz_str"],
+            "is_dst": record.get("is_dst"),
+        }
+
+    def _new_subject(self) -> AstrologicalSubject:
+        """
+        Returns a subject with the shared chart settings, without birth data.
+        """
+        subject = AstrologicalSubject.__new__(AstrologicalSubject)
+        subject.__dict__.update(self._shared_attributes)
+
+        return subject
+
+    def _build_subject(self, record: Mapping[str, Any]) -> AstrologicalSubject:
+        """
+        Computes a single AstrologicalSubject from a birth record, reusing the shared setup.
+        """
+        subject = self._new_subject()
+        subject._setup_birth_data(**self._get_birth_data(record))
+        subject._calculate_chart()
+
+        return subject
+
+    def iter_astrological_subjects(
+        self, records: Iterable[Mapping[str, Any]], as_model: bool = False
+    ) -> Iterator[Union[AstrologicalSubject, AstrologicalSubjectModel]]:
+        """
+        Lazily computes the subjects for the given birth records, one at a time.
+
+        Args:
+        - records (Iterable[Mapping]): A list or an iterator of birth records.
+        - as_model (bool): If True, yields AstrologicalSubjectModel instances. Default is False.
+
+        Yields:
+        - AstrologicalSubject or AstrologicalSubjectModel: One subject for each record, in the same order.
+        """
+        for record in records:
+            subject = self._build_subject(record)
+            yield subject.model() if as_model else subject
+
+    def get_astrological_subjects(
+        self, records: Iterable[Mapping[str, Any]], as_model: bool = False
+    ) -> List[Union[AstrologicalSubject, AstrologicalSubjectModel]]:
+        """
+        Computes the subjects for the given birth records.
+
+        Args:
+        - records (Iterable[Mapping]): A list or an iterator of birth records.
+        - as_model (bool): If True, returns AstrologicalSubjectModel instances. Default is False.
+
+        Returns:
+        - list: One subject for each record, in the same order.
+        """
+        return list(self.iter_astrological_subjects(records, as_model=as_model))
+
+    def get_positions(self, records: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+        """
+        Calculates only the positions of the records, as columns of NumPy arrays.
+
+        No AstrologicalSubject, KerykeionPoint or model is created. The Swiss Ephemeris is configured once
+        for the whole batch, the records with the same UTC time share the calculation of the bodies,
+        and the bodies covered by the ephemeris tables for all the dates of the batch are evaluated
+        in a single call per body. The values are the ones of the subjects of get_astrological_subjects.
+        NumPy is an optional dependency: pip install kerykeion[numpy].
+
+        Args:
+        - records (Iterable[Mapping]): A list or an iterator of birth records.
+
+        Returns:
+        - dict[str, Any]: The columns, one row for each record in the same order:
+            - names: the names of the records;
+            - julian_day: julian days (UT), shape (records,);
+            - bodies: the names of the bodies, in the order of the columns of the next arrays;
+            - longitude, latitude, distance, speed: one column per body, shape (records, bodies),
+              in degrees, AU and degrees per day;
+            - houses: the twelve cusps, shape (records, 12);
+            - ascendant, medium_coeli: the axes, shape (records,).
+        """
+        np = import_numpy()
+
+        bodies = [
+            body for body in DEFAULT_COLUMNAR_BODIES
+            if not (self.disable_chiron_and_lilith and body in ("Chiron", "Mean_Lilith"))
+            and (self.active_points is None or body in self.active_points)
+        ]
+        topocentric = self.perspective_type == "Topocentric"
+
+        # The birth data of every record, with the same defaults and checks of the subjects
+        subject = self._new_subject()
+        names, julian_days, locations = [], [], []
+        for record in records:
+            subject._setup_birth_data(**self._get_birth_data(record))
+            _, _, julian_day = AstrologicalSubject._get_birth_datetimes(
+                subject.year, subject.month, subject.day, subject.hour, subject.minute, subject.tz_str, subject.is_dst
+            )
+
+            names.append(subject.name)
+            julian_days.append(julian_day)
+            locations.append((subject.lng, subject.lat))
+
+        # The records with the same time (and position, for the topocentric perspective) share the bodies
+        rows: dict[tuple, int] = {}
+        inverse = [
+            rows.setdefault((julian_day, location if topocentric else None), len(rows))
+            for julian_day, location in zip(julian_days, locations)
+        ]
+
+        context = SwissEphemerisContext.get_instance()
+        with context.configure(sidereal_mode=self.sidereal_mode):
+            states = self._get_states(np, list(rows), bodies)
+            houses, ascendants, medium_coelis = self._get_houses(julian_days, locations)
+
+        states = states[np.array(inverse, dtype=np.intp)].reshape(len(julian_days), len(bodies), 4)
+
+        return {
+            "names": names,
+            "julian_day": np.array(julian_days, dtype=np.float64),
+            "bodies": bodies,
+            "longitude": states[:, :, 0],
+            "latitude": states[:, :, 1],
+            "distance": states[:, :, 2],
+            "speed": states[:, :, 3],
+            "houses": np.array(houses, dtype=np.float64).reshape(len(julian_days), 12),
+            "ascendant": np.array(ascendants, dtype=np.float64),
+            "medium_coeli": np.array(medium_coelis, dtype=np.float64),
+        }
+
+    def _get_states(self, np: Any, rows: list[tuple], bodies: list[Planet]) -> Any:
+        """
+        Calculates longitude, latitude, distance and speed of the bodies, for every (julian day, location) row.
+        """
+        iflag = self._shared_attributes["_iflag"]
+        julian_days = np.array([julian_day for julian_day, _ in rows], dtype=np.float64)
+        states = np.empty((len(rows), len(bodies), 4), dtype=np.float64)
+
+        planet_numbers = [get_number_from_name(body) for body in bodies]
+        north_node_numbers = list(dict.fromkeys(_SOUTH_NODES.get(number, number) for number in planet_numbers))
+
+        # The bodies covered by the tables for all the dates, in a single call each
+        bodies_states: dict[int, Any] = {}
+        if self.ephemeris_tables is not None and rows:
+            first_julian_day, last_julian_day = float(julian_days.min()), float(julian_days.max())
+            for number in north_node_numbers:
+                if all(self.ephemeris_tables.covers(julian_day, number, iflag, self.sidereal_mode) for julian_day in (first_julian_day, last_julian_day)):
+                    bodies_states[number] = self.ephemeris_tables.get_body_states(julian_days, number)[:, :4]
+
+        calculated_numbers = [number for number in north_node_numbers if number not in bodies_states]
+        if calculated_numbers:
+            calc_ut = swe.calc_ut
+            calculated_states = np.empty((len(rows), len(calculated_numbers), 4), dtype=np.float64)
+
+            for row, (julian_day, topo_location) in enumerate(rows):
+                if topo_location is None:
+                    calculated_states[row] = [calc_ut(julian_day, number, iflag)[0][:4] for number in calculated_numbers]
+                    continue
+
+                # The topocentric position uses the coordinates before the polar circle override
+                topo = (topo_location[0], topo_location[1], 0)
+                with SwissEphemerisContext.get_instance().configure(sidereal_mode=self.sidereal_mode, topo=topo):
+                    calculated_states[row] = [calc_ut(julian_day, number, iflag)[0][:4] for number in calculated_numbers]
+
+            for index, number in enumerate(calculated_numbers):
+                bodies_states[number] = calculated_states[:, index, :]
+
+        for index, number in enumerate(planet_numbers):
+            states[:, index, :] = bodies_states[_SOUTH_NODES.get(number, number)]
+
+            # The south nodes are the north nodes mirrored
+            if number in _SOUTH_NODES:
+                states[:, index, 0] = np.fmod(states[:, index, 0] + 180.0, 360.0)
+                states[:, index, 1] = -states[:, index, 1]
+
+        return states
+
+    def _get_houses(self, julian_days: list[float], locations: list[tuple[float, float]]) -> tuple[list, list, list]:
+        """
+        Calculates the house cusps and the axes of every record, like AstrologicalSubject._initialize_houses.
+        """
+        hsys = self.houses_system_identifier.encode("ascii")
+
+        houses, ascendants, medium_coelis = [], [], []
+        for julian_day, (lng, lat) in zip(julian_days, locations):
+            lat = check_and_adjust_polar_latitude(lat)
+
+            if self.zodiac_type == "Sidereal":
+                cusps, ascmc = swe.houses_ex(tjdut=julian_day, lat=lat, lon=lng, hsys=hsys, flags=swe.FLG_SIDEREAL)
+            else:
+                cusps, ascmc = swe.houses(tjdut=julian_day, lat=lat, lon=lng, hsys=hsys)
+
+            houses.append(cusps[:12])
+            ascendants.append(ascmc[0])
+            medium_coelis.append(ascmc[1])
+
+        return houses, ascendants, medium_coelis
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    records = [
+        {"name": "John", "year": 1940, "month": 10, "day": 9, "hour": 18, "minute": 30, "lng": -2.9779, "lat": 53.4106, "tz_str": "Europe/London"},
+        {"name": "Paul", "year": 1942, "month": 6, "day": 18, "hour": 15, "minute": 30, "lng": -2.9779, "lat": 53.4106, "tz_str": "Europe/London"},
+    ]
+
+    factory = SubjectBatchFactory()
+    for subject in factory.iter_astrological_subjects(records):
+        print(subject, subject.sun.sign)
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Union
+
+from pydantic import BaseModel
+
+from kerykeion.astrological_subject import AstrologicalSubject
+from kerykeion.kr_types import AstrologicalSubjectModel
+
+
+SubjectCacheKey = tuple
+"""
+Canonical key of a chart: UTC instant, latitude, longitude, zodiac type, sidereal mode,
+house system, perspective and disabled points.
+"""
+
+SUBJECT_IDENTITY_FIELDS = (
+    "name",
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "city",
+    "nation",
+    "tz_str",
+    "iso_formatted_local_datetime",
+    "local_time",
+)
+"""
+Fields of AstrologicalSubjectModel that don't depend on the chart and are taken
+from the request, since subjects born at the same instant share the cache entry.
+"""
+
+
+def _copy_subject_model(model: AstrologicalSubjectModel, update: Union[dict[str, Any], None] = None) -> AstrologicalSubjectModel:
+    """
+    Copies a cached model, so that the callers can't change the cache entry.
+    The points and the lunar phase hold only immutable values, a shallow copy of each is enough
+    and much faster than a deep copy.
+    """
+    update = dict(update or {})
+
+    for field, value in model:
+        if field in update:
+            continue
+
+        if isinstance(value, BaseModel):
+            update[field] = value.model_copy()
+        elif isinstance(value, list):
+            update[field] = list(value)
+
+    return model.model_copy(update=update)
+
+
+class InMemorySubjectCacheBackend:
+    """
+    Thread safe in-memory LRU backend for the SubjectCache.
+
+    Args:
+    - max_size (int, optional): Maximum number of entries, the least recently used are evicted first.
+        Defaults to 1024, None disables the limit.
+    - ttl (float, optional): Time to live of the entries, in seconds. Defaults to None (no expiration).
+    """
+
+    def __init__(self, max_size: Union[int, None] = 1024, ttl: Union[float, None] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._entries: OrderedDict[SubjectCacheKey, tuple[float, AstrologicalSubjectModel]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: SubjectCacheKey) -> Union[AstrologicalSubjectModel, None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            created_at, model = entry
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return model
+
+    def set(self, key: SubjectCacheKey, model: AstrologicalSubjectModel) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), model)
+            self._entries.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteSubjectCacheBackend:
+    """
+    On-disk backend for the SubjectCache, the models are stored as JSON in a SQLite database
+    and can be shared between processes and restarts.
+
+    Args:
+    - path (Union[str, Path]): Path of the SQLite database file, created if it doesn't exist.
+    - max_size (int, optional): Maximum number of entries, the least recently used are evicted first.
+        Defaults to None (no limit).
+    - ttl (float, optional): Time to live of the entries, in seconds. Defaults to None (no expiration).
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: Union[int, None] = None, ttl: Union[float, None] = None):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS subjects ("
+                "key TEXT PRIMARY KEY, model TEXT NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS subjects_accessed_at ON subjects (accessed_at)")
+
+    @staticmethod
+    def _serialize_key(key: SubjectCacheKey) -> str:
+        return json.dumps(key)
+
+    def get(self, key: SubjectCacheKey) -> Union[AstrologicalSubjectModel, None]:
+        serialized_key = self._serialize_key(key)
+        now = time.time()
+
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT model, created_at FROM subjects WHERE key = ?", (serialized_key,)).fetchone()
+            if row is None:
+                return None
+
+            model_json, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                self._connection.execute("DELETE FROM subjects WHERE key = ?", (serialized_key,))
+                return None
+
+            self._connection.execute("UPDATE subjects SET accessed_at = ? WHERE key = ?", (now, serialized_key))
+
+        return AstrologicalSubjectModel.model_validate_json(model_json)
+
+    def set(self, key: SubjectCacheKey, model: AstrologicalSubjectModel) -> None:
+        now = time.time()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO subjects (key, model, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (self._serialize_key(key), model.model_dump_json(), now, now),
+            )
+
+            if self.ttl is not None:
+                self._connection.execute("DELETE FROM subjects WHERE created_at < ?", (now - self.ttl,))
+
+            if self.max_size is not None:
+                self._connection.execute(
+                    "DELETE FROM subjects WHERE key NOT IN (SELECT key FROM subjects ORDER BY accessed_at DESC LIMIT ?)",
+                    (self.max_size,),
+                )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM subjects")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM subjects").fetchone()[0]
+
+
+class SubjectCache:
+    """
+    Cache of the calculated charts, returns ready-made AstrologicalSubjectModel instances.
+
+    The entries are keyed by the normalized birth data: the UTC instant, the coordinates,
+    the zodiac type, the sidereal mode, the house system, the perspective and the disabled points.
+    The same birth data sent with a different name, city or timezone representation hits the same entry:
+    the returned model always carries the name, the place and the local time of the request.
+
+    To build the key, the subject is created with no active points (see AstrologicalSubject),
+    which resolves the location and the UTC time without calculating the planets.
+
+    Args:
+    - backend (optional): InMemorySubjectCacheBackend (default) or SQLiteSubjectCacheBackend,
+        any object with get, set, clear and __len__ methods can be used.
+
+    Example:
+        cache = SubjectCache(SQLiteSubjectCacheBackend("cache/subjects.sqlite", ttl=86400))
+        model = cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, lng=-2.97, lat=53.41, tz_str="Europe/London", online=False)
+        print(cache.hits, cache.misses)
+    """
+
+    def __init__(self, backend: Any = None):
+        self.backend = backend if backend is not None else InMemorySubjectCacheBackend()
+        self.hits = 0
+        self.misses = 0
+
+        self._counters_lock = threading.Lock()
+
+    @staticmethod
+    def get_cache_key(subject: AstrologicalSubject) -> SubjectCacheKey:
+        """
+        Returns the canonical key of the chart of a subject.
+        """
+        # Topocentric positions depend on the latitude before the polar circle override
+        latitude = subject._topo[1] if subject._topo else subject.lat
+
+        return (
+            subject.iso_formatted_utc_datetime,
+            round(float(latitude), 6),
+            round(float(subject.lng), 6),
+            subject.zodiac_type,
+            subject.sidereal_mode,
+            subject.houses_system_identifier,
+            subject.perspective_type,
+            ("Chiron", "Mean_Lilith") if subject.disable_chiron_and_lilith else (),
+        )
+
+    def get_astrological_subject_model(self, *args, **kwargs) -> AstrologicalSubjectModel:
+        """
+        Returns the AstrologicalSubjectModel of the given birth data, from the cache when possible.
+
+        Args:
+        - Same arguments of AstrologicalSubject, except active_points.
+
+        Returns:
+        - AstrologicalSubjectModel: The model of the subject.
+        """
+        subject = AstrologicalSubject(*args, **kwargs, active_points=[])
+        key = self.get_cache_key(subject)
+
+        model = self.backend.get(key)
+        if model is not None:
+            with self._counters_lock:
+                self.hits += 1
+
+            logging.debug(f"Subject cache hit: {key}")
+            return _copy_subject_model(model, {field: getattr(subject, field) for field in SUBJECT_IDENTITY_FIELDS})
+
+        with self._counters_lock:
+            self.misses += 1
+
+        model = subject.model()
+        self.backend.set(key, model)
+
+        return _copy_subject_model(model)
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of hits over all the requests, 0 when there were no requests."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def clear(self) -> None:
+        """
+        Removes all the entries and resets the counters.
+        """
+        self.backend.clear()
+
+        with self._counters_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    cache = SubjectCache()
+
+    for name in ("John", "John Lennon"):
+        model = cache.get_astrological_subject_model(name, 1940, 10, 9, 18, 30, lng=-2.9779, lat=53.4106, tz_str="Europe/London", online=False)
+        print(model.name, model.sun.sign)
+
+    print(f"Hits: {cache.hits}, misses: {cache.misses}")
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import logging
+import threading
+import swisseph as swe
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+from kerykeion.kr_types import SiderealMode
+
+
+DEFAULT_EPHEMERIS_PATH = Path(__file__).parent.absolute() / "sweph"
+
+
+def _has_thread_local_state() -> bool:
+    """
+    Checks if the Swiss Ephemeris library has been compiled with thread local storage,
+    in which case every thread has its own ephemeris path, sidereal mode and topocentric position.
+    """
+    reference_julian_day = 2451545.0
+
+    swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+    reference_ayanamsa = swe.get_ayanamsa_ut(reference_julian_day)
+
+    thread = threading.Thread(target=swe.set_sid_mode, args=(swe.SIDM_LAHIRI,))
+    thread.start()
+    thread.join()
+
+    thread_local_state = swe.get_ayanamsa_ut(reference_julian_day) == reference_ayanamsa
+    swe.set_sid_mode(swe.SIDM_FAGAN_BRADLEY)
+
+    return thread_local_state
+
+
+class _SwissEphemerisState:
+    """
+    The configuration currently set in the Swiss Ephemeris library.
+    """
+
+    def __init__(self):
+        self.ephemeris_path: Union[str, None] = None
+        self.sidereal_mode: Union[SiderealMode, None] = None
+        self.topo: Union[tuple[float, float, float], None] = None
+
+
+class SwissEphemerisContext:
+    """
+    Process wide configuration of the Swiss Ephemeris library.
+
+    The Swiss Ephemeris keeps its configuration in global state: changing the ephemeris path
+    closes the open ephemeris files and drops the internal caches, while the sidereal mode
+    and the topocentric position are shared by every calculation.
+
+    This class sets the ephemeris path only once, changes the sidereal mode and the
+    topocentric position only when the requested value differs from the current one,
+    and guards those changes with a lock, so that subjects with different configurations
+    can be calculated safely from a thread pool.
+
+    When the library is compiled with thread local storage (as the pyswisseph wheels are),
+    every thread has its own configuration: the context then tracks it per thread and
+    sets the ephemeris path once for each new thread.
+
+    Use `SwissEphemerisContext.get_instance()` to get the shared context of the process.
+
+    NOTE:
+        The context tracks only the changes made through it, calling `swe.set_ephe_path`,
+        `swe.set_sid_mode` or `swe.set_topo` directly bypasses it.
+
+    Args:
+    - ephemeris_path (Union[str, Path], optional): The path of the ephemeris files. Defaults to the files shipped with Kerykeion.
+    """
+
+    _instance: Union["SwissEphemerisContext", None] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ephemeris_path: Union[str, Path, None] = None):
+        self.ephemeris_path = str(ephemeris_path or DEFAULT_EPHEMERIS_PATH)
+        self.thread_local_state = _has_thread_local_state()
+
+        self._lock = threading.RLock()
+        self._thread_states = threading.local()
+        self._shared_state = _SwissEphemerisState()
+
+        self._set_up_ephemeris_path(self._get_state())
+
+    @classmethod
+    def get_instance(cls) -> "SwissEphemerisContext":
+        """
+        Returns the context shared by the whole process, creating it on the first call.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+
+        return cls._instance
+
+    def _get_state(self) -> _SwissEphemerisState:
+        """
+        Returns the configuration of the current thread, or the shared one
+        when the library state is global.
+        """
+        if not self.thread_local_state:
+            return self._shared_state
+
+        if not hasattr(self._thread_states, "state"):
+            self._thread_states.state = _SwissEphemerisState()
+
+        return self._thread_states.state
+
+    def _set_up_ephemeris_path(self, state: _SwissEphemerisState) -> None:
+        if state.ephemeris_path != self.ephemeris_path:
+            swe.set_ephe_path(self.ephemeris_path)
+            state.ephemeris_path = self.ephemeris_path
+            logging.debug(f"Swiss Ephemeris path set to: {self.ephemeris_path}")
+
+    @property
+    def sidereal_mode(self) -> Union[SiderealMode, None]:
+        """The sidereal mode currently set in the Swiss Ephemeris."""
+        return self._get_state().sidereal_mode
+
+    @property
+    def topo(self) -> Union[tuple[float, float, float], None]:
+        """The topocentric position (longitude, latitude, altitude) currently set in the Swiss Ephemeris."""
+        return self._get_state().topo
+
+    @contextmanager
+    def configure(
+        self,
+        sidereal_mode: Union[SiderealMode, None] = None,
+        topo: Union[tuple[float, float, float], None] = None,
+    ) -> Iterator["SwissEphemerisContext"]:
+        """
+        Context manager that sets the sidereal mode and the topocentric position
+        for the calculations run inside the block.
+
+        Calculations that need neither of them (tropical, non topocentric) do not take the lock.
+        Otherwise, when the library state is global, the lock is held until the end of the block,
+        so another thread can't change the configuration in the middle of a chart calculation.
+
+        Args:
+        - sidereal_mode (SiderealMode, optional): The sidereal mode needed by the calculation.
+        - topo (tuple[float, float, float], optional): Longitude, latitude and altitude for topocentric calculations.
+        """
+        state = self._get_state()
+
+        if (sidereal_mode is None and topo is None) or self.thread_local_state:
+            self._set_up(state, sidereal_mode, topo)
+            yield self
+            return
+
+        with self._lock:
+            self._set_up(state, sidereal_mode, topo)
+            yield self
+
+    def _set_up(
+        self,
+        state: _SwissEphemerisState,
+        sidereal_mode: Union[SiderealMode, None],
+        topo: Union[tuple[float, float, float], None],
+    ) -> None:
+        """
+        Applies the requested configuration, calling the Swiss Ephemeris only for the values that changed.
+        """
+        self._set_up_ephemeris_path(state)
+
+        if sidereal_mode is not None and sidereal_mode != state.sidereal_mode:
+            swe.set_sid_mode(getattr(swe, "SIDM_" + sidereal_mode))
+            state.sidereal_mode = sidereal_mode
+            logging.debug(f"Using sidereal mode: SIDM_{sidereal_mode}")
+
+        if topo is not None and topo != state.topo:
+            swe.set_topo(*topo)
+            state.topo = topo
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import json
+import logging
+import math
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable, Union
+
+from kerykeion.kr_types import KerykeionException
+
+
+_Edge = tuple[float, float, float, float]
+
+
+def get_nautical_timezone(lng: Union[int, float]) -> str:
+    """
+    Returns the nautical timezone (Etc/GMT+N) of a longitude, used for the points outside every boundary.
+    Note that the sign of the Etc timezones is inverted: Etc/GMT-1 is UTC+1.
+    """
+    offset = int(round(lng / 15))
+    if offset == 0:
+        return "Etc/GMT"
+
+    return f"Etc/GMT{'-' if offset > 0 else '+'}{abs(offset)}"
+
+
+def _segments_cross(px: float, py: float, cx: float, cy: float, edge: _Edge) -> bool:
+    """
+    Checks if the segment from the point to the cell center crosses an edge,
+    with the half-open convention of the ray casting, so that a vertex is counted once.
+    """
+    ax, ay, bx, by = edge
+
+    side_a = (cx - px) * (ay - py) - (cy - py) * (ax - px) > 0
+    side_b = (cx - px) * (by - py) - (cy - py) * (bx - px) > 0
+    if side_a == side_b:
+        return False
+
+    side_point = (bx - ax) * (py - ay) - (by - ay) * (px - ax) > 0
+    side_center = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
+    return side_point != side_center
+
+
+class TimezoneResolver:
+    """
+    Offline resolver of the IANA timezone of a couple of coordinates.
+
+    The timezone boundaries (for example the GeoJSON release of timezone-boundary-builder,
+    https://github.com/evansiroky/timezone-boundary-builder) are rasterized on a regular grid:
+
+    - the cells crossed by no boundary belong to a single timezone (or to none) and are answered with a lookup;
+    - the cells crossed by a boundary keep the boundary edges inside them, and whether the cell center
+      is inside each timezone: the point is inside a timezone when the segment from the cell center
+      to the point crosses its edges an even number of times if the center is inside, odd otherwise.
+
+    So every lookup looks only at the few edges of one cell, whatever the size of the polygons.
+    The points outside every boundary get the nautical timezone of their longitude (Etc/GMT+N).
+
+    Args:
+    - features (Iterable[tuple[str, list]]): Couples of timezone id and polygons,
+        every polygon is a list of rings and every ring a list of (lng, lat) couples.
+    - cell_size (float, optional): Size of the grid cells, in degrees. Defaults to 0.5.
+    """
+
+    def __init__(self, features: Iterable[tuple[str, list]], cell_size: float = 0.5):
+        self.cell_size = cell_size
+        self._columns_count = int(math.ceil(360 / cell_size))
+        self._rows_count = int(math.ceil(180 / cell_size))
+
+        # Cell index -> timezone covering the whole cell
+        self._covered_cells: dict[int, str] = {}
+        # Cell index -> list of (timezone, cell center inside, edges inside the cell)
+        self._border_cells: dict[int, list[tuple[str, bool, list[_Edge]]]] = defaultdict(list)
+
+        self.timezones: set[str] = set()
+        for timezone, polygons in features:
+            self.timezones.add(timezone)
+            for polygon in polygons:
+                self._add_polygon(timezone, polygon)
+
+        self._border_cells = dict(self._border_cells)
+        logging.debug(f"Timezone grid: {len(self._covered_cells)} covered cells, {len(self._border_cells)} border cells")
+
+    @classmethod
+    def from_geojson(cls, path: Union[str, Path], cell_size: float = 0.5, timezone_property: str = "tzid") -> "TimezoneResolver":
+        """
+        Builds the resolver from a GeoJSON FeatureCollection of Polygon and MultiPolygon features,
+        with the timezone id in the properties.
+
+        Args:
+        - path (Union[str, Path]): The path of the GeoJSON file.
+        - cell_size (float, optional): Size of the grid cells, in degrees. Defaults to 0.5.
+        - timezone_property (str, optional): The feature property holding the timezone id. Defaults to "tzid".
+        """
+        with open(path, encoding="utf-8") as file:
+            collection: dict[str, Any] = json.load(file)
+
+        features = []
+        for feature in collection.get("features", []):
+            timezone = feature.get("properties", {}).get(timezone_property)
+            geometry = feature.get("geometry") or {}
+
+            if not timezone:
+                continue
+
+            if geometry.get("type") == "Polygon":
+                features.append((timezone, [geometry["coordinates"]]))
+            elif geometry.get("type") == "MultiPolygon":
+                features.append((timezone, geometry["coordinates"]))
+
+        if not features:
+            raise KerykeionException(f"No timezone boundaries found in {path}")
+
+        return cls(features, cell_size=cell_size)
+
+    def _get_cell(self, lat: float, lng: float) -> tuple[int, int]:
+        row = min(max(int((lat + 90) // self.cell_size), 0), self._rows_count - 1)
+        column = min(max(int((lng + 180) // self.cell_size), 0), self._columns_count - 1)
+        return row, column
+
+    def _get_cell_center(self, row: int, column: int) -> tuple[float, float]:
+        return (column + 0.5) * self.cell_size - 180, (row + 0.5) * self.cell_size - 90
+
+    def _add_polygon(self, timezone: str, rings: list) -> None:
+        """
+        Rasterizes a polygon (exterior ring and holes) on the grid.
+        """
+        edges_by_cell: dict[tuple[int, int], list[_Edge]] = defaultdict(list)
+        crossings_by_row: dict[int, list[float]] = defaultdict(list)
+
+        min_row, min_column = self._rows_count, self._columns_count
+        max_row, max_column = -1, -1
+
+        for ring in rings:
+            for (ax, ay), (bx, by) in zip(ring, ring[1:] + ring[:1]):
+                if (ax, ay) == (bx, by):
+                    continue
+
+                edge = (float(ax), float(ay), float(bx), float(by))
+                first_row, first_column = self._get_cell(min(ay, by), min(ax, bx))
+                last_row, last_column = self._get_cell(max(ay, by), max(ax, bx))
+
+                min_row, min_column = min(min_row, first_row), min(min_column, first_column)
+                max_row, max_column = max(max_row, last_row), max(max_column, last_column)
+
+                for row in range(first_row, last_row + 1):
+                    for column in range(first_column, last_column + 1):
+                        edges_by_cell[(row, column)].append(edge)
+
+                    # Crossings of the horizontal line through the cell centers of the row
+                    _, center_lat = self._get_cell_center(row, 0)
+                    if (ay > center_lat) != (by > center_lat):
+                        crossings_by_row[row].append(ax + (center_lat - ay) * (bx - ax) / (by - ay))
+
+        for row in range(min_row, max_row + 1):
+            crossings = sorted(crossings_by_row.get(row, []))
+
+            for column in range(min_column, max_column + 1):
+                center_lng, _ = self._get_cell_center(row, column)
+                center_inside = bisect_left(crossings, center_lng) % 2 == 1
+                cell_index = row * self._columns_count + column
+
+                if (row, column) in edges_by_cell:
+                    self._border_cells[cell_index].append((timezone, center_inside, edges_by_cell[(row, column)]))
+                elif center_inside:
+                    self._covered_cells[cell_index] = timezone
+
+    def get_timezone(self, lat: Union[int, float], lng: Union[int, float]) -> str:
+        """
+        Returns the IANA timezone of the given coordinates.
+
+        Args:
+        - lat (Union[int, float]): The latitude.
+        - lng (Union[int, float]): The longitude.
+
+        Returns:
+        - str: The timezone id, or the nautical timezone for the points outside every boundary.
+        """
+        row, column = self._get_cell(lat, lng)
+        cell_index = row * self._columns_count + column
+
+        border_polygons = self._border_cells.get(cell_index)
+        if border_polygons:
+            center_lng, center_lat = self._get_cell_center(row, column)
+
+            for timezone, center_inside, edges in border_polygons:
+                crossings = sum(1 for edge in edges if _segments_cross(lng, lat, center_lng, center_lat, edge))
+                if center_inside != (crossings % 2 == 1):
+                    return timezone
+
+        return self._covered_cells.get(cell_index) or get_nautical_timezone(lng)
+
+    def get_timezones(self, coordinates: Iterable[tuple[Union[int, float], Union[int, float]]]) -> list[str]:
+        """
+        Batch version of get_timezone.
+
+        Args:
+        - coordinates (Iterable[tuple]): Couples of (lat, lng).
+
+        Returns:
+        - list[str]: The timezones, in the same order.
+        """
+        get_timezone = self.get_timezone
+        return [get_timezone(lat, lng) for lat, lng in coordinates]
+
+
+if __name__ == "__main__":
+    import sys
+    from time import perf_counter
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="debug")
+
+    # Usage: python -m kerykeion.timezone_resolver combined.json
+    resolver = TimezoneResolver.from_geojson(sys.argv[1])
+
+    start = perf_counter()
+    print(resolver.get_timezone(41.9, 12.5), f"{(perf_counter() - start) * 1_000_000:.1f} µs")
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Hashable, Iterator, List, Mapping, Optional, Sequence, Union, TYPE_CHECKING
+
+from kerykeion.astrological_subject import AstrologicalSubject
+from kerykeion.exact_transits import (
+    DEFAULT_SCAN_STEPS,
+    DEFAULT_TIME_TOLERANCE,
+    ExactTransitsFactory,
+    _BodySample,
+    _find_root,
+    _get_signed_difference,
+    get_datetime_from_julian_day,
+)
+from kerykeion.kr_types import KerykeionException, Planet, AxialCusps
+from kerykeion.kr_types.kr_models import ActiveAspect, AstrologicalSubjectModel, ExactTransitModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+from kerykeion.utilities import get_number_from_name
+
+if TYPE_CHECKING:
+    from kerykeion.ephemeris_tables import ChebyshevEphemeris
+
+
+INTERPOLATION_CELL_DEGREES = 1.0
+"""The longest movement of a body in an interpolation cell, in degrees."""
+
+INTERPOLATION_CELL_DAYS = 0.25
+"""The longest interpolation cell, in days: short cells near the stations, where the bodies move slowly."""
+
+# The evaluations of the ephemeris to refine a hit with Brent's method, on average
+_ROOT_FINDING_EVALUATIONS = 5
+
+_MAX_NEWTON_ITERATIONS = 8
+
+# (subject key, natal point, natal position, aspect name, aspect degrees)
+_TargetEntry = tuple[Hashable, Union[Planet, AxialCusps], float, str, float]
+
+# (julian day, target index, longitude, speed)
+_Hit = tuple[float, int, float, float]
+
+
+class TransitScannerFactory:
+    """
+    Finds the exact transits of many natal charts with a single ephemeris pass.
+
+    ExactTransitsFactory (or TransitsTimeRangeFactory) per natal chart computes the same transiting
+    positions once per chart. Here every transiting body is scanned once over the time window, and the
+    longitudes where the aspects to the natal points of all the charts are exact are kept in a single
+    sorted array (natal position plus or minus the aspect degrees). Between two scan points a body moves
+    in a single direction over an arc of longitude: the aspects exact in the arc are found with a range
+    query (bisect) on the sorted array, and only they are refined to the exact time. When a scan step has
+    more hits than it would cost to sample it in short cells (INTERPOLATION_CELL_DEGREES, INTERPOLATION_CELL_DAYS),
+    the hits are solved together on the cubic interpolation of the cells instead of evaluating the ephemeris
+    for every hit. The cost is the scan of the bodies, a range query per scan step, and the hits,
+    instead of charts x samples x points comparisons.
+
+    The results are the same of ExactTransitsFactory for every chart. All the natal charts must have
+    the same zodiac type, sidereal mode and perspective (and location, for the Topocentric perspective),
+    the transiting positions are calculated with them.
+
+    Args:
+    - natal_charts (Mapping[Hashable, AstrologicalSubject] | Sequence[AstrologicalSubject]): The natal charts,
+        by key (e.g. the user id). The keys of a sequence are the indexes.
+    - start_datetime (datetime): The start of the time window, naive datetimes are UTC.
+    - end_datetime (datetime): The end of the time window, naive datetimes are UTC.
+    - transiting_points (list[Planet], optional): The transiting bodies.
+        Defaults to the planets of DEFAULT_ACTIVE_POINTS.
+    - natal_points (list[Planet | AxialCusps], optional): The points of the natal charts. Defaults to DEFAULT_ACTIVE_POINTS.
+    - active_aspects (list[ActiveAspect], optional): The aspects to find. Defaults to DEFAULT_ACTIVE_ASPECTS.
+    - settings_file (optional): Custom settings, with the degrees of the aspects.
+    - time_tolerance (float, optional): The precision of the times, in days. Defaults to DEFAULT_TIME_TOLERANCE (one second).
+    - ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables used instead of the Swiss Ephemeris
+        for the bodies and dates they cover. Defaults to None.
+
+    Example:
+        factory = TransitScannerFactory({"alice": alice, "bob": bob}, datetime(2025, 1, 1), datetime(2025, 1, 2))
+        for subject_key, transit in factory.iter_exact_transits():
+            print(subject_key, transit.date, transit.p1_name, transit.aspect, transit.p2_name)
+    """
+
+    def __init__(
+        self,
+        natal_charts: Union[Mapping[Any, Union[AstrologicalSubject, AstrologicalSubjectModel]], Sequence[Union[AstrologicalSubject, AstrologicalSubjectModel]]],
+        start_datetime: datetime,
+        end_datetime: datetime,
+        transiting_points: Optional[List[Planet]] = None,
+        natal_points: List[Union[Planet, AxialCusps]] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        settings_file=None,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+    ):
+        self.natal_charts: dict[Hashable, Union[AstrologicalSubject, AstrologicalSubjectModel]] = (
+            dict(natal_charts) if isinstance(natal_charts, Mapping) else dict(enumerate(natal_charts))
+        )
+
+        if not self.natal_charts:
+            raise KerykeionException("No natal charts to scan!")
+
+        reference_chart = next(iter(self.natal_charts.values()))
+        reference_settings = self._get_ephemeris_settings(reference_chart)
+        for subject_key, natal_chart in self.natal_charts.items():
+            if self._get_ephemeris_settings(natal_chart) != reference_settings:
+                raise KerykeionException(
+                    f"The natal chart '{subject_key}' has a different zodiac type, sidereal mode or perspective: "
+                    "all the natal charts must share them."
+                )
+
+        # The scan of the bodies and the refinement of the times are the ones of ExactTransitsFactory,
+        # with the ephemeris settings shared by all the charts
+        self._exact_transits_factory = ExactTransitsFactory(
+            reference_chart,
+            start_datetime,
+            end_datetime,
+            transiting_points=transiting_points,
+            natal_points=natal_points,
+            active_aspects=active_aspects,
+            settings_file=settings_file,
+            time_tolerance=time_tolerance,
+            ephemeris_tables=ephemeris_tables,
+        )
+
+        self.start_julian_day = self._exact_transits_factory.start_julian_day
+        self.end_julian_day = self._exact_transits_factory.end_julian_day
+        self.transiting_points = self._exact_transits_factory.transiting_points
+        self.natal_points = natal_points
+        self.active_aspects = active_aspects
+        self.settings_file = settings_file
+        self.time_tolerance = time_tolerance
+        self.ephemeris_tables = ephemeris_tables
+
+        self._targets: list[float] = []
+        self._entries: list[_TargetEntry] = []
+        self._build_targets_index()
+
+    @staticmethod
+    def _get_ephemeris_settings(natal_chart: Union[AstrologicalSubject, AstrologicalSubjectModel]) -> tuple:
+        location = (natal_chart.lng, natal_chart.lat) if natal_chart.perspective_type == "Topocentric" else None
+        return natal_chart.zodiac_type, natal_chart.sidereal_mode, natal_chart.perspective_type, location
+
+    def _build_targets_index(self) -> None:
+        """
+        Sorts the longitudes where the aspects to the natal points of all the charts are exact.
+        """
+        aspects_degrees = self._exact_transits_factory.aspects_degrees
+        indexed = []
+
+        for subject_key, natal_chart in self.natal_charts.items():
+            for point in self.natal_points:
+                natal_point = natal_chart.get(point.lower())
+                if natal_point is None:
+                    continue
+
+                natal_position = natal_point["abs_pos"]
+                for aspect_name, aspect_degrees in aspects_degrees.items():
+                    entry = (subject_key, point, natal_position, aspect_name, aspect_degrees)
+                    indexed.append((math.fmod(natal_position + aspect_degrees, 360), entry))
+
+                    # Conjunction and opposition have a single aspect longitude, the others one on each side
+                    if 0 < aspect_degrees < 180:
+                        indexed.append((math.fmod(natal_position - aspect_degrees + 360, 360), entry))
+
+        indexed.sort(key=lambda item: item[0])
+        self._targets = [target for target, _ in indexed]
+        self._entries = [entry for _, entry in indexed]
+
+    def _iter_targets_between(self, start_longitude: float, end_longitude: float, forward: bool) -> Iterator[int]:
+        """
+        Yields the indexes of the targets passed by a body moving from start_longitude to end_longitude,
+        the end included and the start excluded, like ExactTransitsFactory._iter_longitude_crossings.
+        """
+        targets = self._targets
+
+        ranges: tuple[tuple[int, int], ...]
+        if forward:
+            # (start, end], across 0 when end < start
+            if start_longitude <= end_longitude:
+                ranges = ((bisect_right(targets, start_longitude), bisect_right(targets, end_longitude)),)
+            else:
+                ranges = ((bisect_right(targets, start_longitude), len(targets)), (0, bisect_right(targets, end_longitude)))
+        else:
+            # [end, start), across 0 when end > start
+            if end_longitude <= start_longitude:
+                ranges = ((bisect_left(targets, end_longitude), bisect_left(targets, start_longitude)),)
+            else:
+                ranges = ((bisect_left(targets, end_longitude), len(targets)), (0, bisect_left(targets, start_longitude)))
+
+        for first, last in ranges:
+            yield from range(first, last)
+
+    def _refine_with_root_finding(
+        self, planet_number: int, start_sample: _BodySample, end_sample: _BodySample, indexes: list[int]
+    ) -> Iterator[_Hit]:
+        """
+        Refines the hits of a scan interval one by one with Brent's method, like ExactTransitsFactory.
+        """
+        factory = self._exact_transits_factory
+        previous_julian_day, previous_longitude, _ = start_sample
+        julian_day, longitude, _ = end_sample
+
+        for index in indexes:
+            target = self._targets[index]
+            previous_residual = _get_signed_difference(previous_longitude, target)
+            current_residual = _get_signed_difference(longitude, target)
+
+            if current_residual == 0:
+                hit_julian_day = julian_day
+            else:
+                def residual(time: float, target: float = target) -> float:
+                    return _get_signed_difference(factory._get_body_state(time, planet_number)[0], target)
+
+                hit_julian_day = _find_root(residual, previous_julian_day, julian_day, previous_residual, current_residual, self.time_tolerance)
+
+            yield (hit_julian_day, index, *factory._get_body_state(hit_julian_day, planet_number))
+
+    def _refine_with_interpolation(
+        self, planet_number: int, start_sample: _BodySample, end_sample: _BodySample, indexes: list[int], cells_count: int
+    ) -> Iterator[_Hit]:
+        """
+        Refines all the hits of a scan interval together: the interval is sampled in short cells,
+        and every hit is solved on the cubic Hermite interpolation (longitudes and speeds) of its cell.
+        """
+        factory = self._exact_transits_factory
+        start_julian_day, start_longitude, start_speed = start_sample
+        end_julian_day, end_longitude, end_speed = end_sample
+        cell_days = (end_julian_day - start_julian_day) / cells_count
+
+        # Longitudes unwrapped from the start of the interval, the body moves in a single direction
+        julian_days = [start_julian_day]
+        longitudes = [start_longitude]
+        speeds = [start_speed]
+        for cell in range(1, cells_count):
+            julian_day = start_julian_day + cell * cell_days
+            longitude, speed = factory._get_body_state(julian_day, planet_number)
+            julian_days.append(julian_day)
+            longitudes.append(longitudes[-1] + _get_signed_difference(longitude, longitudes[-1]))
+            speeds.append(speed)
+
+        julian_days.append(end_julian_day)
+        longitudes.append(longitudes[-1] + _get_signed_difference(end_longitude, longitudes[-1]))
+        speeds.append(end_speed)
+
+        forward = longitudes[-1] > longitudes[0]
+        ascending_longitudes = longitudes if forward else [-longitude for longitude in longitudes]
+
+        for index in indexes:
+            target = self._targets[index]
+            unwrapped_target = start_longitude + (target - start_longitude) % 360 if forward else start_longitude - (start_longitude - target) % 360
+
+            cell = min(max(bisect_left(ascending_longitudes, unwrapped_target if forward else -unwrapped_target) - 1, 0), cells_count - 1)
+            days = julian_days[cell + 1] - julian_days[cell]
+            y0, y1 = longitudes[cell], longitudes[cell + 1]
+            m0, m1 = speeds[cell] * days, speeds[cell + 1] * days
+
+            # Newton's method on the cubic, from the linear interpolation
+            position = (unwrapped_target - y0) / (y1 - y0) if y1 != y0 else 0.0
+            for _ in range(_MAX_NEWTON_ITERATIONS):
+                position_2, position_3 = position * position, position * position * position
+                value = (
+                    (2 * position_3 - 3 * position_2 + 1) * y0 + (position_3 - 2 * position_2 + position) * m0
+                    + (-2 * position_3 + 3 * position_2) * y1 + (position_3 - position_2) * m1
+                )
+                derivative = (6 * position_2 - 6 * position) * (y0 - y1) + (3 * position_2 - 4 * position + 1) * m0 + (3 * position_2 - 2 * position) * m1
+                if derivative == 0:
+                    break
+
+                step = (value - unwrapped_target) / derivative
+                position = min(max(position - step, 0.0), 1.0)
+                if abs(step) * days < self.time_tolerance / 10:
+                    break
+
+            hit_julian_day = julian_days[cell] + position * days
+            yield hit_julian_day, index, math.fmod(target + 360, 360), derivative / days
+
+    def _iter_body_transits(self, transiting_point: Planet) -> Iterator[tuple[Hashable, ExactTransitModel]]:
+        """
+        Yields the exact transits of a body to all the natal charts, in chronological order.
+        """
+        factory = self._exact_transits_factory
+        planet_number = get_number_from_name(transiting_point)
+        samples = factory._get_body_samples(planet_number, DEFAULT_SCAN_STEPS[transiting_point])
+
+        hits: list[_Hit] = []
+
+        # A target exactly at the first sample is already passed, ExactTransitsFactory yields it too
+        first_julian_day, first_longitude, first_speed = samples[0]
+        for index in range(bisect_left(self._targets, first_longitude), bisect_right(self._targets, first_longitude)):
+            hits.append((first_julian_day, index, first_longitude, first_speed))
+
+        for start_sample, end_sample in zip(samples, samples[1:]):
+            movement = _get_signed_difference(end_sample[1], start_sample[1])
+            if movement == 0:
+                continue
+
+            indexes = list(self._iter_targets_between(start_sample[1], end_sample[1], movement > 0))
+            if not indexes:
+                continue
+
+            cells_count = max(
+                math.ceil(abs(movement) / INTERPOLATION_CELL_DEGREES), math.ceil((end_sample[0] - start_sample[0]) / INTERPOLATION_CELL_DAYS)
+            )
+
+            # The cells cost one evaluation each, the root finding a few for every hit
+            if len(indexes) * _ROOT_FINDING_EVALUATIONS > cells_count:
+                hits.extend(self._refine_with_interpolation(planet_number, start_sample, end_sample, indexes, cells_count))
+            else:
+                hits.extend(self._refine_with_root_finding(planet_number, start_sample, end_sample, indexes))
+
+        hits.sort()
+        for julian_day, index, longitude, speed in hits:
+            subject_key, natal_point, natal_position, aspect_name, aspect_degrees = self._entries[index]
+
+            yield subject_key, ExactTransitModel(
+                date=get_datetime_from_julian_day(julian_day).isoformat(),
+                julian_day=julian_day,
+                p1_name=transiting_point,
+                p1_abs_pos=longitude,
+                p1_speed=speed,
+                p2_name=natal_point,
+                p2_abs_pos=natal_position,
+                aspect=aspect_name,  # type: ignore
+                aspect_degrees=aspect_degrees,
+                retrograde=speed < 0,
+            )
+
+    def iter_exact_transits(self) -> Iterator[tuple[Hashable, ExactTransitModel]]:
+        """
+        Yields the exact transits to all the natal charts as (subject key, transit),
+        body by body, in chronological order for each body.
+        """
+        for transiting_point in self.transiting_points:
+            yield from self._iter_body_transits(transiting_point)
+
+    def get_exact_transits(self) -> dict[Hashable, list[ExactTransitModel]]:
+        """
+        Returns the exact transits of every natal chart, in chronological order.
+        The charts without transits in the time window have an empty list.
+        """
+        transits: dict[Hashable, list[ExactTransitModel]] = {subject_key: [] for subject_key in self.natal_charts}
+        for subject_key, transit in self.iter_exact_transits():
+            transits[subject_key].append(transit)
+
+        for subject_transits in transits.values():
+            subject_transits.sort(key=lambda transit: transit.julian_day)
+
+        return transits
+
+
+if __name__ == "__main__":
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="info")
+
+    natal_charts = {
+        "johnny": AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False),
+        "yoko": AstrologicalSubject("Yoko Ono", 1933, 2, 18, 20, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False),
+    }
+    factory = TransitScannerFactory(natal_charts, datetime(2025, 1, 1), datetime(2025, 2, 1))
+
+    for subject_key, transit in factory.iter_exact_transits():
+        print(subject_key, transit.date, transit.p1_name, "R" if transit.retrograde else " ", transit.aspect, transit.p2_name)
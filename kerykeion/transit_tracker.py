@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+    This is part of Kerykeion (C) 2025 Giacomo Battaglia
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union, TYPE_CHECKING
+
+from kerykeion.astrological_subject import AstrologicalSubject
+from kerykeion.columnar_ephemeris import get_julian_day_from_datetime
+from kerykeion.exact_transits import DEFAULT_SCAN_STEPS, DEFAULT_TIME_TOLERANCE, ExactTransitsFactory, get_datetime_from_julian_day
+from kerykeion.kr_types import KerykeionException, Planet, AxialCusps
+from kerykeion.kr_types.kr_models import ActiveAspect, AstrologicalSubjectModel, TransitIntervalModel
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
+from kerykeion.utilities import get_number_from_name
+
+if TYPE_CHECKING:
+    from kerykeion.ephemeris_tables import ChebyshevEphemeris
+
+
+_INTERVAL_COLUMNS = (
+    "id, p1_name, p2_name, p2_abs_pos, aspect, aspect_degrees, orb, target, enter_julian_day, exact_julian_days, leave_julian_day"
+)
+
+
+class TransitTracker:
+    """
+    Incremental transits of a natal chart, with the state persisted in a SQLite database.
+
+    The tracker remembers the last processed instant and the orb windows still open: every call to
+    advance only processes the time elapsed since the previous one, opening the windows entered in it,
+    adding the exact passes to the open windows and closing the windows left in it. A nightly job that
+    advances by a day costs one day of transits, not the whole time window, and the state survives
+    restarts. Every advance is a single transaction: if it fails, the next one processes the same time again.
+
+    The windows are the ones of ExactTransitsFactory.get_transit_intervals over the whole tracked time.
+    The first advance starts at start_datetime, the windows already open then have no enter time.
+
+    A database can hold the trackers of many charts, by key. A tracker can be reopened only with the
+    same natal positions, transiting points and aspects it was created with.
+
+    Args:
+    - path (Union[str, Path]): Path of the SQLite database file, created if it doesn't exist.
+    - tracker_key (str): The key of the tracker in the database, e.g. the user id.
+    - natal_chart (AstrologicalSubject): The natal chart.
+    - start_datetime (datetime): The start of the tracked time, naive datetimes are UTC.
+        Ignored when the tracker is already in the database.
+    - transiting_points (list[Planet], optional): The transiting bodies.
+        Defaults to the planets of DEFAULT_ACTIVE_POINTS.
+    - natal_points (list[Planet | AxialCusps], optional): The points of the natal chart. Defaults to DEFAULT_ACTIVE_POINTS.
+    - active_aspects (list[ActiveAspect], optional): The aspects and their orbs. Defaults to DEFAULT_ACTIVE_ASPECTS.
+    - settings_file (optional): Custom settings, with the degrees of the aspects.
+    - time_tolerance (float, optional): The precision of the times, in days. Defaults to DEFAULT_TIME_TOLERANCE (one second).
+    - ephemeris_tables (ChebyshevEphemeris, optional): Precomputed tables used instead of the Swiss Ephemeris
+        for the bodies and dates they cover. Defaults to None.
+
+    Example:
+        tracker = TransitTracker("transits.sqlite3", "johnny", johnny, datetime(2025, 1, 1))
+        for interval in tracker.advance(datetime.now(timezone.utc)):
+            print(interval.p1_name, interval.aspect, interval.p2_name, interval.enter_date, interval.leave_date)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        tracker_key: str,
+        natal_chart: Union[AstrologicalSubject, AstrologicalSubjectModel],
+        start_datetime: datetime,
+        transiting_points: Optional[List[Planet]] = None,
+        natal_points: List[Union[Planet, AxialCusps]] = DEFAULT_ACTIVE_POINTS,
+        active_aspects: List[ActiveAspect] = DEFAULT_ACTIVE_ASPECTS,
+        settings_file=None,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        ephemeris_tables: Union["ChebyshevEphemeris", None] = None,
+    ):
+        self.path = Path(path)
+        self.tracker_key = tracker_key
+        self.natal_chart = natal_chart
+        self.transiting_points = transiting_points
+        self.natal_points = natal_points
+        self.active_aspects = active_aspects
+        self.settings_file = settings_file
+        self.time_tolerance = time_tolerance
+        self.ephemeris_tables = ephemeris_tables
+
+        # Validates the arguments and gives the targets of the aspects, on a placeholder day
+        start_julian_day = get_julian_day_from_datetime(start_datetime)
+        factory = self._get_exact_transits_factory(start_julian_day, start_julian_day + 1)
+        self.transiting_points = factory.transiting_points
+
+        configuration = json.dumps({
+            "natal_positions": factory._get_natal_positions(),
+            "transiting_points": factory.transiting_points,
+            "aspects": {name: [factory.aspects_degrees[name], factory.aspects_orbs[name]] for name in factory.aspects_degrees},
+            "zodiac_type": natal_chart.zodiac_type,
+            "sidereal_mode": natal_chart.sidereal_mode,
+            "perspective_type": natal_chart.perspective_type,
+        })
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS transit_trackers ("
+                "key TEXT PRIMARY KEY, configuration TEXT NOT NULL, start_julian_day REAL NOT NULL, last_julian_day REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS transit_intervals ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, tracker_key TEXT NOT NULL, p1_name TEXT NOT NULL, p2_name TEXT NOT NULL, "
+                "p2_abs_pos REAL NOT NULL, aspect TEXT NOT NULL, aspect_degrees REAL NOT NULL, orb REAL NOT NULL, target REAL NOT NULL, "
+                "enter_julian_day REAL, exact_julian_days TEXT NOT NULL, leave_julian_day REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS transit_intervals_tracker ON transit_intervals (tracker_key, leave_julian_day)")
+
+            row = self._connection.execute(
+                "SELECT configuration, start_julian_day FROM transit_trackers WHERE key = ?", (tracker_key,)
+            ).fetchone()
+
+            if row is None:
+                self._connection.execute(
+                    "INSERT INTO transit_trackers (key, configuration, start_julian_day, last_julian_day) VALUES (?, ?, ?, ?)",
+                    (tracker_key, configuration, start_julian_day, start_julian_day),
+                )
+            elif row[0] != configuration:
+                raise KerykeionException(
+                    f"The transit tracker '{tracker_key}' was created with different natal positions, transiting points or aspects!"
+                )
+
+    def _get_exact_transits_factory(self, start_julian_day: float, end_julian_day: float) -> ExactTransitsFactory:
+        return ExactTransitsFactory(
+            self.natal_chart,
+            get_datetime_from_julian_day(start_julian_day),
+            get_datetime_from_julian_day(end_julian_day),
+            transiting_points=self.transiting_points,
+            natal_points=self.natal_points,
+            active_aspects=self.active_aspects,
+            settings_file=self.settings_file,
+            time_tolerance=self.time_tolerance,
+            ephemeris_tables=self.ephemeris_tables,
+        )
+
+    def _get_julian_days(self) -> tuple[float, float]:
+        return self._connection.execute(
+            "SELECT start_julian_day, last_julian_day FROM transit_trackers WHERE key = ?", (self.tracker_key,)
+        ).fetchone()
+
+    @property
+    def last_julian_day(self) -> float:
+        """The julian day (UT) up to which the transits are processed."""
+        with self._lock:
+            return self._get_julian_days()[1]
+
+    @property
+    def last_datetime(self) -> datetime:
+        """The UTC datetime up to which the transits are processed."""
+        return get_datetime_from_julian_day(self.last_julian_day)
+
+    @staticmethod
+    def _get_interval_model(row: tuple) -> TransitIntervalModel:
+        _, p1_name, p2_name, p2_abs_pos, aspect, aspect_degrees, orb, _, enter, exact_julian_days, leave = row
+        exact = json.loads(exact_julian_days)
+
+        return TransitIntervalModel(
+            p1_name=p1_name,
+            p2_name=p2_name,
+            p2_abs_pos=p2_abs_pos,
+            aspect=aspect,
+            aspect_degrees=aspect_degrees,
+            orb=orb,
+            enter_date=get_datetime_from_julian_day(enter).isoformat() if enter is not None else None,
+            enter_julian_day=enter,
+            exact_dates=[get_datetime_from_julian_day(julian_day).isoformat() for julian_day in exact],
+            exact_julian_days=exact,
+            leave_date=get_datetime_from_julian_day(leave).isoformat() if leave is not None else None,
+            leave_julian_day=leave,
+        )
+
+    def advance(self, end_datetime: datetime) -> list[TransitIntervalModel]:
+        """
+        Processes the transits from the last processed instant to end_datetime.
+
+        Args:
+        - end_datetime (datetime): The new end of the tracked time, naive datetimes are UTC.
+
+        Returns:
+        - list[TransitIntervalModel]: The windows opened, changed or closed by this advance, ordered by enter time.
+            Empty when end_datetime is not after the last processed instant.
+        """
+        end_julian_day = get_julian_day_from_datetime(end_datetime)
+
+        with self._lock, self._connection:
+            start_julian_day, last_julian_day = self._get_julian_days()
+            if end_julian_day <= last_julian_day:
+                return []
+
+            factory = self._get_exact_transits_factory(last_julian_day, end_julian_day)
+            first_advance = last_julian_day == start_julian_day
+
+            open_intervals = {
+                (row[1], row[2], row[4], row[7]): row
+                for row in self._connection.execute(
+                    f"SELECT {_INTERVAL_COLUMNS} FROM transit_intervals WHERE tracker_key = ? AND leave_julian_day IS NULL",
+                    (self.tracker_key,),
+                )
+            }
+            changed_ids = []
+
+            for transiting_point in factory.transiting_points:
+                planet_number = get_number_from_name(transiting_point)
+                samples = factory._get_body_samples(planet_number, DEFAULT_SCAN_STEPS[transiting_point])
+
+                for natal_point, natal_position, aspect_name, aspect_degrees, target in factory._iter_aspect_targets():
+                    orb = factory.aspects_orbs[aspect_name]
+                    open_interval = open_intervals.get((transiting_point, natal_point, aspect_name, target))
+
+                    for enter, exact, leave in factory._iter_orb_intervals(planet_number, samples, target, orb):
+                        if enter is None and open_interval is not None:
+                            # The window open at the previous advance goes on
+                            previous_exact = json.loads(open_interval[9])
+                            exact = previous_exact + [julian_day for julian_day in exact if not previous_exact or julian_day > previous_exact[-1]]
+                            self._connection.execute(
+                                "UPDATE transit_intervals SET exact_julian_days = ?, leave_julian_day = ? WHERE id = ?",
+                                (json.dumps(exact), leave, open_interval[0]),
+                            )
+                            changed_ids.append(open_interval[0])
+                            open_interval = None
+                            continue
+
+                        if enter is None and not first_advance:
+                            # Entered exactly at the end of the previous advance
+                            enter = last_julian_day
+
+                        cursor = self._connection.execute(
+                            "INSERT INTO transit_intervals (tracker_key, p1_name, p2_name, p2_abs_pos, aspect, aspect_degrees, orb, target, "
+                            "enter_julian_day, exact_julian_days, leave_julian_day) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (self.tracker_key, transiting_point, natal_point, natal_position, aspect_name, aspect_degrees, orb, target,
+                             enter, json.dumps(exact), leave),
+                        )
+                        changed_ids.append(cursor.lastrowid)
+
+                    if open_interval is not None:
+                        # Left exactly at the end of the previous advance
+                        self._connection.execute("UPDATE transit_intervals SET leave_julian_day = ? WHERE id = ?", (last_julian_day, open_interval[0]))
+                        changed_ids.append(open_interval[0])
+
+            self._connection.execute("UPDATE transit_trackers SET last_julian_day = ? WHERE key = ?", (end_julian_day, self.tracker_key))
+
+            rows = self._connection.execute(
+                f"SELECT {_INTERVAL_COLUMNS} FROM transit_intervals WHERE id IN ({', '.join('?' * len(changed_ids))})", changed_ids
+            ).fetchall()
+
+        intervals = [self._get_interval_model(row) for row in rows]
+        return sorted(intervals, key=lambda interval: interval.enter_julian_day or start_julian_day)
+
+    def get_open_intervals(self) -> list[TransitIntervalModel]:
+        """
+        Returns the windows open at the last processed instant, ordered by enter time.
+        """
+        return [interval for interval in self.get_intervals() if interval.leave_julian_day is None]
+
+    def get_intervals(self) -> list[TransitIntervalModel]:
+        """
+        Returns all the windows of the tracked time, ordered by enter time.
+        """
+        with self._lock:
+            start_julian_day, _ = self._get_julian_days()
+            rows = self._connection.execute(
+                f"SELECT {_INTERVAL_COLUMNS} FROM transit_intervals WHERE tracker_key = ?", (self.tracker_key,)
+            ).fetchall()
+
+        intervals = [self._get_interval_model(row) for row in rows]
+        return sorted(intervals, key=lambda interval: interval.enter_julian_day or start_julian_day)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+    from datetime import timedelta
+    from kerykeion.utilities import setup_logging
+    setup_logging(level="info")
+
+    johnny = AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False)
+
+    with tempfile.TemporaryDirectory() as directory:
+        tracker = TransitTracker(Path(directory) / "transits.sqlite3", "johnny", johnny, datetime(2025, 1, 1))
+
+        # A nightly job: every run processes only the new day
+        for day in range(1, 8):
+            for interval in tracker.advance(datetime(2025, 1, 1) + timedelta(days=day)):
+                print(interval.p1_name, interval.aspect, interval.p2_name, interval.enter_date, interval.exact_dates, interval.leave_date)
+
+        tracker.close()
@@ -1,9 +1,10 @@
-from typing import Optional, Union, List
+from typing import Optional, Union, List, get_args
 from datetime import datetime, timedelta
-from kerykeion import AstrologicalSubject, SynastryAspects
+from kerykeion import AstrologicalSubject, SynastryAspectsContext
 from kerykeion.ephemeris_data import EphemerisDataFactory
+from kerykeion.exact_transits import ExactTransitsFactory, get_datetime_from_julian_day
 from kerykeion.kr_types.kr_literals import AxialCusps, Planet
-from kerykeion.kr_types.kr_models import ActiveAspect, TransitMomentModel, TransitsTimeRangeModel
+from kerykeion.kr_types.kr_models import ActiveAspect, TransitIntervalModel, TransitMomentModel, TransitsTimeRangeModel
 from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS, DEFAULT_ACTIVE_ASPECTS
 
 
@@ -61,15 +62,14 @@ class TransitsTimeRangeFactory:
         """
         transit_moments = []
 
+        # The settings are compiled and the natal points prepared once, for all the ephemeris data points
+        aspects_context = SynastryAspectsContext(self.settings_file, self.active_points, self.active_aspects)
+        # The natal chart doesn't move: applying and days to exact follow the transiting points only
+        natal_points = aspects_context.get_points(self.natal_chart, fixed=True)
+
         for ephemeris_point in self.ephemeris_data_points:
             # Calculate aspects between transit positions and natal chart
-            aspects = SynastryAspects(
-                ephemeris_point,
-                self.natal_chart,
-                active_points=self.active_points,
-                active_aspects=self.active_aspects,
-                new_settings_file=self.settings_file,
-            ).relevant_aspects
+            aspects = aspects_context.get_relevant_aspects(ephemeris_point, self.natal_chart, second_points=natal_points)
 
             # Create a transit moment for this point in time
             transit_moments.append(
@@ -86,6 +86,31 @@ class TransitsTimeRangeFactory:
             transits=transit_moments
         )
 
+    def get_transit_intervals(self) -> List[TransitIntervalModel]:
+        """
+        Interval output mode: instead of the aspects of every ephemeris data point, returns one interval
+        for every time a transiting planet is within the orb of an aspect to the natal chart,
+        with the enter, exact and leave times.
+
+        The intervals are found by ExactTransitsFactory with event detection between the first
+        and the last ephemeris data point, so they don't depend on the step of the data points.
+        The axial cusps of the active points are used only as natal points.
+
+        Returns:
+            List[TransitIntervalModel]: The orb windows, ordered by enter time.
+        """
+        exact_transits_factory = ExactTransitsFactory(
+            self.natal_chart,
+            get_datetime_from_julian_day(self.ephemeris_data_points[0].julian_day),
+            get_datetime_from_julian_day(self.ephemeris_data_points[-1].julian_day),
+            transiting_points=[point for point in self.active_points if point in get_args(Planet)],  # type: ignore
+            natal_points=self.active_points,
+            active_aspects=self.active_aspects,
+            settings_file=self.settings_file,
+        )
+
+        return exact_transits_factory.get_transit_intervals()
+
 
 if __name__ == "__main__":
     # Create a natal chart for the subject
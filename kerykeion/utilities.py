@@ -1,4 +1,5 @@
-from kerykeion.kr_types import KerykeionPointModel, KerykeionException, ZodiacSignModel, AstrologicalSubjectModel, LunarPhaseModel
+from kerykeion.kr_types import KerykeionPointModel, KerykeionException, ZodiacSignModel, AstrologicalSubjectModel, LunarPhaseModel, KerykeionPoint
+from kerykeion.kr_types.kerykeion_point import ZODIAC_SIGNS_TABLE
 from kerykeion.kr_types.kr_literals import LunarPhaseEmoji, LunarPhaseName, PointType, Planet, Houses, AxialCusps
 from typing import Union, get_args, TYPE_CHECKING
 import logging
@@ -9,6 +10,15 @@ if TYPE_CHECKING:
     from kerykeion import AstrologicalSubject
 
 
+ZODIAC_SIGNS: dict[int, ZodiacSignModel] = {
+    sign_num: ZodiacSignModel(sign=sign, quality=quality, element=element, emoji=emoji, sign_num=sign_num)
+    for sign_num, (sign, quality, element, emoji) in enumerate(ZODIAC_SIGNS_TABLE)
+}
+"""
+The zodiac signs models, indexed by sign number.
+"""
+
+
 def get_number_from_name(name: Planet) -> int:
     """Utility function, gets planet id from the name."""
 
@@ -78,21 +88,6 @@ def get_kerykeion_point_from_degree(
     if degree < 0 or degree >= 360:
         raise KerykeionException(f"Error in calculating positions! Degrees: {degree}")
 
-    ZODIAC_SIGNS = {
-        0: ZodiacSignModel(sign="Ari", quality="Cardinal", element="Fire", emoji="♈️", sign_num=0),
-        1: ZodiacSignModel(sign="Tau", quality="Fixed", element="Earth", emoji="♉️", sign_num=1),
-        2: ZodiacSignModel(sign="Gem", quality="Mutable", element="Air", emoji="♊️", sign_num=2),
-        3: ZodiacSignModel(sign="Can", quality="Cardinal", element="Water", emoji="♋️", sign_num=3),
-        4: ZodiacSignModel(sign="Leo", quality="Fixed", element="Fire", emoji="♌️", sign_num=4),
-        5: ZodiacSignModel(sign="Vir", quality="Mutable", element="Earth", emoji="♍️", sign_num=5),
-        6: ZodiacSignModel(sign="Lib", quality="Cardinal", element="Air", emoji="♎️", sign_num=6),
-        7: ZodiacSignModel(sign="Sco", quality="Fixed", element="Water", emoji="♏️", sign_num=7),
-        8: ZodiacSignModel(sign="Sag", quality="Mutable", element="Fire", emoji="♐️", sign_num=8),
-        9: ZodiacSignModel(sign="Cap", quality="Cardinal", element="Earth", emoji="♑️", sign_num=9),
-        10: ZodiacSignModel(sign="Aqu", quality="Fixed", element="Air", emoji="♒️", sign_num=10),
-        11: ZodiacSignModel(sign="Pis", quality="Mutable", element="Water", emoji="♓️", sign_num=11),
-    }
-
     sign_index = int(degree // 30)
     sign_degree = degree % 30
     zodiac_sign = ZODIAC_SIGNS[sign_index]
@@ -295,7 +290,7 @@ def check_and_adjust_polar_latitude(latitude: float) -> float:
     return latitude
 
 
-def get_houses_list(subject: Union["AstrologicalSubject", AstrologicalSubjectModel]) -> list[KerykeionPointModel]:
+def get_houses_list(subject: Union["AstrologicalSubject", AstrologicalSubjectModel]) -> list[Union[KerykeionPoint, KerykeionPointModel]]:
     """
     Return the names of the houses in the order of the houses.
     """
@@ -306,17 +301,23 @@ def get_houses_list(subject: Union["AstrologicalSubject", AstrologicalSubjectMod
     return houses_absolute_position_list
 
 
-def get_available_astrological_points_list(subject: Union["AstrologicalSubject", AstrologicalSubjectModel]) -> list[KerykeionPointModel]:
+def get_available_astrological_points_list(
+    subject: Union["AstrologicalSubject", AstrologicalSubjectModel],
+    active_points: Union[list[Union[Planet, AxialCusps]], None] = None,
+) -> list[Union[KerykeionPoint, KerykeionPointModel]]:
     """
     Return the names of the planets in the order of the planets.
     The names can be used to access the planets from the AstrologicalSubject object with the __getitem__ method or the [] operator.
+    If active_points is set, only those points are returned (and calculated, for a lazy AstrologicalSubject).
     """
     planets_absolute_position_list = []
     for planet in subject.planets_names_list:
+        if active_points is None or planet in active_points:
             planets_absolute_position_list.append(subject[planet.lower()])
 
     for axis in subject.axial_cusps_names_list:
-        planets_absolute_position_list.append(subject[axis.lower()])
+        if active_points is None or axis in active_points:
+            planets_absolute_position_list.append(subject[axis.lower()])
 
     return planets_absolute_position_list
 
@@ -495,3 +496,16 @@ def inline_css_variables_in_svg(svg_content: str) -> str:
         )
 
     return processed_svg
+
+
+def import_numpy():
+    """
+    Imports NumPy, an optional dependency used by the columnar and vectorized calculations.
+    Raises a KerykeionException when it's not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise KerykeionException("NumPy is required for this feature, install it with: pip install kerykeion[numpy]") from e
+
+    return numpy
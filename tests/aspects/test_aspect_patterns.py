@@ -0,0 +1,184 @@
+from itertools import combinations, permutations
+
+import pytest
+
+from kerykeion import AstrologicalSubject, AspectPatternsFactory, CompositeSubjectFactory, NatalAspects, SubjectBatchFactory
+from kerykeion.aspects import find_aspect_patterns
+from kerykeion.kr_types import AspectModel, KerykeionException
+
+
+def _aspect(first: str, second: str, name: str, owner: str = "Test") -> AspectModel:
+    return AspectModel(
+        p1_name=first, p1_owner=owner, p1_abs_pos=0, p2_name=second, p2_owner=owner, p2_abs_pos=0,
+        aspect=name, orbit=0, aspect_degrees=0, diff=0, p1=0, p2=0,
+    )
+
+
+def _brute_force_patterns(aspects, stellium_min_size=3):
+    """
+    The patterns found with loops over all the triples and quadruples of points.
+    """
+    pairs = {}
+    points = []
+    for aspect in aspects:
+        first, second = (aspect.p1_owner, aspect.p1_name), (aspect.p2_owner, aspect.p2_name)
+        pairs[frozenset((first, second))] = aspect.aspect
+        points.extend(point for point in (first, second) if point not in points)
+
+    def is_aspect(first, second, name):
+        return pairs.get(frozenset((first, second))) == name
+
+    patterns = set()
+    for first, second, third in combinations(points, 3):
+        if is_aspect(first, second, "trine") and is_aspect(second, third, "trine") and is_aspect(first, third, "trine"):
+            patterns.add(("Grand Trine", frozenset((first, second, third)), None))
+
+    for first, second, apex in permutations(points, 3):
+        if is_aspect(first, second, "opposition") and is_aspect(first, apex, "square") and is_aspect(second, apex, "square"):
+            patterns.add(("T-Square", frozenset((first, second, apex)), apex))
+        if is_aspect(first, second, "sextile") and is_aspect(first, apex, "quincunx") and is_aspect(second, apex, "quincunx"):
+            patterns.add(("Yod", frozenset((first, second, apex)), apex))
+
+    for quadruple in permutations(points, 4):
+        first, second, third, fourth = quadruple
+        if (
+            is_aspect(first, third, "opposition") and is_aspect(second, fourth, "opposition")
+            and all(is_aspect(quadruple[index], quadruple[(index + 1) % 4], "square") for index in range(4))
+        ):
+            patterns.add(("Grand Cross", frozenset(quadruple), None))
+
+        if (
+            is_aspect(first, second, "trine") and is_aspect(second, third, "trine") and is_aspect(first, third, "trine")
+            and is_aspect(first, fourth, "opposition") and is_aspect(second, fourth, "sextile") and is_aspect(third, fourth, "sextile")
+        ):
+            patterns.add(("Kite", frozenset(quadruple), fourth))
+
+    conjunct_points = [point for point in points if any(is_aspect(point, other, "conjunction") for other in points)]
+    size = stellium_min_size
+    while True:
+        groups = [
+            group for group in combinations(conjunct_points, size)
+            if all(is_aspect(first, second, "conjunction") for first, second in combinations(group, 2))
+        ]
+        if not groups:
+            break
+
+        for group in groups:
+            # Maximal: no other point is conjunct to all the points of the group
+            if not any(all(is_aspect(point, other, "conjunction") for other in group) for point in conjunct_points if point not in group):
+                patterns.add(("Stellium", frozenset(group), None))
+        size += 1
+
+    return patterns
+
+
+def _as_set(patterns):
+    result = set()
+    for pattern in patterns:
+        apex = None if pattern.apex is None else (pattern.apex_owner, pattern.apex)
+        result.add((pattern.name, frozenset(zip(pattern.owners, pattern.points)), apex))
+    return result
+
+
+class TestAspectPatterns:
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John", 1940, 10, 9, 10, 30, lng=-2.98, lat=53.41, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Yoko", 1933, 2, 18, 10, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False)
+        self.factory = AspectPatternsFactory()
+
+    def test_synthetic_patterns(self):
+        aspects = [
+            # Grand Trine and Kite
+            _aspect("A", "B", "trine"), _aspect("B", "C", "trine"), _aspect("A", "C", "trine"),
+            _aspect("A", "D", "opposition"), _aspect("B", "D", "sextile"), _aspect("C", "D", "sextile"),
+            # Grand Cross and its four T-Squares
+            _aspect("E", "G", "opposition"), _aspect("F", "H", "opposition"),
+            _aspect("E", "F", "square"), _aspect("F", "G", "square"), _aspect("G", "H", "square"), _aspect("H", "E", "square"),
+            # Yod
+            _aspect("I", "J", "sextile"), _aspect("I", "K", "quincunx"), _aspect("J", "K", "quincunx"),
+            # Stellium of four points
+            *[_aspect(first, second, "conjunction") for first, second in combinations("LMNO", 2)],
+        ]
+
+        patterns = find_aspect_patterns(aspects)
+        names = [pattern.name for pattern in patterns]
+
+        assert names == ["Grand Trine"] + ["T-Square"] * 4 + ["Grand Cross", "Yod", "Kite", "Stellium"]
+        assert _as_set(patterns) == _brute_force_patterns(aspects)
+
+        kite = patterns[names.index("Kite")]
+        assert kite.apex == "D" and sorted(kite.points) == ["A", "B", "C", "D"]
+        assert len(kite.aspects) == 6
+
+        yod = patterns[names.index("Yod")]
+        assert yod.apex == "K" and sorted(aspect.aspect for aspect in yod.aspects) == ["quincunx", "quincunx", "sextile"]
+
+        assert patterns[names.index("Stellium")].points == ["L", "M", "N", "O"]
+        assert [pattern.name for pattern in find_aspect_patterns(aspects, stellium_min_size=5)].count("Stellium") == 0
+
+    def test_natal_patterns(self):
+        aspects = self.factory.get_aspects(self.first_subject)
+        patterns = self.factory.get_patterns(self.first_subject)
+
+        assert aspects == NatalAspects(self.first_subject, active_aspects=self.factory.active_aspects).relevant_aspects
+        assert patterns
+        assert _as_set(patterns) == _brute_force_patterns(aspects)
+
+    def test_synastry_patterns(self):
+        aspects = self.factory.get_aspects(self.first_subject, self.second_subject)
+        patterns = self.factory.get_patterns(self.first_subject, self.second_subject)
+
+        assert _as_set(patterns) == _brute_force_patterns(aspects)
+        assert any(len(set(pattern.owners)) == 2 for pattern in patterns)
+
+        with pytest.raises(KerykeionException):
+            self.factory.get_patterns(self.first_subject, self.first_subject)
+
+    def test_composite_patterns(self):
+        composite = CompositeSubjectFactory(self.first_subject, self.second_subject).get_midpoint_composite_subject_model()
+        aspects = self.factory.get_aspects(composite)
+        patterns = self.factory.get_patterns(composite)
+
+        assert patterns
+        assert _as_set(patterns) == _brute_force_patterns(aspects)
+        assert all(owner == composite.name for pattern in patterns for owner in pattern.owners)
+
+    def test_composite_synastry_patterns(self):
+        composite = CompositeSubjectFactory(self.first_subject, self.second_subject).get_midpoint_composite_subject_model()
+        aspects = self.factory.get_aspects(composite, self.first_subject)
+        patterns = self.factory.get_patterns(composite, self.first_subject)
+
+        assert _as_set(patterns) == _brute_force_patterns(aspects)
+        assert any(aspect.p1_owner == composite.name and aspect.p2_owner == self.first_subject.name for aspect in aspects)
+
+    def test_batch(self):
+        records = [
+            {"name": f"Subject {index}", "year": 1950 + 7 * index, "month": 1 + index, "day": 3 + 2 * index, "hour": 2 * index, "minute": 15,
+             "lng": 12.5, "lat": 41.9, "tz_str": "Europe/Rome"}
+            for index in range(6)
+        ]
+        subjects = SubjectBatchFactory().get_astrological_subjects(records, as_model=True)
+
+        batch = self.factory.get_patterns_batch(subjects)
+
+        assert len(batch) == len(subjects)
+        for subject, patterns in zip(subjects, batch):
+            assert patterns == self.factory.get_patterns(subject)
+            assert _as_set(patterns) == _brute_force_patterns(self.factory.get_aspects(subject))
+
+    def test_invalid_stellium_size(self):
+        with pytest.raises(KerykeionException):
+            AspectPatternsFactory(stellium_min_size=1)
+
+        with pytest.raises(KerykeionException):
+            find_aspect_patterns([], stellium_min_size=1)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
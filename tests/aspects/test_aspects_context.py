@@ -0,0 +1,64 @@
+from datetime import datetime
+from kerykeion import AstrologicalSubject, EphemerisDataFactory, SynastryAspects, SynastryAspectsContext, TransitsTimeRangeFactory
+from kerykeion.settings.kerykeion_settings import get_settings
+
+
+class TestSynastryAspectsContext:
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John", 1940, 10, 9, 10, 30, lng=-2.98, lat=53.41, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Yoko", 1933, 2, 18, 10, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False)
+        self.active_aspects = [{"name": "conjunction", "orb": 8}, {"name": "square", "orb": 6}, {"name": "trine", "orb": 7}]
+
+    def test_same_aspects_of_synastry_aspects(self):
+        context = SynastryAspectsContext(active_aspects=self.active_aspects)
+        synastry_aspects = SynastryAspects(self.first_subject, self.second_subject, active_aspects=self.active_aspects)
+
+        assert context.get_aspects(self.first_subject, self.second_subject) == synastry_aspects.all_aspects
+        assert context.get_relevant_aspects(self.first_subject, self.second_subject) == synastry_aspects.relevant_aspects
+
+    def test_prepared_points(self):
+        context = SynastryAspectsContext()
+        second_points = context.get_points(self.second_subject)
+
+        assert [name for name, _, _, _ in second_points] == [name for name, _ in context.points]
+        assert context.get_relevant_aspects(self.first_subject, self.second_subject, second_points=second_points) == (
+            SynastryAspects(self.first_subject, self.second_subject).relevant_aspects
+        )
+
+    def test_settings_are_not_changed(self):
+        settings = get_settings()
+        orbs = [aspect["orb"] for aspect in settings.aspects]
+
+        SynastryAspectsContext(settings, active_aspects=self.active_aspects)
+
+        assert [aspect["orb"] for aspect in settings.aspects] == orbs
+
+    def test_transit_moments(self):
+        ephemeris_data_points = EphemerisDataFactory(
+            start_datetime=datetime(2025, 1, 1),
+            end_datetime=datetime(2025, 1, 10),
+            step_type="days",
+            lat=self.first_subject.lat,
+            lng=self.first_subject.lng,
+            tz_str=self.first_subject.tz_str,
+        ).get_ephemeris_data_as_astrological_subjects()
+
+        transits = TransitsTimeRangeFactory(self.first_subject, ephemeris_data_points).get_transit_moments()
+
+        # The same aspects of SynastryAspects, but the natal points don't move
+        motion_fields = {"p2_speed", "applying", "days_to_exact"}
+        for ephemeris_point, moment in zip(ephemeris_data_points, transits.transits):
+            assert [aspect.model_dump(exclude=motion_fields) for aspect in moment.aspects] == [
+                aspect.model_dump(exclude=motion_fields) for aspect in SynastryAspects(ephemeris_point, self.first_subject).relevant_aspects
+            ]
+            assert all(aspect.p2_speed == 0 for aspect in moment.aspects)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
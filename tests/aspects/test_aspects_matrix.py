@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from kerykeion import KerykeionException
+from kerykeion.aspects import aspects_utils
+from kerykeion.aspects.aspects_utils import get_aspect_from_two_points, get_aspect_motion, iter_aspects_matrix
+from kerykeion.settings.kerykeion_settings import get_settings
+
+
+def get_aspects_settings():
+    return [{"name": aspect["name"], "degree": aspect["degree"], "orb": 6} for aspect in get_settings().aspects]
+
+
+def get_double_loop_aspects(aspects_settings, first_positions, second_positions, upper_triangle=False, first_speeds=None, second_speeds=None):
+    aspects = []
+    for first in range(len(first_positions)):
+        for second in range(first + 1 if upper_triangle else 0, len(second_positions)):
+            aspect = get_aspect_from_two_points(aspects_settings, first_positions[first], second_positions[second])
+            if aspect["verdict"]:
+                aspect["applying"], aspect["days_to_exact"] = get_aspect_motion(
+                    first_positions[first],
+                    second_positions[second],
+                    None if first_speeds is None else first_speeds[first],
+                    None if second_speeds is None else second_speeds[second],
+                    aspect["orbit"],
+                )
+                aspects.append((first, second, aspect))
+
+    return aspects
+
+
+def get_positions(count, seed):
+    random_generator = random.Random(seed)
+    # Half of the positions on whole degrees: distances on the edges of the orbs
+    return [random_generator.uniform(0, 360) if index % 2 else float(random_generator.randint(0, 359)) for index in range(count)]
+
+
+def get_speeds(count, seed):
+    random_generator = random.Random(seed)
+    # Some unknown speeds, like the axes, and some equal speeds
+    return [None if index % 7 == 0 else 1.0 if index % 5 == 0 else random_generator.uniform(-1, 14) for index in range(count)]
+
+
+def test_same_aspects_of_the_double_loop():
+    pytest.importorskip("numpy")
+    aspects_settings = get_aspects_settings()
+    first_positions, second_positions = get_positions(40, 1), get_positions(30, 2)
+
+    assert list(iter_aspects_matrix(aspects_settings, first_positions, second_positions)) == (
+        get_double_loop_aspects(aspects_settings, first_positions, second_positions)
+    )
+    assert list(iter_aspects_matrix(aspects_settings, first_positions, first_positions, upper_triangle=True)) == (
+        get_double_loop_aspects(aspects_settings, first_positions, first_positions, upper_triangle=True)
+    )
+
+
+def test_edge_distances():
+    pytest.importorskip("numpy")
+    aspects_settings = get_aspects_settings()
+    positions = [0.0, 1e-14, 359.99999999999994, 180.0, 90.0, 270.0, 126.0, 354.0, 6.0, 119.99999999999999]
+
+    assert list(iter_aspects_matrix(aspects_settings, positions, positions)) == get_double_loop_aspects(aspects_settings, positions, positions)
+
+
+def test_same_motion_of_the_double_loop():
+    pytest.importorskip("numpy")
+    aspects_settings = get_aspects_settings()
+    first_positions, second_positions = get_positions(40, 5), get_positions(30, 6)
+    first_speeds, second_speeds = get_speeds(40, 7), get_speeds(30, 8)
+
+    aspects = list(iter_aspects_matrix(aspects_settings, first_positions, second_positions, first_speeds=first_speeds, second_speeds=second_speeds))
+
+    assert aspects == get_double_loop_aspects(aspects_settings, first_positions, second_positions, first_speeds=first_speeds, second_speeds=second_speeds)
+    assert {aspect["applying"] for _, _, aspect in aspects} == {True, False, None}
+
+
+def test_aspect_motion():
+    # The Moon 2 degrees before the exact square, 13 degrees a day faster: applying, exact in 2/13 of a day
+    applying, days_to_exact = get_aspect_motion(88.0, 0.0, 13.5, 0.5, -2.0)
+    assert applying is True and days_to_exact == pytest.approx(2 / 13)
+
+    # The same square seen from the other point, or with the Moon 2 degrees past it
+    assert get_aspect_motion(0.0, 88.0, 0.5, 13.5, -2.0) == (True, pytest.approx(2 / 13))
+    assert get_aspect_motion(92.0, 0.0, 13.5, 0.5, 2.0) == (False, pytest.approx(-2 / 13))
+
+    # Across 0 degrees, retrograde first point
+    assert get_aspect_motion(355.0, 5.0, -0.5, 0.5, 10.0) == (False, pytest.approx(-10.0))
+
+    assert get_aspect_motion(10.0, 10.0, 1.0, 0.5, 0.0) == (False, 0.0)
+    assert get_aspect_motion(10.0, 70.0, None, 0.5, 0.0) == (None, None)
+    assert get_aspect_motion(10.0, 72.0, 1.0, 1.0, 2.0) == (None, None)
+
+
+def test_without_numpy(monkeypatch):
+    def import_numpy():
+        raise KerykeionException("NumPy is not installed")
+
+    monkeypatch.setattr(aspects_utils, "import_numpy", import_numpy)
+    aspects_settings = get_aspects_settings()
+    first_positions, second_positions = get_positions(20, 3), get_positions(20, 4)
+    first_speeds, second_speeds = get_speeds(20, 9), get_speeds(20, 10)
+
+    assert list(iter_aspects_matrix(aspects_settings, first_positions, second_positions)) == (
+        get_double_loop_aspects(aspects_settings, first_positions, second_positions)
+    )
+    assert list(iter_aspects_matrix(aspects_settings, first_positions, second_positions, first_speeds=first_speeds, second_speeds=second_speeds)) == (
+        get_double_loop_aspects(aspects_settings, first_positions, second_positions, first_speeds=first_speeds, second_speeds=second_speeds)
+    )
+
+
+def test_empty_points():
+    assert list(iter_aspects_matrix(get_aspects_settings(), [], [10.0, 20.0])) == []
+    assert list(iter_aspects_matrix([], [10.0], [20.0])) == []
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
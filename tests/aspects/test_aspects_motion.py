@@ -0,0 +1,80 @@
+from datetime import datetime
+
+from pytest import approx
+
+from kerykeion import AstrologicalSubject, CompositeSubjectFactory, EphemerisDataFactory, NatalAspects, SynastryAspects, TransitsTimeRangeFactory
+from kerykeion.aspects.aspects_utils import AXES_LIST
+
+
+def check_motion(aspects, later_aspects, hours):
+    """
+    Checks applying and days to exact against the orbits of the same aspects some hours later.
+    """
+    later_orbits = {(aspect.p1_owner, aspect.p1_name, aspect.p2_owner, aspect.p2_name, aspect.aspect): aspect.orbit for aspect in later_aspects}
+
+    checked = 0
+    for aspect in aspects:
+        later_orbit = later_orbits.get((aspect.p1_owner, aspect.p1_name, aspect.p2_owner, aspect.p2_name, aspect.aspect))
+        if aspect.applying is None or later_orbit is None:
+            continue
+
+        assert aspect.applying == (aspect.days_to_exact > 0)
+        assert aspect.applying == (abs(later_orbit) < abs(aspect.orbit))
+        # The linear estimate of the orbit after the hours
+        assert later_orbit == approx(aspect.orbit * (1 - hours / 24 / aspect.days_to_exact), abs=0.05)
+        checked += 1
+
+    return checked
+
+
+class TestAspectsMotion:
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John", 1940, 10, 9, 10, 30, lng=-2.98, lat=53.41, tz_str="Europe/London", online=False)
+        self.first_subject_later = AstrologicalSubject("John", 1940, 10, 9, 11, 30, lng=-2.98, lat=53.41, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Yoko", 1933, 2, 18, 10, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False)
+        self.second_subject_later = AstrologicalSubject("Yoko", 1933, 2, 18, 11, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False)
+
+    def test_natal_aspects(self):
+        aspects = NatalAspects(self.first_subject).all_aspects
+
+        assert check_motion(aspects, NatalAspects(self.first_subject_later).all_aspects, 1) > 10
+        for aspect in aspects:
+            assert aspect.p1_speed == self.first_subject[aspect.p1_name.lower()].speed
+            assert aspect.p2_speed == self.first_subject[aspect.p2_name.lower()].speed
+
+        # The axes have no speed
+        axes_aspects = [aspect for aspect in aspects if "Ascendant" in (aspect.p1_name, aspect.p2_name)]
+        assert axes_aspects
+        assert all(aspect.applying is None and aspect.days_to_exact is None for aspect in axes_aspects)
+
+    def test_synastry_aspects(self):
+        aspects = SynastryAspects(self.first_subject, self.second_subject).all_aspects
+        later_aspects = SynastryAspects(self.first_subject_later, self.second_subject_later).all_aspects
+
+        assert check_motion(aspects, later_aspects, 1) > 10
+
+    def test_transit_aspects(self):
+        ephemeris = EphemerisDataFactory(datetime(2024, 1, 1), datetime(2024, 1, 1, 2), step_type="hours", step=2, lat=53.41, lng=-2.98, tz_str="Europe/London")
+        transits = TransitsTimeRangeFactory(self.first_subject, ephemeris.get_ephemeris_data_as_astrological_subjects()).get_transit_moments()
+
+        first_moment, second_moment = transits.transits
+        assert check_motion(first_moment.aspects, second_moment.aspects, 2) > 5
+        # The natal points don't move, the natal axes included
+        assert all(aspect.p2_speed == 0 for aspect in first_moment.aspects)
+        natal_axes_aspects = [aspect for aspect in first_moment.aspects if aspect.p2_name in AXES_LIST and aspect.p1_name not in AXES_LIST]
+        assert all(aspect.applying is not None for aspect in natal_axes_aspects)
+
+    def test_composite_aspects(self):
+        composite = CompositeSubjectFactory(self.first_subject, self.second_subject).get_midpoint_composite_subject_model()
+
+        assert all(aspect.applying is None for aspect in NatalAspects(composite).all_aspects)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
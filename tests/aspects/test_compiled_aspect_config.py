@@ -0,0 +1,157 @@
+import copy
+import dataclasses
+import json
+import timeit
+
+import pytest
+
+from kerykeion import AstrologicalSubject, NatalAspects, SynastryAspects
+from kerykeion.aspects import CompiledAspectConfig, get_compiled_aspect_config
+from kerykeion.aspects.aspects_utils import AXES_LIST, planet_id_decoder
+from kerykeion.kr_types import AxialCusps, Planet
+from typing import get_args
+from kerykeion.settings.kerykeion_settings import get_settings, get_settings_file_path
+
+
+ACTIVE_ASPECTS = [{"name": "conjunction", "orb": 3}, {"name": "opposition", "orb": 4}]
+
+
+class TestCompiledAspectConfig:
+    def setup_class(self):
+        self.first_subject = AstrologicalSubject("John", 1940, 10, 9, 10, 30, lng=-2.98, lat=53.41, tz_str="Europe/London", online=False)
+        self.second_subject = AstrologicalSubject("Yoko", 1933, 2, 18, 10, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False)
+
+    def test_memoized(self):
+        config = get_compiled_aspect_config(active_aspects=ACTIVE_ASPECTS)
+
+        assert get_compiled_aspect_config(active_aspects=[dict(aspect) for aspect in ACTIVE_ASPECTS]) is config
+        assert get_compiled_aspect_config(active_aspects=[{"name": "conjunction", "orb": 5}]) is not config
+        assert NatalAspects(self.first_subject, active_aspects=ACTIVE_ASPECTS).aspect_config is config
+        assert SynastryAspects(self.first_subject, self.second_subject, active_aspects=ACTIVE_ASPECTS).aspect_config is config
+
+    def test_settings_objects_memoized_by_content(self):
+        settings = get_settings()
+        settings_dict = json.loads(settings.model_dump_json())
+
+        for settings_object in (settings, settings_dict):
+            config = get_compiled_aspect_config(settings_object, active_aspects=ACTIVE_ASPECTS)
+
+            assert get_compiled_aspect_config(settings_object, active_aspects=ACTIVE_ASPECTS) is config
+            assert get_compiled_aspect_config(copy.deepcopy(settings_object), active_aspects=ACTIVE_ASPECTS) is config
+            assert config == CompiledAspectConfig.from_settings(settings, active_aspects=ACTIVE_ASPECTS)
+
+    def test_changed_settings_dict(self):
+        settings_dict = json.loads(get_settings().model_dump_json())
+        relevant_aspects = len(NatalAspects(self.first_subject, new_settings_file=settings_dict).relevant_aspects)
+
+        settings_dict["general_settings"]["axes_orbit"] = 5
+        assert get_compiled_aspect_config(settings_dict).axes_orbit == 5
+        assert len(NatalAspects(self.first_subject, new_settings_file=settings_dict).relevant_aspects) > relevant_aspects
+
+        # The changed sections are validated again
+        settings_dict["aspects"][0]["degree"] = "not a degree"
+        with pytest.raises(ValueError):
+            get_compiled_aspect_config(settings_dict)
+
+    def test_changed_settings_model(self):
+        settings = get_settings().model_copy(deep=True)
+        config = get_compiled_aspect_config(settings)
+
+        settings.general_settings.axes_orbit = 0
+        assert get_compiled_aspect_config(settings) is not config
+        assert get_compiled_aspect_config(settings).axes_orbit == 0
+
+    def test_changed_settings_file(self, tmp_path):
+        settings_dict = json.loads(get_settings().model_dump_json())
+        settings_file = tmp_path / "kr.config.json"
+        settings_file.write_text(json.dumps(settings_dict), encoding="utf8")
+        assert get_compiled_aspect_config(settings_file).axes_orbit == settings_dict["general_settings"]["axes_orbit"]
+
+        settings_dict["general_settings"]["axes_orbit"] = 0
+        settings_file.write_text(json.dumps(settings_dict, indent=2), encoding="utf8")
+        assert get_compiled_aspect_config(settings_file).axes_orbit == 0
+
+    def test_memo_hit_is_cheaper_than_compiling(self):
+        settings = get_settings()
+        settings_dict = json.loads(settings.model_dump_json())
+
+        for settings_object in (get_settings_file_path(), settings_dict, settings):
+            get_compiled_aspect_config(settings_object)
+
+            hit = min(timeit.repeat(lambda: get_compiled_aspect_config(settings_object), number=20, repeat=5))
+            compile = min(timeit.repeat(lambda: CompiledAspectConfig.from_settings(get_settings(settings_object)), number=20, repeat=5))
+
+            assert hit < compile, type(settings_object)
+
+    def test_compiled_values(self):
+        settings = get_settings()
+        config = CompiledAspectConfig.from_settings(settings, ["Sun", "Moon", "Ascendant"], ACTIVE_ASPECTS)
+
+        assert [(aspect["name"], aspect["degree"], aspect["orb"]) for aspect in config.aspects] == [("conjunction", 0, 3), ("opposition", 180, 4)]
+        assert config.active_points == ("Sun", "Moon", "Ascendant")
+        assert config.axes_orbit == settings.general_settings.axes_orbit
+
+        for point in settings.celestial_points:
+            assert config.get_point_id(point["name"]) == planet_id_decoder(settings.celestial_points, point["name"])
+
+        with pytest.raises(ValueError):
+            config.get_point_id("Vulcan")
+
+    def test_frozen_and_hashable(self):
+        config = get_compiled_aspect_config()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.axes_orbit = 5  # type: ignore
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.aspects[0].orb = 5  # type: ignore
+
+        assert hash(config) == hash(CompiledAspectConfig.from_settings(get_settings()))
+
+    def test_settings_are_not_changed(self):
+        settings = get_settings()
+        orbs = [aspect["orb"] for aspect in settings.aspects]
+
+        NatalAspects(self.first_subject, new_settings_file=settings, active_aspects=ACTIVE_ASPECTS).all_aspects
+        SynastryAspects(self.first_subject, self.second_subject, new_settings_file=settings, active_aspects=ACTIVE_ASPECTS).all_aspects
+
+        assert [aspect["orb"] for aspect in settings.aspects] == orbs
+
+    def test_relevant_aspects_of_all_the_points(self):
+        settings = get_settings()
+        active_points = list(get_args(Planet)) + list(get_args(AxialCusps))
+        synastry_aspects = SynastryAspects(self.first_subject, self.second_subject, active_points=active_points)
+
+        # The previous filter of the axes
+        expected = [
+            aspect for aspect in synastry_aspects.all_aspects
+            if not ((aspect["p1_name"] in AXES_LIST or aspect["p2_name"] in AXES_LIST) and abs(aspect["orbit"]) >= settings.general_settings.axes_orbit)
+        ]
+
+        assert synastry_aspects.relevant_aspects == expected
+        assert len(expected) < len(synastry_aspects.all_aspects)
+
+    def test_points_orbs(self):
+        points_orbs = {"Moon": 2, "Ascendant": 3}
+        natal_aspects = NatalAspects(self.first_subject, points_orbs=points_orbs)
+
+        for aspect in natal_aspects.all_aspects:
+            max_orbits = [points_orbs[name] for name in (aspect["p1_name"], aspect["p2_name"]) if name in points_orbs]
+            max_orbits += [1 for name in (aspect["p1_name"], aspect["p2_name"]) if name in AXES_LIST and name not in points_orbs]
+            relevant = not max_orbits or abs(aspect["orbit"]) < min(max_orbits)
+
+            assert (aspect in natal_aspects.relevant_aspects) == relevant
+
+        assert any(aspect["p1_name"] == "Moon" or aspect["p2_name"] == "Moon" for aspect in natal_aspects.all_aspects)
+        assert natal_aspects.aspect_config is not NatalAspects(self.first_subject).aspect_config
+        assert natal_aspects.aspect_config is get_compiled_aspect_config(points_orbs={"Ascendant": 3, "Moon": 2})
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
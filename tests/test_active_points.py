@@ -0,0 +1,82 @@
+from kerykeion import AstrologicalSubject, NatalAspects, KerykeionChartSVG, Report
+from kerykeion.settings.config_constants import DEFAULT_ACTIVE_POINTS
+import swisseph as swe
+
+
+SUBJECT_ARGUMENTS = {
+    "name": "John",
+    "year": 1975,
+    "month": 10,
+    "day": 10,
+    "hour": 21,
+    "minute": 15,
+    "lng": 12.4963,
+    "lat": 41.9027,
+    "tz_str": "Europe/Rome",
+    "online": False,
+}
+
+
+def test_only_active_points_are_calculated(monkeypatch):
+    calculated_bodies = []
+    original_calc_ut = swe.calc_ut
+
+    def calc_ut(*args):
+        calculated_bodies.append(args[1])
+        return original_calc_ut(*args)
+
+    monkeypatch.setattr(swe, "calc_ut", calc_ut)
+
+    subject = AstrologicalSubject(**SUBJECT_ARGUMENTS, active_points=["Sun", "Moon", "Ascendant"])
+    assert sorted(calculated_bodies) == [0, 1]
+
+    assert subject.mars.name == "Mars"
+    assert subject["mean_south_node"].name == "Mean_South_Node"
+    assert sorted(calculated_bodies) == [0, 1, 4, 10]
+
+
+def test_lazy_points_match_the_full_subject():
+    full_subject = AstrologicalSubject(**SUBJECT_ARGUMENTS)
+    lazy_subject = AstrologicalSubject(**SUBJECT_ARGUMENTS, active_points=["Sun"])
+
+    assert lazy_subject.pluto == full_subject.pluto
+    assert lazy_subject.lunar_phase == full_subject.lunar_phase
+    assert lazy_subject.model() == full_subject.model()
+    assert lazy_subject.json() == full_subject.json()
+
+
+def test_lazy_sidereal_topocentric_subject():
+    arguments = {**SUBJECT_ARGUMENTS, "zodiac_type": "Sidereal", "sidereal_mode": "LAHIRI", "perspective_type": "Topocentric"}
+    full_subject = AstrologicalSubject(**arguments)
+    lazy_subject = AstrologicalSubject(**arguments, active_points=[])
+
+    # Another configuration in between must not change the lazy calculations
+    AstrologicalSubject(**SUBJECT_ARGUMENTS, zodiac_type="Sidereal", sidereal_mode="FAGAN_BRADLEY")
+
+    assert lazy_subject.model() == full_subject.model()
+
+
+def test_aspects_chart_and_report_use_active_points():
+    full_subject = AstrologicalSubject(**SUBJECT_ARGUMENTS)
+    lazy_subject = AstrologicalSubject(**SUBJECT_ARGUMENTS, active_points=DEFAULT_ACTIVE_POINTS)
+
+    assert NatalAspects(lazy_subject).relevant_aspects == NatalAspects(full_subject).relevant_aspects
+    assert "true_node" not in vars(lazy_subject)
+
+    assert KerykeionChartSVG(lazy_subject).makeTemplate() == KerykeionChartSVG(full_subject).makeTemplate()
+    assert "true_node" not in vars(lazy_subject)
+
+    report = Report(lazy_subject, active_points=["Sun", "Moon"])
+    assert "Sun" in report.planets_table
+    assert "Mercury" not in report.planets_table
+    assert "true_node" not in vars(lazy_subject)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,80 @@
+from kerykeion import AdaptiveEphemerisFactory, EphemerisDataFactory, KerykeionException
+from kerykeion.kr_types import EphemerisSampleModel
+from datetime import datetime
+from pytest import approx
+import swisseph as swe
+import pytest
+
+START_JULIAN_DAY = 2460676.5
+END_JULIAN_DAY = START_JULIAN_DAY + 90
+
+
+def get_angle_difference(first, second):
+    return abs((first - second + 180) % 360 - 180)
+
+
+def test_samples_follow_the_speed():
+    resolution = {"Moon": 0.5, "Mercury": 0.5, "Pluto": 0.5, "True_South_Node": 0.5}
+    samples = list(AdaptiveEphemerisFactory(START_JULIAN_DAY, END_JULIAN_DAY, resolution=resolution).iter_samples())
+
+    assert [sample["julian_day"] for sample in samples] == sorted(sample["julian_day"] for sample in samples)
+
+    for body in resolution:
+        body_samples = [sample for sample in samples if sample["point"].name == body]
+
+        assert body_samples[0]["julian_day"] == START_JULIAN_DAY
+        assert body_samples[-1]["julian_day"] == END_JULIAN_DAY
+        for previous, current in zip(body_samples, body_samples[1:]):
+            assert get_angle_difference(previous["point"].abs_pos, current["point"].abs_pos) <= 0.5
+
+    samples_count = {body: sum(sample["point"].name == body for sample in samples) for body in resolution}
+
+    # The Moon moves about 13 degrees a day, Pluto a few hundredths
+    assert samples_count["Moon"] > 90 * 13 / 0.5
+    assert samples_count["Pluto"] < 10
+    assert samples_count["Mercury"] < samples_count["Moon"] / 5
+
+
+def test_sample_positions():
+    samples = list(AdaptiveEphemerisFactory(START_JULIAN_DAY, START_JULIAN_DAY + 5, bodies=["Sun", "Mean_South_Node"], resolution=0.3).iter_samples())
+
+    assert samples[0]["date"] == "2025-01-01T00:00:00+00:00"
+    for sample in samples:
+        longitude, latitude, _, speed, _, _ = swe.calc_ut(sample["julian_day"], 0 if sample["point"].name == "Sun" else 10, swe.FLG_SWIEPH + swe.FLG_SPEED)[0]
+
+        if sample["point"].name == "Mean_South_Node":
+            longitude = (longitude + 180) % 360
+            latitude = -latitude
+
+        assert sample["point"].abs_pos == approx(longitude)
+        assert sample["point"].latitude == approx(latitude)
+        assert sample["point"].speed == approx(speed)
+        assert sample["point"].retrograde == (speed < 0)
+
+
+def test_ephemeris_data_factory_adaptive_mode():
+    factory = EphemerisDataFactory(start_datetime=datetime(2025, 1, 1), end_datetime=datetime(2025, 3, 1), tz_str="Europe/Rome")
+    samples = list(factory.iter_adaptive_ephemeris_data(resolution={"Moon": 1, "Saturn": 1}, as_model=True))
+
+    assert all(isinstance(sample, EphemerisSampleModel) for sample in samples)
+    assert samples[0].date == "2024-12-31T23:00:00+00:00"
+    assert samples[-1].date == "2025-02-28T23:00:00+00:00"
+    assert {sample.point.name for sample in samples} == {"Moon", "Saturn"}
+
+
+def test_invalid_resolutions():
+    with pytest.raises(KerykeionException):
+        AdaptiveEphemerisFactory(START_JULIAN_DAY, END_JULIAN_DAY, resolution={"Moon": 1}, bodies=["Moon", "Sun"])
+
+    with pytest.raises(ValueError):
+        AdaptiveEphemerisFactory(START_JULIAN_DAY, END_JULIAN_DAY, resolution=0)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,189 @@
+from kerykeion import AstrologicalSubject
+from kerykeion.async_fetch_geonames import AsyncFetchGeonames
+from kerykeion.fetch_geonames import set_geonames_cache_dir, get_geonames_cache_dir, clear_resolved_cities_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import asyncio
+import json
+import threading
+import time
+import pytest
+
+
+CITIES = {
+    "Liverpool": {"name": "Liverpool", "lat": "53.41058", "lng": "-2.97794", "countryCode": "GB"},
+    "London": {"name": "London", "lat": "51.50853", "lng": "-0.12574", "countryCode": "GB"},
+    "Manchester": {"name": "Manchester", "lat": "53.48095", "lng": "-2.23743", "countryCode": "GB"},
+    "Leeds": {"name": "Leeds", "lat": "53.79648", "lng": "-1.54785", "countryCode": "GB"},
+}
+
+
+class StubGeonamesServer(ThreadingHTTPServer):
+    """
+    Local stub of the GeoNames API, slow enough to have concurrent requests.
+    """
+
+    def __init__(self, delay=0.2):
+        super().__init__(("127.0.0.1", 0), StubGeonamesHandler)
+        self.delay = delay
+        self.searches = []
+        self.running_requests = 0
+        self.max_running_requests = 0
+        self.counters_lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubGeonamesHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        with self.server.counters_lock:
+            self.server.running_requests += 1
+            self.server.max_running_requests = max(self.server.max_running_requests, self.server.running_requests)
+
+        time.sleep(self.server.delay)
+
+        if url.path == "/searchJSON":
+            self.server.searches.append(query["q"][0])
+            city = CITIES.get(query["q"][0])
+            body = {"geonames": [city] if city else []}
+        else:
+            body = {"timezoneId": "Europe/London"}
+
+        with self.server.counters_lock:
+            self.server.running_requests -= 1
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(tmp_path):
+    previous_cache_dir = get_geonames_cache_dir()
+    set_geonames_cache_dir(tmp_path)
+    clear_resolved_cities_cache()
+
+    server = StubGeonamesServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    clear_resolved_cities_cache()
+    set_geonames_cache_dir(previous_cache_dir)
+
+
+def test_concurrent_lookups_are_coalesced(stub_server):
+    async def lookups():
+        client = AsyncFetchGeonames(geonames_url=stub_server.url)
+        return await asyncio.gather(*(client.get_serialized_data("Liverpool", "GB") for _ in range(20)))
+
+    results = asyncio.run(lookups())
+
+    assert stub_server.searches == ["Liverpool"]
+    assert all(result["timezonestr"] == "Europe/London" and result["lat"] == "53.41058" for result in results)
+
+
+def test_lookups_are_capped_per_username(stub_server):
+    async def lookups():
+        client = AsyncFetchGeonames(max_concurrent_requests_per_username=2, geonames_url=stub_server.url)
+        return await asyncio.gather(*(client.get_serialized_data(city, "GB", username="user") for city in CITIES))
+
+    results = asyncio.run(lookups())
+
+    assert sorted(stub_server.searches) == sorted(CITIES)
+    assert [result["name"] for result in results] == list(CITIES)
+    assert stub_server.max_running_requests == 2
+
+
+def test_native_lookups_hold_no_threads(stub_server, monkeypatch):
+    pytest.importorskip("httpx")
+
+    def to_thread(*args, **kwargs):
+        raise AssertionError("The native lookups must not run in threads")
+
+    monkeypatch.setattr(asyncio, "to_thread", to_thread)
+
+    async def lookups():
+        async with AsyncFetchGeonames(max_concurrent_requests_per_username=len(CITIES), geonames_url=stub_server.url) as client:
+            return await asyncio.gather(*(client.get_serialized_data(city, "GB") for city in CITIES))
+
+    results = asyncio.run(lookups())
+
+    assert [result["name"] for result in results] == list(CITIES)
+    assert all(result["timezonestr"] == "Europe/London" for result in results)
+    assert stub_server.max_running_requests == len(CITIES)
+
+
+def test_thread_lookups(stub_server):
+    async def lookup():
+        async with AsyncFetchGeonames(geonames_url=stub_server.url, use_threads=True) as client:
+            return await client.get_serialized_data("Leeds", "GB")
+
+    result = asyncio.run(lookup())
+
+    assert {key: result[key] for key in ("name", "lat", "lng", "countryCode", "timezonestr")} == dict(CITIES["Leeds"], timezonestr="Europe/London")
+
+
+def test_failed_lookup_is_empty(stub_server):
+    async def lookup():
+        return await AsyncFetchGeonames(geonames_url=stub_server.url).get_serialized_data("Nowhere", "GB")
+
+    assert asyncio.run(lookup()) == {}
+
+
+def test_acreate(stub_server):
+    async def create_subjects():
+        client = AsyncFetchGeonames(geonames_url=stub_server.url)
+        return await asyncio.gather(*(
+            AstrologicalSubject.acreate("John", 1940, 10, 9, 18, 30, "Liverpool", "GB", geonames_username="user", geonames_client=client)
+            for _ in range(3)
+        ))
+
+    subjects = asyncio.run(create_subjects())
+    expected = AstrologicalSubject("John", 1940, 10, 9, 18, 30, "Liverpool", "GB", lng=-2.97794, lat=53.41058, tz_str="Europe/London", online=False)
+
+    assert stub_server.searches == ["Liverpool"]
+    for subject in subjects:
+        assert subject.tz_str == "Europe/London"
+        assert subject.model().model_dump(exclude={"online"}) == expected.model().model_dump(exclude={"online"})
+
+
+def test_acreate_offline():
+    async def create_subject():
+        return await AstrologicalSubject.acreate("John", 1940, 10, 9, 18, 30, lng=-2.97794, lat=53.41058, tz_str="Europe/London", online=False)
+
+    expected = AstrologicalSubject("John", 1940, 10, 9, 18, 30, lng=-2.97794, lat=53.41058, tz_str="Europe/London", online=False)
+    assert asyncio.run(create_subject()).model() == expected.model()
+
+
+def test_acreate_city_not_found(stub_server):
+    async def create_subject():
+        client = AsyncFetchGeonames(geonames_url=stub_server.url)
+        return await AstrologicalSubject.acreate("John", 1940, 10, 9, 18, 30, "Nowhere", "GB", geonames_username="user", geonames_client=client)
+
+    with pytest.raises(Exception, match="No data found for this city"):
+        asyncio.run(create_subject())
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
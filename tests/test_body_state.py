@@ -0,0 +1,54 @@
+from kerykeion import AstrologicalSubject
+from pytest import approx
+import swisseph as swe
+
+
+class TestBodyState:
+    def setup_class(self):
+        self.subject = AstrologicalSubject(
+            "John Lennon", 1940, 10, 9, 18, 30, "Liverpool", "GB", lng=-2.97794, lat=53.41058, tz_str="Europe/London", online=False
+        )
+
+    def test_speed_latitude_distance(self):
+        expected = swe.calc_ut(self.subject.julian_day, 1, self.subject._iflag)[0]
+
+        assert self.subject.moon.abs_pos == expected[0]
+        assert self.subject.moon.latitude == expected[1]
+        assert self.subject.moon.distance == expected[2]
+        assert self.subject.moon.speed == expected[3]
+
+    def test_retrograde_follows_speed(self):
+        for planet in self.subject.planets_names_list:
+            point = self.subject[planet.lower()]
+            assert point.retrograde == (point.speed < 0)
+
+    def test_south_nodes_mirror_north_nodes(self):
+        assert self.subject.mean_south_node.speed == self.subject.mean_node.speed
+        assert self.subject.true_south_node.distance == self.subject.true_node.distance
+        assert self.subject.true_south_node.latitude == approx(-self.subject.true_node.latitude)
+
+    def test_axes_and_houses_have_no_speed(self):
+        assert self.subject.ascendant.speed is None
+        assert self.subject.first_house.speed is None
+
+    def test_one_swisseph_call_per_body(self, monkeypatch):
+        calls = []
+        original_calc_ut = swe.calc_ut
+
+        def counting_calc_ut(julian_day, planet_number, flags):
+            calls.append(planet_number)
+            return original_calc_ut(julian_day, planet_number, flags)
+
+        monkeypatch.setattr(swe, "calc_ut", counting_calc_ut)
+        AstrologicalSubject("John Lennon", 1940, 10, 9, 18, 30, lng=-2.97794, lat=53.41058, tz_str="Europe/London", online=False)
+
+        assert sorted(calls) == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 15]
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
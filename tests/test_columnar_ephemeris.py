@@ -0,0 +1,106 @@
+from kerykeion import AstrologicalSubject, EphemerisDataFactory, KerykeionException
+from kerykeion.columnar_ephemeris import ColumnarEphemerisFactory, get_julian_day_from_datetime
+from kerykeion.utilities import import_numpy
+from datetime import datetime, timezone
+from pytest import approx
+import sys
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def get_subject(date: datetime, **kwargs) -> AstrologicalSubject:
+    return AstrologicalSubject(
+        "Columnar", date.year, date.month, date.day, date.hour, date.minute,
+        lng=12.4963, lat=41.9027, tz_str="Etc/UTC", online=False, **kwargs
+    )
+
+
+def test_julian_day_from_datetime():
+    subject = get_subject(datetime(1999, 12, 31, 23, 59))
+
+    assert get_julian_day_from_datetime(datetime(1999, 12, 31, 23, 59)) == approx(subject.julian_day, abs=1e-9)
+    assert get_julian_day_from_datetime(datetime(2000, 1, 1, 12, tzinfo=timezone.utc)) == 2451545.0
+
+
+def test_positions_match_the_subjects():
+    start = datetime(2024, 2, 28, 22, 0)
+    start_julian_day = get_julian_day_from_datetime(start)
+
+    factory = ColumnarEphemerisFactory(start_julian_day, start_julian_day + 3, step=0.5, lat=41.9027, lng=12.4963, include_houses=True)
+    data = factory.get_ephemeris_arrays()
+
+    assert data["longitude"].shape == (7, len(data["bodies"]))
+    assert data["houses"].shape == (7, 12)
+    assert str(data["datetime"][2]) == "2024-02-29T22:00:00.000"
+    assert data["timestamp"][1] - data["timestamp"][0] == approx(43200)
+
+    for row in (0, 2, 6):
+        subject = get_subject(start + (data["datetime"][row] - data["datetime"][0]).astype(object))
+
+        for column, body in enumerate(data["bodies"]):
+            point = subject[body.lower()]
+            assert data["longitude"][row, column] == approx(point.abs_pos, abs=1e-7)
+            assert data["latitude"][row, column] == approx(point.latitude, abs=1e-7)
+            assert data["speed"][row, column] == approx(point.speed, abs=1e-7)
+            assert data["distance"][row, column] == approx(point.distance, abs=1e-7)
+
+        assert data["houses"][row].tolist() == approx(list(subject._houses_degree_ut), abs=1e-7)
+        assert data["ascendant"][row] == approx(subject.ascendant.abs_pos, abs=1e-7)
+        assert data["medium_coeli"][row] == approx(subject.medium_coeli.abs_pos, abs=1e-7)
+
+
+def test_sidereal_bodies_subset():
+    date = datetime(1980, 5, 17, 6, 30)
+    julian_day = get_julian_day_from_datetime(date)
+
+    data = ColumnarEphemerisFactory(
+        julian_day, julian_day, bodies=["Moon", "True_South_Node"], zodiac_type="Sidereal", sidereal_mode="LAHIRI"
+    ).get_ephemeris_arrays()
+    subject = get_subject(date, zodiac_type="Sidereal", sidereal_mode="LAHIRI")
+
+    assert data["bodies"] == ["Moon", "True_South_Node"]
+    assert data["longitude"][0].tolist() == approx([subject.moon.abs_pos, subject.true_south_node.abs_pos], abs=1e-7)
+    assert "houses" not in data
+
+
+def test_ephemeris_data_factory_columnar_mode():
+    factory = EphemerisDataFactory(
+        start_datetime=datetime(2021, 3, 1),
+        end_datetime=datetime(2021, 3, 1, 2),
+        step_type="minutes",
+        step=30,
+        tz_str="Europe/Rome",
+    )
+
+    rows = factory.get_ephemeris_data()
+    data = factory.get_columnar_ephemeris_data(bodies=["Sun", "Moon"])
+
+    assert len(data["julian_day"]) == len(rows) == 5
+    for row_index, row in enumerate(rows):
+        assert data["longitude"][row_index].tolist() == approx([row["planets"][0].abs_pos, row["planets"][1].abs_pos], abs=1e-7)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ColumnarEphemerisFactory(2451545.0, 2451544.0)
+
+    with pytest.raises(KerykeionException):
+        ColumnarEphemerisFactory(2451545.0, 2451546.0, bodies=["Vulcan"])
+
+
+def test_numpy_is_optional(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(KerykeionException, match="kerykeion\\[numpy\\]"):
+        import_numpy()
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -1,5 +1,7 @@
 from kerykeion import EphemerisDataFactory
+from kerykeion.kr_types import KerykeionPointModel
 from datetime import datetime
+import types
 
 def test_ephemeris_data():
     start_date = datetime.fromisoformat("2020-01-01")
@@ -27,6 +29,77 @@ def test_ephemeris_data():
     assert ephemeris_data[0].planets[0].name == "Sun"
     assert ephemeris_data[0].houses[0].name == "First_House"
 
+    # The dictionaries hold pydantic points, like the models
+    ephemeris_dicts = factory.get_ephemeris_data()
+    for point in ephemeris_dicts[0]["planets"] + ephemeris_dicts[0]["houses"]:
+        assert isinstance(point, KerykeionPointModel)
+    assert ephemeris_dicts[0]["planets"][0].model_dump() == ephemeris_data[0].planets[0].model_dump()
+
+
+def test_iter_ephemeris_data():
+    factory = EphemerisDataFactory(
+        start_datetime=datetime.fromisoformat("2020-01-01"),
+        end_datetime=datetime.fromisoformat("2020-01-02"),
+        step_type="hours",
+        step=6,
+        lat=37.9838,
+        lng=23.7275,
+        tz_str="Europe/Athens",
+    )
+
+    ephemeris_iterator = factory.iter_ephemeris_data(as_model=True)
+    assert isinstance(ephemeris_iterator, types.GeneratorType)
+
+    ephemeris_data = list(ephemeris_iterator)
+    assert [data.date for data in ephemeris_data] == [date.isoformat() for date in factory.dates_list]
+    assert [data.date for data in ephemeris_data][-1] == "2020-01-02T00:00:00"
+    assert ephemeris_data == factory.get_ephemeris_data(as_model=True)
+
+    subjects = list(factory.iter_astrological_subjects(as_model=True))
+    assert len(subjects) == factory.dates_count == 5
+    assert subjects[0].sun.abs_pos == ephemeris_data[0].planets[0].abs_pos
+
+
+def test_parallel_ephemeris_data():
+    arguments = dict(
+        start_datetime=datetime.fromisoformat("2020-01-01"),
+        end_datetime=datetime.fromisoformat("2020-01-03"),
+        step_type="hours",
+        step=5,
+        lat=37.9838,
+        lng=23.7275,
+        tz_str="Europe/Athens",
+    )
+    factory = EphemerisDataFactory(**arguments)
+    parallel_factory = EphemerisDataFactory(**arguments, workers=2, chunk_size=2)
+
+    ephemeris_data = parallel_factory.get_ephemeris_data(as_model=True)
+    assert ephemeris_data == factory.get_ephemeris_data(as_model=True)
+    assert [data.date for data in ephemeris_data] == [date.isoformat() for date in factory.dates_list]
+
+    subjects = list(parallel_factory.iter_astrological_subjects())
+    assert [subject.model() for subject in subjects] == factory.get_ephemeris_data_as_astrological_subjects(as_model=True)
+
+    # The pool is stopped when the iterator is closed early
+    ephemeris_iterator = parallel_factory.iter_ephemeris_data()
+    assert next(ephemeris_iterator)["date"] == "2020-01-01T00:00:00"
+    ephemeris_iterator.close()
+
+
+def test_long_range_is_not_materialized():
+    factory = EphemerisDataFactory(
+        start_datetime=datetime.fromisoformat("2000-01-01"),
+        end_datetime=datetime.fromisoformat("2030-01-01"),
+        step_type="minutes",
+        max_minutes=None,
+    )
+
+    assert factory.dates_count == 15_779_521
+
+    ephemeris_iterator = factory.iter_ephemeris_data()
+    assert next(ephemeris_iterator)["date"] == "2000-01-01T00:00:00"
+    assert next(ephemeris_iterator)["date"] == "2000-01-01T00:01:00"
+
 
 if __name__ == "__main__":
     import pytest
@@ -0,0 +1,142 @@
+from kerykeion import AstrologicalSubject, ChebyshevEphemeris, EphemerisDataFactory, KerykeionException, SubjectBatchFactory
+from kerykeion.columnar_ephemeris import ColumnarEphemerisFactory, get_julian_day_from_datetime
+from datetime import datetime
+from pytest import approx
+import pickle
+import random
+import swisseph as swe
+import pytest
+
+np = pytest.importorskip("numpy")
+
+START_JULIAN_DAY = get_julian_day_from_datetime(datetime(2024, 1, 1))
+END_JULIAN_DAY = START_JULIAN_DAY + 40
+TABLES_BODIES = ["Sun", "Moon", "Mercury", "Mars", "Mean_Node", "True_Node", "Chiron"]
+
+ARCSECOND = 1 / 3600
+
+
+@pytest.fixture(scope="module")
+def tables(tmp_path_factory):
+    tables_path = ChebyshevEphemeris.build(tmp_path_factory.mktemp("tables") / "test.krcheb", START_JULIAN_DAY, END_JULIAN_DAY, bodies=TABLES_BODIES)
+    return ChebyshevEphemeris(tables_path)
+
+
+def get_subject(date: datetime, **kwargs) -> AstrologicalSubject:
+    return AstrologicalSubject(
+        "Tables", date.year, date.month, date.day, date.hour, date.minute,
+        lng=12.4963, lat=41.9027, tz_str="Etc/UTC", online=False, **kwargs
+    )
+
+
+def test_errors_within_bounds(tables):
+    assert tables.bodies == TABLES_BODIES
+    assert all(errors["longitude"] <= 1 and errors["latitude"] <= 1 for errors in tables.max_errors.values())
+
+    generator = random.Random(42)
+    for _ in range(200):
+        julian_day = generator.uniform(START_JULIAN_DAY, END_JULIAN_DAY)
+        for body_number in (0, 1, 2, 4, 10, 11, 15):
+            state = tables.get_body_state(julian_day, body_number)
+            expected = swe.calc_ut(julian_day, body_number, tables.iflag)[0]
+
+            assert abs((state[0] - expected[0] + 180) % 360 - 180) <= ARCSECOND
+            assert state[1] == approx(expected[1], abs=ARCSECOND)
+            assert state[2] == approx(expected[2], abs=1e-6)
+            assert state[3] == approx(expected[3], abs=3.6 * ARCSECOND)
+
+
+def test_vectorized_states(tables):
+    julian_days = np.linspace(START_JULIAN_DAY, END_JULIAN_DAY, 97)
+    states = tables.get_body_states(julian_days, 1)
+
+    assert states.shape == (97, 6)
+    for julian_day, state in zip(julian_days.tolist(), states):
+        assert state.tolist() == approx(tables.get_body_state(julian_day, 1), abs=1e-9)
+
+
+def test_subject_reads_the_tables(tables, monkeypatch):
+    date = datetime(2024, 1, 20, 13, 45)
+    expected = get_subject(date)
+
+    calculated_bodies = []
+    calc_ut = swe.calc_ut
+
+    def recording_calc_ut(julian_day, planet_number, iflag):
+        calculated_bodies.append(planet_number)
+        return calc_ut(julian_day, planet_number, iflag)
+
+    monkeypatch.setattr(swe, "calc_ut", recording_calc_ut)
+    subject = get_subject(date, ephemeris_tables=tables)
+
+    # Only the bodies missing from the tables are calculated by the Swiss Ephemeris
+    assert sorted(calculated_bodies) == [3, 5, 6, 7, 8, 9, 12]
+
+    for planet in subject.planets_names_list:
+        point, expected_point = subject[planet.lower()], expected[planet.lower()]
+        assert abs((point.abs_pos - expected_point.abs_pos + 180) % 360 - 180) <= ARCSECOND
+        assert point.speed == approx(expected_point.speed, abs=3.6 * ARCSECOND)
+        assert point.sign == expected_point.sign
+
+    assert subject.true_south_node.abs_pos == approx((subject.true_node.abs_pos + 180) % 360)
+
+
+def test_uncovered_subjects_use_the_swiss_ephemeris(tables):
+    outside = get_subject(datetime(2023, 6, 1), ephemeris_tables=tables)
+    assert outside.moon.abs_pos == get_subject(datetime(2023, 6, 1)).moon.abs_pos
+
+    sidereal = get_subject(datetime(2024, 1, 20), zodiac_type="Sidereal", sidereal_mode="LAHIRI", ephemeris_tables=tables)
+    assert sidereal.moon.abs_pos == get_subject(datetime(2024, 1, 20), zodiac_type="Sidereal", sidereal_mode="LAHIRI").moon.abs_pos
+
+
+def test_factories_use_the_tables(tables):
+    data = ColumnarEphemerisFactory(START_JULIAN_DAY, END_JULIAN_DAY, step=0.25, bodies=["Moon", "True_South_Node", "Venus"], ephemeris_tables=tables).get_ephemeris_arrays()
+    expected = ColumnarEphemerisFactory(START_JULIAN_DAY, END_JULIAN_DAY, step=0.25, bodies=["Moon", "True_South_Node", "Venus"]).get_ephemeris_arrays()
+
+    longitude_errors = (data["longitude"] - expected["longitude"] + 180) % 360 - 180
+    assert np.abs(longitude_errors).max() <= ARCSECOND
+    assert np.array_equal(data["longitude"][:, 2], expected["longitude"][:, 2])
+
+    factory = EphemerisDataFactory(datetime(2024, 1, 2), datetime(2024, 1, 4), ephemeris_tables=tables)
+    for subject in factory.iter_astrological_subjects():
+        assert subject.ephemeris_tables is tables
+
+    batch = SubjectBatchFactory(ephemeris_tables=tables)
+    record = {"year": 2024, "month": 1, "day": 20, "hour": 13, "minute": 45, "lng": 12.4963, "lat": 41.9027, "tz_str": "Etc/UTC"}
+    assert batch.get_astrological_subjects([record])[0].moon.abs_pos == approx(get_subject(datetime(2024, 1, 20, 13, 45)).moon.abs_pos, abs=ARCSECOND)
+
+    # The positions of the batch read the covered bodies from the tables, for all the records at once
+    records = [dict(record, day=2), record, dict(record, month=2, day=8)]
+    positions = batch.get_positions(records)
+    for row, subject in enumerate(batch.get_astrological_subjects(records)):
+        for column, body in enumerate(positions["bodies"]):
+            assert positions["longitude"][row, column] == approx(subject[body.lower()].abs_pos, abs=1e-9)
+            assert positions["speed"][row, column] == approx(subject[body.lower()].speed, abs=1e-9)
+
+
+def test_pickle(tables):
+    copy = pickle.loads(pickle.dumps(tables))
+
+    assert copy.tables_path == tables.tables_path
+    assert copy.get_body_state(START_JULIAN_DAY + 3.3, 1) == tables.get_body_state(START_JULIAN_DAY + 3.3, 1)
+
+
+def test_invalid_tables(tmp_path):
+    invalid_path = tmp_path / "invalid.krcheb"
+    invalid_path.write_bytes(b"NOT TABLES" * 10)
+
+    with pytest.raises(KerykeionException):
+        ChebyshevEphemeris(invalid_path)
+
+    with pytest.raises(KerykeionException):
+        ChebyshevEphemeris.build(tmp_path / "topocentric.krcheb", START_JULIAN_DAY, END_JULIAN_DAY, perspective_type="Topocentric")
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,163 @@
+from kerykeion import AstrologicalSubject, EphemerisDataFactory, ExactTransitsFactory, KerykeionException, TransitsTimeRangeFactory
+from kerykeion.exact_transits import get_datetime_from_julian_day
+from kerykeion.columnar_ephemeris import get_julian_day_from_datetime
+from datetime import datetime
+from pytest import approx
+import swisseph as swe
+import pytest
+
+SECOND = 1 / 86400
+
+
+@pytest.fixture(scope="module")
+def natal_chart():
+    return AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False)
+
+
+def get_separation(julian_day, planet_number, natal_position):
+    longitude = swe.calc_ut(julian_day, planet_number, swe.FLG_SWIEPH + swe.FLG_SPEED)[0][0]
+    return abs((longitude - natal_position + 180) % 360 - 180)
+
+
+def test_exact_times(natal_chart):
+    transits = ExactTransitsFactory(natal_chart, datetime(2025, 1, 1), datetime(2026, 1, 1), transiting_points=["Sun", "Moon", "Mars"]).get_exact_transits()
+
+    assert transits
+    assert [transit.julian_day for transit in transits] == sorted(transit.julian_day for transit in transits)
+
+    for transit in transits:
+        planet_number = {"Sun": 0, "Moon": 1, "Mars": 4}[transit.p1_name]
+        separation = get_separation(transit.julian_day, planet_number, transit.p2_abs_pos)
+
+        # Within the distance covered by the body in a second
+        assert separation == approx(transit.aspect_degrees, abs=abs(transit.p1_speed) * SECOND + 1e-9)
+        assert transit.date == get_datetime_from_julian_day(transit.julian_day).isoformat()
+
+
+def test_retrograde_passes_match_a_fine_scan(natal_chart):
+    # Mercury is retrograde three times a year: some aspects are exact three times in a few weeks
+    start, end = datetime(2025, 1, 1), datetime(2026, 1, 1)
+    transits = ExactTransitsFactory(
+        natal_chart, start, end, transiting_points=["Mercury"], natal_points=["Sun", "Saturn"], active_aspects=[{"name": "square", "orb": 5}]
+    ).get_exact_transits()
+
+    expected = []
+    for natal_point in ("sun", "saturn"):
+        natal_position = natal_chart[natal_point].abs_pos
+        julian_day = get_julian_day_from_datetime(start)
+        previous = get_separation(julian_day, 2, natal_position) - 90
+
+        while julian_day < get_julian_day_from_datetime(end):
+            julian_day += 1 / 24
+            current = get_separation(julian_day, 2, natal_position) - 90
+            if previous * current < 0:
+                expected.append((natal_point.capitalize(), julian_day))
+            previous = current
+
+    found = sorted((transit.p2_name, transit.julian_day) for transit in transits)
+    expected.sort()
+
+    # The fine scan finds the hour after the exact time
+    assert [name for name, _ in found] == [name for name, _ in expected]
+    for (_, julian_day), (_, expected_julian_day) in zip(found, expected):
+        assert 0 < expected_julian_day - julian_day <= 1 / 24
+
+    assert any(transit.retrograde for transit in transits)
+    assert len(transits) > 4
+
+
+def test_south_node_and_axes(natal_chart):
+    transits = ExactTransitsFactory(
+        natal_chart, datetime(2025, 1, 1), datetime(2025, 3, 1),
+        transiting_points=["Moon", "True_South_Node"], natal_points=["Ascendant"], active_aspects=[{"name": "opposition", "orb": 10}],
+    ).get_exact_transits()
+
+    moon_transits = [transit for transit in transits if transit.p1_name == "Moon"]
+    assert len(moon_transits) == 2
+    assert all(transit.p2_name == "Ascendant" for transit in transits)
+
+
+def test_transit_intervals_match_hourly_snapshots(natal_chart):
+    start, end = datetime(2025, 3, 1), datetime(2025, 4, 1)
+    aspects = [{"name": "conjunction", "orb": 8}, {"name": "square", "orb": 5}, {"name": "trine", "orb": 6}]
+    intervals = ExactTransitsFactory(
+        natal_chart, start, end, transiting_points=["Moon", "Mercury", "Venus"], natal_points=["Sun", "Moon", "Ascendant"], active_aspects=aspects,
+    ).get_transit_intervals()
+
+    start_julian_day, end_julian_day = get_julian_day_from_datetime(start), get_julian_day_from_datetime(end)
+    degrees = {"conjunction": 0, "square": 90, "trine": 120}
+    planet_numbers = {"Moon": 1, "Mercury": 2, "Venus": 3}
+
+    for interval in intervals:
+        assert interval.enter_julian_day is None or interval.enter_julian_day >= start_julian_day
+        for julian_day in interval.exact_julian_days:
+            assert (interval.enter_julian_day or start_julian_day) <= julian_day <= (interval.leave_julian_day or end_julian_day)
+
+        for edge in (interval.enter_julian_day, interval.leave_julian_day):
+            if edge is not None:
+                separation = get_separation(edge, planet_numbers[interval.p1_name], interval.p2_abs_pos)
+                assert abs(separation - interval.aspect_degrees) == approx(interval.orb, abs=1e-3)
+
+    # Every hour, the aspects within the orb are the ones of the open intervals
+    julian_day = start_julian_day + 0.5 / 24
+    while julian_day < end_julian_day:
+        open_intervals = sorted(
+            (interval.p1_name, interval.p2_name, interval.aspect)
+            for interval in intervals
+            if (interval.enter_julian_day or start_julian_day) < julian_day < (interval.leave_julian_day or end_julian_day)
+        )
+
+        in_orb = []
+        for body, planet_number in planet_numbers.items():
+            for natal_point in ("Sun", "Moon", "Ascendant"):
+                separation = get_separation(julian_day, planet_number, natal_chart[natal_point.lower()].abs_pos)
+                for aspect in aspects:
+                    if abs(separation - degrees[aspect["name"]]) <= aspect["orb"]:
+                        in_orb.append((body, natal_point, aspect["name"]))
+
+        assert open_intervals == sorted(in_orb)
+        julian_day += 1 / 24
+
+
+def test_transits_time_range_interval_mode(natal_chart):
+    ephemeris_data_points = EphemerisDataFactory(
+        start_datetime=datetime(2025, 6, 1), end_datetime=datetime(2025, 6, 11), lat=natal_chart.lat, lng=natal_chart.lng, tz_str="Etc/UTC"
+    ).get_ephemeris_data_as_astrological_subjects()
+
+    factory = TransitsTimeRangeFactory(natal_chart, ephemeris_data_points, active_points=["Sun", "Moon", "Ascendant"])
+    intervals = factory.get_transit_intervals()
+
+    assert {interval.p1_name for interval in intervals} == {"Sun", "Moon"}
+    assert all(interval.leave_julian_day is None or interval.leave_julian_day <= ephemeris_data_points[-1].julian_day + 1e-6 for interval in intervals)
+
+    moments = factory.get_transit_moments()
+    factory_orbs = {aspect["name"]: aspect["orb"] for aspect in factory.active_aspects}
+    for moment, ephemeris_point in zip(moments.transits, ephemeris_data_points):
+        # The snapshots truncate the separation to whole degrees, the intervals use the continuous orb
+        moon_aspects = {
+            (aspect.p2_name, aspect.aspect) for aspect in moment.aspects
+            if aspect.p1_name == "Moon" and abs(aspect.orbit) <= factory_orbs[aspect.aspect]
+        }
+        for natal_point, aspect in moon_aspects:
+            assert any(
+                interval.p1_name == "Moon" and interval.p2_name == natal_point and interval.aspect == aspect
+                for interval in intervals
+            )
+
+
+def test_invalid_arguments(natal_chart):
+    with pytest.raises(KerykeionException):
+        ExactTransitsFactory(natal_chart, datetime(2025, 1, 1), datetime(2025, 2, 1), transiting_points=["Ascendant"])
+
+    with pytest.raises(ValueError):
+        ExactTransitsFactory(natal_chart, datetime(2025, 2, 1), datetime(2025, 1, 1))
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
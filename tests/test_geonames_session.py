@@ -0,0 +1,82 @@
+from kerykeion import fetch_geonames
+from kerykeion.fetch_geonames import FetchGeonames, get_geonames_session, set_geonames_cache_dir, get_geonames_cache_dir, clear_resolved_cities_cache
+import pytest
+
+
+class FakeResponse:
+    from_cache = False
+
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def geonames_requests(monkeypatch, tmp_path):
+    previous_cache_dir = get_geonames_cache_dir()
+    set_geonames_cache_dir(tmp_path)
+    clear_resolved_cities_cache()
+
+    sent_urls = []
+
+    def send(self, prepared_request, **kwargs):
+        sent_urls.append(prepared_request.url)
+        if "timezoneJSON" in prepared_request.url:
+            return FakeResponse({"timezoneId": "Europe/Rome"})
+
+        return FakeResponse({"geonames": [{"name": "Roma", "lat": "41.89193", "lng": "12.51133", "countryCode": "IT"}]})
+
+    monkeypatch.setattr(type(get_geonames_session()), "send", send)
+    yield sent_urls
+
+    clear_resolved_cities_cache()
+    set_geonames_cache_dir(previous_cache_dir)
+
+
+def test_session_is_shared(geonames_requests):
+    first = FetchGeonames("Roma", "IT")
+    second = FetchGeonames("Milano", "IT")
+
+    assert first.session is second.session
+    assert FetchGeonames("Roma", "IT", cache_expire_after_days=1).session is not first.session
+
+
+def test_cache_dir_is_absolute(geonames_requests, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    set_geonames_cache_dir("relative_cache")
+
+    assert get_geonames_cache_dir() == tmp_path / "relative_cache"
+    assert get_geonames_cache_dir().is_absolute()
+
+    get_geonames_session()
+    assert (tmp_path / "relative_cache" / "kerykeion_geonames_cache.sqlite").exists()
+
+
+def test_resolved_cities_are_kept_in_memory(geonames_requests):
+    data = FetchGeonames("Roma", "IT").get_serialized_data()
+    assert data["timezonestr"] == "Europe/Rome"
+    assert len(geonames_requests) == 2
+
+    # Same city, different spelling of the key: no request at all
+    data["lat"] = "0"
+    assert FetchGeonames(" roma ", "it").get_serialized_data()["lat"] == "41.89193"
+    assert len(geonames_requests) == 2
+
+
+def test_failed_lookups_are_not_kept(geonames_requests, monkeypatch):
+    monkeypatch.setattr(type(get_geonames_session()), "send", lambda self, request, **kwargs: FakeResponse({"geonames": []}))
+    assert FetchGeonames("Nowhere", "IT").get_serialized_data() == {}
+
+    assert not fetch_geonames._resolved_cities
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,57 @@
+from kerykeion import AstrologicalSubject
+from kerykeion.kr_types import KerykeionException, KerykeionPoint, KerykeionPointModel
+from kerykeion.utilities import get_kerykeion_point_from_degree
+import pickle
+import pytest
+
+
+def test_point_matches_the_pydantic_model():
+    for degree in (0, 29.99, 30, 123.456, 359.99):
+        point = KerykeionPoint("Sun", degree, "Planet", house="First_House", retrograde=False, speed=0.98)
+        model = get_kerykeion_point_from_degree(degree, "Sun", "Planet")
+        model.house = "First_House"
+        model.retrograde = False
+        model.speed = 0.98
+
+        assert point == model
+        assert point.model() == model
+        assert point.json() == model.model_dump_json(exclude_none=True)
+
+
+def test_point_is_subscriptable():
+    point = KerykeionPoint("Ascendant", 95.5, "AxialCusps")
+
+    assert point["sign"] == "Can"
+    assert point["position"] == pytest.approx(5.5)
+    assert point.get("house") is None
+    assert point.get("missing", "default") == "default"
+
+    point["house"] = "Fourth_House"
+    assert point.house == "Fourth_House"
+
+
+def test_point_validation_and_pickling():
+    with pytest.raises(KerykeionException):
+        KerykeionPoint("Sun", 360, "Planet")
+
+    point = KerykeionPoint("Moon", 200.25, "Planet", retrograde=False, latitude=-4.5)
+    assert pickle.loads(pickle.dumps(point)) == point
+
+
+def test_subject_uses_compact_points():
+    subject = AstrologicalSubject("John", 1975, 10, 10, 21, 15, lng=12.4963, lat=41.9027, tz_str="Europe/Rome", online=False)
+
+    assert isinstance(subject.sun, KerykeionPoint)
+    assert isinstance(subject.model().sun, KerykeionPointModel)
+    assert subject.model().sun == subject.sun
+    assert KerykeionPointModel.model_validate(subject.first_house) == subject.first_house
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,103 @@
+from kerykeion import AstrologicalSubject, OfflineGazetteer, KerykeionException
+import pickle
+import pytest
+
+
+GEONAMES_ROWS = [
+    # geonameid, name, asciiname, alternatenames, lat, lng, feature class, feature code, country code, cc2,
+    # admin1, admin2, admin3, admin4, population, elevation, dem, timezone, modification date
+    ["3169070", "Rome", "Rome", "Roma", "41.89193", "12.51133", "P", "PPLC", "IT", "", "07", "RM", "", "", "2318895", "", "20", "Europe/Rome", "2024-01-01"],
+    ["3172394", "Napoli", "Napoli", "Naples", "40.85216", "14.26811", "P", "PPLA", "IT", "", "04", "NA", "", "", "909048", "", "17", "Europe/Rome", "2024-01-01"],
+    ["3172395", "Montichiari", "Montichiari", "", "45.41591", "10.39717", "P", "PPL", "IT", "", "09", "BS", "", "", "23542", "", "97", "Europe/Rome", "2024-01-01"],
+    ["3172396", "Montalto", "Montalto", "", "42.35", "11.6", "P", "PPL", "IT", "", "07", "VT", "", "", "8900", "", "50", "Europe/Rome", "2024-01-01"],
+    ["4409896", "Springfield", "Springfield", "", "37.21533", "-93.29824", "P", "PPLA2", "US", "", "MO", "077", "", "", "169176", "", "396", "America/Chicago", "2024-01-01"],
+    ["4250542", "Springfield", "Springfield", "", "39.80172", "-89.64371", "P", "PPLA", "US", "", "IL", "167", "", "", "114394", "", "183", "America/Chicago", "2024-01-01"],
+    ["3448439", "São Paulo", "Sao Paulo", "", "-23.5475", "-46.63611", "P", "PPLA", "BR", "", "27", "", "", "", "10021295", "", "769", "America/Sao_Paulo", "2024-01-01"],
+    # More populated than Napoli, with Napoli as alternate name
+    ["3172397", "Napoli Metro", "Napoli Metro", "Napoli,Greater Naples", "40.9", "14.3", "P", "PPL", "IT", "", "04", "NA", "", "", "3000000", "", "17", "Europe/Rome", "2024-01-01"],
+    ["0000001", "No Timezone", "No Timezone", "", "0", "0", "P", "PPL", "IT", "", "", "", "", "", "0", "", "0", "", "2024-01-01"],
+]
+
+
+@pytest.fixture(scope="module")
+def gazetteer(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("gazetteer")
+    dump_path = directory / "cities.txt"
+    dump_path.write_text("\n".join("\t".join(row) for row in GEONAMES_ROWS) + "\n", encoding="utf-8")
+
+    return OfflineGazetteer(OfflineGazetteer.build_index(dump_path, directory / "cities.kgaz"))
+
+
+def test_exact_lookup(gazetteer):
+    assert gazetteer.get_serialized_data("Rome", "IT") == {
+        "timezonestr": "Europe/Rome",
+        "name": "Rome",
+        "lat": "41.89193",
+        "lng": "12.51133",
+        "countryCode": "IT",
+    }
+    assert gazetteer.get_serialized_data(" napoli ", "it")["name"] == "Napoli"
+    assert gazetteer.get_serialized_data("Sao Paulo", "BR")["name"] == "São Paulo"
+    assert gazetteer.get_serialized_data("São Paulo", "BR")["timezonestr"] == "America/Sao_Paulo"
+
+    # The most populated place wins
+    assert gazetteer.get_serialized_data("Springfield", "US")["lat"] == "37.21533"
+
+    assert gazetteer.get_serialized_data("Rome", "US") == {}
+    assert gazetteer.get_serialized_data("No Timezone", "IT") == {}
+    assert gazetteer.get_serialized_data("Rom", "IT") == {}
+
+
+def test_alternate_names_lookup(gazetteer):
+    assert gazetteer.get_serialized_data("Roma", "IT")["name"] == "Rome"
+    assert gazetteer.get_serialized_data("naples", "IT")["name"] == "Napoli"
+    assert gazetteer.get_serialized_data("Greater Naples", "IT")["name"] == "Napoli Metro"
+
+    # The primary name wins over an alternate name, even of a more populated place
+    assert gazetteer.get_serialized_data("Napoli", "IT")["lat"] == "40.85216"
+    assert [place["name"] for place in gazetteer.search("napoli", "IT")] == ["Napoli", "Napoli Metro"]
+
+
+def test_prefix_lookup(gazetteer):
+    assert [place["name"] for place in gazetteer.search("mont", "IT")] == ["Montalto", "Montichiari"]
+    assert [place["name"] for place in gazetteer.search("mont", "IT", limit=1)] == ["Montalto"]
+    assert len(gazetteer.search("Springfield", "US")) == 2
+    assert gazetteer.search("x", "IT") == []
+
+
+def test_subject_with_offline_gazetteer(gazetteer):
+    subject = AstrologicalSubject("John", 1975, 10, 10, 21, 15, "Napoli", "IT", online=False, offline_gazetteer=gazetteer)
+
+    assert subject.tz_str == "Europe/Rome"
+    assert subject.lat == pytest.approx(40.85216)
+    assert subject.lng == pytest.approx(14.26811)
+
+    with pytest.raises(KerykeionException):
+        AstrologicalSubject("John", 1975, 10, 10, 21, 15, "Atlantis", "IT", online=False, offline_gazetteer=gazetteer)
+
+    # The subject can still be pickled, the copy opens the same index
+    assert pickle.loads(pickle.dumps(subject)).offline_gazetteer.get_serialized_data("Rome", "IT")["name"] == "Rome"
+
+
+def test_invalid_index(tmp_path):
+    index_path = tmp_path / "invalid.kgaz"
+    index_path.write_bytes(b"not an index")
+
+    with pytest.raises(KerykeionException):
+        OfflineGazetteer(index_path)
+
+    # Shorter than the header, or empty
+    for content in (b"KGAZ", b""):
+        index_path.write_bytes(content)
+        with pytest.raises(KerykeionException, match="is not a Kerykeion gazetteer index"):
+            OfflineGazetteer(index_path)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,106 @@
+from kerykeion import AstrologicalSubject, SubjectBatchFactory, KerykeionException
+import pytest
+
+
+RECORDS = [
+    {"name": "John", "year": 1940, "month": 10, "day": 9, "hour": 18, "minute": 30, "lng": -2.97794, "lat": 53.41058, "tz_str": "Europe/London", "city": "Liverpool", "nation": "GB"},
+    {"name": "Yoko", "year": 1933, "month": 2, "day": 18, "hour": 10, "minute": 30, "lng": 139.69171, "lat": 35.6895, "tz_str": "Asia/Tokyo", "city": "Tokyo", "nation": "JP"},
+    {"name": "Polar", "year": 1990, "month": 1, "day": 1, "hour": 0, "minute": 0, "lng": 25.0, "lat": 70.0, "tz_str": "Europe/Oslo"},
+]
+
+
+def get_single_subject(record, **kwargs):
+    return AstrologicalSubject(
+        record["name"], record["year"], record["month"], record["day"], record["hour"], record["minute"],
+        city=record.get("city"), nation=record.get("nation"),
+        lng=record["lng"], lat=record["lat"], tz_str=record["tz_str"], online=False, **kwargs
+    )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"zodiac_type": "Sidereal", "sidereal_mode": "LAHIRI"},
+        {"perspective_type": "Topocentric"},
+        {"perspective_type": "Heliocentric", "houses_system_identifier": "W"},
+        {"disable_chiron_and_lilith": True},
+    ],
+)
+def test_batch_is_identical_to_single_subjects(config):
+    batch_models = SubjectBatchFactory(**config).get_astrological_subjects(RECORDS, as_model=True)
+
+    for record, batch_model in zip(RECORDS, batch_models):
+        assert batch_model == get_single_subject(record, **config).model()
+
+
+@pytest.mark.parametrize("config", [{}, {"zodiac_type": "Sidereal"}, {"active_points": ["Sun", "Moon", "Ascendant"]}])
+def test_batch_subjects_have_the_attributes_of_single_subjects(config):
+    batch_subjects = SubjectBatchFactory(**config).get_astrological_subjects(RECORDS)
+
+    for record, batch_subject in zip(RECORDS, batch_subjects):
+        single_subject = get_single_subject(record, **config)
+
+        assert set(vars(batch_subject)) == set(vars(single_subject))
+        for attribute in ("json_dir", "cache_expire_after_days", "offline_gazetteer", "geonames_username", "sidereal_mode", "_iflag"):
+            assert getattr(batch_subject, attribute) == getattr(single_subject, attribute)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {},
+        {"zodiac_type": "Sidereal", "sidereal_mode": "LAHIRI"},
+        {"perspective_type": "Topocentric"},
+        {"disable_chiron_and_lilith": True},
+        {"active_points": ["Sun", "Mean_South_Node", "Ascendant"]},
+    ],
+)
+def test_positions_are_the_ones_of_the_subjects(config):
+    pytest.importorskip("numpy")
+
+    # The same time in another place shares the bodies, not the houses
+    records = RECORDS + [dict(RECORDS[0], name="Elsewhere", lng=12.5, lat=41.9, tz_str="Europe/London")]
+    positions = SubjectBatchFactory(**config).get_positions(iter(records))
+
+    assert positions["names"] == [record["name"] for record in records]
+    assert positions["longitude"].shape == (len(records), len(positions["bodies"]))
+    for row, record in enumerate(records):
+        subject = get_single_subject(record, **config)
+
+        assert positions["julian_day"][row] == subject.julian_day
+        for column, body in enumerate(positions["bodies"]):
+            point = subject[body.lower()]
+            assert (positions["longitude"][row, column], positions["latitude"][row, column]) == (point.abs_pos, point.latitude)
+            assert (positions["distance"][row, column], positions["speed"][row, column]) == (point.distance, point.speed)
+
+        assert positions["houses"][row].tolist() == list(subject._houses_degree_ut[:12])
+        assert (positions["ascendant"][row], positions["medium_coeli"][row]) == (subject.ascendant.abs_pos, subject.medium_coeli.abs_pos)
+
+
+def test_batch_accepts_iterators():
+    subjects = list(SubjectBatchFactory().iter_astrological_subjects(iter(RECORDS)))
+
+    assert [subject.name for subject in subjects] == ["John", "Yoko", "Polar"]
+    assert subjects[2].city == "London"
+
+
+def test_batch_invalid_records_and_config():
+    with pytest.raises(KerykeionException):
+        SubjectBatchFactory().get_astrological_subjects([{"year": 1940, "month": 10, "day": 9}])
+
+    with pytest.raises(KerykeionException):
+        SubjectBatchFactory().get_positions([{"year": 1940, "month": 10, "day": 9}])
+
+    with pytest.raises(KerykeionException):
+        SubjectBatchFactory(sidereal_mode="LAHIRI")
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,82 @@
+from kerykeion import AstrologicalSubject, SubjectCache, InMemorySubjectCacheBackend, SQLiteSubjectCacheBackend
+import time
+
+
+LIVERPOOL = {"lng": -2.9779, "lat": 53.4106, "tz_str": "Europe/London", "online": False}
+
+
+def test_hits_return_the_same_chart_with_the_request_identity():
+    cache = SubjectCache()
+
+    first_model = cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, city="Liverpool", **LIVERPOOL)
+    second_model = cache.get_astrological_subject_model("Johnny", 1940, 10, 9, 18, 30, city="Liverpool", **LIVERPOOL)
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert second_model == AstrologicalSubject("Johnny", 1940, 10, 9, 18, 30, city="Liverpool", **LIVERPOOL).model()
+    assert first_model.name == "John"
+
+    # Changing a returned model doesn't change the cache entry
+    second_model.sun.abs_pos = 0
+    assert cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, city="Liverpool", **LIVERPOOL) == first_model
+
+
+def test_key_uses_the_utc_instant_and_the_chart_settings():
+    cache = SubjectCache()
+
+    cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, **LIVERPOOL)
+    model = cache.get_astrological_subject_model("John", 1940, 10, 9, 19, 30, **{**LIVERPOOL, "tz_str": "Etc/GMT-2"})
+    assert cache.hits == 1
+    assert model.tz_str == "Etc/GMT-2"
+    assert model.iso_formatted_local_datetime == "1940-10-09T19:30:00+02:00"
+
+    cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, houses_system_identifier="W", **LIVERPOOL)
+    cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, zodiac_type="Sidereal", **LIVERPOOL)
+    cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, disable_chiron_and_lilith=True, **LIVERPOOL)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_size_and_ttl_eviction(monkeypatch):
+    cache = SubjectCache(InMemorySubjectCacheBackend(max_size=2, ttl=60))
+
+    for minute in (1, 2, 1, 3):
+        cache.get_astrological_subject_model("John", 1940, 10, 9, 18, minute, **LIVERPOOL)
+
+    # Minute 2 was the least recently used
+    assert len(cache) == 2
+    cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 1, **LIVERPOOL)
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 1, **LIVERPOOL)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_sqlite_backend(tmp_path):
+    path = tmp_path / "subjects.sqlite"
+    cache = SubjectCache(SQLiteSubjectCacheBackend(path, max_size=2))
+
+    expected_model = cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, **LIVERPOOL)
+    cache.backend.close()
+
+    # A new cache on the same file finds the entry
+    cache = SubjectCache(SQLiteSubjectCacheBackend(path, max_size=2))
+    assert cache.get_astrological_subject_model("John", 1940, 10, 9, 18, 30, **LIVERPOOL) == expected_model
+    assert cache.hits == 1
+
+    for minute in (31, 32):
+        cache.get_astrological_subject_model("John", 1940, 10, 9, 18, minute, **LIVERPOOL)
+    assert len(cache) == 2
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
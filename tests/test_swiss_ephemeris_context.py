@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from kerykeion import AstrologicalSubject, SwissEphemerisContext
+import swisseph as swe
+
+
+CONFIGURATIONS = [
+    {},
+    {"zodiac_type": "Sidereal", "sidereal_mode": "LAHIRI"},
+    {"zodiac_type": "Sidereal", "sidereal_mode": "FAGAN_BRADLEY"},
+    {"perspective_type": "Topocentric"},
+    {"zodiac_type": "Sidereal", "sidereal_mode": "J2000", "perspective_type": "Topocentric"},
+]
+
+LOCATIONS = [
+    {"lng": -2.97794, "lat": 53.41058, "tz_str": "Europe/London"},
+    {"lng": 139.69171, "lat": 35.6895, "tz_str": "Asia/Tokyo"},
+]
+
+
+def get_subject_model(configuration, location):
+    return AstrologicalSubject("Test", 1940, 10, 9, 18, 30, online=False, **location, **configuration).model()
+
+
+def test_same_instance_for_the_whole_process():
+    assert SwissEphemerisContext.get_instance() is SwissEphemerisContext.get_instance()
+
+
+def test_sidereal_mode_is_set_only_when_it_changes(monkeypatch):
+    # Forget the sidereal mode left by the other tests, so the first configuration sets it
+    context = SwissEphemerisContext.get_instance()
+    context._get_state().sidereal_mode = None
+
+    calls = []
+    original_set_sid_mode = swe.set_sid_mode
+    monkeypatch.setattr(swe, "set_sid_mode", lambda *args: (calls.append(args), original_set_sid_mode(*args)))
+
+    with context.configure(sidereal_mode="DELUCE"):
+        pass
+
+    assert len(calls) == 1
+
+    calls.clear()
+    with context.configure(sidereal_mode="DELUCE"):
+        assert context.sidereal_mode == "DELUCE"
+    with context.configure():
+        pass
+
+    assert len(calls) == 0
+
+
+def test_mixed_configurations_in_threads():
+    jobs = [(configuration, location) for configuration in CONFIGURATIONS for location in LOCATIONS] * 4
+    expected = [get_subject_model(configuration, location) for configuration, location in jobs]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda job: get_subject_model(*job), jobs))
+
+    assert results == expected
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,92 @@
+from kerykeion import AstrologicalSubject, TimezoneResolver, KerykeionException
+from kerykeion.timezone_resolver import get_nautical_timezone
+import json
+import pytest
+
+
+def rectangle(min_lng, min_lat, max_lng, max_lat):
+    return [[min_lng, min_lat], [max_lng, min_lat], [max_lng, max_lat], [min_lng, max_lat], [min_lng, min_lat]]
+
+
+# Two timezones with a diagonal border, a hole and a multipolygon island
+BOUNDARIES = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "properties": {"tzid": "Europe/Rome"},
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [[6.3, 36.2], [18.7, 36.2], [18.7, 47.1], [6.3, 40.9], [6.3, 36.2]],
+                    rectangle(12.3, 41.8, 12.6, 42.0),
+                ],
+            },
+        },
+        {
+            "type": "Feature",
+            "properties": {"tzid": "Europe/Zurich"},
+            "geometry": {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [[[6.3, 40.9], [18.7, 47.1], [6.3, 47.1], [6.3, 40.9]]],
+                    [rectangle(12.35, 41.85, 12.45, 41.95)],
+                ],
+            },
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def resolver(tmp_path_factory):
+    path = tmp_path_factory.mktemp("timezones") / "boundaries.json"
+    path.write_text(json.dumps(BOUNDARIES), encoding="utf-8")
+
+    return TimezoneResolver.from_geojson(path)
+
+
+def test_timezone_lookup(resolver):
+    assert resolver.get_timezone(37.5, 15.1) == "Europe/Rome"
+    assert resolver.get_timezone(46.5, 8.1) == "Europe/Zurich"
+
+    # Both sides of the diagonal border, inside the same grid cell
+    assert resolver.get_timezone(43.9, 12.45) == "Europe/Rome"
+    assert resolver.get_timezone(44.05, 12.45) == "Europe/Zurich"
+
+    # The hole of Rome and the island of Zurich inside it
+    assert resolver.get_timezone(41.81, 12.31) == get_nautical_timezone(12.31)
+    assert resolver.get_timezone(41.9, 12.4) == "Europe/Zurich"
+
+    # Outside every boundary
+    assert resolver.get_timezone(0, 0) == "Etc/GMT"
+    assert resolver.get_timezone(0, 30) == "Etc/GMT-2"
+    assert resolver.get_timezone(0, -75) == "Etc/GMT+5"
+
+
+def test_batch_lookup(resolver):
+    coordinates = [(37.5, 15.1), (46.5, 8.1), (0, 30)]
+    assert resolver.get_timezones(coordinates) == [resolver.get_timezone(lat, lng) for lat, lng in coordinates]
+
+
+def test_subject_with_timezone_resolver(resolver):
+    subject = AstrologicalSubject("John", 1975, 10, 10, 21, 15, lng=15.1, lat=37.5, online=False, timezone_resolver=resolver)
+    assert subject.tz_str == "Europe/Rome"
+
+
+def test_empty_boundaries(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": []}), encoding="utf-8")
+
+    with pytest.raises(KerykeionException):
+        TimezoneResolver.from_geojson(path)
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
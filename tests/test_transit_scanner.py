@@ -0,0 +1,72 @@
+from kerykeion import AstrologicalSubject, ExactTransitsFactory, KerykeionException, TransitScannerFactory
+from datetime import datetime
+from pytest import approx
+import pytest
+
+SECOND = 1 / 86400
+
+
+@pytest.fixture(scope="module")
+def natal_charts():
+    return {
+        "johnny": AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False),
+        "yoko": AstrologicalSubject("Yoko Ono", 1933, 2, 18, 20, 30, lng=139.69, lat=35.69, tz_str="Asia/Tokyo", online=False),
+        "paul": AstrologicalSubject("Paul McCartney", 1942, 6, 18, 15, 30, lng=-2.98, lat=53.41, tz_str="Europe/London", online=False),
+    }
+
+
+def test_same_transits_of_exact_transits_factory(natal_charts):
+    start, end = datetime(2025, 1, 1), datetime(2025, 7, 1)
+    transiting_points = ["Sun", "Moon", "Mercury", "Saturn", "True_Node"]
+    scanned = TransitScannerFactory(natal_charts, start, end, transiting_points=transiting_points).get_exact_transits()
+
+    assert list(scanned) == list(natal_charts)
+
+    for subject_key, natal_chart in natal_charts.items():
+        expected = ExactTransitsFactory(natal_chart, start, end, transiting_points=transiting_points).get_exact_transits()
+        found = scanned[subject_key]
+
+        assert len(found) == len(expected)
+        assert [transit.julian_day for transit in found] == sorted(transit.julian_day for transit in found)
+
+        key = lambda transit: (transit.p1_name, transit.p2_name, transit.aspect, round(transit.julian_day, 3))
+        for found_transit, expected_transit in zip(sorted(found, key=key), sorted(expected, key=key)):
+            assert (found_transit.p1_name, found_transit.p2_name, found_transit.aspect) == (
+                expected_transit.p1_name, expected_transit.p2_name, expected_transit.aspect
+            )
+            assert found_transit.julian_day == approx(expected_transit.julian_day, abs=2 * SECOND)
+
+
+def test_sequence_keys_and_iteration_order(natal_charts):
+    factory = TransitScannerFactory(
+        list(natal_charts.values()), datetime(2025, 1, 1), datetime(2025, 2, 1), transiting_points=["Moon", "Sun"]
+    )
+    transits = list(factory.iter_exact_transits())
+
+    assert {subject_key for subject_key, _ in transits} == {0, 1, 2}
+    assert [transit.p1_name for _, transit in transits] == sorted((transit.p1_name for _, transit in transits), key=["Moon", "Sun"].index)
+
+    for body in ("Moon", "Sun"):
+        julian_days = [transit.julian_day for _, transit in transits if transit.p1_name == body]
+        assert julian_days == sorted(julian_days)
+
+
+def test_invalid_natal_charts(natal_charts):
+    with pytest.raises(KerykeionException):
+        TransitScannerFactory({}, datetime(2025, 1, 1), datetime(2025, 2, 1))
+
+    sidereal = AstrologicalSubject(
+        "Sidereal", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", zodiac_type="Sidereal", online=False
+    )
+    with pytest.raises(KerykeionException):
+        TransitScannerFactory([natal_charts["johnny"], sidereal], datetime(2025, 1, 1), datetime(2025, 2, 1))
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])
@@ -0,0 +1,83 @@
+from kerykeion import AstrologicalSubject, ExactTransitsFactory, KerykeionException, TransitTracker
+from datetime import datetime, timedelta
+from pytest import approx
+import pytest
+
+SECOND = 1 / 86400
+START = datetime(2025, 1, 1)
+TRANSITING_POINTS = ["Sun", "Moon", "Mercury", "Mars"]
+
+
+@pytest.fixture(scope="module")
+def natal_chart():
+    return AstrologicalSubject("Johnny Depp", 1963, 6, 9, 20, 15, lng=-87.11, lat=37.77, tz_str="America/Chicago", online=False)
+
+
+def get_interval_key(interval):
+    return (interval.p1_name, interval.p2_name, interval.aspect, interval.p2_abs_pos, round(interval.enter_julian_day or 0, 2))
+
+
+def test_daily_advances_match_the_whole_window(natal_chart, tmp_path):
+    tracker = TransitTracker(tmp_path / "transits.sqlite3", "johnny", natal_chart, START, transiting_points=TRANSITING_POINTS)
+
+    for day in range(1, 61):
+        changed = tracker.advance(START + timedelta(days=day))
+        assert all(interval.leave_julian_day is None or interval.leave_julian_day <= tracker.last_julian_day for interval in changed)
+
+    expected = ExactTransitsFactory(natal_chart, START, START + timedelta(days=60), transiting_points=TRANSITING_POINTS).get_transit_intervals()
+    found = tracker.get_intervals()
+    tracker.close()
+
+    assert len(found) == len(expected)
+    for found_interval, expected_interval in zip(sorted(found, key=get_interval_key), sorted(expected, key=get_interval_key)):
+        assert get_interval_key(found_interval) == get_interval_key(expected_interval)
+        assert (found_interval.enter_julian_day is None) == (expected_interval.enter_julian_day is None)
+        assert (found_interval.leave_julian_day is None) == (expected_interval.leave_julian_day is None)
+        assert found_interval.leave_julian_day == approx(expected_interval.leave_julian_day, abs=2 * SECOND)
+        assert found_interval.exact_julian_days == approx(expected_interval.exact_julian_days, abs=2 * SECOND)
+
+
+def test_resume_from_the_database(natal_chart, tmp_path):
+    path = tmp_path / "transits.sqlite3"
+
+    tracker = TransitTracker(path, "johnny", natal_chart, START, transiting_points=TRANSITING_POINTS)
+    tracker.advance(START + timedelta(days=10))
+    open_intervals = tracker.get_open_intervals()
+    tracker.close()
+
+    assert open_intervals
+
+    # The start of a tracker already in the database is ignored
+    tracker = TransitTracker(path, "johnny", natal_chart, datetime(2030, 1, 1), transiting_points=TRANSITING_POINTS)
+    assert tracker.last_datetime == datetime(2025, 1, 11, tzinfo=tracker.last_datetime.tzinfo)
+    assert tracker.get_open_intervals() == open_intervals
+    assert tracker.advance(START + timedelta(days=5)) == []
+
+    changed = tracker.advance(START + timedelta(days=11))
+    # The open windows go on or are closed
+    assert {get_interval_key(interval) for interval in open_intervals} <= {get_interval_key(interval) for interval in changed}
+    assert tracker.last_datetime == datetime(2025, 1, 12, tzinfo=tracker.last_datetime.tzinfo)
+
+    # Another tracker in the same database
+    other = TransitTracker(path, "other", natal_chart, START, transiting_points=["Sun"])
+    assert other.get_intervals() == []
+    other.close()
+    tracker.close()
+
+
+def test_different_configuration(natal_chart, tmp_path):
+    path = tmp_path / "transits.sqlite3"
+    TransitTracker(path, "johnny", natal_chart, START, transiting_points=TRANSITING_POINTS).close()
+
+    with pytest.raises(KerykeionException):
+        TransitTracker(path, "johnny", natal_chart, START, transiting_points=["Sun"])
+
+
+if __name__ == "__main__":
+    import pytest
+    import logging
+
+    # Set the log level to CRITICAL
+    logging.basicConfig(level=logging.CRITICAL)
+
+    pytest.main(["-vv", "--log-level=CRITICAL", "--log-cli-level=CRITICAL", __file__])